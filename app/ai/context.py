@@ -22,7 +22,7 @@ Usage:
 ```python
 from app.ai.context import build_unified_context
 
-# In an endpoint/handler with database session
+# In an endpoint/handler with an async database session
 context = await build_unified_context(user_id=user.id, db=db)
 
 # Pass to AI providers
@@ -36,8 +36,8 @@ from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
 from app.models.device import Device
@@ -596,7 +596,7 @@ def build_request_context(
 
 async def build_unified_context(
     user_id: UUID,
-    db: Session,
+    db: AsyncSession,
     request_id: Optional[str] = None,
 ) -> UnifiedContext:
     """
@@ -607,7 +607,7 @@ async def build_unified_context(
     
     Args:
         user_id: The user's UUID
-        db: Database session
+        db: Async database session
         request_id: Optional request tracking ID
         
     Returns:
@@ -620,22 +620,22 @@ async def build_unified_context(
         ```
     """
     # Fetch user
-    user = db.execute(
+    user = (await db.execute(
         select(User).where(User.id == user_id)
-    ).scalar_one_or_none()
+    )).scalar_one_or_none()
     
     if not user:
         raise ValueError(f"User {user_id} not found")
     
     # Fetch devices (eagerly load to avoid N+1 queries)
-    devices = db.execute(
+    devices = (await db.execute(
         select(Device).where(Device.user_id == user_id)
-    ).scalars().all()
+    )).scalars().all()
     
     # Fetch OAuth credentials
-    oauth_creds = db.execute(
+    oauth_creds = (await db.execute(
         select(OAuthCredential).where(OAuthCredential.user_id == user_id)
-    ).scalars().all()
+    )).scalars().all()
     
     # Build device capabilities
     device_capabilities = []
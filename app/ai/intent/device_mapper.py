@@ -45,7 +45,8 @@ class DeviceMapper:
         mapper = DeviceMapper()
         
         # Get user's devices from database
-        devices = db.query(Device).filter(Device.user_id == user_id).all()
+        result = await db.execute(select(Device).where(Device.user_id == user_id))
+        devices = result.scalars().all()
         
         # Match a spoken name to a device
         device, score = mapper.match("living room tv", devices)
@@ -62,6 +63,9 @@ class DeviceMapper:
         "de", "la", "el", "mi", "del", "en", "un", "una",  # Spanish
     }
     
+    # Normalized words too vague to identify a device on their own
+    GENERIC_WORDS = {"tv", "display", "room"}
+    
     def __init__(self):
         """Initialize the device mapper."""
         logger.info("Device mapper initialized")
@@ -154,6 +158,36 @@ class DeviceMapper:
         scored.sort(key=lambda x: x[1], reverse=True)
         return scored[:limit]
     
+    def match_contained(
+        self,
+        spoken_name: str,
+        devices: List[Device],
+    ) -> Optional[Device]:
+        """
+        Find the only device whose name contains every spoken word.
+        
+        Handles partial names that score low on similarity, e.g.
+        "kitchen" → "Kitchen Display" when no other device mentions
+        the kitchen.
+        
+        Args:
+            spoken_name: The (partial) name as spoken by the user
+            devices: List of Device records to match against
+            
+        Returns:
+            The device if exactly one contains all the words, None otherwise
+            (also None if the words are all generic, like "tv" or "room")
+        """
+        spoken_words = set(self._normalize(spoken_name).split())
+        if not spoken_words - self.GENERIC_WORDS:
+            return None
+        
+        matches = [
+            device for device in devices
+            if spoken_words <= set(self._normalize(device.name).split())
+        ]
+        return matches[0] if len(matches) == 1 else None
+    
     def _normalize(self, name: str) -> str:
         """
         Normalize a device name for comparison.
@@ -216,8 +250,8 @@ class DeviceMapper:
                 translated.append(w)
         words = translated
         
-        # Join back
-        return " ".join(words)
+        # Sort so "tele de la sala" ("tv living room") matches "Living Room TV"
+        return " ".join(sorted(words))
     
     def _calculate_similarity(self, name1: str, name2: str) -> float:
         """
@@ -0,0 +1,453 @@
+"""
+Fast Path Classifier - Local intent matching for common device commands.
+
+"Turn off the living room TV" or "sube el volumen de la tele" used to cost
+two LLM round-trips (AI router + intent parser) even though the action
+and the device can be resolved deterministically. This module recognizes
+those commands locally and produces a DeviceCommand with a confidence
+score; above INTENT_FAST_PATH_MIN_CONFIDENCE, IntentService skips the
+LLM entirely.
+
+Scope:
+======
+Only single-action power, volume, input and clear-content commands:
+- Action phrases come from ActionRegistry (action names + aliases, e.g.
+  "turn_on" → "turn on") plus English/Spanish phrasings
+- The device is whatever is left after removing the action phrase,
+  parameters and filler words, matched with DeviceMapper against the
+  user's devices
+
+Anything that looks like more than that (questions, compound requests
+"X and Y", schedules "in 10 minutes", pronouns "turn it off", several
+actions, unknown leftover words) returns None and goes through the LLM.
+
+Confidence:
+===========
+- Device named explicitly → DeviceMapper score (0.6 - 1.0), minus a
+  penalty when a second device scores almost as well
+- No device named ("mute the tv") and the user has exactly one device →
+  IMPLICIT_DEVICE_CONFIDENCE
+
+Usage:
+======
+    from app.ai.intent.fast_path import fast_path_classifier
+
+    parsed = fast_path_classifier.parse(text, devices, user_id=user_id)
+    if parsed:
+        # Confident DeviceCommand - no LLM call needed
+        ...
+"""
+
+import logging
+import re
+import time
+import unicodedata
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.ai.actions.registry import ActionRegistry, action_registry
+from app.ai.intent.device_mapper import DeviceMapper, device_mapper
+from app.ai.intent.schemas import ActionType, DeviceCommand, ParsedCommand
+from app.core.config import settings
+
+
+logger = logging.getLogger("jarvis.ai.fast_path")
+
+
+# ---------------------------------------------------------------------------
+# VOCABULARY
+# ---------------------------------------------------------------------------
+
+# Actions the fast path may produce (names in ActionRegistry)
+FAST_PATH_ACTIONS = (
+    "power_on",
+    "power_off",
+    "clear_content",
+    "set_input",
+    "volume_up",
+    "volume_down",
+    "volume_set",
+    "mute",
+    "unmute",
+)
+
+# Phrasings on top of the registry names/aliases (accent-free, lowercase)
+EXTRA_PHRASES: Dict[str, Tuple[str, ...]] = {
+    "power_on": (
+        "power up", "enciende", "encender", "prende", "prender",
+    ),
+    "power_off": (
+        "shut down", "shut off", "apaga", "apagar",
+    ),
+    "clear_content": (
+        "clear", "clear screen", "clear the screen", "limpia", "limpiar",
+        "limpia la pantalla", "borra la pantalla",
+    ),
+    "set_input": (
+        "switch to", "change to", "set input", "go to",
+        "cambia a", "cambiar a", "cambia la entrada a", "pon", "pon la entrada en",
+    ),
+    "volume_up": (
+        "volume up", "raise the volume", "sube", "subir", "sube el volumen",
+    ),
+    "volume_down": (
+        "volume down", "lower", "lower the volume", "baja", "bajar", "baja el volumen",
+    ),
+    "volume_set": (
+        "set the volume", "volume to", "volumen a", "volumen al", "volumen en", "pon el volumen",
+    ),
+    "mute": (
+        "silencia", "silenciar", "mutea", "quita el sonido",
+    ),
+    "unmute": (
+        "desmutea", "activa el sonido", "quita el silencio",
+    ),
+}
+
+# "turn the TV on" / "turn the TV off" - verb split around the device
+_SPLIT_VERBS = {"turn", "switch", "power"}
+_SPLIT_PARTICLES = {"on": "power_on", "off": "power_off"}
+
+# "switch the living room TV to HDMI 2" - input verbs away from "to"
+INPUT_VERBS = {"switch", "change", "set", "select", "put", "cambia", "cambiar", "pon", "poner"}
+
+# Words that carry no device information
+FILLER_WORDS = {
+    "please", "can", "could", "would", "you", "now", "right", "just", "set",
+    "the", "an", "my", "on", "in", "at", "to", "of", "for",
+    "volume", "sound", "input", "source",
+    "por", "favor", "puedes", "podrias", "ahora", "ya",
+    "el", "la", "los", "las", "mi", "de", "del", "en", "a", "al", "un", "una",
+    "volumen", "sonido", "entrada",
+}
+
+# Words that mean "the screen" without naming one
+GENERIC_DEVICE_WORDS = {
+    "tv", "tele", "television", "televisor", "screen", "display", "pantalla", "monitor",
+}
+
+# Presence of any of these means the request isn't a plain device command
+REJECT_WORDS = {
+    # Compound / multi-step requests
+    "and", "then", "also", "after", "before", "y", "luego", "despues", "tambien",
+    # Scheduling
+    "tomorrow", "tonight", "later", "minutes", "hours", "until", "every",
+    "manana", "minutos", "horas", "hasta", "cada", "noche",
+    # References that need conversation context or mean several devices
+    "it", "that", "this", "them", "all", "everything",
+    "eso", "esto", "esa", "ese", "todo", "todos", "todas",
+}
+
+QUESTION_STARTERS = {
+    "what", "which", "is", "are", "does", "do", "how", "why", "when", "who",
+    "que", "cual", "cuando", "como", "quien", "esta", "estan",
+}
+
+_INPUT_PATTERN = re.compile(r"\b(hdmi|av|usb|component|componente)\s?(\d)\b")
+_NUMBER_PATTERN = re.compile(r"\b(\d{1,3})\s?(%|percent|por ciento)?\b")
+
+
+# ---------------------------------------------------------------------------
+# STATS
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FastPathStats:
+    """Counters for monitoring how often the LLM is skipped."""
+    hits: int = 0
+    below_threshold: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.below_threshold + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "below_threshold": self.below_threshold,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+# ---------------------------------------------------------------------------
+# CLASSIFIER
+# ---------------------------------------------------------------------------
+
+class FastPathClassifier:
+    """
+    Rule/keyword classifier for single device commands.
+
+    match() returns the best DeviceCommand regardless of confidence;
+    classify() / parse() only return it when the confidence clears the
+    threshold (and update stats).
+    """
+
+    # Confidence when no device is named and the user has only one
+    IMPLICIT_DEVICE_CONFIDENCE = 0.9
+
+    # Runner-up device within this score of the best → ambiguous
+    AMBIGUITY_MARGIN = 0.15
+
+    def __init__(
+        self,
+        registry: ActionRegistry = action_registry,
+        mapper: DeviceMapper = device_mapper,
+        min_confidence: Optional[float] = None,
+    ):
+        self._mapper = mapper
+        self.min_confidence = (
+            min_confidence
+            if min_confidence is not None
+            else settings.INTENT_FAST_PATH_MIN_CONFIDENCE
+        )
+        # phrase (tuple of words) → action, longest phrases first
+        self._phrases: List[Tuple[Tuple[str, ...], str]] = self._build_phrases(registry)
+        self.stats = FastPathStats()
+
+    @staticmethod
+    def _build_phrases(registry: ActionRegistry) -> List[Tuple[Tuple[str, ...], str]]:
+        phrases: Dict[Tuple[str, ...], str] = {}
+        for name in FAST_PATH_ACTIONS:
+            definition = registry.get_action(name)
+            if definition is None:
+                continue
+            spoken = {definition.name, *definition.aliases, *EXTRA_PHRASES.get(name, ())}
+            for phrase in spoken:
+                words = tuple(_normalize(phrase.replace("_", " ")).split())
+                # A phrase belongs to the first action (FAST_PATH_ACTIONS order) claiming it
+                phrases.setdefault(words, name)
+        return sorted(phrases.items(), key=lambda item: len(item[0]), reverse=True)
+
+    # -------------------------------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------------------------------
+
+    def match(self, text: str, devices: Sequence[Any]) -> Optional[DeviceCommand]:
+        """
+        Try to read `text` as a single device command.
+
+        Args:
+            text: The user's request
+            devices: The user's Device records (anything with .name)
+
+        Returns:
+            DeviceCommand with a confidence score, or None if the request
+            isn't a plain power/volume/input/clear command
+        """
+        if not text or "?" in text or not devices:
+            return None
+
+        normalized = _normalize(text)
+        words = normalized.split()
+        if not words or words[0] in QUESTION_STARTERS:
+            return None
+        if any(word in REJECT_WORDS for word in words):
+            return None
+
+        input_match = _INPUT_PATTERN.search(normalized)
+        found = self._find_action(words, has_input=input_match is not None)
+        if found is None:
+            return None
+        action, consumed = found
+
+        parameters: Dict[str, Any] = {}
+        if action == "set_input":
+            if not input_match:
+                return None
+            parameters["input"] = f"{_input_name(input_match.group(1))}{input_match.group(2)}"
+            consumed |= _span_words(normalized, input_match)
+        elif input_match:
+            return None
+
+        number_match = _NUMBER_PATTERN.search(normalized) if not input_match else None
+        if number_match:
+            has_volume_word = "volume" in words or "volumen" in words
+            if action not in ("volume_set", "volume_up", "volume_down") or not has_volume_word:
+                return None
+            action = "volume_set"
+            parameters["level"] = int(number_match.group(1))
+            consumed |= _span_words(normalized, number_match)
+        elif action == "volume_set":
+            return None
+
+        if parameters.get("level") is not None and not 0 <= parameters["level"] <= 100:
+            return None
+
+        leftover = [
+            word for index, word in enumerate(words)
+            if index not in consumed and word not in FILLER_WORDS
+        ]
+        resolved = self._resolve_device(leftover, devices)
+        if resolved is None:
+            return None
+        device, confidence = resolved
+
+        return DeviceCommand(
+            confidence=round(confidence, 3),
+            original_text=text,
+            reasoning=f"fast_path: action={action} device={device.name}",
+            device_name=device.name,
+            action=ActionType(action),
+            parameters=parameters or None,
+            matched_device_name=device.name,
+        )
+
+    def classify(self, text: str, devices: Sequence[Any]) -> Optional[DeviceCommand]:
+        """match() above the confidence threshold, with stats."""
+        intent = self.match(text, devices)
+        if intent is None:
+            self.stats.misses += 1
+            return None
+        if intent.confidence < self.min_confidence:
+            self.stats.below_threshold += 1
+            logger.debug(
+                f"Fast path below threshold ({intent.confidence:.2f} < "
+                f"{self.min_confidence:.2f}): {text!r}"
+            )
+            return None
+        self.stats.hits += 1
+        return intent
+
+    def parse(
+        self,
+        text: str,
+        devices: Sequence[Any],
+        user_id: Optional[uuid.UUID] = None,
+    ) -> Optional[ParsedCommand]:
+        """
+        classify() wrapped in a ParsedCommand, shaped like
+        IntentParser.create_parsed_command() output for device commands.
+        """
+        start_time = time.time()
+        intent = self.classify(text, devices)
+        if intent is None:
+            return None
+
+        processing_time = (time.time() - start_time) * 1000
+        logger.info(
+            f"Fast path: {intent.action.value} → {intent.device_name} "
+            f"(confidence {intent.confidence:.2f}, {processing_time:.2f}ms)"
+        )
+        return ParsedCommand(
+            request_id=str(uuid.uuid4()),
+            user_id=user_id,
+            intent=intent,
+            device_name=intent.device_name,
+            action=intent.action.value,
+            parameters=intent.parameters,
+            ai_provider="fast_path",
+            processing_time_ms=processing_time,
+        )
+
+    # -------------------------------------------------------------------------
+    # HELPERS
+    # -------------------------------------------------------------------------
+
+    def _find_action(self, words: List[str], has_input: bool = False) -> Optional[Tuple[str, set]]:
+        """
+        Locate the action phrase.
+
+        Returns:
+            (action, indexes of the words it used), or None if no phrase
+            matches or phrases for two different actions do
+        """
+        taken: set = set()
+        actions: Dict[str, set] = {}
+        for phrase, action in self._phrases:
+            size = len(phrase)
+            for start in range(len(words) - size + 1):
+                span = set(range(start, start + size))
+                if span & taken or tuple(words[start:start + size]) != phrase:
+                    continue
+                taken |= span
+                actions.setdefault(action, set()).update(span)
+
+        # "turn the living room TV off" - verb and particle around the device
+        if not actions and words[0] in _SPLIT_VERBS and words[-1] in _SPLIT_PARTICLES:
+            actions[_SPLIT_PARTICLES[words[-1]]] = {0, len(words) - 1}
+
+        # "cambia la tele de la sala a HDMI 1" - verb and input name suffice
+        if has_input and (not actions or set(actions) == {"set_input"}):
+            verbs = {i for i, word in enumerate(words) if word in INPUT_VERBS}
+            if verbs:
+                actions.setdefault("set_input", set()).update(verbs)
+                actions["set_input"] |= {
+                    i for i, word in enumerate(words) if word in ("to", "a") and i > min(verbs)
+                }
+
+        # "volume 30 on the bedroom TV" - a level needs no verb
+        if not actions:
+            for index, word in enumerate(words):
+                if word in ("volume", "volumen"):
+                    actions["volume_set"] = {index}
+                    break
+
+        # "turn up the volume to 30" - a level wins over up/down
+        if "volume_set" in actions and len(actions) == 2:
+            other = next(a for a in actions if a != "volume_set")
+            if other in ("volume_up", "volume_down", "set_input"):
+                actions["volume_set"] |= actions.pop(other)
+
+        if len(actions) != 1:
+            return None
+        return next(iter(actions.items()))
+
+    def _resolve_device(
+        self,
+        leftover: List[str],
+        devices: Sequence[Any],
+    ) -> Optional[Tuple[Any, float]]:
+        """Pick the target device from the words that aren't action/filler."""
+        if any(word.isdigit() for word in leftover):
+            return None
+
+        candidates = []
+        if leftover:
+            candidates = self._mapper.match_all(" ".join(leftover), list(devices), limit=2)
+
+        # "apaga la cocina" - a partial name only one device contains
+        contained = self._mapper.match_contained(" ".join(leftover), list(devices))
+        if contained is not None:
+            score = candidates[0][1] if candidates and candidates[0][0] is contained else 0.0
+            return contained, max(score, self.IMPLICIT_DEVICE_CONFIDENCE)
+
+        if not candidates or candidates[0][1] < self._mapper.MIN_MATCH_SCORE:
+            # "mute the TV" with a single device: nothing to disambiguate
+            generic = all(word in GENERIC_DEVICE_WORDS for word in leftover)
+            if generic and len(devices) == 1:
+                return devices[0], self.IMPLICIT_DEVICE_CONFIDENCE
+            return None
+
+        device, score = candidates[0]
+
+        confidence = score
+        if len(candidates) > 1 and score - candidates[1][1] < self.AMBIGUITY_MARGIN:
+            confidence -= self.AMBIGUITY_MARGIN
+        return device, min(confidence, 1.0)
+
+
+def _normalize(text: str) -> str:
+    """Lowercase, strip accents and punctuation (keeps digits and %)."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(re.sub(r"[^a-z0-9%]+", " ", stripped).split())
+
+
+def _span_words(normalized: str, match: "re.Match") -> set:
+    """Word indexes covered by a regex match on the normalized text."""
+    first = len(normalized[:match.start()].split())
+    count = len(match.group(0).split())
+    return set(range(first, first + count))
+
+
+def _input_name(kind: str) -> str:
+    return "component" if kind == "componente" else kind
+
+
+
+# Singleton instance used by IntentService
+fast_path_classifier = FastPathClassifier()
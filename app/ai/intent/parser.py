@@ -22,9 +22,11 @@ import json
 import logging
 import time
 import uuid
+from datetime import datetime, timezone
 from typing import Optional, Dict, Any, Union
 
 from app.ai.providers import gemini_provider, AIResponse
+from app.ai.response_cache import intent_cache
 from app.ai.prompts.intent_prompts import (
     INTENT_SYSTEM_PROMPT,
     INTENT_EXTRACTION_PROMPT,
@@ -48,6 +50,19 @@ from app.ai.intent.schemas import (
 
 logger = logging.getLogger("jarvis.ai.intent")
 
+# Intents that only depend on the request text and device list. Calendar
+# create/edit carry titles/times copied from the text and drive
+# confirmation flows, so they are always parsed fresh.
+CACHEABLE_INTENT_TYPES = {
+    IntentType.DEVICE_COMMAND,
+    IntentType.DEVICE_QUERY,
+    IntentType.SYSTEM_QUERY,
+    IntentType.CALENDAR_QUERY,
+    IntentType.DOC_QUERY,
+    IntentType.DISPLAY_CONTENT,
+    IntentType.CONVERSATION,
+}
+
 
 class IntentParser:
     """
@@ -90,6 +105,16 @@ class IntentParser:
         start_time = time.time()
         logger.info(f"Parsing intent: {text[:50]}...")
         
+        # Repeated requests with the same context reuse the last intent
+        cache_key = intent_cache.key_for(text, context)
+        cached = intent_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Parsed intent (cached): {cached.intent_type}")
+            return cached.model_copy(
+                deep=True,
+                update={"original_text": text, "created_at": datetime.now(timezone.utc)},
+            )
+        
         # Build context string with devices, pending operations, conversation history, and generated content
         # Sprint 4.2 FIX: Include conversation context for memory-aware parsing
         context_parts = []
@@ -173,7 +198,6 @@ or implicit ("muéstramelo", "ponlo", "ábrelo") - refers to this document."""
             # Sprint 4.2: Add generated content context (CRITICAL for "show that note" references)
             if "generated_content" in context and context["generated_content"]:
                 gen_content = context["generated_content"]
-                from datetime import datetime, timezone
                 
                 # Calculate how long ago the content was generated
                 timestamp = gen_content.get("timestamp")
@@ -255,7 +279,7 @@ When user mentions "that meeting", "esa reunión", etc., use these values direct
             intent_data = json.loads(response.content)
             intent = self._create_intent(intent_data, text)
             logger.info(f"Parsed intent in {processing_time:.0f}ms: {intent.intent_type}")
-            return intent
+            return self._remember(cache_key, intent)
 
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse intent JSON: {e}")
@@ -276,7 +300,7 @@ When user mentions "that meeting", "esa reunión", etc., use these values direct
                 intent_data = json.loads(cleaned_content)
                 intent = self._create_intent(intent_data, text)
                 logger.info(f"Recovered from JSON error with cleanup")
-                return intent
+                return self._remember(cache_key, intent)
             except Exception as retry_error:
                 logger.error(f"JSON cleanup failed: {retry_error}")
                 return self._create_unknown_intent(text, str(e))
@@ -285,6 +309,12 @@ When user mentions "that meeting", "esa reunión", etc., use these values direct
             logger.error(f"Intent creation failed: {e}")
             return self._create_unknown_intent(text, str(e))
     
+    def _remember(self, cache_key: Optional[str], intent: Intent) -> Intent:
+        """Store a freshly parsed intent in the response cache if it's cacheable."""
+        if intent.intent_type in CACHEABLE_INTENT_TYPES:
+            intent_cache.set(cache_key, intent.model_copy(deep=True))
+        return intent
+    
     def _create_intent(self, data: Dict[str, Any], original_text: str) -> Intent:
         """
         Create a typed Intent object from parsed JSON data.
@@ -36,12 +36,13 @@ Usage:
 
 import json
 import logging
+import math
 import sys
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from threading import Lock
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
 from uuid import UUID
 
 from app.ai.providers.base import ProviderType, TokenUsage, AIResponse
@@ -124,6 +125,57 @@ class AggregatedMetrics:
         }
 
 
+def _percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (0.0 for no samples)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class SpeculationMetrics:
+    """
+    Speculative intent parsing (routing + parse started in parallel).
+    
+    savings = (routing_ms + parse_ms) - elapsed_ms, i.e. what the serial
+    route-then-parse path would have cost minus what the parallel path did.
+    Discarded speculations (routing said COMPLEX) save nothing and waste
+    a partial parse call.
+    """
+    max_samples: int = 1000
+    total: int = 0
+    used: int = 0
+    discarded: int = 0
+    latency_ms: Deque[float] = field(default_factory=deque)
+    savings_ms: Deque[float] = field(default_factory=deque)
+    
+    def record(self, used: bool, elapsed_ms: float, savings_ms: float) -> None:
+        self.total += 1
+        if used:
+            self.used += 1
+        else:
+            self.discarded += 1
+        for samples, value in ((self.latency_ms, elapsed_ms), (self.savings_ms, savings_ms)):
+            samples.append(value)
+            if len(samples) > self.max_samples:
+                samples.popleft()
+    
+    def to_dict(self) -> Dict:
+        latency = list(self.latency_ms)
+        savings = list(self.savings_ms)
+        return {
+            "speculative_requests": self.total,
+            "used": self.used,
+            "discarded": self.discarded,
+            "latency_p50_ms": round(_percentile(latency, 50), 2),
+            "latency_p95_ms": round(_percentile(latency, 95), 2),
+            "savings_p50_ms": round(_percentile(savings, 50), 2),
+            "savings_p95_ms": round(_percentile(savings, 95), 2),
+        }
+
+
 # ---------------------------------------------------------------------------
 # UNIFIED AI MONITOR
 # ---------------------------------------------------------------------------
@@ -154,6 +206,7 @@ class AIMonitor:
         self._max_history = max_history
         self._lock = Lock()
         self._aggregated = AggregatedMetrics()
+        self._speculation = SpeculationMetrics(max_samples=max_history)
     
     # -----------------------------------------------------------------------
     # MAIN TRACKING METHODS
@@ -400,6 +453,41 @@ class AIMonitor:
         
         self._logger.info(f"AI Event: {json.dumps(log_data)}")
     
+    def track_speculation(
+        self,
+        request_id: str,
+        used: bool,
+        routing_ms: float,
+        parse_ms: Optional[float],
+        elapsed_ms: float,
+    ) -> None:
+        """
+        Track a speculative routing + intent parse.
+        
+        Args:
+            request_id: Request being processed
+            used: True if the speculative parse was used (simple task)
+            routing_ms: Routing call latency
+            parse_ms: Intent parse latency (None if discarded before finishing)
+            elapsed_ms: Wall time until routing (and the parse, if used) finished
+        """
+        savings_ms = max(0.0, routing_ms + parse_ms - elapsed_ms) if used and parse_ms else 0.0
+        with self._lock:
+            self._speculation.record(used, elapsed_ms, savings_ms)
+        
+        log_data = {
+            "event": "speculative_parse",
+            "request_id": request_id,
+            "used": used,
+            "routing_ms": round(routing_ms, 2),
+            "parse_ms": round(parse_ms, 2) if parse_ms is not None else None,
+            "elapsed_ms": round(elapsed_ms, 2),
+            "savings_ms": round(savings_ms, 2),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+        
+        self._logger.info(f"Speculation: {json.dumps(log_data)}")
+    
     # -----------------------------------------------------------------------
     # METRICS METHODS
     # -----------------------------------------------------------------------
@@ -409,6 +497,11 @@ class AIMonitor:
         with self._lock:
             return self._aggregated
     
+    def get_speculation_stats(self) -> Dict:
+        """Get speculative parsing counts and p50/p95 latency and savings."""
+        with self._lock:
+            return self._speculation.to_dict()
+    
     def get_recent_requests(self, limit: int = 10) -> List[RequestMetrics]:
         """Get recent requests."""
         with self._lock:
@@ -419,6 +512,7 @@ class AIMonitor:
         with self._lock:
             self._history = []
             self._aggregated = AggregatedMetrics()
+            self._speculation = SpeculationMetrics(max_samples=self._max_history)
     
     # -----------------------------------------------------------------------
     # PRIVATE METHODS
@@ -28,7 +28,7 @@ response = await gemini_provider.generate(prompt)
 ```
 """
 
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 from app.ai.context import UnifiedContext
 
 
@@ -433,24 +433,46 @@ def format_context_for_logging(context: UnifiedContext) -> str:
     )
 
 
-def get_context_hash(context: UnifiedContext) -> str:
+def get_context_hash(context: Union[UnifiedContext, Dict[str, Any]]) -> str:
     """
     Generate a hash of the context for caching.
     
     This can be used to determine if context has changed
     and prompts need to be rebuilt.
+    
+    Accepts a UnifiedContext or the request context dict built by
+    build_request_context() (RequestContext.to_dict()). Device names and
+    online state are part of the hash, so renaming a device or a device
+    going offline invalidates anything cached for the old context.
+    Conversation state is NOT included - callers that depend on it must
+    not cache (see app/ai/response_cache.py).
     """
     import hashlib
     import json
     
     # Create a stable representation
-    context_data = {
-        "user_id": str(context.user_id),
-        "device_count": context.device_count,
-        "online_count": len(context.online_devices),
-        "has_calendar": context.has_google_calendar,
-        "actions": sorted(context.available_actions),
-    }
+    if isinstance(context, UnifiedContext):
+        context_data = {
+            "user_id": str(context.user_id),
+            "device_count": context.device_count,
+            "online_count": len(context.online_devices),
+            "devices": sorted(
+                [str(device.device_name), bool(device.is_online)]
+                for device in context.devices
+            ),
+            "has_calendar": context.has_google_calendar,
+            "actions": sorted(context.available_actions),
+        }
+    else:
+        devices = context.get("devices") or []
+        context_data = {
+            "user_id": str(context.get("user_id")),
+            "device_count": len(devices),
+            "devices": sorted(
+                [str(device.get("name")), bool(device.get("is_online"))]
+                for device in devices
+            ),
+        }
     
     # Hash it
     context_str = json.dumps(context_data, sort_keys=True)
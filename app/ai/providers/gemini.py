@@ -4,10 +4,13 @@ Gemini Provider - Google's GenAI SDK (New Standard).
 Compatible with Gemini 2.0, 2.5 Flash-Lite, and Gemini 3 Flash.
 """
 
+import asyncio
 import time
 import json
 import logging
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Optional, Any, Dict, List
 
 # --- NUEVO IMPORT PARA EL SDK V2 ---
@@ -24,12 +27,24 @@ from app.ai.providers.base import (
 
 logger = logging.getLogger("jarvis.ai.gemini")
 
+# Max threads used when the SDK client has no native async surface (client.aio).
+# Bounded so a burst of requests can't spawn unlimited blocking threads.
+EXECUTOR_MAX_WORKERS = 8
+
+
 class GeminiProvider(AIProvider):
     provider_type = ProviderType.GEMINI
 
-    def __init__(self, model: str = None, api_key: str = None):
+    def __init__(
+        self,
+        model: str = None,
+        api_key: str = None,
+        timeout: Optional[float] = None,
+    ):
         self.model = model or settings.GEMINI_MODEL
         self.api_key = api_key or settings.GEMINI_API_KEY
+        self.timeout = timeout or settings.AI_REQUEST_TIMEOUT
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # --- INICIALIZACIÓN CLIENTE V2 ---
         if self.api_key:
@@ -85,11 +100,12 @@ class GeminiProvider(AIProvider):
             # Construcción de configuración V2
             config = types.GenerateContentConfig(**config_kwargs)
 
-            # Llamada al modelo V2
-            response = self._client.models.generate_content(
+            # Llamada al modelo V2 (non-blocking)
+            response = await self._generate_content(
                 model=model,
                 contents=prompt,
-                config=config
+                config=config,
+                timeout=kwargs.get("timeout"),
             )
 
             latency_ms = self._measure_latency(start_time)
@@ -113,6 +129,8 @@ class GeminiProvider(AIProvider):
                 raw_response=response,
             )
 
+        except asyncio.TimeoutError:
+            return self._timeout_error(kwargs.get("timeout"), start_time)
         except Exception as e:
             logger.error(f"Gemini generation failed: {e}")
             return self._error(str(e), start_time)
@@ -181,6 +199,7 @@ class GeminiProvider(AIProvider):
                 temperature=0.2,
                 max_tokens=kwargs.get("max_tokens", 2048),  # Allow override, default 2048
                 response_mime_type="application/json",
+                timeout=kwargs.get("timeout"),
             )
 
             if not response.success:
@@ -278,11 +297,12 @@ class GeminiProvider(AIProvider):
 
             config = types.GenerateContentConfig(**config_kwargs)
 
-            # Call Gemini with multimodal content
-            response = self._client.models.generate_content(
+            # Call Gemini with multimodal content (non-blocking)
+            response = await self._generate_content(
                 model=model,
                 contents=contents,
-                config=config
+                config=config,
+                timeout=kwargs.get("timeout"),
             )
 
             latency_ms = self._measure_latency(start_time)
@@ -298,6 +318,8 @@ class GeminiProvider(AIProvider):
                 raw_response=response,
             )
 
+        except asyncio.TimeoutError:
+            return self._timeout_error(kwargs.get("timeout"), start_time)
         except Exception as e:
             logger.error(f"Gemini vision generation failed: {e}")
             return self._error(str(e), start_time)
@@ -329,10 +351,11 @@ class GeminiProvider(AIProvider):
                 tools=tools_list
             )
 
-            response = self._client.models.generate_content(
+            response = await self._generate_content(
                 model=self.model,
                 contents=prompt,
-                config=config
+                config=config,
+                timeout=kwargs.get("timeout"),
             )
 
             latency_ms = self._measure_latency(start_time)
@@ -350,11 +373,58 @@ class GeminiProvider(AIProvider):
                 metadata=metadata,
             )
 
+        except asyncio.TimeoutError:
+            return self._timeout_error(kwargs.get("timeout"), start_time)
         except Exception as e:
             return self._error(str(e), start_time)
 
     # --- HELPERS PRIVADOS ACTUALIZADOS ---
 
+    async def _generate_content(
+        self,
+        model: str,
+        contents: Any,
+        config: types.GenerateContentConfig,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Call generate_content without blocking the event loop.
+
+        Uses the SDK's native async client (client.aio) when available and
+        falls back to a bounded thread pool otherwise. The call is bounded by
+        AI_REQUEST_TIMEOUT (or the per-call timeout) and is cancelled if the
+        awaiting task is cancelled.
+
+        Raises:
+            asyncio.TimeoutError: If the call exceeds the timeout
+        """
+        timeout = timeout or self.timeout
+        aio = getattr(self._client, "aio", None)
+
+        if aio is not None:
+            call = aio.models.generate_content(
+                model=model,
+                contents=contents,
+                config=config,
+            )
+        else:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=EXECUTOR_MAX_WORKERS,
+                    thread_name_prefix="gemini",
+                )
+            call = asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(
+                    self._client.models.generate_content,
+                    model=model,
+                    contents=contents,
+                    config=config,
+                ),
+            )
+
+        return await asyncio.wait_for(call, timeout=timeout)
+
     def _extract_usage(self, response):
         # El SDK v2 a veces devuelve None si no hay uso reportado
         # Los campos individuales también pueden ser None incluso si usage_metadata existe
@@ -379,6 +449,11 @@ class GeminiProvider(AIProvider):
                 metadata['sources'] = sources
         return metadata
 
+    def _timeout_error(self, timeout, start_time):
+        msg = f"Gemini request timed out after {timeout or self.timeout}s"
+        logger.error(msg)
+        return self._error(msg, start_time)
+
     def _error(self, msg, start_time):
         return self._create_error_response(
             error=msg, model=self.model, latency_ms=self._measure_latency(start_time)
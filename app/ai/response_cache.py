@@ -0,0 +1,266 @@
+"""
+LLM Response Cache - Reuse routing and intent-parsing results.
+
+"show my calendar" asked twice a minute apart used to cost two identical
+Gemini round-trips in AIRouter.analyze_request and two more in
+IntentParser.parse. This module caches those results per user.
+
+Cache Key:
+==========
+    (normalized request text, context fingerprint)
+
+- Normalized text: Unicode NFKC, lowercased, whitespace collapsed, outer
+  punctuation stripped ("¿Show my calendar?" == "show my calendar")
+- Context fingerprint: get_context_hash() from app/ai/prompts/base_prompt.py
+  (user, device names and online state)
+
+Bypass:
+=======
+Some requests depend on more than the text and the device list. They are
+never read from or written to the cache:
+- Pending operation: a calendar create/edit/delete is awaiting
+  confirmation, or a content request awaits a follow-up ("si, hazlo")
+- Conversation references: "it", "that meeting", "muéstralo", or
+  references already resolved by build_request_context()
+- Time-relative wording: "today", "tomorrow at 3pm", "el lunes"... (the
+  parser resolves these to concrete dates)
+- URLs (document IDs are case-sensitive)
+
+Entries expire after AI_RESPONSE_CACHE_TTL_SECONDS and the least recently
+used ones are evicted beyond AI_RESPONSE_CACHE_MAX_ENTRIES.
+
+Usage:
+======
+    from app.ai.response_cache import routing_cache
+
+    key = routing_cache.key_for(request, context)   # None → bypass
+    cached = routing_cache.get(key)
+    if cached is None:
+        decision = await call_llm(...)
+        routing_cache.set(key, decision)
+"""
+
+import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+from app.ai.prompts.base_prompt import get_context_hash
+from app.core.config import settings
+
+
+logger = logging.getLogger("jarvis.ai.response_cache")
+
+
+# ---------------------------------------------------------------------------
+# BYPASS RULES
+# ---------------------------------------------------------------------------
+
+# Words that point at something earlier in the conversation
+REFERENCE_WORDS = {
+    # English
+    "it", "that", "this", "those", "these", "them", "same", "again",
+    "yes", "yeah", "yep", "no", "nope", "ok", "okay", "sure", "confirm", "cancel",
+    # Spanish
+    "eso", "esto", "esa", "ese", "esas", "esos", "esta", "este", "estas", "estos",
+    "si", "sí", "vale", "dale", "claro", "confirma", "cancela", "otra", "otro",
+}
+
+# Spanish verbs with an attached pronoun: "muéstralo", "cámbiala", "ponlo"
+_ENCLITIC_PATTERN = re.compile(
+    r"\b\w*[áéíóú]\w*(?:lo|la|los|las|le|les|melo|mela)\b"
+    r"|\b(?:ponlo|ponla|hazlo|hazla|dimelo|quitalo|quitala)\b"
+)
+
+_TIME_WORDS = {
+    # English
+    "today", "tonight", "tomorrow", "yesterday", "now", "next", "last",
+    "week", "weekend", "month", "year", "morning", "afternoon", "evening",
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+    "minutes", "hours", "days", "later", "soon",
+    # Spanish
+    "hoy", "mañana", "manana", "ayer", "ahora", "próximo", "proximo", "próxima",
+    "proxima", "siguiente", "pasado", "semana", "mes", "año", "tarde", "noche",
+    "lunes", "martes", "miércoles", "miercoles", "jueves", "viernes", "sábado",
+    "sabado", "domingo", "minutos", "horas", "días", "dias", "luego",
+}
+
+_TIME_PATTERN = re.compile(
+    r"\b\d{1,2}(?::\d{2})?\s?(?:am|pm|a\.m\.|p\.m\.|h|hrs)\b"
+    r"|\b\d{1,2}:\d{2}\b"
+    r"|\b\d{4}-\d{2}-\d{2}\b"
+    r"|\b\d{1,2}/\d{1,2}\b"
+)
+
+_URL_PATTERN = re.compile(r"https?://|docs\.google\.com", re.IGNORECASE)
+
+
+def normalize_request(text: str) -> str:
+    """Normalize a request for use in a cache key."""
+    normalized = unicodedata.normalize("NFKC", text).lower()
+    normalized = " ".join(normalized.split())
+    return normalized.strip(" .,;:!?¡¿\"'")
+
+
+def bypass_reason(text: str, context: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Explain why a request must not use the cache.
+
+    Args:
+        text: The user's request
+        context: Request context dict (RequestContext.to_dict())
+
+    Returns:
+        Reason string ("pending_operation", "reference", ...) or None if
+        the request is cacheable
+    """
+    context = context or {}
+
+    pending = context.get("pending_operation") or {}
+    if any(pending.get(flag) for flag in ("has_pending_create", "has_pending_edit", "has_pending_delete")):
+        return "pending_operation"
+
+    conversation = (context.get("conversation_context") or {}).get("conversation") or {}
+    if conversation.get("pending_content"):
+        return "pending_operation"
+
+    if context.get("resolved_references"):
+        return "reference"
+
+    if _URL_PATTERN.search(text):
+        return "url"
+
+    normalized = normalize_request(text)
+    words = set(re.findall(r"\w+", normalized))
+    if words & REFERENCE_WORDS or _ENCLITIC_PATTERN.search(normalized):
+        return "reference"
+
+    if words & _TIME_WORDS or _TIME_PATTERN.search(normalized):
+        return "time_relative"
+
+    return None
+
+
+# ---------------------------------------------------------------------------
+# CACHE
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ResponseCacheStats:
+    """Hit/miss counters for monitoring."""
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    bypasses: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 3),
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "bypasses": dict(self.bypasses),
+        }
+
+
+class LLMResponseCache:
+    """
+    TTL + LRU cache for one kind of LLM result (routing or intent).
+
+    Values are stored as returned by the caller; callers copy them on
+    the way out if they are mutable.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.name = name
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.AI_RESPONSE_CACHE_TTL_SECONDS
+        self.max_entries = max_entries or settings.AI_RESPONSE_CACHE_MAX_ENTRIES
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self.stats = ResponseCacheStats()
+
+    def key_for(self, text: str, context: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        Build the cache key for a request.
+
+        Returns:
+            The key, or None if caching is disabled or the request must
+            bypass the cache (counted in stats.bypasses)
+        """
+        if not settings.AI_RESPONSE_CACHE_ENABLED or not text:
+            return None
+
+        reason = bypass_reason(text, context)
+        if reason:
+            self.stats.bypasses[reason] = self.stats.bypasses.get(reason, 0) + 1
+            logger.debug(f"{self.name} cache bypass ({reason}): {text[:50]}")
+            return None
+
+        return f"{get_context_hash(context or {})}:{normalize_request(text)}"
+
+    def get(self, key: Optional[str]) -> Optional[Any]:
+        if key is None:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Optional[str], value: Any) -> None:
+        if key is None:
+            return
+
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        self.stats.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats = ResponseCacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Singleton instances: AIRouter.analyze_request and IntentParser.parse
+routing_cache = LLMResponseCache("routing")
+intent_cache = LLMResponseCache("intent")
+
+
+def response_cache_stats() -> Dict[str, dict]:
+    """Stats for both caches (for /intent/stats)."""
+    return {
+        "routing": routing_cache.stats.as_dict(),
+        "intent": intent_cache.stats.as_dict(),
+    }
@@ -49,7 +49,7 @@ COMPLEX_REASONING (Route to Gemini 3 Flash):
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from typing import Optional, Dict, Any
 
@@ -62,6 +62,7 @@ from app.ai.prompts.router_prompts import (
     ROUTING_SYSTEM_PROMPT,
     ROUTING_ANALYSIS_PROMPT,
 )
+from app.ai.response_cache import routing_cache
 
 logger = logging.getLogger("jarvis.ai.router")
 
@@ -160,6 +161,13 @@ class AIRouter:
         """
         logger.info(f"Analyzing request: {request[:50]}...")
         
+        # Repeated requests with the same context reuse the last decision
+        cache_key = routing_cache.key_for(request, context)
+        cached = routing_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Routing decision (cached): {cached.to_dict()}")
+            return replace(cached)
+        
         # Build the analysis prompt
         context_str = ""
         if context:
@@ -221,6 +229,7 @@ class AIRouter:
             )
             
             logger.info(f"Routing decision: {decision.to_dict()}")
+            routing_cache.set(cache_key, replace(decision))
             return decision
             
         except (json.JSONDecodeError, KeyError) as e:
@@ -34,6 +34,7 @@ from .contracts import (
 )
 from .visual_analyzer import visual_analyzer
 from .scene_graph import scene_graph_extractor
+from ...html_fixer.sandbox.page_snapshot import PageSnapshot
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
@@ -723,15 +724,23 @@ class InteractionValidator:
         self,
         page: "Page",
         html_content: str,
+        snapshot: Optional[PageSnapshot] = None,
     ) -> bool:
         """
         Sprint 12: Reset page to initial state after testing modal content.
 
         Strategy:
+        0. Restore the snapshot taken after the initial render (undoes every
+           DOM change since, no reload)
         1. Try to find and click a "close" button
         2. Try pressing Escape key
-        3. If all else fails, reload the HTML
+        3. If all else fails, reload the HTML (and snapshot it again)
         """
+        # Strategy 0: Snapshot restore
+        if snapshot is not None and await snapshot.restore(page):
+            logger.debug("Sprint 12: Reset page from snapshot")
+            return True
+
         # Strategy 1: Look for close button
         close_selectors = [
             'button:has-text("close")',
@@ -772,6 +781,8 @@ class InteractionValidator:
         try:
             await page.set_content(html_content, wait_until="networkidle")
             await asyncio.sleep(0.5)  # Wait for JS to initialize
+            if snapshot is not None:
+                await snapshot.capture(page)
             logger.debug("Sprint 12: Reset page by reloading HTML")
             return True
         except Exception as e:
@@ -821,6 +832,13 @@ class InteractionValidator:
                 duration_ms=(time.time() - start_time) * 1000,
             ), []
 
+        # Snapshot of the initial state for fast resets after modal tests
+        snapshot: Optional[PageSnapshot] = None
+        if html_content:
+            snapshot = PageSnapshot()
+            if not await snapshot.capture(page):
+                snapshot = None
+
         # Filter testable inputs
         testable_inputs = [inp for inp in inputs if inp.testable]
         navigation_count = sum(1 for inp in inputs if inp.interaction_category.value == "navigation")
@@ -888,8 +906,8 @@ class InteractionValidator:
 
                     # Reset page state before testing next original element
                     if html_content and len(testable_inputs) > 1:
-                        await self._reset_page_state(page, html_content)
-                        await asyncio.sleep(0.3)  # Wait for reset
+                        # Each strategy waits for its own close animation
+                        await self._reset_page_state(page, html_content, snapshot)
             else:
                 # Log non-responsive
                 delta = result.visual_delta.pixel_diff_ratio if result.visual_delta else 0
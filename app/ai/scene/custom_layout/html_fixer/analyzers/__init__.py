@@ -2,12 +2,14 @@
 Analyzers - DOM and Tailwind analysis tools.
 
 This module provides tools for analyzing HTML documents:
-- DOMParser: Parse and query HTML structure
+- DOMParser: Parse and query HTML structure (pluggable parser backend)
 - TailwindAnalyzer: Extract Tailwind class information
 - InteractiveDetector: Find interactive elements
 - EventMapper: Map event handlers
 - ZIndexHierarchyBuilder: Build stacking context hierarchy
 - PointerBlockageDetector: Detect pointer-events blockages
+- DocumentCache: Parse-once shared documents, keyed by content hash
+- ElementIndex: Per-element Tailwind facts, computed once per document
 
 Usage:
     from app.ai.scene.custom_layout.html_fixer.analyzers import (
@@ -30,8 +32,10 @@ Usage:
         print(f"{item.selector}: z={info.z_index}")
 """
 
-from .dom_parser import DOMParser
+from .dom_parser import DOMParser, PARSER_BACKENDS, resolve_parser_backend
+from .document_cache import DocumentCache, DocumentCacheStats, get_document_cache
 from .tailwind_analyzer import TailwindAnalyzer
+from .element_index import ElementIndex, IndexedElement
 from .interactive_detector import (
     InteractiveDetector,
     InteractiveElement,
@@ -54,8 +58,17 @@ from .pointer_detector import (
 __all__ = [
     # DOM Parser
     "DOMParser",
+    "PARSER_BACKENDS",
+    "resolve_parser_backend",
+    # Document Cache
+    "DocumentCache",
+    "DocumentCacheStats",
+    "get_document_cache",
     # Tailwind Analyzer
     "TailwindAnalyzer",
+    # Element Index
+    "ElementIndex",
+    "IndexedElement",
     # Interactive Detector
     "InteractiveDetector",
     "InteractiveElement",
@@ -0,0 +1,192 @@
+"""
+Document Cache - Parse each HTML version once, share it across the pipeline.
+
+One Orchestrator pass used to build a fresh BeautifulSoup tree for the same
+HTML in the classification pipeline, the JS validators, every LLMFixer
+helper, each patch validator check, the prompt builders, the injectors...
+DocumentCache keys parsed documents by content hash (LRU), so every
+analyzer, validator and fixer reading an HTML version gets the same tree.
+
+Shared trees are READ-ONLY. Code that mutates a tree (TailwindInjector,
+JSPatchApplier) takes a clone(): a copy of the cached tree that never
+touches the cached one. beautifulsoup4 >= 4.13 copies the tree node by
+node, cheaper than parsing the HTML again (older releases re-parse on
+copy). Clones are always "html.parser" trees, so fixers serialize the
+HTML the same way whatever HTML_FIXER_PARSER_BACKEND the analyzers use.
+
+Usage:
+======
+    documents = get_document_cache()
+
+    parser = documents.parser(html)       # DOMParser, parsed on first use
+    soup = documents.soup(html)           # Its BeautifulSoup (read-only)
+
+    tree = documents.clone(html)          # Private mutable copy
+    tree.select_one("button")["class"] = ["z-50"]
+
+    documents.stats.as_dict()
+    # {"parses": 3, "hits": 41, "clones": 2, "evictions": 0}
+"""
+
+import copy
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from bs4 import BeautifulSoup
+
+from app.core.config import settings
+
+from .dom_parser import DEFAULT_PARSER_BACKEND, DOMParser, resolve_parser_backend
+
+logger = logging.getLogger("jarvis.ai.html_fixer.document_cache")
+
+
+@dataclass
+class DocumentCacheStats:
+    """Parse sharing counters of a DocumentCache."""
+
+    parses: int = 0      # HTML versions parsed
+    hits: int = 0        # Requests served by an already parsed document
+    clones: int = 0      # Mutable copies handed out
+    evictions: int = 0   # Documents dropped to stay within max_documents
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "parses": self.parses,
+            "hits": self.hits,
+            "clones": self.clones,
+            "evictions": self.evictions,
+        }
+
+
+class DocumentCache:
+    """
+    Parsed HTML documents keyed by content hash.
+
+    Usage:
+        documents = DocumentCache(max_documents=32)
+        parser = documents.parser(html)
+    """
+
+    def __init__(self, max_documents: Optional[int] = None, backend: Optional[str] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            max_documents: Documents kept parsed; least recently used ones
+                           are dropped (default: HTML_FIXER_DOCUMENT_CACHE_SIZE)
+            backend: DOMParser tree builder (default: HTML_FIXER_PARSER_BACKEND)
+        """
+        if max_documents is None:
+            max_documents = settings.HTML_FIXER_DOCUMENT_CACHE_SIZE
+        self._max_documents = max(1, max_documents)
+        self._backend = resolve_parser_backend(backend)
+        self._documents: "OrderedDict[str, DOMParser]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = DocumentCacheStats()
+
+    @property
+    def backend(self) -> str:
+        """Tree builder documents are parsed with."""
+        return self._backend
+
+    @staticmethod
+    def content_hash(html: str) -> str:
+        """Cache key of an HTML version."""
+        return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+    def parser(self, html: str) -> DOMParser:
+        """
+        Shared DOMParser for an HTML version (read-only).
+
+        Args:
+            html: HTML content
+
+        Returns:
+            The cached DOMParser, parsing the HTML on first request
+        """
+        key = self.content_hash(html)
+        with self._lock:
+            parser = self._documents.get(key)
+            if parser is not None:
+                self._documents.move_to_end(key)
+                self.stats.hits += 1
+                return parser
+
+        parser = DOMParser(html, backend=self._backend)
+
+        with self._lock:
+            # Another thread may have parsed it meanwhile: keep the first
+            existing = self._documents.get(key)
+            if existing is not None:
+                self.stats.hits += 1
+                return existing
+
+            self.stats.parses += 1
+            self._documents[key] = parser
+            while len(self._documents) > self._max_documents:
+                self._documents.popitem(last=False)
+                self.stats.evictions += 1
+        return parser
+
+    def soup(self, html: str) -> BeautifulSoup:
+        """Shared BeautifulSoup tree for an HTML version (read-only)."""
+        return self.parser(html).soup
+
+    def clone(self, html: str) -> BeautifulSoup:
+        """
+        Private, mutable copy of the parsed HTML.
+
+        Args:
+            html: HTML content
+
+        Returns:
+            A BeautifulSoup tree the caller may modify freely
+        """
+        parser = self.parser(html)
+        if parser.backend == DEFAULT_PARSER_BACKEND:
+            tree = copy.copy(parser.soup)
+        else:
+            # Other builders normalize the markup (implied <html>/<body>,
+            # void tags...): serialize from the reference parser instead
+            tree = BeautifulSoup(html, DEFAULT_PARSER_BACKEND)
+        with self._lock:
+            self.stats.clones += 1
+        return tree
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._documents.clear()
+
+    def __contains__(self, html: str) -> bool:
+        return self.content_hash(html) in self._documents
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __bool__(self) -> bool:
+        # An empty cache is still a cache (`documents or get_document_cache()`)
+        return True
+
+    def __repr__(self) -> str:
+        return f"DocumentCache({len(self)}/{self._max_documents} documents, {self._backend})"
+
+
+# ---------------------------------------------------------------------------
+# SINGLETON
+# ---------------------------------------------------------------------------
+
+_cache: Optional[DocumentCache] = None
+
+
+def get_document_cache() -> DocumentCache:
+    """Get the application-wide document cache, creating it if needed."""
+    global _cache
+    if _cache is None:
+        _cache = DocumentCache()
+    return _cache
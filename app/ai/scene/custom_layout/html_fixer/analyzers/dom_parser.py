@@ -5,6 +5,13 @@ This module provides the foundation for all HTML analysis in the fixer pipeline.
 It wraps BeautifulSoup with convenient methods for CSS selector queries and
 source line tracking.
 
+The BeautifulSoup tree builder is pluggable (HTML_FIXER_PARSER_BACKEND):
+"html.parser" (default, pure Python), "lxml" (fast C parser) or "html5lib"
+(browser-grade, slow). Backends that aren't installed fall back to
+"html.parser". The regex line map used when an element carries no
+sourceline (lxml never sets it) is built on first use only, and so is the
+per-element Tailwind index shared by the analyzers (element_index).
+
 Usage:
     from app.ai.scene.custom_layout.html_fixer.analyzers import DOMParser
 
@@ -13,15 +20,57 @@ Usage:
     for btn in buttons:
         line = parser.get_source_line(btn)
         print(f"Button at line {line}")
+
+    fast = DOMParser(html_string, backend="lxml")
 """
 
+import logging
 import re
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 
 from bs4 import BeautifulSoup, Tag, NavigableString
+from bs4.builder import builder_registry
+
+from app.core.config import settings
 
 from ..core.selector import SelectorService
 
+if TYPE_CHECKING:
+    from .element_index import ElementIndex
+
+logger = logging.getLogger("jarvis.ai.html_fixer.dom_parser")
+
+# Tree builders DOMParser accepts (BeautifulSoup feature names)
+PARSER_BACKENDS = ("html.parser", "lxml", "html5lib")
+DEFAULT_PARSER_BACKEND = "html.parser"
+
+_unavailable_backends: set = set()
+
+
+def resolve_parser_backend(backend: Optional[str] = None) -> str:
+    """
+    Pick the BeautifulSoup tree builder to use.
+
+    Args:
+        backend: Requested backend (default: HTML_FIXER_PARSER_BACKEND)
+
+    Returns:
+        The backend if known and installed, otherwise "html.parser"
+    """
+    backend = backend or settings.HTML_FIXER_PARSER_BACKEND or DEFAULT_PARSER_BACKEND
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(
+            f"Unknown parser backend '{backend}', expected one of {PARSER_BACKENDS}"
+        )
+    if backend != DEFAULT_PARSER_BACKEND and builder_registry.lookup(backend) is None:
+        if backend not in _unavailable_backends:
+            _unavailable_backends.add(backend)
+            logger.warning(
+                f"Parser backend '{backend}' is not installed, using '{DEFAULT_PARSER_BACKEND}'"
+            )
+        return DEFAULT_PARSER_BACKEND
+    return backend
+
 
 class DOMParser:
     """
@@ -34,16 +83,19 @@ class DOMParser:
     - Parent chain analysis
     """
 
-    def __init__(self, html: str):
+    def __init__(self, html: str, backend: Optional[str] = None):
         """
         Initialize parser with HTML content.
 
         Args:
             html: Raw HTML string to parse
+            backend: BeautifulSoup tree builder (default: HTML_FIXER_PARSER_BACKEND)
         """
         self._html = html
-        self._soup = BeautifulSoup(html, "html.parser")
-        self._line_map = self._build_line_map()
+        self._backend = resolve_parser_backend(backend)
+        self._soup = BeautifulSoup(html, self._backend)
+        self._line_map: Optional[Dict[str, int]] = None
+        self._element_index = None
 
     @property
     def soup(self) -> BeautifulSoup:
@@ -55,6 +107,20 @@ class DOMParser:
         """Access the original HTML string."""
         return self._html
 
+    @property
+    def backend(self) -> str:
+        """Tree builder the document was parsed with."""
+        return self._backend
+
+    @property
+    def element_index(self) -> "ElementIndex":
+        """Per-element Tailwind facts of the document, built on first access."""
+        if self._element_index is None:
+            from .element_index import ElementIndex
+
+            self._element_index = ElementIndex(self)
+        return self._element_index
+
     # =========================================================================
     # ELEMENT SELECTION
     # =========================================================================
@@ -247,6 +313,8 @@ class DOMParser:
             return element.sourceline
 
         # Fallback: try to find in line map
+        if self._line_map is None:
+            self._line_map = self._build_line_map()
         element_str = str(element)[:50]  # First 50 chars
         return self._line_map.get(element_str)
 
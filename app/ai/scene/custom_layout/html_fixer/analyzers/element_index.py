@@ -0,0 +1,224 @@
+"""
+Element Index - Per-element Tailwind facts, computed once per document.
+
+InteractiveDetector, PointerBlockageDetector, ZIndexHierarchyBuilder and
+the classification pipeline all walk the same document and used to call
+TailwindAnalyzer.analyze_element on the same tags over and over (the
+pointer checks once per element/blocker pair and per ancestor).
+ElementIndex walks the tree once and records, for every Tag:
+- its class set and TailwindInfo (positioning flags, z-index...)
+- whether it is interactive (InteractiveDetector rules)
+- its pre-order interval [order, last]: `a` contains `b` iff
+  a.order <= b.order <= a.last, an O(1) descendant test
+- its containing block (nearest positioned ancestor) and nearest
+  pointer-events-none ancestor
+
+The index belongs to its DOMParser (DOMParser.element_index) and is built
+on first use, so a document shared through the DocumentCache is indexed
+once for the whole pipeline. It describes the tree as parsed: shared trees
+are read-only.
+
+Usage:
+======
+    index = parser.element_index
+
+    info = index.info(button)                   # TailwindInfo
+    for entry in index:
+        if entry.is_interactive and entry.info.z_index is None:
+            ...
+
+    index.is_descendant_of(button, container)   # Interval test, O(1)
+    index.containing_block(overlay)
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, TYPE_CHECKING
+
+from bs4 import Tag
+
+from ..contracts.validation import TailwindInfo
+from .interactive_detector import InteractiveDetector
+from .tailwind_analyzer import TailwindAnalyzer
+
+if TYPE_CHECKING:
+    from .dom_parser import DOMParser
+
+
+@dataclass(eq=False)
+class IndexedElement:
+    """Precomputed facts about one element of the document."""
+
+    element: Tag
+    """The BeautifulSoup Tag."""
+
+    order: int
+    """Position in document order (pre-order number)."""
+
+    last: int
+    """Pre-order number of the last descendant (`order` for a leaf)."""
+
+    info: TailwindInfo
+    """Tailwind analysis of the element (shared, do not modify)."""
+
+    is_interactive: bool
+    """Whether InteractiveDetector considers the element interactive."""
+
+    parent: Optional["IndexedElement"] = field(default=None, repr=False)
+    """Indexed parent (None below the document root)."""
+
+    containing_block: Optional[Tag] = None
+    """Nearest positioned ancestor (None: viewport)."""
+
+    pointer_none_ancestor: Optional[Tag] = None
+    """Nearest ancestor with pointer-events-none."""
+
+    def contains(self, other: "IndexedElement") -> bool:
+        """True if `other` is this element or one of its descendants."""
+        return self.order <= other.order <= self.last
+
+    @property
+    def classes(self) -> Set[str]:
+        """Class set of the element."""
+        return self.info.all_classes
+
+    @property
+    def z_index(self) -> Optional[int]:
+        """Tailwind z-index (None if not set)."""
+        return self.info.z_index
+
+
+class ElementIndex:
+    """
+    Single-pass index of the elements of a parsed document.
+
+    Usage:
+        index = ElementIndex(parser)        # Or parser.element_index
+        info = index.info(element)
+    """
+
+    def __init__(
+        self,
+        parser: "DOMParser",
+        analyzer: Optional[TailwindAnalyzer] = None,
+        detector: Optional[InteractiveDetector] = None,
+    ):
+        """
+        Index every element of the document.
+
+        Args:
+            parser: DOMParser of the document
+            analyzer: Tailwind analyzer (default: TailwindAnalyzer())
+            detector: Interactivity rules (default: InteractiveDetector())
+        """
+        self._analyzer = analyzer or TailwindAnalyzer()
+        self._detector = detector or InteractiveDetector()
+        self._root = parser.soup
+        self._entries: List[IndexedElement] = []
+        self._by_id: Dict[int, IndexedElement] = {}
+
+        for element in parser.get_all_elements():
+            order = len(self._entries)
+            entry = IndexedElement(
+                element=element,
+                order=order,
+                last=order,
+                info=self._analyzer.analyze_element(element),
+                is_interactive=self._detector.is_interactive(element),
+            )
+            self._link(entry, self._by_id.get(id(element.parent)))
+            self._entries.append(entry)
+            self._by_id[id(element)] = entry
+
+        # Close the intervals: children come after their parent
+        for entry in reversed(self._entries):
+            if entry.parent is not None and entry.last > entry.parent.last:
+                entry.parent.last = entry.last
+
+    def _link(self, entry: IndexedElement, parent: Optional[IndexedElement]) -> None:
+        """Derive the inherited facts of an entry from its parent."""
+        entry.parent = parent
+        if parent is None:
+            return
+        parent_info = parent.info
+        entry.containing_block = (
+            parent.element if parent_info.is_positioned else parent.containing_block
+        )
+        entry.pointer_none_ancestor = (
+            parent.element if parent_info.has_pointer_none else parent.pointer_none_ancestor
+        )
+
+    # =========================================================================
+    # LOOKUP
+    # =========================================================================
+
+    def get(self, element: Tag) -> IndexedElement:
+        """
+        Indexed facts of an element.
+
+        Tags outside the indexed tree (document root, detached copies) are
+        analyzed on demand and cached. The document root contains every
+        indexed element.
+        """
+        entry = self._by_id.get(id(element))
+        if entry is None:
+            last = len(self._entries) - 1 if element is self._root else -1
+            entry = IndexedElement(
+                element=element,
+                order=-1,
+                last=last,
+                info=self._analyzer.analyze_element(element),
+                is_interactive=self._detector.is_interactive(element),
+            )
+            self._link(entry, self._by_id.get(id(element.parent)))
+            self._by_id[id(element)] = entry
+        return entry
+
+    def info(self, element: Tag) -> TailwindInfo:
+        """TailwindInfo of an element."""
+        return self.get(element).info
+
+    @property
+    def elements(self) -> List[Tag]:
+        """All Tags, in document order."""
+        return [entry.element for entry in self._entries]
+
+    def interactive(self) -> List[IndexedElement]:
+        """Interactive elements, in document order."""
+        return [entry for entry in self._entries if entry.is_interactive]
+
+    # =========================================================================
+    # ANCESTRY
+    # =========================================================================
+
+    def is_descendant_of(self, element: Tag, ancestor: Tag) -> bool:
+        """True if `ancestor` is `element` or one of its ancestors (O(1))."""
+        if element is ancestor:
+            return True
+        entry = self.get(element)
+        return entry.order >= 0 and self.get(ancestor).contains(entry)
+
+    def containing_block(self, element: Tag) -> Optional[Tag]:
+        """Nearest positioned ancestor of an element (None: viewport)."""
+        return self.get(element).containing_block
+
+    def pointer_none_ancestor(self, element: Tag) -> Optional[Tag]:
+        """Nearest ancestor with pointer-events-none, if any."""
+        return self.get(element).pointer_none_ancestor
+
+    def parent_chain(self, element: Tag) -> List[Tag]:
+        """Ancestors of an element, nearest first (document root excluded)."""
+        chain = []
+        parent = self.get(element).parent
+        while parent is not None:
+            chain.append(parent.element)
+            parent = parent.parent
+        return chain
+
+    def __iter__(self) -> Iterator[IndexedElement]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ElementIndex({len(self._entries)} elements)"
@@ -174,18 +174,19 @@ class InteractiveDetector:
         """
         results = []
 
-        for element in parser.get_all_elements():
-            if self.is_interactive(element):
-                info = InteractiveElement(
-                    element=element,
-                    interaction_type=self.get_interaction_type(element),
-                    selector=parser.generate_selector(element),
-                    has_handler=self._has_event_handler(element),
-                    is_form_element=self._is_form_element(element),
-                    is_link=self._is_link(element),
-                    is_disabled=self._is_disabled(element),
-                )
-                results.append(info)
+        # Interactivity is precomputed by the document's ElementIndex
+        for entry in parser.element_index.interactive():
+            element = entry.element
+            info = InteractiveElement(
+                element=element,
+                interaction_type=self.get_interaction_type(element),
+                selector=parser.generate_selector(element),
+                has_handler=self._has_event_handler(element),
+                is_form_element=self._is_form_element(element),
+                is_link=self._is_link(element),
+                is_disabled=self._is_disabled(element),
+            )
+            results.append(info)
 
         return results
 
@@ -17,15 +17,23 @@ Usage:
 
     blocker = PointerBlockageDetector()
     blockages = blocker.find_blocked_elements(parser, interactive)
+
+Tailwind facts (classes, positioning, z-index, containing block, ancestry)
+come from the document's ElementIndex (parser.element_index). Blockers are
+grouped once per document (_BlockerIndex) so each interactive element only
+looks at the overlays scoped to its positioned ancestors and finds z-index
+conflicts by bisection, instead of checking every element/blocker pair.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from bs4 import Tag
 
 from .dom_parser import DOMParser
+from .element_index import ElementIndex, IndexedElement
 from .tailwind_analyzer import TailwindAnalyzer
 from .interactive_detector import InteractiveElement
 
@@ -90,6 +98,83 @@ class BlockageInfo:
         return "\n".join(lines)
 
 
+class _FirstAbove:
+    """
+    Blockers in document order, answering "first one with z-index > z".
+
+    Prefix maxima of the z-indexes are non-decreasing, so the first blocker
+    above a z-index is found by bisection instead of a scan.
+    """
+
+    def __init__(self):
+        self._entries: List[IndexedElement] = []
+        self._prefix_max: List[int] = []
+
+    def add(self, entry: IndexedElement) -> None:
+        """Append a blocker (callers add them in document order)."""
+        z = entry.info.z_index or 0
+        self._prefix_max.append(max(z, self._prefix_max[-1]) if self._prefix_max else z)
+        self._entries.append(entry)
+
+    def first_above(self, z: int) -> Optional[IndexedElement]:
+        """First blocker whose z-index is strictly greater than z."""
+        i = bisect_right(self._prefix_max, z)
+        return self._entries[i] if i < len(self._entries) else None
+
+
+class _BlockerIndex:
+    """
+    Potential blockers of a document grouped for per-element queries.
+
+    - Blocking overlays by scope: fixed or unscoped overlays cover every
+      element; absolute ones only cover their containing block, so an
+      element only meets the overlays scoped to itself or one of its
+      positioned ancestors.
+    - Z-index candidates by overlap rule (covering, fixed, absolute
+      siblings), each a _FirstAbove.
+    """
+
+    def __init__(self, blockers: List[Tag], index: ElementIndex, detector: "PointerBlockageDetector"):
+        self._index = index
+        self.global_overlays: List[IndexedElement] = []
+        self.scoped_overlays: Dict[int, List[IndexedElement]] = {}
+
+        self.all = _FirstAbove()
+        self.covering = _FirstAbove()
+        self.fixed = _FirstAbove()
+        self.absolute_by_parent: Dict[int, _FirstAbove] = {}
+
+        for blocker in blockers:
+            entry = index.get(blocker)
+            info = entry.info
+
+            if detector._is_blocking_overlay(blocker, index):
+                container = None if info.has_fixed else entry.containing_block
+                if container is None:
+                    self.global_overlays.append(entry)
+                else:
+                    self.scoped_overlays.setdefault(id(container), []).append(entry)
+
+            self.all.add(entry)
+            if "inset-0" in info.all_classes:
+                self.covering.add(entry)
+            if info.has_fixed:
+                self.fixed.add(entry)
+            if info.has_absolute:
+                self.absolute_by_parent.setdefault(id(blocker.parent), _FirstAbove()).add(entry)
+
+    def overlays_covering(self, entry: IndexedElement) -> List[IndexedElement]:
+        """Blocking overlays whose scope contains the element."""
+        overlays = list(self.global_overlays)
+        # The element itself, then its positioned ancestors
+        scope: Optional[IndexedElement] = entry
+        while scope is not None:
+            overlays.extend(self.scoped_overlays.get(id(scope.element), ()))
+            container = scope.containing_block
+            scope = self._index.get(container) if container is not None else None
+        return overlays
+
+
 class PointerBlockageDetector:
     """
     Detects elements that block pointer events.
@@ -127,11 +212,12 @@ class PointerBlockageDetector:
 
         # Find all potential blockers (overlays, high z-index elements)
         potential_blockers = self._find_potential_blockers(parser)
+        blockers = _BlockerIndex(potential_blockers, parser.element_index, self)
 
         for item in interactive:
             # Check overlay blockage
             overlay_blockage = self._check_overlay_blockage(
-                item.element, potential_blockers, parser
+                item.element, blockers, parser
             )
             if overlay_blockage:
                 blockages.append(overlay_blockage)
@@ -139,7 +225,7 @@ class PointerBlockageDetector:
 
             # Check z-index conflicts
             zindex_blockage = self._check_zindex_blockage(
-                item.element, potential_blockers, parser
+                item.element, blockers, parser
             )
             if zindex_blockage:
                 blockages.append(zindex_blockage)
@@ -169,8 +255,9 @@ class PointerBlockageDetector:
         """
         blockers = []
 
-        for element in parser.get_all_elements():
-            info = self._analyzer.analyze_element(element)
+        for entry in parser.element_index:
+            element = entry.element
+            info = entry.info
             classes = info.all_classes
 
             # Skip if has pointer-events-none (pass-through)
@@ -198,66 +285,52 @@ class PointerBlockageDetector:
     def _check_overlay_blockage(
         self,
         element: Tag,
-        potential_blockers: List[Tag],
+        blockers: _BlockerIndex,
         parser: DOMParser,
     ) -> Optional[BlockageInfo]:
         """
         Check if element is blocked by an overlay.
 
+        Only the overlays whose containing block holds the element are
+        considered (see _BlockerIndex).
+
         Args:
             element: Element to check
-            potential_blockers: List of potential blocking elements
+            blockers: Potential blocking elements of the document
             parser: DOMParser instance
 
         Returns:
             BlockageInfo if blocked, None otherwise
         """
-        element_info = self._analyzer.analyze_element(element)
-        element_z = element_info.z_index or 0
+        entry = parser.element_index.get(element)
+        element_z = entry.info.z_index or 0
 
-        best: Optional[Tuple[Tag, str, int, Optional[int]]] = None
-        # Tuple: (blocker_tag, blocker_selector, line_number, blocker_z)
+        best: Optional[Tuple[int, int, int]] = None
+        best_blocker: Optional[Tag] = None
+        # Key: (blocker_z, line_number, -document_order)
 
-        for blocker in potential_blockers:
+        for blocker in blockers.overlays_covering(entry):
             # Skip self
-            if blocker == element:
+            if blocker.element is element:
                 continue
 
-            blocker_info = self._analyzer.analyze_element(blocker)
-
-            # Check if blocker is an overlay
-            if not self._is_blocking_overlay(blocker):
+            # Overlay at same or higher z-index blocks
+            blocker_z = blocker.info.z_index or 0
+            if blocker_z < element_z:
                 continue
 
-            # Overlay scope: absolute inset-0 overlays only cover their containing block.
-            # Avoid false positives where an overlay in one section "blocks" buttons in another.
-            if not blocker_info.has_fixed:
-                container = self._find_containing_block(blocker)
-                if container is not None and not self._is_descendant_of(element, container):
-                    continue
+            # Prefer highest z-index; tie-break by later appearance in DOM
+            # (line number), then by first in document order
+            line = parser.get_source_line(blocker.element) or 0
+            key = (blocker_z, line, -blocker.order)
+            if best is None or key > best:
+                best = key
+                best_blocker = blocker.element
 
-            # Check z-index relationship
-            blocker_z = blocker_info.z_index or 0
-
-            # Overlay at same or higher z-index blocks
-            if blocker_z >= element_z:
-                # Check if they share context (same container)
-                if self._share_stacking_context(element, blocker):
-                    selector = parser.generate_selector(blocker)
-                    line = parser.get_source_line(blocker) or 0
-                    if best is None:
-                        best = (blocker, selector, line, blocker_z)
-                    else:
-                        _, _, best_line, best_z = best
-                        best_z_val = best_z or 0
-                        # Prefer highest z-index; tie-break by later appearance in DOM (line number)
-                        if (blocker_z, line) > (best_z_val, best_line):
-                            best = (blocker, selector, line, blocker_z)
-
-        if best is None:
+        if best_blocker is None:
             return None
 
-        best_blocker, best_selector, _, _ = best
+        best_selector = parser.generate_selector(best_blocker)
         blocked_selector = parser.generate_selector(element)
 
         return BlockageInfo(
@@ -275,49 +348,58 @@ class PointerBlockageDetector:
     def _check_zindex_blockage(
         self,
         element: Tag,
-        potential_blockers: List[Tag],
+        blockers: _BlockerIndex,
         parser: DOMParser,
     ) -> Optional[BlockageInfo]:
         """
         Check if element is blocked by z-index conflict.
 
+        Reports the first blocker in document order with a higher z-index
+        that may overlap the element. Without computed positions, elements
+        may overlap when either covers its area (inset-0), both are fixed,
+        or both are absolute siblings; each rule is one _FirstAbove lookup.
+
         Args:
             element: Element to check
-            potential_blockers: List of potential blocking elements
+            blockers: Potential blocking elements of the document
             parser: DOMParser instance
 
         Returns:
             BlockageInfo if blocked, None otherwise
         """
-        element_info = self._analyzer.analyze_element(element)
-        element_z = element_info.z_index or 0
-
-        for blocker in potential_blockers:
-            if blocker == element:
-                continue
-
-            blocker_info = self._analyzer.analyze_element(blocker)
-            blocker_z = blocker_info.z_index or 0
+        index = parser.element_index
+        info = index.info(element)
+        element_z = info.z_index or 0
+
+        if "inset-0" in info.all_classes:
+            candidates = [blockers.all.first_above(element_z)]
+        else:
+            candidates = [blockers.covering.first_above(element_z)]
+            if info.has_fixed:
+                candidates.append(blockers.fixed.first_above(element_z))
+            if info.has_absolute and id(element.parent) in blockers.absolute_by_parent:
+                candidates.append(
+                    blockers.absolute_by_parent[id(element.parent)].first_above(element_z)
+                )
 
-            # Only check elements with higher z-index
-            if blocker_z <= element_z:
-                continue
+        found = [c for c in candidates if c is not None]
+        if not found:
+            return None
 
-            # Check if they might overlap
-            if self._elements_may_overlap(element, blocker):
-                return BlockageInfo(
-                    blocked_element=element,
-                    blocking_element=blocker,
-                    reason=BlockageReason.ZINDEX_CONFLICT,
-                    blocked_selector=parser.generate_selector(element),
-                    blocking_selector=parser.generate_selector(blocker),
-                    suggested_fix=(
-                        f"Increase z-index on {parser.generate_selector(element)} "
-                        f"to z-{blocker_z + 10} or higher"
-                    ),
-                )
+        blocker = min(found, key=lambda c: c.order)
+        blocker_z = blocker.info.z_index or 0
 
-        return None
+        return BlockageInfo(
+            blocked_element=element,
+            blocking_element=blocker.element,
+            reason=BlockageReason.ZINDEX_CONFLICT,
+            blocked_selector=parser.generate_selector(element),
+            blocking_selector=parser.generate_selector(blocker.element),
+            suggested_fix=(
+                f"Increase z-index on {parser.generate_selector(element)} "
+                f"to z-{blocker_z + 10} or higher"
+            ),
+        )
 
     def _check_parent_pointer_none(
         self,
@@ -334,30 +416,25 @@ class PointerBlockageDetector:
         Returns:
             BlockageInfo if blocked by parent, None otherwise
         """
-        element_info = self._analyzer.analyze_element(element)
+        entry = parser.element_index.get(element)
 
         # If element has pointer-events-auto, it overrides parent
-        if element_info.has_pointer_auto:
+        if entry.info.has_pointer_auto:
             return None
 
-        # Check parent chain
-        parent = element.parent
-        while parent and isinstance(parent, Tag):
-            parent_info = self._analyzer.analyze_element(parent)
-
-            if parent_info.has_pointer_none:
-                return BlockageInfo(
-                    blocked_element=element,
-                    blocking_element=parent,
-                    reason=BlockageReason.PARENT_POINTER_NONE,
-                    blocked_selector=parser.generate_selector(element),
-                    blocking_selector=parser.generate_selector(parent),
-                    suggested_fix=(
-                        f"Add 'pointer-events-auto' to {parser.generate_selector(element)}"
-                    ),
-                )
-
-            parent = parent.parent
+        # Nearest ancestor with pointer-events-none (precomputed)
+        parent = entry.pointer_none_ancestor
+        if parent is not None:
+            return BlockageInfo(
+                blocked_element=element,
+                blocking_element=parent,
+                reason=BlockageReason.PARENT_POINTER_NONE,
+                blocked_selector=parser.generate_selector(element),
+                blocking_selector=parser.generate_selector(parent),
+                suggested_fix=(
+                    f"Add 'pointer-events-auto' to {parser.generate_selector(element)}"
+                ),
+            )
 
         return None
 
@@ -365,17 +442,18 @@ class PointerBlockageDetector:
     # HELPER METHODS
     # =========================================================================
 
-    def _is_blocking_overlay(self, element: Tag) -> bool:
+    def _is_blocking_overlay(self, element: Tag, index: ElementIndex) -> bool:
         """
         Check if element is an overlay that blocks clicks.
 
         Args:
             element: BeautifulSoup Tag
+            index: ElementIndex of the document
 
         Returns:
             True if element is a blocking overlay
         """
-        info = self._analyzer.analyze_element(element)
+        info = index.info(element)
         classes = info.all_classes
 
         # Must be positioned and covering
@@ -391,107 +469,6 @@ class PointerBlockageDetector:
 
         return True
 
-    def _share_stacking_context(self, el1: Tag, el2: Tag) -> bool:
-        """
-        Check if two elements share a stacking context.
-
-        Elements in same stacking context can potentially overlap.
-
-        Args:
-            el1: First element
-            el2: Second element
-
-        Returns:
-            True if elements might be in same stacking context
-        """
-        info2 = self._analyzer.analyze_element(el2)
-        # Fixed overlays can block across the viewport
-        if info2.has_fixed:
-            return True
-
-        # Absolute inset-0 overlays only cover their containing block
-        container = self._find_containing_block(el2)
-        if container is None:
-            return True
-
-        return self._is_descendant_of(el1, container)
-
-    def _find_containing_block(self, element: Tag) -> Optional[Tag]:
-        """
-        Find the nearest positioned ancestor that acts as the containing block.
-
-        For absolute positioned elements, this is the nearest ancestor with
-        position != static (relative/absolute/fixed in Tailwind terms).
-        Returns None if not found (treat as global scope).
-        """
-        current = element.parent
-        while current and isinstance(current, Tag):
-            info = self._analyzer.analyze_element(current)
-            if info.is_positioned:
-                return current
-            current = current.parent
-        return None
-
-    def _is_descendant_of(self, element: Tag, ancestor: Tag) -> bool:
-        """Return True if `ancestor` is in `element`'s parent chain."""
-        current = element
-        while current and isinstance(current, Tag):
-            if current == ancestor:
-                return True
-            current = current.parent
-        return False
-
-    def _get_parent_chain(self, element: Tag) -> Set[Tag]:
-        """
-        Get set of all parent elements.
-
-        Args:
-            element: Starting element
-
-        Returns:
-            Set of parent Tags
-        """
-        parents = set()
-        current = element.parent
-        while current and isinstance(current, Tag):
-            parents.add(current)
-            current = current.parent
-        return parents
-
-    def _elements_may_overlap(self, el1: Tag, el2: Tag) -> bool:
-        """
-        Check if two elements may visually overlap.
-
-        This is a heuristic since we don't have actual positions.
-
-        Args:
-            el1: First element
-            el2: Second element
-
-        Returns:
-            True if elements might overlap
-        """
-        info1 = self._analyzer.analyze_element(el1)
-        info2 = self._analyzer.analyze_element(el2)
-
-        classes1 = info1.all_classes
-        classes2 = info2.all_classes
-
-        # Full-coverage elements overlap with everything
-        if "inset-0" in classes1 or "inset-0" in classes2:
-            return True
-
-        # Both fixed means they share viewport space
-        if info1.has_fixed and info2.has_fixed:
-            return True
-
-        # Same parent with absolute positioning
-        if el1.parent == el2.parent:
-            if info1.has_absolute and info2.has_absolute:
-                return True
-
-        return False
-
     def check_pointer_inheritance(self, element: Tag) -> bool:
         """
         Check if element can receive pointer events.
@@ -536,10 +513,11 @@ class PointerBlockageDetector:
             List of blocking overlays
         """
         overlays = []
+        index = parser.element_index
 
-        for element in parser.get_all_elements():
-            if self._is_blocking_overlay(element):
-                overlays.append(element)
+        for entry in index:
+            if self._is_blocking_overlay(entry.element, index):
+                overlays.append(entry.element)
 
         return overlays
 
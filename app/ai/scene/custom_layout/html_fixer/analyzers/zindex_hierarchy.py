@@ -14,13 +14,20 @@ Usage:
     builder = ZIndexHierarchyBuilder()
     hierarchy = builder.build_hierarchy(parser)
     conflicts = builder.find_conflicts()
+
+Element facts come from the document's ElementIndex (parser.element_index)
+once a hierarchy is built; contexts are keyed by element identity. The
+context every element is painted in is recorded while building (one pass),
+and conflict queries only pair contexts that may overlap.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 
 from bs4 import Tag
 
+from ..contracts.validation import TailwindInfo
 from .dom_parser import DOMParser
 from .tailwind_analyzer import TailwindAnalyzer
 
@@ -83,8 +90,10 @@ class ZIndexHierarchyBuilder:
         self._analyzer = TailwindAnalyzer()
         self._parser: Optional[DOMParser] = None
         self._root: Optional[StackingContext] = None
-        self._element_map: Dict[Tag, StackingContext] = {}
+        self._element_map: Dict[int, StackingContext] = {}  # id(element) -> context
+        self._enclosing: Dict[int, Optional[StackingContext]] = {}  # id(element) -> painted in
         self._zindex_groups: Dict[int, List[StackingContext]] = {}
+        self._overlays_by_z: Optional[Dict[int, List[Tag]]] = None
 
     @property
     def root(self) -> Optional[StackingContext]:
@@ -107,7 +116,9 @@ class ZIndexHierarchyBuilder:
         """
         self._parser = parser
         self._element_map = {}
+        self._enclosing = {}
         self._zindex_groups = {}
+        self._overlays_by_z = None
 
         # Create root context (document body)
         body = parser.get_element_by_selector("body")
@@ -121,11 +132,11 @@ class ZIndexHierarchyBuilder:
             z_index=0,
             depth=0,
         )
-        self._element_map[body] = self._root
+        self._element_map[id(body)] = self._root
         self._add_to_zindex_group(self._root)
 
         # Build tree recursively
-        self._build_subtree(parser.get_all_elements(), self._root)
+        self._build_subtree(parser.element_index.elements, self._root)
 
         return self._root
 
@@ -143,12 +154,13 @@ class ZIndexHierarchyBuilder:
         """
         for element in elements:
             # Skip already processed
-            if element in self._element_map:
+            if id(element) in self._element_map:
+                self._enclosing[id(element)] = self._element_map[id(element)]
                 continue
 
             # Check if element creates a stacking context
             if self._creates_stacking_context(element):
-                info = self._analyzer.analyze_element(element)
+                info = self._info(element)
 
                 context = StackingContext(
                     element=element,
@@ -167,8 +179,11 @@ class ZIndexHierarchyBuilder:
                 else:
                     parent_context.children.append(context)
 
-                self._element_map[element] = context
+                self._element_map[id(element)] = context
                 self._add_to_zindex_group(context)
+                self._enclosing[id(element)] = context
+            else:
+                self._enclosing[id(element)] = self._find_parent_context(element)
 
     def _creates_stacking_context(self, element: Tag) -> bool:
         """
@@ -186,7 +201,7 @@ class ZIndexHierarchyBuilder:
         Returns:
             True if element creates stacking context
         """
-        info = self._analyzer.analyze_element(element)
+        info = self._info(element)
 
         # Position + z-index
         if info.is_positioned and info.z_index is not None:
@@ -218,8 +233,12 @@ class ZIndexHierarchyBuilder:
         """
         parent = element.parent
         while parent:
-            if parent in self._element_map:
-                return self._element_map[parent]
+            # Elements already visited record the context they are painted in
+            if id(parent) in self._enclosing:
+                return self._enclosing[id(parent)]
+            context = self._element_map.get(id(parent))
+            if context is not None:
+                return context
             parent = parent.parent
         return None
 
@@ -263,10 +282,10 @@ class ZIndexHierarchyBuilder:
         Returns:
             List of elements above this one
         """
-        if element not in self._element_map:
+        if id(element) not in self._element_map:
             return []
 
-        target_z = self._element_map[element].effective_z_index
+        target_z = self._element_map[id(element)].effective_z_index
         results = []
 
         for z, contexts in self._zindex_groups.items():
@@ -285,10 +304,10 @@ class ZIndexHierarchyBuilder:
         Returns:
             List of elements below this one
         """
-        if element not in self._element_map:
+        if id(element) not in self._element_map:
             return []
 
-        target_z = self._element_map[element].effective_z_index
+        target_z = self._element_map[id(element)].effective_z_index
         results = []
 
         for z, contexts in self._zindex_groups.items():
@@ -307,17 +326,17 @@ class ZIndexHierarchyBuilder:
         Returns:
             List of elements at same z-index (excluding target)
         """
-        if element not in self._element_map:
+        if id(element) not in self._element_map:
             return []
 
-        target_z = self._element_map[element].effective_z_index
+        target_z = self._element_map[id(element)].effective_z_index
 
         if target_z not in self._zindex_groups:
             return []
 
         return [
             ctx.element for ctx in self._zindex_groups[target_z]
-            if ctx.element != element
+            if ctx.element is not element
         ]
 
     def get_zindex_for_element(self, element: Tag) -> Optional[int]:
@@ -330,10 +349,25 @@ class ZIndexHierarchyBuilder:
         Returns:
             Z-index value or None
         """
-        if element in self._element_map:
-            return self._element_map[element].z_index
+        if id(element) in self._element_map:
+            return self._element_map[id(element)].z_index
         return None
 
+    def get_stacking_context(self, element: Tag) -> Optional[StackingContext]:
+        """
+        Get the stacking context an element is painted in.
+
+        Args:
+            element: Target element
+
+        Returns:
+            The element's own context if it creates one, else the nearest
+            ancestor's (root if none); None if no hierarchy was built
+        """
+        if id(element) in self._element_map:
+            return self._element_map[id(element)]
+        return self._find_parent_context(element) or self._root
+
     # =========================================================================
     # CONFLICT DETECTION
     # =========================================================================
@@ -356,13 +390,39 @@ class ZIndexHierarchyBuilder:
         for z, contexts in self._zindex_groups.items():
             if len(contexts) > 1:
                 # Multiple elements at same z-index
-                for i, ctx1 in enumerate(contexts):
-                    for ctx2 in contexts[i + 1:]:
-                        if self._may_overlap(ctx1.element, ctx2.element):
-                            conflicts.append((ctx1.element, ctx2.element))
+                conflicts.extend(self._overlapping_pairs(contexts))
 
         return conflicts
 
+    def _overlapping_pairs(self, contexts: List[StackingContext]) -> List[Tuple[Tag, Tag]]:
+        """
+        Pairs of contexts that may overlap (_may_overlap), in pairwise order.
+
+        Contexts are bucketed by overlap rule (covering, fixed, absolute),
+        so only pairs that overlap are visited.
+        """
+        infos = [self._info(ctx.element) for ctx in contexts]
+        covering = [i for i, info in enumerate(infos) if "inset-0" in info.all_classes]
+        fixed = [i for i, info in enumerate(infos) if info.has_fixed]
+        absolute = [i for i, info in enumerate(infos) if info.has_absolute]
+
+        pairs = []
+        for i, info in enumerate(infos):
+            if "inset-0" in info.all_classes:
+                partners = range(i + 1, len(contexts))
+            else:
+                buckets = [covering]
+                if info.has_fixed:
+                    buckets.append(fixed)
+                if info.has_absolute:
+                    buckets.append(absolute)
+                partners = sorted({
+                    j for bucket in buckets for j in bucket[bisect_right(bucket, i):]
+                })
+            pairs.extend((contexts[i].element, contexts[j].element) for j in partners)
+
+        return pairs
+
     def find_interactive_below_overlay(
         self, interactive_elements: List[Tag]
     ) -> List[Tuple[Tag, Tag]]:
@@ -377,11 +437,20 @@ class ZIndexHierarchyBuilder:
         """
         conflicts = []
 
+        if self._overlays_by_z is None:
+            self._overlays_by_z = {
+                z: [ctx.element for ctx in contexts if self._is_potential_overlay(ctx.element)]
+                for z, contexts in self._zindex_groups.items()
+            }
+
         for element in interactive_elements:
-            above = self.get_elements_above(element)
-            for other in above:
-                if self._is_potential_overlay(other):
-                    conflicts.append((element, other))
+            context = self._element_map.get(id(element))
+            if context is None:
+                continue
+            target_z = context.effective_z_index
+            for z, overlays in self._overlays_by_z.items():
+                if z > target_z:
+                    conflicts.extend((element, other) for other in overlays)
 
         return conflicts
 
@@ -399,8 +468,8 @@ class ZIndexHierarchyBuilder:
         Returns:
             True if elements might overlap
         """
-        info1 = self._analyzer.analyze_element(el1)
-        info2 = self._analyzer.analyze_element(el2)
+        info1 = self._info(el1)
+        info2 = self._info(el2)
 
         # Fixed/absolute positioned elements likely overlap
         if info1.has_fixed and info2.has_fixed:
@@ -427,7 +496,7 @@ class ZIndexHierarchyBuilder:
         Returns:
             True if element looks like an overlay
         """
-        info = self._analyzer.analyze_element(element)
+        info = self._info(element)
 
         # Must be positioned
         if not (info.has_absolute or info.has_fixed):
@@ -444,6 +513,12 @@ class ZIndexHierarchyBuilder:
     # UTILITIES
     # =========================================================================
 
+    def _info(self, element: Tag) -> TailwindInfo:
+        """TailwindInfo of an element, from the ElementIndex once built."""
+        if self._parser is not None:
+            return self._parser.element_index.info(element)
+        return self._analyzer.analyze_element(element)
+
     def get_sorted_zindexes(self) -> List[int]:
         """
         Get all z-index values in sorted order.
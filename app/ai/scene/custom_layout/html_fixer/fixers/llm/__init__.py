@@ -42,6 +42,7 @@ from .validators import (
 
 # Appliers
 from .js_patch_applier import JSPatchApplier, ApplyResult
+from .patch_engine import PatchEngine, PatchBatch, PatchOutcome, BatchApplyResult
 
 __all__ = [
     # Main class
@@ -63,4 +64,8 @@ __all__ = [
     # Appliers
     "JSPatchApplier",
     "ApplyResult",
+    "PatchEngine",
+    "PatchBatch",
+    "PatchOutcome",
+    "BatchApplyResult",
 ]
@@ -2,6 +2,10 @@
 JSPatchApplier - Applies JavaScript patches to HTML.
 
 Sprint 6: Modifies <script> tags and event handlers based on JSPatch objects.
+
+All patches are applied to one copy of the cached parse of the input HTML
+(DocumentCache), serialized once; the shared tree is never modified.
+apply_to_soup applies a patch to a caller-owned tree (PatchEngine).
 """
 
 import logging
@@ -11,6 +15,7 @@ from typing import List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
+from ...analyzers.document_cache import DocumentCache, get_document_cache
 from .contracts.js_patch import JSPatch, JSPatchType
 
 logger = logging.getLogger(__name__)
@@ -62,6 +67,15 @@ class JSPatchApplier:
     - ADD_VARIABLE: Add variable declaration
     """
 
+    def __init__(self, documents: Optional[DocumentCache] = None):
+        """
+        Initialize the applier.
+
+        Args:
+            documents: Parsed-document cache (default: shared cache)
+        """
+        self._documents = documents or get_document_cache()
+
     def apply(self, html: str, patches: List[JSPatch]) -> ApplyResult:
         """
         Apply all JavaScript patches to HTML.
@@ -73,15 +87,13 @@ class JSPatchApplier:
         Returns:
             ApplyResult with modified HTML and status
         """
-        current_html = html
+        soup = self._documents.clone(html) if patches else None
         applied = []
         failed = []
 
         for patch in patches:
             try:
-                result = self._apply_single(current_html, patch)
-                if result:
-                    current_html = result
+                if self.apply_to_soup(soup, patch):
                     applied.append(patch)
                     logger.debug(f"Applied patch: {patch.describe()}")
                 else:
@@ -93,24 +105,22 @@ class JSPatchApplier:
 
         return ApplyResult(
             success=len(applied) > 0,
-            html=current_html,
+            html=str(soup) if applied else html,
             applied=applied,
             failed=failed,
         )
 
-    def _apply_single(self, html: str, patch: JSPatch) -> Optional[str]:
+    def apply_to_soup(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
-        Apply a single patch to HTML.
+        Apply a single patch to a parsed document, in place.
 
         Args:
-            html: Current HTML content
+            soup: Document to modify (owned by the caller, not shared)
             patch: The patch to apply
 
         Returns:
-            Modified HTML or None if patch couldn't be applied
+            True if the patch modified the document
         """
-        soup = BeautifulSoup(html, "html.parser")
-
         if patch.patch_type == JSPatchType.ADD_FUNCTION:
             return self._add_function(soup, patch)
 
@@ -130,9 +140,9 @@ class JSPatchApplier:
             return self._add_variable(soup, patch)
 
         logger.warning(f"Unknown patch type: {patch.patch_type}")
-        return None
+        return False
 
-    def _add_function(self, soup: BeautifulSoup, patch: JSPatch) -> Optional[str]:
+    def _add_function(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
         Add a new function to the last script block.
 
@@ -165,16 +175,16 @@ class JSPatchApplier:
             else:
                 soup.append(new_script)
 
-        return str(soup)
+        return True
 
-    def _replace_function(self, soup: BeautifulSoup, patch: JSPatch) -> Optional[str]:
+    def _replace_function(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
         Replace an existing function definition.
 
         Searches all inline scripts for the function and replaces it.
         """
         if not patch.function_name:
-            return None
+            return False
 
         # Pattern to match function definition
         # Handles: function name(), const name = function(), const name = () =>
@@ -205,20 +215,20 @@ class JSPatchApplier:
                 break
 
         if modified:
-            return str(soup)
+            return True
 
         # Function not found - fall back to adding it
         logger.info(f"Function '{patch.function_name}' not found, adding instead")
         return self._add_function(soup, patch)
 
-    def _fix_dom_reference(self, soup: BeautifulSoup, patch: JSPatch) -> Optional[str]:
+    def _fix_dom_reference(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
         Replace old DOM ID reference with new one in all scripts.
 
         Handles getElementById, querySelector, etc.
         """
         if not patch.old_reference or not patch.new_reference:
-            return None
+            return False
 
         modified = False
 
@@ -254,23 +264,20 @@ class JSPatchApplier:
             if new_content != content:
                 script.string = new_content
 
-        if modified:
-            return str(soup)
-
-        return None
+        return modified
 
-    def _modify_handler(self, soup: BeautifulSoup, patch: JSPatch) -> Optional[str]:
+    def _modify_handler(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
         Modify an onclick/onchange/etc. attribute on an element.
         """
         if not patch.selector or not patch.new_handler:
-            return None
+            return False
 
         try:
             elements = soup.select(patch.selector)
             if not elements:
                 logger.warning(f"Selector '{patch.selector}' not found")
-                return None
+                return False
 
             element = elements[0]
 
@@ -283,43 +290,43 @@ class JSPatchApplier:
                         continue
 
                     element[attr] = patch.new_handler
-                    return str(soup)
+                    return True
 
             # No existing handler found - add onclick
             element["onclick"] = patch.new_handler
-            return str(soup)
+            return True
 
         except Exception as e:
             logger.error(f"Error modifying handler: {e}")
-            return None
+            return False
 
-    def _fix_syntax(self, soup: BeautifulSoup, patch: JSPatch) -> Optional[str]:
+    def _fix_syntax(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
         Fix syntax error at specific line in a script.
 
         Replaces lines from line_start to line_end with replacement_code.
         """
         if patch.script_index is None or patch.line_start is None:
-            return None
+            return False
 
         scripts = soup.find_all("script")
         inline_scripts = [s for s in scripts if not s.get("src")]
 
         if patch.script_index >= len(inline_scripts):
             logger.warning(f"Script index {patch.script_index} out of range")
-            return None
+            return False
 
         script = inline_scripts[patch.script_index]
         content = script.string
         if not content:
-            return None
+            return False
 
         lines = content.split("\n")
         line_end = patch.line_end if patch.line_end is not None else patch.line_start
 
         if patch.line_start < 1 or patch.line_start > len(lines):
             logger.warning(f"Line {patch.line_start} out of range")
-            return None
+            return False
 
         # Replace lines (1-indexed in patch, 0-indexed in list)
         start_idx = patch.line_start - 1
@@ -328,14 +335,14 @@ class JSPatchApplier:
         new_lines = lines[:start_idx] + [patch.replacement_code] + lines[end_idx:]
         script.string = "\n".join(new_lines)
 
-        return str(soup)
+        return True
 
-    def _add_variable(self, soup: BeautifulSoup, patch: JSPatch) -> Optional[str]:
+    def _add_variable(self, soup: BeautifulSoup, patch: JSPatch) -> bool:
         """
         Add a variable declaration to the beginning of the first script.
         """
         if not patch.function_code:
-            return None
+            return False
 
         scripts = soup.find_all("script")
         inline_scripts = [s for s in scripts if not s.get("src")]
@@ -360,4 +367,4 @@ class JSPatchApplier:
             else:
                 soup.append(new_script)
 
-        return str(soup)
+        return True
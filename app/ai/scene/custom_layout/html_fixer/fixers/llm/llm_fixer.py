@@ -3,6 +3,10 @@ LLMFixer - Orchestrates LLM-based HTML repairs.
 
 Sprint 6: Main orchestrator that coordinates prompt builders, LLM calls,
 validation, and patch application for both Tailwind and JavaScript fixes.
+
+Context extraction, patch validation and patch application read the HTML
+from one shared parse (DocumentCache). Tailwind and JS patches of a fix
+are applied to one tree (PatchEngine) and serialized once.
 """
 
 import logging
@@ -12,11 +16,10 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 
 from app.core.config import settings
 
-from bs4 import BeautifulSoup
-
+from ...analyzers.document_cache import DocumentCache, get_document_cache
 from ...contracts.errors import ErrorType
 from ...contracts.validation import ClassifiedError
-from ...contracts.patches import TailwindPatch, PatchSet
+from ...contracts.patches import TailwindPatch
 from ...contracts.feedback import MergedError
 from ...fixers.tailwind_injector import TailwindInjector
 from ...prompts.fixer_prompt_v2 import FeedbackAwareLLMPrompt
@@ -27,6 +30,7 @@ from .prompt_builders.tailwind_prompt_builder import TailwindPromptBuilder
 from .prompt_builders.js_prompt_builder import JSPromptBuilder
 from .validators.patch_validator import PatchValidator
 from .js_patch_applier import JSPatchApplier
+from .patch_engine import PatchEngine
 
 if TYPE_CHECKING:
     from app.ai.providers.gemini import GeminiProvider
@@ -104,6 +108,7 @@ class LLMFixer:
         js_builder: JSPromptBuilder = None,
         validator: PatchValidator = None,
         max_retries: int = 2,
+        documents: Optional[DocumentCache] = None,
     ):
         """
         Initialize the LLM fixer.
@@ -114,7 +119,10 @@ class LLMFixer:
             js_builder: Custom JS prompt builder
             validator: Custom patch validator
             max_retries: Maximum retry attempts per domain
+            documents: Parsed-document cache (default: shared cache)
         """
+        self._documents = documents or get_document_cache()
+
         # Use provided provider or import singleton
         if provider is not None:
             self._provider = provider
@@ -126,14 +134,21 @@ class LLMFixer:
                 logger.warning("GeminiProvider not available, LLM calls will fail")
                 self._provider = None
 
-        self._tailwind_builder = tailwind_builder or TailwindPromptBuilder()
-        self._js_builder = js_builder or JSPromptBuilder()
-        self._validator = validator or PatchValidator()
+        self._tailwind_builder = tailwind_builder or TailwindPromptBuilder(
+            documents=self._documents
+        )
+        self._js_builder = js_builder or JSPromptBuilder(documents=self._documents)
+        self._validator = validator or PatchValidator(documents=self._documents)
         self._max_retries = max_retries
 
         # Appliers
-        self._tailwind_injector = TailwindInjector()
-        self._js_applier = JSPatchApplier()
+        self._tailwind_injector = TailwindInjector(documents=self._documents)
+        self._js_applier = JSPatchApplier(documents=self._documents)
+        self._patch_engine = PatchEngine(
+            injector=self._tailwind_injector,
+            js_applier=self._js_applier,
+            documents=self._documents,
+        )
 
     async def fix(
         self,
@@ -178,14 +193,14 @@ class LLMFixer:
         tailwind_errors = [e for e in llm_errors if e.error_type.is_feedback_related]
         js_errors = [e for e in llm_errors if e.error_type.is_js_related]
 
-        current_html = html
+        batch = self._patch_engine.begin(html)
         total_tokens = 0
         total_calls = 0
 
         # Fix Tailwind/CSS errors first (simpler)
         if tailwind_errors:
             tailwind_context = FixContext(
-                html=current_html,
+                html=batch.html,
                 errors=tailwind_errors,
                 before_screenshot=screenshots.get("before") if screenshots else None,
                 after_screenshot=screenshots.get("after") if screenshots else None,
@@ -202,11 +217,9 @@ class LLMFixer:
 
             if tailwind_patches:
                 # Apply Tailwind patches
-                patch_set = PatchSet(patches=tailwind_patches, source="llm")
-                injection_result = self._tailwind_injector.inject(current_html, patch_set)
+                outcomes = batch.apply(tailwind_patches)
 
-                if injection_result.success:
-                    current_html = injection_result.html
+                if any(outcome.applied for outcome in outcomes):
                     result.tailwind_patches.extend(tailwind_patches)
                     logger.info(f"Applied {len(tailwind_patches)} Tailwind patches")
 
@@ -214,7 +227,7 @@ class LLMFixer:
         if js_errors:
             # Update context with potentially modified HTML
             js_context = FixContext(
-                html=current_html,
+                html=batch.html,
                 errors=js_errors,
                 defined_functions=context.defined_functions,
                 called_functions=context.called_functions,
@@ -230,16 +243,15 @@ class LLMFixer:
             total_tokens += tokens
 
             if js_patches:
-                # Apply JS patches
-                apply_result = self._js_applier.apply(current_html, js_patches)
+                # Apply JS patches to the same tree
+                applied = [o.patch for o in batch.apply(js_patches) if o.applied]
 
-                if apply_result.success:
-                    current_html = apply_result.html
-                    result.js_patches.extend(apply_result.applied)
-                    logger.info(f"Applied {len(apply_result.applied)} JS patches")
+                if applied:
+                    result.js_patches.extend(applied)
+                    logger.info(f"Applied {len(applied)} JS patches")
 
         # Finalize result
-        result.fixed_html = current_html
+        result.fixed_html = batch.html
         result.llm_calls_made = total_calls
         result.tokens_used = total_tokens
         result.success = len(result.tailwind_patches) > 0 or len(result.js_patches) > 0
@@ -367,7 +379,7 @@ class LLMFixer:
         import re
 
         functions = set()
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._documents.soup(html)
 
         for script in soup.find_all("script"):
             if script.get("src"):
@@ -400,7 +412,7 @@ class LLMFixer:
         import re
 
         functions = set()
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._documents.soup(html)
 
         # Find elements with event handlers
         handler_attrs = ["onclick", "onchange", "onsubmit", "onmouseover", "onkeydown", "onload"]
@@ -421,7 +433,7 @@ class LLMFixer:
     def _extract_dom_ids(self, html: str) -> set:
         """Extract all element IDs from HTML."""
         ids = set()
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._documents.soup(html)
 
         for element in soup.find_all(id=True):
             ids.add(element.get("id"))
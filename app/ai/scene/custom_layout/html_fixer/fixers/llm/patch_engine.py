@@ -0,0 +1,254 @@
+"""
+PatchEngine - Applies mixed Tailwind and JavaScript patches in one pass.
+
+TailwindInjector.inject and JSPatchApplier.apply each parse the HTML and
+serialize their result, so a fix made of Tailwind and JS patches went
+through several parse/serialize round trips. PatchEngine applies an
+ordered list of TailwindPatch and JSPatch objects to a single copy of the
+cached parse (DocumentCache) and serializes once.
+
+Rollback: the input HTML and the shared tree are never modified. The
+result is a new HTML version (the input string itself if nothing was
+applied), to be pushed to HistoryManager like any other candidate;
+rolling back means returning to the previous history entry. As with the
+individual appliers, a failing patch is reported and skipped, the batch
+continues.
+
+Usage:
+    engine = PatchEngine()
+    result = engine.apply(html, [tailwind_patch, js_patch])
+    for outcome in result.outcomes:
+        print(outcome.describe())
+    fixed_html = result.html
+
+    # Apply in steps, serializing only when the HTML is needed
+    batch = engine.begin(html)
+    batch.apply(tailwind_patches)
+    prompt_html = batch.html
+    batch.apply(js_patches)
+    result = batch.result()
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple, Union
+
+from bs4 import BeautifulSoup
+
+from ...analyzers.document_cache import DocumentCache, get_document_cache
+from ...contracts.patches import TailwindPatch
+from ..tailwind_injector import TailwindInjector
+from .contracts.js_patch import JSPatch
+from .js_patch_applier import JSPatchApplier
+
+logger = logging.getLogger("jarvis.ai.html_fixer.patch_engine")
+
+Patch = Union[TailwindPatch, JSPatch]
+
+
+@dataclass
+class PatchOutcome:
+    """Result of applying one patch of a batch."""
+
+    patch: Patch
+    """The patch."""
+
+    applied: bool
+    """True if the patch modified the document."""
+
+    error: Optional[str] = None
+    """Why the patch was not applied."""
+
+    elements: int = 0
+    """Elements modified (Tailwind patches)."""
+
+    def describe(self) -> str:
+        """Generate human-readable description."""
+        if self.applied:
+            return f"{self.patch.describe()}: applied"
+        return f"{self.patch.describe()}: {self.error}"
+
+
+@dataclass
+class BatchApplyResult:
+    """Result of applying a batch of patches."""
+
+    success: bool
+    """True if at least one patch was applied (or the batch was empty)."""
+
+    html: str
+    """The modified HTML (or original if no patches applied)."""
+
+    outcomes: List[PatchOutcome] = field(default_factory=list)
+    """Per-patch outcomes, in batch order."""
+
+    @property
+    def applied(self) -> List[Patch]:
+        """Patches that were applied."""
+        return [o.patch for o in self.outcomes if o.applied]
+
+    @property
+    def failed(self) -> List[Tuple[Patch, str]]:
+        """Patches that failed, with error messages."""
+        return [(o.patch, o.error) for o in self.outcomes if not o.applied]
+
+    @property
+    def tailwind_applied(self) -> List[TailwindPatch]:
+        """Tailwind patches that were applied."""
+        return [p for p in self.applied if isinstance(p, TailwindPatch)]
+
+    @property
+    def js_applied(self) -> List[JSPatch]:
+        """JavaScript patches that were applied."""
+        return [p for p in self.applied if isinstance(p, JSPatch)]
+
+    def describe(self) -> str:
+        """Generate human-readable description."""
+        lines = [f"Applied: {len(self.applied)}, Failed: {len(self.failed)}"]
+        for outcome in self.outcomes:
+            lines.append(f"  - {outcome.describe()}")
+        return "\n".join(lines)
+
+
+class PatchBatch:
+    """
+    One document being patched.
+
+    The tree is cloned on the first patch and serialized on demand; the
+    serialization is cached until the next applied patch.
+    """
+
+    def __init__(self, engine: "PatchEngine", html: str):
+        self._engine = engine
+        self._original = html
+        self._soup: Optional[BeautifulSoup] = None
+        self._html: Optional[str] = html
+        self._outcomes: List[PatchOutcome] = []
+
+    def apply(self, patches: Sequence[Patch]) -> List[PatchOutcome]:
+        """
+        Apply patches, in order, to the document.
+
+        Args:
+            patches: TailwindPatch and JSPatch objects, in any mix
+
+        Returns:
+            Outcomes of these patches
+        """
+        outcomes = []
+        for patch in patches:
+            if self._soup is None:
+                self._soup = self._engine.documents.clone(self._original)
+            outcome = self._engine.apply_to_soup(self._soup, patch)
+            if outcome.applied:
+                self._html = None
+            outcomes.append(outcome)
+
+        self._outcomes.extend(outcomes)
+        return outcomes
+
+    @property
+    def html(self) -> str:
+        """Current HTML (the original string until a patch is applied)."""
+        if self._html is None:
+            self._html = str(self._soup)
+        return self._html
+
+    @property
+    def outcomes(self) -> List[PatchOutcome]:
+        """Outcomes of every patch applied so far."""
+        return list(self._outcomes)
+
+    def result(self) -> BatchApplyResult:
+        """Serialize the document and report every patch."""
+        applied = any(o.applied for o in self._outcomes)
+        return BatchApplyResult(
+            success=applied or not self._outcomes,
+            html=self.html,
+            outcomes=self.outcomes,
+        )
+
+
+class PatchEngine:
+    """
+    Applies ordered, mixed Tailwind and JavaScript patches to one tree.
+
+    Tailwind patches go through TailwindInjector, JS patches through
+    JSPatchApplier, both working in place on the same document.
+    """
+
+    def __init__(
+        self,
+        injector: Optional[TailwindInjector] = None,
+        js_applier: Optional[JSPatchApplier] = None,
+        documents: Optional[DocumentCache] = None,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            injector: Tailwind patch applier (default: TailwindInjector())
+            js_applier: JS patch applier (default: JSPatchApplier())
+            documents: Parsed-document cache (default: shared cache)
+        """
+        self._documents = documents or get_document_cache()
+        self._injector = injector or TailwindInjector(documents=self._documents)
+        self._js_applier = js_applier or JSPatchApplier(documents=self._documents)
+
+    @property
+    def documents(self) -> DocumentCache:
+        """Parsed-document cache the batches clone from."""
+        return self._documents
+
+    def begin(self, html: str) -> PatchBatch:
+        """Start patching a document."""
+        return PatchBatch(self, html)
+
+    def apply(self, html: str, patches: Sequence[Patch]) -> BatchApplyResult:
+        """
+        Apply all patches to HTML, parsing and serializing once.
+
+        Args:
+            html: Original HTML content
+            patches: TailwindPatch and JSPatch objects, in application order
+
+        Returns:
+            BatchApplyResult with modified HTML and per-patch outcomes
+        """
+        batch = self.begin(html)
+        batch.apply(patches)
+        return batch.result()
+
+    def apply_to_soup(self, soup: BeautifulSoup, patch: Patch) -> PatchOutcome:
+        """
+        Apply one patch to a parsed document, in place.
+
+        Args:
+            soup: Document to modify (owned by the caller, not shared)
+            patch: TailwindPatch or JSPatch
+
+        Returns:
+            PatchOutcome of the patch
+        """
+        try:
+            if isinstance(patch, TailwindPatch):
+                count = self._injector.apply_to_soup(soup, patch)
+                if count > 0:
+                    return PatchOutcome(patch, applied=True, elements=count)
+                return PatchOutcome(patch, applied=False, error="No matching elements found")
+
+            if isinstance(patch, JSPatch):
+                if self._js_applier.apply_to_soup(soup, patch):
+                    return PatchOutcome(patch, applied=True)
+                return PatchOutcome(patch, applied=False, error="No changes made")
+
+        except Exception as e:
+            logger.warning(f"Failed to apply patch {patch.describe()}: {e}")
+            return PatchOutcome(patch, applied=False, error=str(e))
+
+        return PatchOutcome(
+            patch, applied=False, error=f"Unsupported patch type: {type(patch).__name__}"
+        )
+
+    def __repr__(self) -> str:
+        return "PatchEngine()"
@@ -8,10 +8,9 @@ Generates prompts that instruct the LLM to fix JavaScript code issues.
 import json
 import logging
 import re
-from typing import List, Union
-
-from bs4 import BeautifulSoup
+from typing import List, Optional, Union
 
+from ....analyzers.document_cache import DocumentCache, get_document_cache
 from ....contracts.errors import ErrorType
 from ....contracts.validation import ClassifiedError
 from ....contracts.patches import TailwindPatch
@@ -113,6 +112,15 @@ class JSPromptBuilder(PromptBuilder):
 
     SYSTEM_PROMPT = JS_SYSTEM_PROMPT
 
+    def __init__(self, documents: Optional[DocumentCache] = None):
+        """
+        Initialize the builder.
+
+        Args:
+            documents: Parsed-document cache (default: shared cache)
+        """
+        self._documents = documents or get_document_cache()
+
     @property
     def domain(self) -> str:
         return "js"
@@ -287,7 +295,7 @@ Please provide different or more comprehensive patches."""
         """
         scripts = []
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
 
             for i, script in enumerate(soup.find_all("script")):
                 src = script.get("src")
@@ -317,7 +325,7 @@ Please provide different or more comprehensive patches."""
         """
         handlers = []
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
 
             # Find elements with onclick, onchange, etc.
             for attr in ["onclick", "onchange", "onsubmit", "onmouseover", "onkeydown"]:
@@ -8,10 +8,9 @@ Generates prompts that instruct the LLM to add appropriate hover/active/focus st
 import json
 import logging
 import re
-from typing import List, Union
-
-from bs4 import BeautifulSoup
+from typing import List, Optional, Union
 
+from ....analyzers.document_cache import DocumentCache, get_document_cache
 from ....contracts.errors import ErrorType
 from ....contracts.validation import ClassifiedError
 from ....contracts.patches import TailwindPatch
@@ -90,6 +89,15 @@ class TailwindPromptBuilder(PromptBuilder):
 
     SYSTEM_PROMPT = TAILWIND_SYSTEM_PROMPT
 
+    def __init__(self, documents: Optional[DocumentCache] = None):
+        """
+        Initialize the builder.
+
+        Args:
+            documents: Parsed-document cache (default: shared cache)
+        """
+        self._documents = documents or get_document_cache()
+
     @property
     def domain(self) -> str:
         return "tailwind"
@@ -216,7 +224,7 @@ Please provide different or more comprehensive patches."""
             HTML string of the element and surrounding context
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
             elements = soup.select(selector)
 
             if not elements:
@@ -243,7 +251,7 @@ Please provide different or more comprehensive patches."""
             Space-separated class string
         """
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
             elements = soup.select(selector)
 
             if not elements:
@@ -8,8 +8,7 @@ import logging
 import re
 from typing import Optional
 
-from bs4 import BeautifulSoup
-
+from ....analyzers.document_cache import DocumentCache, get_document_cache
 from ..contracts.js_patch import JSPatch, JSPatchType
 
 logger = logging.getLogger(__name__)
@@ -38,14 +37,20 @@ class JSPatchValidator:
         r"sessionStorage\.clear",        # Clear storage
     ]
 
-    def __init__(self, allow_external_calls: bool = False):
+    def __init__(
+        self,
+        allow_external_calls: bool = False,
+        documents: Optional[DocumentCache] = None,
+    ):
         """
         Initialize validator.
 
         Args:
             allow_external_calls: If True, allow fetch/XHR patterns
+            documents: Parsed-document cache (default: shared cache)
         """
         self.allow_external_calls = allow_external_calls
+        self._documents = documents or get_document_cache()
         # Note: Don't use IGNORECASE to avoid matching 'function()' as 'Function()'
         self._dangerous_compiled = [re.compile(p) for p in self.DANGEROUS_PATTERNS]
 
@@ -175,7 +180,7 @@ class JSPatchValidator:
 
         # Check selector exists
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
             if not soup.select(patch.selector):
                 logger.warning(f"Selector '{patch.selector}' not found in HTML")
                 return False
@@ -237,7 +242,7 @@ class JSPatchValidator:
     def _dom_id_exists(self, element_id: str, html: str) -> bool:
         """Check if an element with given ID exists in HTML."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
             return soup.find(id=element_id) is not None
         except Exception:
             return False
@@ -5,7 +5,9 @@ Sprint 6: Routes patches to appropriate validators based on type.
 """
 
 import logging
-from typing import List, Union
+from typing import List, Optional, Union
+
+from ....analyzers.document_cache import DocumentCache
 
 from ....contracts.patches import TailwindPatch
 from ..contracts.js_patch import JSPatch
@@ -27,6 +29,7 @@ class PatchValidator:
         self,
         tailwind_validator: TailwindPatchValidator = None,
         js_validator: JSPatchValidator = None,
+        documents: Optional[DocumentCache] = None,
     ):
         """
         Initialize the patch validator.
@@ -34,9 +37,13 @@ class PatchValidator:
         Args:
             tailwind_validator: Optional custom Tailwind validator
             js_validator: Optional custom JS validator
+            documents: Parsed-document cache of the default validators
+                       (default: shared cache)
         """
-        self._tailwind_validator = tailwind_validator or TailwindPatchValidator()
-        self._js_validator = js_validator or JSPatchValidator()
+        self._tailwind_validator = tailwind_validator or TailwindPatchValidator(
+            documents=documents
+        )
+        self._js_validator = js_validator or JSPatchValidator(documents=documents)
 
     def validate(
         self,
@@ -6,10 +6,9 @@ Sprint 6: Ensures LLM-generated Tailwind patches are safe and valid.
 
 import logging
 import re
-from typing import List
-
-from bs4 import BeautifulSoup
+from typing import List, Optional
 
+from ....analyzers.document_cache import DocumentCache, get_document_cache
 from ....contracts.patches import TailwindPatch
 
 logger = logging.getLogger(__name__)
@@ -84,14 +83,20 @@ class TailwindPatchValidator:
         "sr-only",
     ]
 
-    def __init__(self, strict_mode: bool = False):
+    def __init__(
+        self,
+        strict_mode: bool = False,
+        documents: Optional[DocumentCache] = None,
+    ):
         """
         Initialize validator.
 
         Args:
             strict_mode: If True, reject unknown classes. If False, warn only.
+            documents: Parsed-document cache (default: shared cache)
         """
         self.strict_mode = strict_mode
+        self._documents = documents or get_document_cache()
         self._compiled_patterns = [re.compile(p) for p in self.VALID_PATTERNS]
 
     def validate(self, patch: TailwindPatch, html: str) -> bool:
@@ -156,7 +161,7 @@ class TailwindPatchValidator:
     def _selector_exists(self, selector: str, html: str) -> bool:
         """Check if selector matches any element in HTML."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
             return len(soup.select(selector)) > 0
         except Exception as e:
             logger.warning(f"Error checking selector '{selector}': {e}")
@@ -189,7 +194,7 @@ class TailwindPatchValidator:
     def _is_interactive_selector(self, selector: str, html: str) -> bool:
         """Check if selector targets an interactive element."""
         try:
-            soup = BeautifulSoup(html, "html.parser")
+            soup = self._documents.soup(html)
             elements = soup.select(selector)
 
             if not elements:
@@ -5,6 +5,10 @@ Uses BeautifulSoup to modify class attributes based on patches.
 Unlike CSS injection, this modifies the class attribute directly,
 which is more predictable and easier to rollback.
 
+Patches are applied to a copy of the cached parse of the input HTML
+(DocumentCache), never to the shared tree. apply_to_soup applies a patch
+to a caller-owned tree (PatchEngine).
+
 Usage:
     from ..fixers import TailwindInjector
     from ..contracts.patches import TailwindPatch, PatchSet
@@ -21,6 +25,7 @@ import logging
 
 from bs4 import BeautifulSoup, Tag
 
+from ..analyzers.document_cache import DocumentCache, get_document_cache
 from ..contracts.patches import TailwindPatch, PatchSet
 
 
@@ -89,15 +94,21 @@ class TailwindInjector:
     - Detailed result tracking
     """
 
-    def __init__(self, preserve_formatting: bool = False):
+    def __init__(
+        self,
+        preserve_formatting: bool = False,
+        documents: Optional[DocumentCache] = None,
+    ):
         """
         Initialize the injector.
 
         Args:
             preserve_formatting: If True, use prettify() for output
                                  (may change whitespace)
+            documents: Parsed-document cache (default: shared cache)
         """
         self._preserve_formatting = preserve_formatting
+        self._documents = documents or get_document_cache()
 
     def inject(
         self,
@@ -114,13 +125,13 @@ class TailwindInjector:
         Returns:
             InjectionResult with modified HTML and status
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._documents.clone(html)
         applied: List[TailwindPatch] = []
         failed: List[Tuple[TailwindPatch, str]] = []
 
         for patch in patches:
             try:
-                count = self._apply_patch(soup, patch)
+                count = self.apply_to_soup(soup, patch)
                 if count > 0:
                     applied.append(patch)
                     logger.debug(
@@ -166,12 +177,12 @@ class TailwindInjector:
         patch_set = PatchSet(patches=[patch], source="single")
         return self.inject(html, patch_set)
 
-    def _apply_patch(self, soup: BeautifulSoup, patch: TailwindPatch) -> int:
+    def apply_to_soup(self, soup: BeautifulSoup, patch: TailwindPatch) -> int:
         """
-        Apply a single patch to the soup.
+        Apply a single patch to the soup, in place.
 
         Args:
-            soup: BeautifulSoup instance to modify
+            soup: BeautifulSoup instance to modify (owned by the caller)
             patch: Patch to apply
 
         Returns:
@@ -271,7 +282,7 @@ class TailwindInjector:
         Returns:
             Dict mapping selector to {before: [...], after: [...], add: [...], remove: [...]}
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = self._documents.soup(html)
         preview: Dict[str, Dict[str, List[str]]] = {}
 
         for patch in patches:
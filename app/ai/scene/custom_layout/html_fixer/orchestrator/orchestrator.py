@@ -3,6 +3,14 @@ Orchestrator - Main coordinator for the HTML repair pipeline.
 
 Sprint 7: Coordinates error classification, deterministic fixes,
 LLM fixes, validation, and rollback to produce the best result.
+
+Every HTML version of a fix run is rendered once (RenderSession, cached by
+content hash until the run ends): dynamic classification, its JS runtime
+checks and the Sandbox validations of the same HTML share that render.
+
+Validations after a patch pass are incremental: the Sandbox re-tests only
+the elements the applied patches can affect and reuses the previous
+validation's results for the others.
 """
 
 import asyncio
@@ -10,12 +18,16 @@ import logging
 import time
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from app.core.config import settings
+
+from ..analyzers.document_cache import DocumentCache, get_document_cache
 from ..contracts.validation import ClassifiedError
 from ..contracts.patches import TailwindPatch, PatchSet
 from ..validators.classification_pipeline import ErrorClassificationPipeline
 from ..fixers.deterministic.rule_engine import RuleEngine, create_default_engine
 from ..fixers.llm import LLMFixer
 from ..fixers.tailwind_injector import TailwindInjector
+from ..sandbox.contracts import ValidationResult
 from ..sandbox.sandbox import Sandbox
 
 from .contracts import FixPhase, OrchestratorMetrics, OrchestratorResult
@@ -25,7 +37,8 @@ from .best_result_tracker import BestResultTracker
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
-    from ..sandbox.contracts import ValidationResult
+    from ..fixers.llm.contracts.js_patch import JSPatch
+    from ..sandbox.render_session import RenderSession, RenderSessionCache
 
 
 logger = logging.getLogger("jarvis.ai.html_fixer.orchestrator")
@@ -60,12 +73,15 @@ class Orchestrator:
         llm_fixer: Optional[LLMFixer] = None,
         sandbox: Optional[Sandbox] = None,
         decision_engine: Optional[DecisionEngine] = None,
+        documents: Optional[DocumentCache] = None,
         # Configuration
         max_llm_attempts: int = 1,  # Single attempt, user feedback loop handles iterations
         global_timeout_seconds: float = 120.0,
         validate_after_deterministic: bool = True,
         validate_after_llm: bool = True,
         enable_rollback: bool = True,
+        share_renders: Optional[bool] = None,
+        incremental_validation: Optional[bool] = None,
     ):
         """
         Initialize the orchestrator.
@@ -76,11 +92,19 @@ class Orchestrator:
             llm_fixer: LLMFixer instance
             sandbox: Sandbox instance
             decision_engine: DecisionEngine instance
+            documents: Parsed-document cache of the default components
+                       (default: shared cache)
             max_llm_attempts: Maximum LLM retry attempts
             global_timeout_seconds: Total timeout for fix operation
             validate_after_deterministic: Run validation after deterministic fixes
             validate_after_llm: Run validation after LLM fixes
             enable_rollback: Enable rollback on score degradation
+            share_renders: Render each HTML version once per fix run and share
+                           it between classification and validations
+                           (default: SANDBOX_SHARED_RENDERS)
+            incremental_validation: After patches, re-test only the elements
+                                    they can affect
+                                    (default: SANDBOX_INCREMENTAL_VALIDATION)
         """
         # Initialize components lazily to avoid import issues in tests
         self._classifier = classifier
@@ -91,8 +115,10 @@ class Orchestrator:
             max_llm_attempts=max_llm_attempts
         )
 
+        self._documents = documents or get_document_cache()
+
         # Injector for applying patches
-        self._injector = TailwindInjector()
+        self._injector = TailwindInjector(documents=self._documents)
 
         # Configuration
         self._max_llm_attempts = max_llm_attempts
@@ -100,11 +126,19 @@ class Orchestrator:
         self._validate_deterministic = validate_after_deterministic
         self._validate_llm = validate_after_llm
         self._enable_rollback = enable_rollback
+        self._share_renders = (
+            share_renders if share_renders is not None else settings.SANDBOX_SHARED_RENDERS
+        )
+        self._incremental = (
+            incremental_validation
+            if incremental_validation is not None
+            else settings.SANDBOX_INCREMENTAL_VALIDATION
+        )
 
     def _get_classifier(self) -> ErrorClassificationPipeline:
         """Get or create classifier."""
         if self._classifier is None:
-            self._classifier = ErrorClassificationPipeline()
+            self._classifier = ErrorClassificationPipeline(documents=self._documents)
         return self._classifier
 
     def _get_rule_engine(self) -> RuleEngine:
@@ -116,7 +150,7 @@ class Orchestrator:
     def _get_llm_fixer(self) -> LLMFixer:
         """Get or create LLM fixer."""
         if self._llm_fixer is None:
-            self._llm_fixer = LLMFixer()
+            self._llm_fixer = LLMFixer(documents=self._documents)
         return self._llm_fixer
 
     def _get_sandbox(self) -> Sandbox:
@@ -125,6 +159,56 @@ class Orchestrator:
             self._sandbox = Sandbox()
         return self._sandbox
 
+    def _open_render_sessions(self) -> Optional["RenderSessionCache"]:
+        """Render session cache for one fix run (None if renders aren't shared)."""
+        if not self._share_renders:
+            return None
+        factory = getattr(self._get_sandbox(), "render_sessions", None)
+        return factory() if factory is not None else None
+
+    async def _render_session(
+        self, sessions: Optional["RenderSessionCache"], html: str
+    ) -> Optional["RenderSession"]:
+        """Shared render of `html` (None: consumers render on their own)."""
+        if sessions is None:
+            return None
+        return await sessions.get(html)
+
+    async def _validate(
+        self,
+        html: str,
+        sessions: Optional["RenderSessionCache"] = None,
+        previous: Optional["ValidationResult"] = None,
+        tailwind_patches: Optional[List[TailwindPatch]] = None,
+        js_patches: Optional[List["JSPatch"]] = None,
+    ) -> "ValidationResult":
+        """
+        Sandbox validation, on the run's shared render of `html` when available.
+
+        Args:
+            html: HTML content to validate
+            sessions: Render sessions of the fix run
+            previous: Validation of the HTML the patches were applied to
+                      (incremental: only affected elements are re-tested)
+            tailwind_patches: Tailwind patches applied since `previous`
+            js_patches: JavaScript patches applied since `previous`
+        """
+        kwargs = {}
+        session = await self._render_session(sessions, html)
+        if session is not None:
+            kwargs["session"] = session
+        elif sessions is not None and sessions.base_context is not None:
+            # Render on the browser the run already holds: borrowing a
+            # second one from the pool can deadlock concurrent runs
+            kwargs["context"] = sessions.base_context
+        if self._incremental and isinstance(previous, ValidationResult):
+            kwargs.update(
+                previous=previous,
+                tailwind_patches=list(tailwind_patches or []),
+                js_patches=list(js_patches or []),
+            )
+        return await self._get_sandbox().validate(html, **kwargs)
+
     async def fix(
         self,
         html: str,
@@ -136,7 +220,11 @@ class Orchestrator:
 
         Args:
             html: HTML content to fix
-            page: Optional Playwright page for dynamic analysis
+            page: Optional Playwright page for dynamic analysis (with shared
+                  renders, the analysis runs on the run's render of `html`,
+                  which the Sandbox validation then reuses). Without it the
+                  classification is static only; the Sandbox validations
+                  still share their renders
             screenshots: Optional before/after screenshots for LLM context
 
         Returns:
@@ -151,6 +239,7 @@ class Orchestrator:
         phases_completed: List[FixPhase] = []
 
         history.push(html, FixPhase.INITIAL, errors_count=0)
+        sessions = self._open_render_sessions()
 
         try:
             # Wrap in timeout
@@ -164,6 +253,7 @@ class Orchestrator:
                     metrics=metrics,
                     phases_completed=phases_completed,
                     start_time=start_time,
+                    sessions=sessions,
                 ),
                 timeout=self._global_timeout,
             )
@@ -194,6 +284,10 @@ class Orchestrator:
                 error=str(e),
             )
 
+        finally:
+            if sessions is not None:
+                await sessions.close()
+
     async def _fix_pipeline(
         self,
         html: str,
@@ -204,27 +298,37 @@ class Orchestrator:
         metrics: OrchestratorMetrics,
         phases_completed: List[FixPhase],
         start_time: float,
+        sessions: Optional["RenderSessionCache"] = None,
     ) -> OrchestratorResult:
         """Internal pipeline execution."""
 
         # PHASE 1: Classify errors
         logger.info("Phase 1: Classifying errors")
         classify_start = time.time()
-        report = await self._get_classifier().classify(html, page)
+        session = await self._render_session(sessions, html) if page is not None else None
+        if session is not None:
+            report = await self._get_classifier().classify(html, session=session)
+        else:
+            report = await self._get_classifier().classify(html, page)
         metrics.classification_time_ms = (time.time() - classify_start) * 1000
         metrics.errors_initial = len(report.errors)
 
         phases_completed.append(FixPhase.CLASSIFY)
 
+        # Validation of the HTML being fixed (None while not validated)
+        baseline: Optional["ValidationResult"] = None
+
         if not report.errors:
             # Even if classification finds nothing, we still need to validate:
             # the Sandbox can detect feedback failures (NO_VISUAL_CHANGE) that
             # static analyzers won't flag.
             logger.info("No classified errors; validating for feedback issues")
             val_start = time.time()
-            initial_val = await self._get_sandbox().validate(html)
+            initial_val = await self._validate(html, sessions)
             metrics.validation_time_ms += (time.time() - val_start) * 1000
 
+            baseline = initial_val
+
             initial_score = self._calculate_score(initial_val)
             history.update_score(initial_score, initial_val.passed)
             tracker.update(html, initial_score, FixPhase.CLASSIFY, 0)
@@ -273,7 +377,8 @@ class Orchestrator:
             logger.info(f"Phase 2: Applying deterministic fixes for {len(det_errors)} errors")
             det_start = time.time()
 
-            current_html, current_errors = await self._apply_deterministic(
+            previous_val, baseline = baseline, None
+            current_html, current_errors, applied = await self._apply_deterministic(
                 current_html, det_errors, history, tracker, metrics
             )
 
@@ -288,7 +393,11 @@ class Orchestrator:
                     history,
                     tracker,
                     metrics,
+                    sessions,
+                    previous=previous_val,
+                    tailwind_patches=applied,
                 )
+                baseline = val_result
                 phases_completed.append(FixPhase.VALIDATE_DETERMINISTIC)
 
                 if val_result.passed:
@@ -315,7 +424,7 @@ class Orchestrator:
 
                 if feedback_det:
                     logger.info(f"Applying feedback fixes for {len(feedback_det)} elements")
-                    current_html, _ = await self._apply_deterministic(
+                    current_html, _, applied = await self._apply_deterministic(
                         current_html, feedback_det, history, tracker, metrics
                     )
 
@@ -325,7 +434,11 @@ class Orchestrator:
                         history,
                         tracker,
                         metrics,
+                        sessions,
+                        previous=val_result,
+                        tailwind_patches=applied,
                     )
+                    baseline = val_result
 
                     if val_result.passed:
                         logger.info("Validation passed after feedback fixes")
@@ -358,6 +471,8 @@ class Orchestrator:
                 tracker,
                 metrics,
                 screenshots=screenshots,
+                sessions=sessions,
+                previous=baseline,
             )
 
             metrics.llm_time_ms = (time.time() - llm_start) * 1000
@@ -371,6 +486,7 @@ class Orchestrator:
                     history,
                     tracker,
                     metrics,
+                    sessions,
                 )
                 phases_completed.append(FixPhase.VALIDATE_LLM)
 
@@ -398,15 +514,12 @@ class Orchestrator:
         errors but the Sandbox detects interaction failures (e.g. missing/weak
         visual feedback).
         """
-        from bs4 import BeautifulSoup
-
-        from ..analyzers.tailwind_analyzer import TailwindAnalyzer
         from ..contracts.errors import ErrorType
         from ..contracts.validation import TailwindInfo
         from ..sandbox.contracts import ElementStatus
 
-        soup = BeautifulSoup(html, "html.parser")
-        analyzer = TailwindAnalyzer()
+        parser = self._documents.parser(html)
+        soup = parser.soup
 
         derived: List[ClassifiedError] = []
         seen: set[tuple[str, ErrorType]] = set()
@@ -440,7 +553,7 @@ class Orchestrator:
 
             if el is not None:
                 element_tag = el.name
-                tailwind_info = analyzer.analyze_element(el)
+                tailwind_info = parser.element_index.info(el)
 
             derived.append(
                 ClassifiedError(
@@ -462,13 +575,18 @@ class Orchestrator:
         history: HistoryManager,
         tracker: BestResultTracker,
         metrics: OrchestratorMetrics,
-    ) -> Tuple[str, List[ClassifiedError]]:
-        """Apply deterministic fixes using RuleEngine."""
+    ) -> Tuple[str, List[ClassifiedError], List[TailwindPatch]]:
+        """
+        Apply deterministic fixes using RuleEngine.
+
+        Returns:
+            (HTML, errors not addressed, patches applied)
+        """
         patches = self._get_rule_engine().apply_rules(errors)
 
         if not patches:
             logger.debug("No patches generated by RuleEngine")
-            return html, errors
+            return html, errors, []
 
         result = self._injector.inject(html, patches)
 
@@ -488,10 +606,10 @@ class Orchestrator:
                 e for e in errors
                 if not self._error_addressed(e, result.applied)
             ]
-            return result.html, remaining
+            return result.html, remaining, list(result.applied)
 
         logger.warning(f"Injection failed: {len(result.failed)} patches failed")
-        return html, errors
+        return html, errors, []
 
     async def _apply_llm_fixes(
         self,
@@ -501,8 +619,15 @@ class Orchestrator:
         tracker: BestResultTracker,
         metrics: OrchestratorMetrics,
         screenshots: Optional[Dict[str, bytes]] = None,
+        sessions: Optional["RenderSessionCache"] = None,
+        previous: Optional["ValidationResult"] = None,
     ) -> str:
-        """Apply LLM fixes with retry and rollback."""
+        """
+        Apply LLM fixes with retry and rollback.
+
+        `previous` is the validation of `html` (if any): candidates are then
+        validated incrementally against it.
+        """
         current_html = html
         best_llm_html = html
         best_llm_score = tracker.best_score
@@ -534,7 +659,13 @@ class Orchestrator:
             metrics.patches_applied += patch_count
 
             # Validate candidate
-            val_result = await self._get_sandbox().validate(candidate)
+            val_result = await self._validate(
+                candidate,
+                sessions,
+                previous=previous,
+                tailwind_patches=llm_result.tailwind_patches,
+                js_patches=llm_result.js_patches,
+            )
             score = self._calculate_score(val_result)
 
             history.push(
@@ -573,6 +704,7 @@ class Orchestrator:
 
             # Update for next iteration
             current_html = candidate
+            previous = val_result
 
             # Re-classify errors
             report = await self._get_classifier().classify_static(current_html)
@@ -587,10 +719,15 @@ class Orchestrator:
         history: HistoryManager,
         tracker: BestResultTracker,
         metrics: OrchestratorMetrics,
+        sessions: Optional["RenderSessionCache"] = None,
+        previous: Optional["ValidationResult"] = None,
+        tailwind_patches: Optional[List[TailwindPatch]] = None,
     ) -> "ValidationResult":
         """Validate HTML and track result."""
         val_start = time.time()
-        result = await self._get_sandbox().validate(html)
+        result = await self._validate(
+            html, sessions, previous=previous, tailwind_patches=tailwind_patches
+        )
         metrics.validation_time_ms += (time.time() - val_start) * 1000
 
         score = self._calculate_score(result)
@@ -38,6 +38,16 @@ from .contracts import (
     ValidationResult,
 )
 from .sandbox import Sandbox, quick_validate
+from .browser_pool import (
+    BrowserPool,
+    BrowserPoolStats,
+    get_browser_pool,
+    close_browser_pool,
+)
+from .page_snapshot import PageRestoreStats, PageSnapshot
+from .render_session import RenderSession, RenderSessionCache, RenderSessionStats
+from .incremental import HandlerDependencies, IncrementalPlan, PatchImpact, PatchImpactAnalyzer
+from .asset_cache import AssetCache, AssetCacheStats, get_asset_cache
 
 # Sprint 5: DiffEngine
 from .diff_engine import (
@@ -45,6 +55,9 @@ from .diff_engine import (
     DiffResult,
     RegionDiff,
     ComparisonScale,
+    ComparisonMode,
+    ElementCapture,
+    MODE_THRESHOLD_SCALE,
 )
 
 # Sprint 5: ResultClassifier
@@ -72,6 +85,27 @@ __all__ = [
     # Main class
     "Sandbox",
     "quick_validate",
+    # Browser pool
+    "BrowserPool",
+    "BrowserPoolStats",
+    "get_browser_pool",
+    "close_browser_pool",
+    # Page restore between element tests
+    "PageSnapshot",
+    "PageRestoreStats",
+    # Hermetic renders
+    "AssetCache",
+    "AssetCacheStats",
+    "get_asset_cache",
+    # Renders shared within a fix run
+    "RenderSession",
+    "RenderSessionCache",
+    "RenderSessionStats",
+    # Incremental re-validation after patches
+    "IncrementalPlan",
+    "HandlerDependencies",
+    "PatchImpact",
+    "PatchImpactAnalyzer",
     # Contracts
     "ElementInfo",
     "ElementResult",
@@ -82,6 +116,9 @@ __all__ = [
     "DiffResult",
     "RegionDiff",
     "ComparisonScale",
+    "ComparisonMode",
+    "ElementCapture",
+    "MODE_THRESHOLD_SCALE",
     # Sprint 5: Classification
     "ResultClassifier",
     "InteractionClassification",
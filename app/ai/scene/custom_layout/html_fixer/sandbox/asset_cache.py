@@ -0,0 +1,405 @@
+"""
+AssetCache - Hermetic network for Sandbox renders.
+
+Generated layouts load Tailwind (and sometimes Google Fonts, Font Awesome,
+...) from CDNs. Every validation used to fetch them again and wait for
+`networkidle`, so validation time followed CDN latency, and renders failed
+outright in workers without egress.
+
+Every request of a sandbox BrowserContext is routed through the cache:
+- Whitelisted CDN hosts (WHITELISTED_HOSTS): served from a versioned
+  on-disk cache. A miss is fetched once (SANDBOX_ASSET_FETCH_MISSING) and
+  stored; if it can't be fetched it is stubbed
+- Any other http(s) request: stubbed with an empty response of the
+  matching type (no network, no "Failed to load resource" console errors
+  to misreport as page errors)
+
+With nothing left on the network, the page's `load` event covers every
+subresource, so Sandbox._render no longer needs `networkidle`.
+
+Layout:
+=======
+    <SANDBOX_ASSET_CACHE_DIR>/v<SANDBOX_ASSET_CACHE_VERSION>/
+        <sha256(normalize_url(url))>.body   # Response bytes
+        <sha256(normalize_url(url))>.json   # {"url", "status", "content_type", "fetched_at"}
+
+URLs are normalized before hashing (normalize_url) the way the browser
+serializes them: "https://cdn.tailwindcss.com" is requested by Chromium
+as "https://cdn.tailwindcss.com/", and both must hit the same entry.
+
+Bumping SANDBOX_ASSET_CACHE_VERSION starts from an empty cache (e.g. to
+pick up a new Tailwind release behind the unversioned CDN URL).
+
+Pre-seed the cache where workers have no egress (the Dockerfile does):
+    python -m app.ai.scene.custom_layout.html_fixer.sandbox.asset_cache
+
+Usage:
+======
+    from .asset_cache import get_asset_cache
+
+    async with pool.context(viewport=viewport) as context:
+        await get_asset_cache().install(context)
+        page = await context.new_page()
+
+    get_asset_cache().stats.as_dict()
+    # {"hits": 41, "misses": 1, "fetched": 1, "fetch_failures": 0, "stubbed": 3}
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TYPE_CHECKING
+from urllib.parse import urlsplit, urlunsplit
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Route
+
+logger = logging.getLogger("jarvis.ai.html_fixer.asset_cache")
+
+
+# CDN hosts whose assets are cached (CSS frameworks, fonts, icon sets)
+WHITELISTED_HOSTS = frozenset({
+    "cdn.tailwindcss.com",
+    "fonts.googleapis.com",
+    "fonts.gstatic.com",
+    "cdnjs.cloudflare.com",
+    "cdn.jsdelivr.net",
+    "unpkg.com",
+    "use.fontawesome.com",
+    "code.iconify.design",
+})
+
+# Assets fetched by the pre-seed command (as the browser requests them)
+PRELOAD_URLS = (
+    "https://cdn.tailwindcss.com/",
+)
+
+def normalize_url(url: str) -> str:
+    """
+    URL as a browser serializes it (WHATWG URL parsing, http(s) only).
+
+    Lowercases the scheme and host, drops default ports and the fragment,
+    and turns an empty path into "/".
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return url
+
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    port = parts.port
+    if port is not None and port != (443 if scheme == "https" else 80):
+        host = f"{host}:{port}"
+    userinfo = parts.netloc.rpartition("@")[0]
+    netloc = f"{userinfo}@{host}" if userinfo else host
+
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+_TRANSPARENT_GIF = base64.b64decode(
+    "R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7"
+)
+
+# Stub responses by Playwright resource type: (content type, body)
+_STUBS = {
+    "stylesheet": ("text/css", b""),
+    "script": ("application/javascript", b""),
+    "image": ("image/gif", _TRANSPARENT_GIF),
+    "font": ("font/woff2", b""),
+    "fetch": ("application/json", b"{}"),
+    "xhr": ("application/json", b"{}"),
+}
+_DEFAULT_STUB = ("text/plain", b"")
+
+
+@dataclass
+class CachedAsset:
+    """One cached response."""
+
+    url: str
+    status: int
+    content_type: str
+    body: bytes
+
+
+@dataclass
+class AssetCacheStats:
+    """Request routing counters."""
+
+    hits: int = 0            # Served from the cache
+    misses: int = 0          # Whitelisted but not cached yet
+    fetched: int = 0         # Misses fetched and stored
+    fetch_failures: int = 0  # Misses that couldn't be fetched (stubbed)
+    stubbed: int = 0         # Requests answered with a stub
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetched": self.fetched,
+            "fetch_failures": self.fetch_failures,
+            "stubbed": self.stubbed,
+        }
+
+
+class AssetCache:
+    """
+    Versioned on-disk cache of whitelisted CDN assets, plus the Playwright
+    route handler that serves it and stubs everything else.
+
+    Entries are also kept in memory once read; the set of assets used by
+    generated layouts is small.
+    """
+
+    FETCH_TIMEOUT_MS = 15000
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        version: Optional[str] = None,
+        fetch_missing: Optional[bool] = None,
+        whitelist: Optional[Iterable[str]] = None,
+    ):
+        """
+        Initialize the cache (nothing is created on disk until a store).
+
+        Args:
+            cache_dir: Cache root (default: SANDBOX_ASSET_CACHE_DIR, or
+                       ~/.cache/jarvis/sandbox-assets)
+            version: Cache version (default: SANDBOX_ASSET_CACHE_VERSION)
+            fetch_missing: Fetch whitelisted misses from the network
+                           (default: SANDBOX_ASSET_FETCH_MISSING)
+            whitelist: Hosts to cache (default: WHITELISTED_HOSTS)
+        """
+        root = cache_dir or settings.SANDBOX_ASSET_CACHE_DIR
+        root_path = Path(root).expanduser() if root else Path.home() / ".cache" / "jarvis" / "sandbox-assets"
+        self.version = version or settings.SANDBOX_ASSET_CACHE_VERSION
+        self.directory = root_path / f"v{self.version}"
+        self.fetch_missing = (
+            fetch_missing if fetch_missing is not None else settings.SANDBOX_ASSET_FETCH_MISSING
+        )
+        self.whitelist = frozenset(whitelist) if whitelist is not None else WHITELISTED_HOSTS
+        self.stats = AssetCacheStats()
+        self._memory: Dict[str, CachedAsset] = {}
+
+    # -------------------------------------------------------------------------
+    # Cache
+    # -------------------------------------------------------------------------
+
+    def is_whitelisted(self, url: str) -> bool:
+        host = urlsplit(url).hostname or ""
+        return host in self.whitelist
+
+    def get(self, url: str) -> Optional[CachedAsset]:
+        """Cached asset for a URL, or None."""
+        url = normalize_url(url)
+        asset = self._memory.get(url)
+        if asset is not None:
+            return asset
+
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+        asset = CachedAsset(
+            url=url,
+            status=meta.get("status", 200),
+            content_type=meta.get("content_type", "application/octet-stream"),
+            body=body,
+        )
+        self._memory[url] = asset
+        return asset
+
+    def put(self, url: str, status: int, content_type: str, body: bytes) -> CachedAsset:
+        """Store an asset (atomically, so concurrent workers never read half a file)."""
+        url = normalize_url(url)
+        asset = CachedAsset(url=url, status=status, content_type=content_type, body=body)
+        self._memory[url] = asset
+
+        body_path, meta_path = self._paths(url)
+        meta = {
+            "url": url,
+            "status": status,
+            "content_type": content_type,
+            "fetched_at": time.time(),
+        }
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._write_atomic(body_path, body)
+            self._write_atomic(meta_path, json.dumps(meta).encode())
+        except OSError as e:
+            logger.warning(f"Could not store {url} in asset cache: {e}")
+        return asset
+
+    def _paths(self, url: str):
+        key = hashlib.sha256(normalize_url(url).encode()).hexdigest()
+        return self.directory / f"{key}.body", self.directory / f"{key}.json"
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    # -------------------------------------------------------------------------
+    # Routing
+    # -------------------------------------------------------------------------
+
+    async def install(self, context: "BrowserContext") -> None:
+        """Route every request of a context through the cache."""
+        await context.route("**/*", self.handle)
+
+    async def handle(self, route: "Route") -> None:
+        """Playwright route handler: cached asset, fetched asset or stub."""
+        request = route.request
+        url = request.url
+
+        if not url.startswith(("http://", "https://")):
+            await route.continue_()
+            return
+
+        if request.method == "GET" and self.is_whitelisted(url):
+            asset = self.get(url)
+            if asset is None:
+                self.stats.misses += 1
+                if self.fetch_missing:
+                    asset = await self._fetch(route)
+            else:
+                self.stats.hits += 1
+
+            if asset is not None:
+                await route.fulfill(
+                    status=asset.status,
+                    headers={
+                        "content-type": asset.content_type,
+                        "access-control-allow-origin": "*",
+                    },
+                    body=asset.body,
+                )
+                return
+
+        self.stats.stubbed += 1
+        content_type, body = _STUBS.get(request.resource_type, _DEFAULT_STUB)
+        await route.fulfill(
+            status=200,
+            headers={"content-type": content_type, "access-control-allow-origin": "*"},
+            body=body,
+        )
+
+    async def _fetch(self, route: "Route") -> Optional[CachedAsset]:
+        """Fetch a whitelisted miss over the network and store it."""
+        url = route.request.url
+        try:
+            response = await route.fetch(timeout=self.FETCH_TIMEOUT_MS)
+            body = await response.body()
+        except Exception as e:
+            self.stats.fetch_failures += 1
+            logger.warning(f"Asset fetch failed for {url}: {e}")
+            return None
+
+        if not 200 <= response.status < 300:
+            self.stats.fetch_failures += 1
+            logger.warning(f"Asset fetch for {url} returned {response.status}")
+            return None
+
+        self.stats.fetched += 1
+        content_type = response.headers.get("content-type", "application/octet-stream")
+        logger.info(f"Cached sandbox asset {url} ({len(body)} bytes)")
+        return self.put(url, response.status, content_type, body)
+
+    # -------------------------------------------------------------------------
+    # Pre-seeding
+    # -------------------------------------------------------------------------
+
+    async def preload(self, urls: Iterable[str] = PRELOAD_URLS, strict: bool = False) -> int:
+        """
+        Fetch assets into the cache ahead of time (outside a browser).
+
+        Args:
+            urls: Assets to fetch
+            strict: Raise the first fetch error instead of skipping the asset
+
+        Returns:
+            Number of assets stored
+        """
+        import httpx
+
+        stored = 0
+        async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
+            for url in urls:
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    if strict:
+                        raise
+                    logger.warning(f"Asset preload failed for {url}: {e}")
+                    continue
+                self.put(
+                    url,
+                    response.status_code,
+                    response.headers.get("content-type", "application/octet-stream"),
+                    response.content,
+                )
+                stored += 1
+        return stored
+
+
+# ---------------------------------------------------------------------------
+# SHARED CACHE
+# ---------------------------------------------------------------------------
+
+_cache: Optional[AssetCache] = None
+
+
+def get_asset_cache() -> AssetCache:
+    """Get the application-wide asset cache, creating it if needed."""
+    global _cache
+    if _cache is None:
+        _cache = AssetCache()
+    return _cache
+
+
+def main() -> int:
+    """
+    Pre-seed the shared cache (`python -m ...sandbox.asset_cache`).
+
+    Exit status 0 when every asset is stored on disk, or when the network
+    is unreachable (build without egress: workers fetch on first use).
+    Anything else (HTTP error status, unwritable cache directory...) fails.
+    """
+    import asyncio
+
+    import httpx
+
+    logging.basicConfig(level=logging.INFO)
+    cache = get_asset_cache()
+    try:
+        count = asyncio.run(cache.preload(strict=True))
+    except httpx.TransportError as e:
+        print(f"Network unavailable, asset cache not pre-seeded: {e!r}")
+        return 0
+
+    missing = [url for url in PRELOAD_URLS if not cache._paths(url)[0].exists()]
+    if missing:
+        print(f"Asset(s) not written to {cache.directory}: {', '.join(missing)}")
+        return 1
+
+    print(f"Stored {count}/{len(PRELOAD_URLS)} asset(s) in {cache.directory}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
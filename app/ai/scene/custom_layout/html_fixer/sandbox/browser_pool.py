@@ -0,0 +1,415 @@
+"""
+BrowserPool - Long-lived Chromium processes for Sandbox validation.
+
+Sandbox.validate used to start Playwright and launch a new Chromium for
+every validation (~1s before the HTML is even rendered), then kill it.
+The pool keeps a fixed number of browsers alive and hands out a fresh,
+isolated BrowserContext per validation (contexts are cheap: ~10-20ms).
+
+Lifecycle:
+==========
+- Browsers are launched lazily on first use (no Chromium in workers that
+  never validate HTML)
+- Each validation gets exclusive use of one browser and a new context,
+  closed when the validation finishes
+- A browser is relaunched after `max_uses` validations (bounds memory
+  growth of long-lived renderer processes)
+- Crashed / disconnected browsers are replaced on the next acquire, and a
+  background health check probes idle browsers every
+  `health_check_seconds`
+- close_browser_pool(): Called on app shutdown; waits for in-flight
+  validations, then closes all browsers and stops Playwright
+
+Usage:
+======
+    from .browser_pool import get_browser_pool
+
+    pool = get_browser_pool()
+    async with pool.context(viewport={"width": 1920, "height": 1080}) as context:
+        page = await context.new_page()
+        await page.set_content(html)
+
+    pool.stats.as_dict()
+    # {"launches": 2, "contexts": 140, "recycled": 1, "crashes": 0, ...}
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
+
+from app.core.config import settings
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Playwright
+
+logger = logging.getLogger("jarvis.ai.html_fixer.browser_pool")
+
+
+@dataclass
+class BrowserPoolStats:
+    """Counters for browser reuse in the pool."""
+
+    launches: int = 0                # Chromium processes started
+    contexts: int = 0                # Validations served
+    recycled: int = 0                # Browsers relaunched after max_uses
+    crashes: int = 0                 # Browsers found dead on acquire
+    health_check_failures: int = 0   # Idle browsers replaced by health check
+
+    @property
+    def contexts_per_launch(self) -> float:
+        """Average validations served per Chromium launch."""
+        return self.contexts / self.launches if self.launches else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "launches": self.launches,
+            "contexts": self.contexts,
+            "recycled": self.recycled,
+            "crashes": self.crashes,
+            "health_check_failures": self.health_check_failures,
+            "contexts_per_launch": round(self.contexts_per_launch, 1),
+        }
+
+
+class _PooledBrowser:
+    """One pool slot: a (possibly not yet launched) browser and its use count."""
+
+    __slots__ = ("browser", "uses")
+
+    def __init__(self):
+        self.browser: Optional["Browser"] = None
+        self.uses = 0
+
+    @property
+    def alive(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+
+class BrowserPool:
+    """
+    Fixed-size pool of headless Chromium browsers.
+
+    The pool size is also the maximum number of concurrent validations:
+    callers beyond that wait for a browser to be released.
+    """
+
+    PROBE_TIMEOUT_SECONDS = 5.0
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        health_check_seconds: Optional[float] = None,
+        launch_options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize the pool (no browser is launched yet).
+
+        Args:
+            size: Number of browsers (default: SANDBOX_BROWSER_POOL_SIZE)
+            max_uses: Validations per browser before relaunch
+                      (default: SANDBOX_BROWSER_MAX_USES)
+            health_check_seconds: Background health check interval, 0 disables
+                                  (default: SANDBOX_BROWSER_HEALTH_CHECK_SECONDS)
+            launch_options: Extra kwargs for chromium.launch()
+        """
+        self.size = max(1, size or settings.SANDBOX_BROWSER_POOL_SIZE)
+        self.max_uses = max(1, max_uses or settings.SANDBOX_BROWSER_MAX_USES)
+        self.health_check_seconds = (
+            health_check_seconds
+            if health_check_seconds is not None
+            else settings.SANDBOX_BROWSER_HEALTH_CHECK_SECONDS
+        )
+        self.launch_options = {"headless": True, **(launch_options or {})}
+        self.stats = BrowserPoolStats()
+
+        self._playwright_cm = None
+        self._playwright: Optional["Playwright"] = None
+        self._slots: List[_PooledBrowser] = []
+        self._idle: Optional[asyncio.Queue] = None
+        self._start_lock = asyncio.Lock()
+        self._released = asyncio.Event()
+        self._health_task: Optional[asyncio.Task] = None
+        self._in_use = 0
+        self._closed = False
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def started(self) -> bool:
+        return self._playwright is not None
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def in_use(self) -> int:
+        """Browsers currently lent to a validation."""
+        return self._in_use
+
+    async def start(self) -> None:
+        """Start Playwright and create the (empty) slots. Idempotent."""
+        if self.started:
+            return
+        async with self._start_lock:
+            if self.started:
+                return
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+
+            from playwright.async_api import async_playwright
+
+            self._playwright_cm = async_playwright()
+            self._playwright = await self._playwright_cm.start()
+            self.loop = asyncio.get_running_loop()
+
+            self._slots = [_PooledBrowser() for _ in range(self.size)]
+            self._idle = asyncio.Queue()
+            for slot in self._slots:
+                self._idle.put_nowait(slot)
+
+            if self.health_check_seconds and self.health_check_seconds > 0:
+                self._health_task = asyncio.create_task(self._health_loop())
+
+            logger.info(
+                f"Browser pool started (size={self.size}, max_uses={self.max_uses})"
+            )
+
+    @asynccontextmanager
+    async def context(self, **context_options: Any) -> AsyncIterator["BrowserContext"]:
+        """
+        Borrow a browser and open a fresh context on it.
+
+        The context (and every page in it) is closed when the block exits;
+        the browser goes back to the pool.
+
+        Args:
+            **context_options: kwargs for browser.new_context() (viewport, ...)
+
+        Yields:
+            A new BrowserContext
+        """
+        slot = await self._acquire()
+        try:
+            try:
+                browser_context = await slot.browser.new_context(**context_options)
+            except Exception as e:
+                # Browser died after the liveness check: relaunch once
+                logger.warning(f"new_context failed ({e}), relaunching browser")
+                self.stats.crashes += 1
+                await self._relaunch(slot)
+                browser_context = await slot.browser.new_context(**context_options)
+
+            slot.uses += 1
+            self.stats.contexts += 1
+            try:
+                yield browser_context
+            finally:
+                await self._close_quietly(browser_context)
+        finally:
+            self._release(slot)
+
+    async def health_check(self) -> int:
+        """
+        Probe idle browsers and replace the ones that don't respond.
+
+        Browsers lent to a validation are skipped (a crash there is
+        handled on the next acquire).
+
+        Returns:
+            Number of browsers replaced
+        """
+        if not self.started or self._closed:
+            return 0
+
+        replaced = 0
+        for _ in range(self._idle.qsize()):
+            try:
+                slot = self._idle.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            try:
+                if slot.browser is not None and not await self._probe(slot.browser):
+                    self.stats.health_check_failures += 1
+                    replaced += 1
+                    await self._relaunch(slot)
+            except Exception as e:
+                logger.error(f"Browser health check relaunch failed: {e}")
+            finally:
+                self._idle.put_nowait(slot)
+
+        if replaced:
+            logger.warning(f"Health check replaced {replaced} browser(s)")
+        return replaced
+
+    async def close(self, timeout: float = 10.0) -> None:
+        """
+        Shut the pool down.
+
+        New acquires fail immediately; in-flight validations get up to
+        `timeout` seconds to finish before browsers are closed anyway.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._health_task is not None:
+            self._health_task.cancel()
+            try:
+                await self._health_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._health_task = None
+
+        if not self.started:
+            return
+
+        try:
+            await asyncio.wait_for(self._wait_idle(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Closing browser pool with {self._in_use} validation(s) still running"
+            )
+
+        for slot in self._slots:
+            await self._discard(slot)
+
+        try:
+            await self._playwright_cm.__aexit__(None, None, None)
+        except Exception as e:
+            logger.debug(f"Playwright stop failed: {e}")
+        self._playwright = None
+        self._playwright_cm = None
+
+        logger.info(f"Browser pool closed: {self.stats.as_dict()}")
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    async def _acquire(self) -> _PooledBrowser:
+        """Wait for a free slot and make sure its browser is usable."""
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+        await self.start()
+
+        slot = await self._idle.get()
+        self._in_use += 1
+        try:
+            if self._closed:
+                raise RuntimeError("Browser pool is closed")
+            if slot.browser is not None and not slot.alive:
+                logger.warning("Pooled browser disconnected, relaunching")
+                self.stats.crashes += 1
+                await self._relaunch(slot)
+            elif slot.uses >= self.max_uses:
+                logger.debug(f"Recycling browser after {slot.uses} uses")
+                self.stats.recycled += 1
+                await self._relaunch(slot)
+            elif slot.browser is None:
+                await self._launch(slot)
+        except BaseException:
+            self._release(slot)
+            raise
+        return slot
+
+    def _release(self, slot: _PooledBrowser) -> None:
+        self._in_use -= 1
+        self._idle.put_nowait(slot)
+        self._released.set()
+
+    async def _wait_idle(self) -> None:
+        while self._in_use > 0:
+            self._released.clear()
+            await self._released.wait()
+
+    async def _launch(self, slot: _PooledBrowser) -> None:
+        slot.browser = await self._playwright.chromium.launch(**self.launch_options)
+        slot.uses = 0
+        self.stats.launches += 1
+        logger.debug(f"Launched pooled browser ({self.stats.launches} total)")
+
+    async def _relaunch(self, slot: _PooledBrowser) -> None:
+        await self._discard(slot)
+        await self._launch(slot)
+
+    async def _discard(self, slot: _PooledBrowser) -> None:
+        browser, slot.browser, slot.uses = slot.browser, None, 0
+        if browser is not None:
+            await self._close_quietly(browser)
+
+    async def _probe(self, browser: "Browser") -> bool:
+        """A browser is healthy if it can open and close a context quickly."""
+        if not browser.is_connected():
+            return False
+        try:
+            probe = await asyncio.wait_for(
+                browser.new_context(), timeout=self.PROBE_TIMEOUT_SECONDS
+            )
+            await asyncio.wait_for(probe.close(), timeout=self.PROBE_TIMEOUT_SECONDS)
+            return True
+        except Exception:
+            return False
+
+    async def _health_loop(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.health_check_seconds)
+            try:
+                await self.health_check()
+            except Exception as e:
+                logger.error(f"Browser health check failed: {e}")
+
+    @staticmethod
+    async def _close_quietly(closable: Any) -> None:
+        try:
+            await closable.close()
+        except Exception as e:
+            logger.debug(f"Close failed (already gone?): {e}")
+
+
+# ---------------------------------------------------------------------------
+# SHARED POOL
+# ---------------------------------------------------------------------------
+
+_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """
+    Get the application-wide pool, creating it if needed.
+
+    Playwright objects are bound to the event loop that started them, so
+    a pool started on another (finished) loop - e.g. a previous
+    asyncio.run() in a script - is replaced rather than reused.
+
+    Returns:
+        The shared BrowserPool
+    """
+    global _pool
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    if (
+        _pool is None
+        or _pool.closed
+        or (_pool.loop is not None and loop is not None and _pool.loop is not loop)
+    ):
+        _pool = BrowserPool()
+    return _pool
+
+
+async def close_browser_pool() -> None:
+    """Close the shared pool and its browsers (app shutdown)."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
+
+
+def browser_pool_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the shared pool, or None if it was never created."""
+    return _pool.stats.as_dict() if _pool is not None else None
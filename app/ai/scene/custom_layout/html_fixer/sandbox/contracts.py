@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from enum import Enum
 
+from .diff_engine import ComparisonMode
+
 if TYPE_CHECKING:
     from .diff_engine import DiffResult
     from .result_classifier import ClassificationResult
@@ -160,6 +162,12 @@ class ValidationResult:
     viewport_height: int = 1080
     """Height of the viewport used."""
 
+    comparison_mode: ComparisonMode = ComparisonMode.PIXEL
+    """How before/after screenshots were compared (diff_ratio calibration)."""
+
+    reused_elements: int = 0
+    """Element results carried over from the previous validation (incremental mode)."""
+
     @property
     def total_elements(self) -> int:
         """Total number of elements tested."""
@@ -222,6 +230,9 @@ class ValidationResult:
         if self.js_errors:
             lines.append(f"  JS Errors: {len(self.js_errors)}")
 
+        if self.reused_elements:
+            lines.append(f"  Reused: {self.reused_elements} (incremental)")
+
         lines.append(f"  Time: {self.validation_time_ms:.0f}ms")
 
         return "\n".join(lines)
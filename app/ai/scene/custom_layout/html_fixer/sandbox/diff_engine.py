@@ -5,14 +5,35 @@ Sprint 5: Advanced visual comparison for interaction validation.
 
 Uses PIL for image processing with configurable pixel tolerance
 and multi-scale region comparison (tight, local, global).
+
+Two comparison modes (ComparisonMode):
+- PIXEL: full-resolution screenshots (Sandbox with DiffEngine)
+- PERCEPTUAL: screenshots box-downsampled to PERCEPTUAL_MAX_WIDTH first,
+  which averages away sub-pixel/anti-aliasing noise and compares 4x fewer
+  pixels (Sandbox fallback, compare_quick)
+
+Ratios from the two modes are not interchangeable: thin high-contrast
+changes (focus rings, text) cover whole downsampled cells and read higher
+in PERCEPTUAL mode. DiffResult.mode records which one produced a result and
+MODE_THRESHOLD_SCALE rescales thresholds accordingly.
+
+Sandbox element tests don't capture full-resolution pages: they capture the
+element's local region (ElementCapture.region, exact PNG) plus a
+half-resolution JPEG thumbnail of the viewport for the global scale, and
+compare them with compare_captures().
+
+Pixel comparison runs in Pillow's C operations (ImageChops + ImageMath)
+rather than Python loops over getdata(): a full-HD global comparison
+drops from seconds to a few milliseconds with identical results.
 """
 
 import io
+import math
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
-from PIL import Image, ImageChops
+from PIL import Image, ImageChops, ImageMath
 
 
 class ComparisonScale(Enum):
@@ -23,6 +44,40 @@ class ComparisonScale(Enum):
     GLOBAL = "global"  # Full page comparison
 
 
+class ComparisonMode(Enum):
+    """How screenshots are compared."""
+
+    PIXEL = "pixel"            # Full resolution, per pixel
+    PERCEPTUAL = "perceptual"  # Box-downsampled, per averaged cell
+
+
+# Multiplier applied to ratio thresholds (DiffEngine.threshold and the
+# ResultClassifier thresholds) for each mode. Calibrated on synthetic
+# 1920x1080 interactions (button fill, modal, 3px focus ring, text recolor,
+# status label) downsampled 2x: solid fills read 0.98-1.03x their PIXEL
+# ratio, thin details 1.17-1.74x.
+MODE_THRESHOLD_SCALE: Dict[ComparisonMode, float] = {
+    ComparisonMode.PIXEL: 1.0,
+    ComparisonMode.PERCEPTUAL: 1.25,
+}
+
+
+@dataclass
+class ElementCapture:
+    """
+    Screenshots taken around one element click (Sandbox region strategy).
+
+    The region covers the element box + LOCAL_PADDING, so the tight and local
+    scales are computed from it at full resolution; the thumbnail feeds the
+    global scale.
+    """
+
+    region: bytes                              # PNG of region_box
+    region_box: Tuple[int, int, int, int]      # (x1, y1, x2, y2) in viewport px
+    thumbnail: bytes                           # Low-res capture of the viewport
+    thumbnail_scale: float = 1.0               # Thumbnail px per viewport px
+
+
 @dataclass
 class RegionDiff:
     """Result of comparing a specific region."""
@@ -55,6 +110,7 @@ class DiffResult:
     element_box: Dict[str, float]  # Original element bounding box
     has_significant_change: bool   # Any scale exceeded threshold
     primary_change_location: ComparisonScale  # Where change was detected
+    mode: ComparisonMode = ComparisonMode.PIXEL  # How the ratios were computed
 
     @property
     def max_diff_ratio(self) -> float:
@@ -80,6 +136,7 @@ class DiffResult:
             "has_significant_change": self.has_significant_change,
             "primary_change_location": self.primary_change_location.value,
             "max_diff_ratio": self.max_diff_ratio,
+            "mode": self.mode.value,
         }
 
 
@@ -105,6 +162,7 @@ class DiffEngine:
     LOCAL_PADDING = 100    # Pixels around element for local comparison
     THRESHOLD = 0.02       # 2% = significant change
     PIXEL_TOLERANCE = 20   # Per-channel difference to count as "changed"
+    PERCEPTUAL_MAX_WIDTH = 960  # PERCEPTUAL mode downsamples to at most this width
 
     def __init__(
         self,
@@ -112,6 +170,7 @@ class DiffEngine:
         local_padding: int = LOCAL_PADDING,
         threshold: float = THRESHOLD,
         pixel_tolerance: int = PIXEL_TOLERANCE,
+        perceptual_max_width: int = PERCEPTUAL_MAX_WIDTH,
     ):
         """
         Initialize the DiffEngine.
@@ -121,11 +180,13 @@ class DiffEngine:
             local_padding: Pixels around element for local comparison
             threshold: Percentage threshold for significant change (0.0-1.0)
             pixel_tolerance: Per-channel difference to count as changed (0-255)
+            perceptual_max_width: Width screenshots are reduced to in PERCEPTUAL mode
         """
         self.tight_padding = tight_padding
         self.local_padding = local_padding
         self.threshold = threshold
         self.pixel_tolerance = pixel_tolerance
+        self.perceptual_max_width = perceptual_max_width
 
     def compare(
         self,
@@ -133,6 +194,7 @@ class DiffEngine:
         after: bytes,
         element_box: Dict[str, float],
         generate_diff_images: bool = False,
+        mode: ComparisonMode = ComparisonMode.PIXEL,
     ) -> DiffResult:
         """
         Perform multi-scale comparison.
@@ -142,30 +204,20 @@ class DiffEngine:
             after: PNG screenshot after interaction
             element_box: {x, y, width, height} of clicked element
             generate_diff_images: If True, generate visual diff PNGs
+            mode: PIXEL (full resolution) or PERCEPTUAL (downsampled)
 
         Returns:
             DiffResult with comparison at all scales
         """
-        # Load images
-        img_before = Image.open(io.BytesIO(before)).convert("RGB")
-        img_after = Image.open(io.BytesIO(after)).convert("RGB")
+        img_before, img_after, factor = self._load_pair(before, after, mode)
 
-        # Ensure same size
-        if img_before.size != img_after.size:
-            # Resize to minimum common size
-            min_size = (
-                min(img_before.width, img_after.width),
-                min(img_before.height, img_after.height)
-            )
-            img_before = img_before.resize(min_size)
-            img_after = img_after.resize(min_size)
-
-        # Calculate regions
+        # Calculate regions (in downsampled coordinates for PERCEPTUAL)
+        scaled_box = {k: v / factor for k, v in element_box.items()}
         tight_box = self._expand_box(
-            element_box, self.tight_padding, img_before.size
+            scaled_box, self.tight_padding / factor, img_before.size
         )
         local_box = self._expand_box(
-            element_box, self.local_padding, img_before.size
+            scaled_box, self.local_padding / factor, img_before.size
         )
 
         # Compare at each scale
@@ -182,20 +234,99 @@ class DiffEngine:
             ComparisonScale.GLOBAL, generate_diff_images
         )
 
+        # Report region boxes in screenshot coordinates
+        if factor > 1:
+            for region_result in (tight_result, local_result, global_result):
+                region_result.region_box = tuple(v * factor for v in region_result.region_box)
+
+        return self._build_result(
+            tight_result, local_result, global_result, element_box, mode
+        )
+
+    def compare_captures(
+        self,
+        before: ElementCapture,
+        after: ElementCapture,
+        element_box: Dict[str, float],
+        generate_diff_images: bool = False,
+    ) -> DiffResult:
+        """
+        Multi-scale comparison of region + thumbnail captures.
+
+        Tight and local scales come from the full-resolution region
+        captures (local = the whole region), the global scale from the
+        thumbnails. Region boxes in the result are in viewport coordinates.
+
+        Args:
+            before: Capture before interaction
+            after: Capture after interaction (same region_box as before)
+            element_box: {x, y, width, height} of clicked element
+            generate_diff_images: If True, generate visual diff PNGs
+
+        Returns:
+            DiffResult with comparison at all scales (PIXEL mode)
+        """
+        region_before, region_after = self._decode_pair(before.region, after.region)
+        x1, y1, _, _ = before.region_box
+
+        # Tight box, translated into region coordinates
+        shifted_box = dict(element_box, x=element_box["x"] - x1, y=element_box["y"] - y1)
+        tight_box = self._expand_box(shifted_box, self.tight_padding, region_before.size)
+
+        tight_result = self._compare_region(
+            region_before, region_after, tight_box,
+            ComparisonScale.TIGHT, generate_diff_images
+        )
+        local_result = self._compare_region(
+            region_before, region_after, None,
+            ComparisonScale.LOCAL, generate_diff_images
+        )
+
+        thumb_before, thumb_after = self._decode_pair(before.thumbnail, after.thumbnail)
+        global_result = self._compare_region(
+            thumb_before, thumb_after, None,
+            ComparisonScale.GLOBAL, generate_diff_images
+        )
+
+        tight_result.region_box = (
+            tight_box[0] + x1, tight_box[1] + y1, tight_box[2] + x1, tight_box[3] + y1
+        )
+        local_result.region_box = before.region_box
+        global_result.region_box = (
+            0,
+            0,
+            round(thumb_before.width / before.thumbnail_scale),
+            round(thumb_before.height / before.thumbnail_scale),
+        )
+
+        return self._build_result(
+            tight_result, local_result, global_result, element_box, ComparisonMode.PIXEL
+        )
+
+    def _build_result(
+        self,
+        tight_result: RegionDiff,
+        local_result: RegionDiff,
+        global_result: RegionDiff,
+        element_box: Dict[str, float],
+        mode: ComparisonMode,
+    ) -> DiffResult:
+        """Combine the three scales into a DiffResult."""
         # Determine primary change location (prioritize tight -> local -> global)
-        if tight_result.diff_ratio >= self.threshold:
+        threshold = self.threshold * MODE_THRESHOLD_SCALE[mode]
+        if tight_result.diff_ratio >= threshold:
             primary = ComparisonScale.TIGHT
-        elif local_result.diff_ratio >= self.threshold:
+        elif local_result.diff_ratio >= threshold:
             primary = ComparisonScale.LOCAL
-        elif global_result.diff_ratio >= self.threshold:
+        elif global_result.diff_ratio >= threshold:
             primary = ComparisonScale.GLOBAL
         else:
             primary = ComparisonScale.TIGHT  # Default
 
         has_significant = any([
-            tight_result.diff_ratio >= self.threshold,
-            local_result.diff_ratio >= self.threshold,
-            global_result.diff_ratio >= self.threshold,
+            tight_result.diff_ratio >= threshold,
+            local_result.diff_ratio >= threshold,
+            global_result.diff_ratio >= threshold,
         ])
 
         return DiffResult(
@@ -205,8 +336,54 @@ class DiffEngine:
             element_box=element_box,
             has_significant_change=has_significant,
             primary_change_location=primary,
+            mode=mode,
         )
 
+    def _load_pair(
+        self,
+        before: bytes,
+        after: bytes,
+        mode: ComparisonMode,
+    ) -> Tuple[Image.Image, Image.Image, int]:
+        """
+        Decode two screenshots to same-size RGB images.
+
+        In PERCEPTUAL mode both are box-downsampled (each output pixel is
+        the average of a factor x factor block) to at most
+        perceptual_max_width.
+
+        Returns:
+            (before image, after image, downsampling factor)
+        """
+        img_before, img_after = self._decode_pair(before, after)
+
+        factor = 1
+        if mode == ComparisonMode.PERCEPTUAL:
+            factor = max(1, math.ceil(img_before.width / self.perceptual_max_width))
+            if factor > 1:
+                img_before = img_before.reduce(factor)
+                img_after = img_after.reduce(factor)
+
+        return img_before, img_after, factor
+
+    @staticmethod
+    def _decode_pair(before: bytes, after: bytes) -> Tuple[Image.Image, Image.Image]:
+        """Decode two screenshots (PNG or JPEG) to same-size RGB images."""
+        img_before = Image.open(io.BytesIO(before)).convert("RGB")
+        img_after = Image.open(io.BytesIO(after)).convert("RGB")
+
+        # Ensure same size
+        if img_before.size != img_after.size:
+            # Resize to minimum common size
+            min_size = (
+                min(img_before.width, img_after.width),
+                min(img_before.height, img_after.height)
+            )
+            img_before = img_before.resize(min_size)
+            img_after = img_after.resize(min_size)
+
+        return img_before, img_after
+
     def _expand_box(
         self,
         box: Dict[str, float],
@@ -260,25 +437,16 @@ class DiffEngine:
             crop2 = img2
             region = (0, 0, img1.width, img1.height)
 
-        # Pixel-by-pixel comparison
-        pixels1 = list(crop1.getdata())
-        pixels2 = list(crop2.getdata())
-
-        diff_count = 0
-        total_pixels = len(pixels1)
-
-        for p1, p2 in zip(pixels1, pixels2):
-            # Calculate average channel difference
-            channel_diff = sum(abs(a - b) for a, b in zip(p1, p2)) / 3
-            if channel_diff > self.pixel_tolerance:
-                diff_count += 1
+        mask = self._changed_mask(crop1, crop2)
+        diff_count = mask.histogram()[255]
+        total_pixels = crop1.width * crop1.height
 
         diff_ratio = diff_count / total_pixels if total_pixels > 0 else 0.0
 
         # Generate diff image if requested
         diff_image = None
         if generate_diff:
-            diff_image = self._generate_diff_image(crop1, crop2)
+            diff_image = self._generate_diff_image(crop1, crop2, mask)
 
         return RegionDiff(
             scale=scale,
@@ -289,10 +457,41 @@ class DiffEngine:
             diff_image=diff_image,
         )
 
+    def _changed_mask(
+        self,
+        img1: Image.Image,
+        img2: Image.Image,
+    ) -> Image.Image:
+        """
+        Mark the pixels whose average channel difference exceeds the tolerance.
+
+        A pixel is changed when (|dR| + |dG| + |dB|) / 3 > pixel_tolerance,
+        evaluated as |dR| + |dG| + |dB| > 3 * pixel_tolerance on 32-bit
+        integers so no channel sum is clipped.
+
+        Args:
+            img1: Before image (RGB)
+            img2: After image (RGB, same size)
+
+        Returns:
+            Mode "L" mask: 255 for changed pixels, 0 otherwise
+        """
+        red, green, blue = ImageChops.difference(img1, img2).split()
+        limit = 3 * self.pixel_tolerance
+        changed = ImageMath.lambda_eval(
+            lambda args: args["convert"](args["r"] + args["g"] + args["b"] > limit, "L"),
+            r=red,
+            g=green,
+            b=blue,
+        )
+        # Comparison yields 0/1; scale to a 0/255 mask
+        return changed.point(lambda v: 255 if v else 0)
+
     def _generate_diff_image(
         self,
         img1: Image.Image,
         img2: Image.Image,
+        mask: Optional[Image.Image] = None,
     ) -> bytes:
         """
         Generate a visual diff image highlighting changed pixels.
@@ -302,34 +501,29 @@ class DiffEngine:
         Args:
             img1: Before image (cropped region)
             img2: After image (cropped region)
+            mask: Precomputed _changed_mask() of the two images
 
         Returns:
             PNG bytes of diff visualization
         """
-        # Create output image
-        output = Image.new("RGB", img1.size, (0, 0, 0))
-
-        pixels1 = list(img1.getdata())
-        pixels2 = list(img2.getdata())
+        if mask is None:
+            mask = self._changed_mask(img1, img2)
 
-        output_pixels = []
-        for p1, p2 in zip(pixels1, pixels2):
-            channel_diff = sum(abs(a - b) for a, b in zip(p1, p2)) / 3
-            if channel_diff > self.pixel_tolerance:
-                # Mark changed pixel as red
-                output_pixels.append((255, 0, 0))
-            else:
-                # Keep original (dimmed)
-                output_pixels.append((p1[0] // 2, p1[1] // 2, p1[2] // 2))
-
-        output.putdata(output_pixels)
+        red = Image.new("RGB", img1.size, (255, 0, 0))
+        dimmed = img1.point(lambda v: v // 2)
+        output = Image.composite(red, dimmed, mask)
 
         # Export as PNG
         buffer = io.BytesIO()
         output.save(buffer, format="PNG")
         return buffer.getvalue()
 
-    def compare_quick(self, before: bytes, after: bytes) -> float:
+    def compare_quick(
+        self,
+        before: bytes,
+        after: bytes,
+        mode: ComparisonMode = ComparisonMode.PIXEL,
+    ) -> float:
         """
         Quick global comparison (for backward compatibility).
 
@@ -339,18 +533,12 @@ class DiffEngine:
         Args:
             before: PNG screenshot before interaction
             after: PNG screenshot after interaction
+            mode: PIXEL (full resolution) or PERCEPTUAL (downsampled)
 
         Returns:
             diff_ratio for full page (0.0-1.0)
         """
-        img1 = Image.open(io.BytesIO(before)).convert("RGB")
-        img2 = Image.open(io.BytesIO(after)).convert("RGB")
-
-        # Ensure same size
-        if img1.size != img2.size:
-            min_size = (min(img1.width, img2.width), min(img1.height, img2.height))
-            img1 = img1.resize(min_size)
-            img2 = img2.resize(min_size)
+        img1, img2, _ = self._load_pair(before, after, mode)
 
         result = self._compare_region(
             img1, img2, None, ComparisonScale.GLOBAL, False
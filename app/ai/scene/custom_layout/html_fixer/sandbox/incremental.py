@@ -0,0 +1,512 @@
+"""
+Incremental validation - Re-test only the elements a patch set can affect.
+
+After a deterministic or LLM patch pass, most interactive elements are
+untouched: re-clicking them reproduces the previous ElementResult. Given
+the previous ValidationResult and the TailwindPatch / JSPatch list applied
+since, PatchImpactAnalyzer marks the elements a patch can change on the
+patched HTML (DOM dependency map):
+- the patch targets, their ancestors and their descendants
+- when a patch touches stacking or hit-testing classes (z-*, position,
+  pointer-events, opacity, transforms, visibility...) or the target is an
+  overlay: every element painted in the target's stacking context
+  (ZIndexHierarchyBuilder), since they compete for the same clicks
+- elements previously INTERCEPTED by an affected element
+- elements whose inline handler (on*="..."), directly or through the page
+  functions it calls, references an affected element (getElementById,
+  querySelector(All), getElementsByClassName, document.body): a button
+  toggling a panel behaves differently once the panel is patched
+
+Every other element reuses its previous result (RESPONSIVE,
+NO_VISUAL_CHANGE or INTERCEPTED only; errors and timeouts are re-tested).
+A NO_VISUAL_CHANGE result is not reused after any patch when what the
+click acts on can't be read statically (non-literal selectors, unknown
+functions, listeners attached by page scripts).
+
+Falls back to a full validation (PatchImpact.full) when:
+- a JSPatch touches global scope (functions, variables, DOM references,
+  syntax): any handler may call into it
+- a patch selector matches nothing in the patched HTML
+- the previous validation captured JS errors, which can't be attributed
+  to the elements whose clicks raised them
+
+Usage:
+======
+    impact = PatchImpactAnalyzer().analyze(patched_html, tailwind_patches, js_patches)
+    plan = IncrementalPlan(previous_result, impact)
+
+    reused = plan.reusable(interactive)     # selector -> previous ElementResult
+    to_test = [e for e in interactive if e.selector not in reused]
+
+    # Or through the Sandbox:
+    result = await sandbox.validate(
+        patched_html, previous=previous_result, tailwind_patches=patches,
+    )
+"""
+
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Set, TYPE_CHECKING
+
+from bs4 import Tag
+
+from ..analyzers.document_cache import DocumentCache, get_document_cache
+from ..analyzers.dom_parser import DOMParser
+from ..analyzers.tailwind_analyzer import TailwindAnalyzer
+from ..analyzers.zindex_hierarchy import ZIndexHierarchyBuilder
+from ..contracts.patches import TailwindPatch
+from .contracts import ElementInfo, ElementResult, ElementStatus, ValidationResult
+
+if TYPE_CHECKING:
+    from ..fixers.llm.contracts.js_patch import JSPatch
+
+logger = logging.getLogger("jarvis.ai.html_fixer.incremental")
+
+
+# Class prefixes whose change can move an element above/below its
+# neighbours or change which element receives a click
+STACKING_CLASS_PREFIXES = (
+    "z-", "-z-",
+    "static", "relative", "absolute", "fixed", "sticky",
+    "inset-", "-inset-", "top-", "-top-", "left-", "-left-",
+    "right-", "-right-", "bottom-", "-bottom-",
+    "pointer-events-",
+    "opacity-",
+    "transform", "translate-", "-translate-", "scale-", "-scale-",
+    "rotate-", "-rotate-", "skew-", "-skew-",
+    "hidden", "invisible", "visible", "isolate",
+)
+
+# DOM lookups in handler code; group 2 is the literal argument
+_ID_LOOKUP = re.compile(r"getElementById\(\s*(['\"`])([^'\"`]+)\1\s*\)")
+_SELECTOR_LOOKUP = re.compile(r"querySelector(?:All)?\(\s*(['\"`])([^'\"`]+)\1\s*\)")
+_CLASS_LOOKUP = re.compile(r"getElementsByClassName\(\s*(['\"`])([^'\"`]+)\1\s*\)")
+_ANY_LOOKUP = re.compile(r"\b(?:getElementById|querySelector(?:All)?|getElementsBy\w+|closest)\s*\(")
+_DOCUMENT_ROOTS = re.compile(r"\bdocument\.(body|documentElement)\b")
+
+# Named functions of inline scripts (declarations and assigned functions)
+_FUNCTION_START = re.compile(
+    r"(?:function\s+([A-Za-z_$][\w$]*)\s*\([^)]*\)"
+    r"|(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*(?:async\s*)?"
+    r"(?:function\s*\([^)]*\)|\([^)]*\)\s*=>|[A-Za-z_$][\w$]*\s*=>))\s*\{"
+)
+_CALL = re.compile(r"(?<![\w$.])([A-Za-z_$][\w$]*)\s*\(")
+
+# Call-like keywords and browser APIs that don't reach page functions
+_NON_FUNCTIONS = frozenset({
+    "if", "for", "while", "switch", "catch", "return", "typeof", "function",
+    "getElementById", "querySelector", "querySelectorAll",
+    "getElementsByClassName", "getElementsByTagName", "getElementsByName", "closest",
+})
+_BUILTIN_CALLS = frozenset({
+    "alert", "confirm", "prompt", "setTimeout", "setInterval", "clearTimeout",
+    "clearInterval", "requestAnimationFrame", "parseInt", "parseFloat", "String",
+    "Number", "Boolean", "Array", "Object", "Date", "JSON", "Math", "Promise",
+    "fetch", "encodeURIComponent", "decodeURIComponent", "isNaN",
+})
+
+# Script code attaching handlers the inline attributes don't show
+_SCRIPT_LISTENERS = re.compile(r"addEventListener\s*\(|\.on[a-z]+\s*=(?!=)")
+
+# Statuses worth carrying over: re-clicking the element reproduces them
+REUSABLE_STATUSES = frozenset({
+    ElementStatus.RESPONSIVE,
+    ElementStatus.NO_VISUAL_CHANGE,
+    ElementStatus.INTERCEPTED,
+})
+
+
+@dataclass
+class PatchImpact:
+    """
+    Elements of a patched HTML document that a patch set can affect.
+
+    full=True means "re-test everything" (see reason).
+    """
+
+    full: bool = False
+    """Whether the whole page must be re-validated."""
+
+    reason: Optional[str] = None
+    """Why a full validation is needed."""
+
+    affected: Set[int] = field(default_factory=set)
+    """id() of the affected Tags of `parser`."""
+
+    parser: Optional[DOMParser] = None
+    """The patched document the Tags belong to."""
+
+    opaque: Set[int] = field(default_factory=set)
+    """id() of the Tags whose click targets can't be read statically."""
+
+    all_opaque: bool = False
+    """Page scripts attach listeners: no click target is known statically."""
+
+    @classmethod
+    def everything(cls, reason: str) -> "PatchImpact":
+        """Impact requiring a full validation."""
+        return cls(full=True, reason=reason)
+
+    def affects(self, selector: Optional[str]) -> bool:
+        """
+        Check if the element(s) matched by `selector` may behave differently.
+
+        Unresolvable selectors count as affected.
+        """
+        if self.full:
+            return True
+        if not selector or self.parser is None:
+            return True
+        try:
+            elements = self.parser.get_elements_by_selector(selector)
+        except Exception:
+            return True
+        if not elements:
+            return True
+        return any(id(element) in self.affected for element in elements)
+
+    def is_opaque(self, selector: Optional[str]) -> bool:
+        """
+        Check if what a click on `selector` acts on is unknown.
+
+        Unresolvable selectors count as opaque.
+        """
+        if self.full or self.all_opaque:
+            return True
+        if not selector or self.parser is None:
+            return True
+        try:
+            elements = self.parser.get_elements_by_selector(selector)
+        except Exception:
+            return True
+        if not elements:
+            return True
+        return any(id(element) in self.opaque for element in elements)
+
+
+class HandlerDependencies:
+    """
+    Elements the inline handlers of a document act on.
+
+    Handler code is read together with the page functions it calls
+    (transitively); lookups with literal arguments are resolved on the
+    document. None means "unknown" (dynamic lookup, undefined function).
+    """
+
+    def __init__(self, parser: DOMParser):
+        """
+        Read the inline scripts of a document.
+
+        Args:
+            parser: The (patched) document
+        """
+        self._parser = parser
+        code = "\n".join(
+            script.string or ""
+            for script in parser.get_elements_by_tag("script")
+            if not script.get("src")
+        )
+        self.scripts_attach_listeners = bool(_SCRIPT_LISTENERS.search(code))
+        self._functions = self._extract_functions(code)
+        self._cache: Dict[str, Optional[List[Tag]]] = {}
+
+    @staticmethod
+    def handler_code(element: Tag) -> str:
+        """Code of the inline on* handlers of an element."""
+        return "\n".join(
+            value for name, value in element.attrs.items()
+            if name.startswith("on") and isinstance(value, str)
+        )
+
+    def targets(self, element: Tag) -> Optional[List[Tag]]:
+        """
+        Elements the inline handlers of `element` look up.
+
+        Returns:
+            The referenced elements, or None when they can't be known
+        """
+        code = self.handler_code(element)
+        if code not in self._cache:
+            self._cache[code] = self._resolve(code)
+        return self._cache[code]
+
+    def _resolve(self, code: str) -> Optional[List[Tag]]:
+        bodies = self._reachable_code(code)
+        if bodies is None:
+            return None
+
+        targets: List[Tag] = []
+        for body in bodies:
+            literal = 0
+            for match in _ID_LOOKUP.finditer(body):
+                element = self._parser.soup.find(id=match.group(2))
+                if element is not None:
+                    targets.append(element)
+                literal += 1
+            for regex, to_selector in (
+                (_SELECTOR_LOOKUP, lambda value: value),
+                (_CLASS_LOOKUP, lambda value: "." + ".".join(value.split())),
+            ):
+                for match in regex.finditer(body):
+                    try:
+                        selector = to_selector(match.group(2))
+                        targets.extend(self._parser.get_elements_by_selector(selector))
+                    except Exception:
+                        return None
+                    literal += 1
+            # Lookups without a literal argument (variables, closest...)
+            if len(_ANY_LOOKUP.findall(body)) > literal:
+                return None
+            for match in _DOCUMENT_ROOTS.finditer(body):
+                root = self._parser.soup.body if match.group(1) == "body" else self._parser.soup.html
+                if root is not None:
+                    targets.append(root)
+        return targets
+
+    def _reachable_code(self, code: str) -> Optional[List[str]]:
+        """Handler code plus the bodies of the page functions it calls."""
+        bodies = [code]
+        seen: Set[str] = set()
+        pending = [code]
+        while pending:
+            for name in _CALL.findall(pending.pop()):
+                if name in seen or name in _NON_FUNCTIONS:
+                    continue
+                seen.add(name)
+                body = self._functions.get(name)
+                if body is None:
+                    if name in _BUILTIN_CALLS:
+                        continue
+                    return None
+                bodies.append(body)
+                pending.append(body)
+        return bodies
+
+    @staticmethod
+    def _extract_functions(code: str) -> Dict[str, str]:
+        """Name -> body of the named functions of the script code."""
+        functions: Dict[str, str] = {}
+        for match in _FUNCTION_START.finditer(code):
+            name = match.group(1) or match.group(2)
+            depth, end = 1, match.end()
+            while end < len(code) and depth:
+                depth += {"{": 1, "}": -1}.get(code[end], 0)
+                end += 1
+            functions[name] = code[match.end():end - 1]
+        return functions
+
+
+class PatchImpactAnalyzer:
+    """
+    Builds the PatchImpact of a patch set on the patched HTML.
+
+    Usage:
+        analyzer = PatchImpactAnalyzer()
+        impact = analyzer.analyze(html, tailwind_patches, js_patches)
+
+        if not impact.affects(".card button"):
+            ...  # Previous result still valid
+    """
+
+    def __init__(self, documents: Optional[DocumentCache] = None):
+        """
+        Initialize the analyzer.
+
+        Args:
+            documents: Parsed-document cache (default: shared cache)
+        """
+        self._analyzer = TailwindAnalyzer()
+        self._documents = documents or get_document_cache()
+
+    def analyze(
+        self,
+        html: str,
+        tailwind_patches: Sequence[TailwindPatch] = (),
+        js_patches: Sequence["JSPatch"] = (),
+    ) -> PatchImpact:
+        """
+        Compute the elements affected by the patches.
+
+        Args:
+            html: HTML after the patches were applied
+            tailwind_patches: Tailwind patches applied since the last validation
+            js_patches: JavaScript patches applied since the last validation
+
+        Returns:
+            PatchImpact (full when the impact can't be bounded)
+        """
+        # Handler patches are local to their element; anything else in a
+        # script may be called from every handler on the page
+        for patch in js_patches:
+            if not patch.is_handler_patch() or not patch.selector:
+                return PatchImpact.everything(
+                    f"JS patch touches global scope: {patch.describe()}"
+                )
+
+        try:
+            parser = self._documents.parser(html)
+        except Exception as e:
+            return PatchImpact.everything(f"Patched HTML could not be parsed: {e}")
+
+        hierarchy = ZIndexHierarchyBuilder()
+        hierarchy.build_hierarchy(parser)
+
+        impact = PatchImpact(parser=parser)
+        targets = [(patch.selector, self._changed_classes(patch)) for patch in tailwind_patches]
+        targets += [(patch.selector, []) for patch in js_patches]
+
+        for selector, classes in targets:
+            try:
+                elements = parser.get_elements_by_selector(selector)
+            except Exception:
+                elements = []
+            if not elements:
+                return PatchImpact.everything(f"Patch selector not found: {selector}")
+
+            for element in elements:
+                self._mark_local(parser, element, impact.affected)
+                info = parser.element_index.info(element)
+                if self._changes_stacking(classes) or self._analyzer.is_overlay(element, info):
+                    scope = self._stacking_scope(hierarchy, element)
+                    impact.affected.add(id(scope))
+                    impact.affected.update(id(el) for el in parser.get_descendants(scope))
+
+        self._mark_handler_dependents(parser, impact)
+        return impact
+
+    def _mark_handler_dependents(self, parser: DOMParser, impact: PatchImpact) -> None:
+        """
+        Mark the elements whose handlers act on affected elements.
+
+        Clicks on descendants bubble to the handler: they are marked too.
+        Elements with unreadable handlers are recorded as opaque.
+        """
+        dependencies = HandlerDependencies(parser)
+        impact.all_opaque = dependencies.scripts_attach_listeners
+
+        dependents = []
+        for element in parser.get_all_elements():
+            if not dependencies.handler_code(element):
+                continue
+            targets = dependencies.targets(element)
+            if targets is None:
+                impact.opaque.add(id(element))
+                impact.opaque.update(id(el) for el in parser.get_descendants(element))
+            elif any(id(target) in impact.affected for target in targets):
+                dependents.append(element)
+
+        for element in dependents:
+            impact.affected.add(id(element))
+            impact.affected.update(id(el) for el in parser.get_descendants(element))
+
+    def _changed_classes(self, patch: TailwindPatch) -> List[str]:
+        """Classes added or removed by a Tailwind patch."""
+        return list(patch.add_classes) + list(patch.remove_classes)
+
+    def _changes_stacking(self, classes: List[str]) -> bool:
+        """
+        Check if a class change can alter stacking or hit-testing.
+
+        Variant classes (hover:, focus:...) only apply in a state of the
+        element itself and are treated as local.
+        """
+        return any(
+            ":" not in cls and cls.startswith(STACKING_CLASS_PREFIXES)
+            for cls in classes
+        )
+
+    def _mark_local(self, parser: DOMParser, element: Tag, affected: Set[int]) -> None:
+        """Mark the element, its ancestors and its descendants."""
+        affected.add(id(element))
+        affected.update(id(el) for el in parser.get_parent_chain(element))
+        affected.update(id(el) for el in parser.get_descendants(element))
+
+    def _stacking_scope(self, hierarchy: ZIndexHierarchyBuilder, element: Tag) -> Tag:
+        """
+        Root element of the stacking context the element competes in.
+
+        An element creating its own context is ordered within its parent's.
+        """
+        context = hierarchy.get_stacking_context(element)
+        if context is None:
+            return element
+        if context.element is element and context.parent is not None:
+            context = context.parent
+        return context.element
+
+
+class IncrementalPlan:
+    """
+    Which previous ElementResults a validation can reuse.
+
+    Usage:
+        plan = IncrementalPlan.build(previous, html, tailwind_patches, js_patches)
+        if plan is not None:
+            reused = plan.reusable(interactive)
+    """
+
+    def __init__(self, previous: ValidationResult, impact: PatchImpact):
+        """
+        Initialize the plan.
+
+        Args:
+            previous: Validation of the HTML before the patches
+            impact: Impact of the patches on the patched HTML
+        """
+        self.previous = previous
+        self.impact = impact
+        self._previous_results: Dict[str, ElementResult] = {
+            r.selector: r for r in previous.element_results
+        }
+
+    @classmethod
+    def build(
+        cls,
+        previous: ValidationResult,
+        html: str,
+        tailwind_patches: Sequence[TailwindPatch] = (),
+        js_patches: Sequence["JSPatch"] = (),
+    ) -> Optional["IncrementalPlan"]:
+        """
+        Plan an incremental validation of `html`.
+
+        Returns:
+            The plan, or None when a full validation is needed
+        """
+        if previous.js_errors:
+            logger.info("Full validation: previous validation had JS errors")
+            return None
+
+        impact = PatchImpactAnalyzer().analyze(html, tailwind_patches, js_patches)
+        if impact.full:
+            logger.info(f"Full validation: {impact.reason}")
+            return None
+
+        return cls(previous, impact)
+
+    def reusable(self, elements: List[ElementInfo]) -> Dict[str, ElementResult]:
+        """
+        Previous results still valid for the elements found on the new render.
+
+        Returns:
+            Dict mapping selector to the previous ElementResult
+        """
+        reused: Dict[str, ElementResult] = {}
+        for element in elements:
+            previous = self._previous_results.get(element.selector)
+            if previous is None or previous.status not in REUSABLE_STATUSES:
+                continue
+            if self.impact.affects(element.selector):
+                continue
+            # "Nothing happened" may be about an element a patch changed
+            if (
+                previous.status == ElementStatus.NO_VISUAL_CHANGE
+                and self.impact.affected
+                and self.impact.is_opaque(element.selector)
+            ):
+                continue
+            if previous.is_blocked and self.impact.affects(previous.blocking_element):
+                continue
+            reused[element.selector] = previous
+        return reused
@@ -0,0 +1,335 @@
+"""
+PageSnapshot - Restore a rendered page to its initial state without a reload.
+
+Every element test must start from the same page state, otherwise a click
+sees the modal / toggled class / open menu left behind by the previous one.
+Re-rendering (set_content + ready wait + JS init buffer) restores that
+state but costs hundreds of milliseconds per element; a snapshot restore
+costs a few.
+
+capture(page), once after the render:
+=====================================
+1. Freezes animations: finite ones (entrance fades, slide-ins) jump to their
+   end state, infinite ones (spinners, orbits) are paused at t=0, so two
+   screenshots of the same state are pixel-identical
+2. Starts a MutationObserver that records every DOM change in <html> and
+   <body> (attributes, text, added/removed nodes, with old values)
+3. Records form values, scroll offsets, focus, open <dialog>s and a
+   fingerprint of the serialized DOM; timers started from now on are
+   tracked
+
+restore(page), before each following test:
+==========================================
+1. Cancels timers/animation frames started since the capture, closes
+   dialogs, restores focus
+2. Undoes the recorded mutations in reverse order. Nodes are put back, not
+   re-created, so listeners attached by the page's scripts keep working
+3. Restores form values and scroll offsets, re-freezes animations (also
+   the transitions triggered by the undo)
+4. Checks the DOM fingerprint against the captured one
+
+restore() returns False when there is no snapshot or the fingerprint
+differs (a timer started before the capture keeps mutating the page, a
+node moved into <head>...): the caller re-renders and captures again.
+
+Not restored: script variables (a `let` slide index), canvas pixels and
+media playback. Those are not part of the DOM; tests that depend on them
+see the state the previous click left, as they did before snapshots.
+<head> changes are kept on purpose: the Tailwind CDN appends the CSS it
+generates for classes added by clicks there.
+
+Usage:
+======
+    snapshot = PageSnapshot()
+    await render(page, html)
+    await snapshot.capture(page)
+
+    for element in elements:
+        if not await snapshot.restore(page):
+            await render(page, html)
+            await snapshot.capture(page)
+        await test(page, element)
+
+    snapshot.stats.as_dict()
+    # {"captures": 1, "restores": 11, "fallbacks": 0, "avg_restore_ms": 4.2, ...}
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+logger = logging.getLogger("jarvis.ai.html_fixer.page_snapshot")
+
+
+# ---------------------------------------------------------------------------
+# PAGE SCRIPTS
+# ---------------------------------------------------------------------------
+
+_HELPERS = """
+    const freezeAnimations = () => {
+        for (const animation of document.getAnimations()) {
+            try {
+                const timing = animation.effect && animation.effect.getComputedTiming();
+                if (timing && timing.endTime !== Infinity) {
+                    animation.finish();
+                } else {
+                    animation.pause();
+                    animation.currentTime = 0;
+                }
+            } catch (e) {}
+        }
+    };
+    const fingerprint = () => {
+        const root = document.documentElement;
+        const attributes = root.getAttributeNames()
+            .map((name) => name + '=' + root.getAttribute(name)).join(' ');
+        return attributes + '|' + (document.body ? document.body.outerHTML : root.outerHTML);
+    };
+"""
+
+CAPTURE_SCRIPT = "() => {" + _HELPERS + """
+    const previous = window.__sandboxSnapshot;
+    if (previous) {
+        previous.observer.disconnect();
+        document.removeEventListener('scroll', previous.onScroll, true);
+    }
+
+    freezeAnimations();
+
+    // Track timers started after the capture
+    if (!window.__sandboxTimers) {
+        const tracked = {timeouts: new Set(), intervals: new Set(), frames: new Set()};
+        const wrap = (name, ids) => {
+            const original = window[name];
+            window[name] = function (...args) {
+                const id = original.apply(this, args);
+                ids.add(id);
+                return id;
+            };
+        };
+        wrap('setTimeout', tracked.timeouts);
+        wrap('setInterval', tracked.intervals);
+        wrap('requestAnimationFrame', tracked.frames);
+        tracked.clear = () => {
+            tracked.timeouts.forEach((id) => clearTimeout(id));
+            tracked.intervals.forEach((id) => clearInterval(id));
+            tracked.frames.forEach((id) => cancelAnimationFrame(id));
+            tracked.forget();
+        };
+        tracked.forget = () => {
+            tracked.timeouts.clear();
+            tracked.intervals.clear();
+            tracked.frames.clear();
+        };
+        Object.defineProperty(window, '__sandboxTimers', {value: tracked, configurable: true});
+    }
+    window.__sandboxTimers.forget();
+
+    const snapshot = {
+        log: [],
+        scrolled: new Set(),
+        offsets: new Map(),
+        windowScroll: [window.scrollX, window.scrollY],
+        dialogs: new Set(document.querySelectorAll('dialog[open]')),
+        focus: document.activeElement,
+        forms: [],
+    };
+    for (const el of document.querySelectorAll('input, textarea, select')) {
+        snapshot.forms.push([el, el.value, el.checked, el.indeterminate, el.selectedIndex]);
+    }
+    for (const el of document.querySelectorAll('*')) {
+        if (el.scrollTop || el.scrollLeft) {
+            snapshot.offsets.set(el, [el.scrollLeft, el.scrollTop]);
+        }
+    }
+
+    snapshot.onScroll = (event) => {
+        if (event.target !== document) snapshot.scrolled.add(event.target);
+    };
+    document.addEventListener('scroll', snapshot.onScroll, {capture: true, passive: true});
+
+    snapshot.observer = new MutationObserver((records) => { snapshot.log.push(...records); });
+    snapshot.observe = () => snapshot.observer.observe(document.documentElement, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        attributeOldValue: true,
+        characterData: true,
+        characterDataOldValue: true,
+    });
+    snapshot.fingerprint = fingerprint();
+    snapshot.observe();
+
+    Object.defineProperty(window, '__sandboxSnapshot', {
+        value: snapshot, configurable: true, writable: true,
+    });
+    return true;
+}"""
+
+# Returns null on success, else the reason the restore is not exact
+RESTORE_SCRIPT = "() => {" + _HELPERS + """
+    const snapshot = window.__sandboxSnapshot;
+    if (!snapshot) return 'no snapshot';
+
+    // Side effects first, while the observer still records their mutations
+    if (window.__sandboxTimers) window.__sandboxTimers.clear();
+    for (const dialog of document.querySelectorAll('dialog[open]')) {
+        if (!snapshot.dialogs.has(dialog)) {
+            try { dialog.close(); } catch (e) {}
+        }
+    }
+    if (document.activeElement !== snapshot.focus) {
+        if (document.activeElement && document.activeElement.blur) document.activeElement.blur();
+        if (snapshot.focus && snapshot.focus !== document.body && snapshot.focus.focus) {
+            snapshot.focus.focus({preventScroll: true});
+        }
+    }
+
+    const records = snapshot.log.concat(snapshot.observer.takeRecords());
+    snapshot.observer.disconnect();
+    snapshot.log = [];
+
+    const head = document.head;
+    for (let i = records.length - 1; i >= 0; i--) {
+        const record = records[i];
+        const target = record.target;
+        if (head && head.contains(target)) continue;
+
+        if (record.type === 'attributes') {
+            if (record.oldValue === null) {
+                target.removeAttributeNS(record.attributeNamespace, record.attributeName);
+            } else {
+                target.setAttributeNS(record.attributeNamespace, record.attributeName, record.oldValue);
+            }
+        } else if (record.type === 'characterData') {
+            target.data = record.oldValue;
+        } else {
+            for (const node of record.addedNodes) {
+                if (node.parentNode === target) target.removeChild(node);
+            }
+            const next = record.nextSibling && record.nextSibling.parentNode === target
+                ? record.nextSibling : null;
+            for (const node of record.removedNodes) target.insertBefore(node, next);
+        }
+    }
+
+    for (const [el, value, checked, indeterminate, selectedIndex] of snapshot.forms) {
+        try {
+            if (el.type !== 'file' && el.value !== value) el.value = value;
+            if (el.checked !== checked) el.checked = checked;
+            el.indeterminate = indeterminate;
+            if (el.tagName === 'SELECT') el.selectedIndex = selectedIndex;
+        } catch (e) {}
+    }
+
+    for (const el of snapshot.scrolled) {
+        const [left, top] = snapshot.offsets.get(el) || [0, 0];
+        el.scrollLeft = left;
+        el.scrollTop = top;
+    }
+    snapshot.scrolled.clear();
+    window.scrollTo(snapshot.windowScroll[0], snapshot.windowScroll[1]);
+
+    freezeAnimations();
+    snapshot.observe();
+
+    return fingerprint() === snapshot.fingerprint ? null : 'dom mismatch';
+}"""
+
+
+# ---------------------------------------------------------------------------
+# SNAPSHOT
+# ---------------------------------------------------------------------------
+
+@dataclass
+class PageRestoreStats:
+    """Restore vs re-render timings (the per-test savings of snapshots)."""
+
+    captures: int = 0
+    restores: int = 0        # Exact snapshot restores
+    fallbacks: int = 0       # Restores that needed a full re-render
+    renders: int = 0         # Full renders (initial + fallbacks)
+    restore_ms: float = 0.0
+    render_ms: float = 0.0
+
+    @property
+    def avg_restore_ms(self) -> float:
+        return self.restore_ms / self.restores if self.restores else 0.0
+
+    @property
+    def avg_render_ms(self) -> float:
+        return self.render_ms / self.renders if self.renders else 0.0
+
+    @property
+    def saved_ms(self) -> float:
+        """Estimated time saved vs re-rendering before every restored test."""
+        return self.restores * (self.avg_render_ms - self.avg_restore_ms) if self.renders else 0.0
+
+    def record_render(self, duration_ms: float) -> None:
+        self.renders += 1
+        self.render_ms += duration_ms
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "captures": self.captures,
+            "restores": self.restores,
+            "fallbacks": self.fallbacks,
+            "renders": self.renders,
+            "avg_restore_ms": round(self.avg_restore_ms, 1),
+            "avg_render_ms": round(self.avg_render_ms, 1),
+            "saved_ms": round(self.saved_ms, 1),
+        }
+
+
+class PageSnapshot:
+    """
+    Captures and restores the initial state of rendered pages.
+
+    The snapshot itself lives in the page (window.__sandboxSnapshot), so one
+    PageSnapshot serves any number of pages; it only keeps the stats.
+    """
+
+    def __init__(self):
+        self.stats = PageRestoreStats()
+
+    async def capture(self, page: "Page") -> bool:
+        """
+        Freeze animations and snapshot the page's current state.
+
+        Returns:
+            True if the snapshot was taken (False: restore() will fail too)
+        """
+        try:
+            await page.evaluate(CAPTURE_SCRIPT)
+        except Exception as e:
+            logger.debug(f"Page snapshot failed: {e}")
+            return False
+        self.stats.captures += 1
+        return True
+
+    async def restore(self, page: "Page") -> bool:
+        """
+        Bring the page back to the captured state.
+
+        Returns:
+            True if the DOM matches the snapshot again, False if the caller
+            must re-render
+        """
+        start = time.perf_counter()
+        try:
+            reason = await page.evaluate(RESTORE_SCRIPT)
+        except Exception as e:
+            reason = str(e)
+
+        if reason:
+            logger.debug(f"Page restore failed ({reason}), re-rendering")
+            self.stats.fallbacks += 1
+            return False
+
+        self.stats.restores += 1
+        self.stats.restore_ms += (time.perf_counter() - start) * 1000
+        return True
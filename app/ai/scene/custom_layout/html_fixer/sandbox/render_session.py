@@ -0,0 +1,297 @@
+"""
+RenderSession - One render of an HTML version, shared by every browser check.
+
+A fix run used to render the same HTML several times: the classification
+pipeline's set_content, the JSRuntimeValidator's own set_content on the same
+page, and Sandbox.validate in a browser of its own. A RenderSession renders
+the HTML once and keeps:
+- the page (in its own isolated BrowserContext, asset routing installed)
+- the pageerror / console.error capture, from the first script on
+- the initial screenshot
+
+Consumers borrow the page with `session.use()`. The first borrower gets the
+fresh render; later ones get the page restored to it (PageSnapshot, or a
+re-render when the restore isn't exact), so a click made by one check is
+never seen by the next. The restore only covers the DOM: checks that change
+JavaScript state (wrapping console.error, adding listeners, running inline
+handlers by hand) use `session.isolated()` instead, a throwaway render in a
+context of its own, and leave the shared page untouched.
+
+RenderSessionCache keys sessions by content hash for the life of one fix
+run. It borrows a single browser (Sandbox._open_context) and opens one
+context per HTML version on it; the least recently used sessions are
+closed beyond max_sessions. If no browser can be opened, get() returns
+None and callers fall back to rendering on their own. A fallback render
+made while the cache holds the browser opens its context on
+`base_context` (Sandbox.validate(context=...)): asking the pool for a
+second browser while holding one can deadlock concurrent runs.
+
+Usage:
+======
+    async with sandbox.render_sessions() as sessions:
+        session = await sessions.get(html)
+
+        report = await classifier.classify(html, session=session)
+        result = await sandbox.validate(html, session=session)   # No re-render
+
+    sessions.stats.as_dict()
+    # {"renders": 3, "reuses": 5, "evictions": 0, "failures": 0}
+"""
+
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from playwright.async_api import BrowserContext, Page
+    from .sandbox import Sandbox
+
+logger = logging.getLogger("jarvis.ai.html_fixer.render_session")
+
+
+def content_hash(html: str) -> str:
+    """Cache key of an HTML version."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+class RenderSession:
+    """
+    A rendered HTML version: page, error capture and initial screenshot.
+
+    Create through RenderSessionCache.get() (or RenderSession.open()).
+    """
+
+    def __init__(self, sandbox: "Sandbox", html: str, context: "BrowserContext", page: "Page"):
+        self.html = html
+        self.content_hash = content_hash(html)
+        self.context = context
+        self.page = page
+        self.initial_screenshot: Optional[bytes] = None
+
+        # Live capture: keeps growing while consumers use the page
+        self.js_errors: List[str] = []
+        self.console_errors: List[str] = []
+        self._load_js_errors = 0
+        self._load_console_errors = 0
+
+        self._sandbox = sandbox
+        self._lock = asyncio.Lock()
+        self._used = False
+        self.uses = 0
+
+    @classmethod
+    async def open(cls, sandbox: "Sandbox", html: str, context: "BrowserContext") -> "RenderSession":
+        """
+        Render `html` on a new page of `context`.
+
+        Args:
+            sandbox: Sandbox providing the render (viewport, asset cache, snapshot)
+            html: HTML content to render
+            context: Context owning the page (closed with the session)
+        """
+        page = await context.new_page()
+        session = cls(sandbox, html, context, page)
+        page.on("pageerror", lambda e: session.js_errors.append(str(e)))
+        page.on("console", lambda msg: (
+            session.console_errors.append(msg.text)
+            if msg.type == "error" else None
+        ))
+
+        await sandbox._render_and_snapshot(page, html)
+        session.initial_screenshot = await page.screenshot()
+        session._load_js_errors = len(session.js_errors)
+        session._load_console_errors = len(session.console_errors)
+        return session
+
+    @property
+    def load_js_errors(self) -> List[str]:
+        """Uncaught errors raised while the page loaded."""
+        return self.js_errors[:self._load_js_errors]
+
+    @property
+    def load_console_errors(self) -> List[str]:
+        """console.error messages logged while the page loaded."""
+        return self.console_errors[:self._load_console_errors]
+
+    @asynccontextmanager
+    async def use(self) -> AsyncIterator["Page"]:
+        """
+        Borrow the page, in its initial rendered state.
+
+        Borrowers are serialized; the page is restored to the initial
+        render for every borrower but the first.
+        """
+        async with self._lock:
+            if self._used:
+                await self._sandbox._restore(self.page, self.html)
+            self._used = True
+            self.uses += 1
+            yield self.page
+
+    @asynccontextmanager
+    async def isolated(self) -> AsyncIterator["Page"]:
+        """
+        Render the session's HTML on a page of its own, closed on exit.
+
+        For checks that change JavaScript state, which a snapshot restore
+        doesn't undo. Errors raised on this page are not captured by the
+        session (load errors are the same as the session's load_js_errors).
+        """
+        context = await self._sandbox._new_worker_context(self.context)
+        try:
+            page = await context.new_page()
+            await self._sandbox._render(page, self.html)
+            yield page
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Closing isolated render failed: {e}")
+
+    async def close(self) -> None:
+        """Close the session's context (and page)."""
+        try:
+            await self.context.close()
+        except Exception as e:
+            logger.debug(f"Closing render session failed: {e}")
+
+    def __repr__(self) -> str:
+        return f"RenderSession({self.content_hash[:12]}, uses={self.uses})"
+
+
+@dataclass
+class RenderSessionStats:
+    """Render sharing counters of a RenderSessionCache."""
+
+    renders: int = 0     # Sessions rendered
+    reuses: int = 0      # get() calls served by an existing session
+    evictions: int = 0   # Sessions closed to stay within max_sessions
+    failures: int = 0    # Renders / browser acquisitions that failed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "renders": self.renders,
+            "reuses": self.reuses,
+            "evictions": self.evictions,
+            "failures": self.failures,
+        }
+
+
+class RenderSessionCache:
+    """
+    Render sessions of one fix run, keyed by content hash.
+
+    Holds one browser (through the Sandbox's context) until close(); every
+    session is an isolated context on it.
+    """
+
+    def __init__(self, sandbox: "Sandbox", max_sessions: int = 4):
+        """
+        Initialize the cache (no browser is borrowed until the first get()).
+
+        Args:
+            sandbox: Sandbox that renders the sessions
+            max_sessions: Sessions kept open; older ones are closed
+        """
+        self._sandbox = sandbox
+        self._max_sessions = max(1, max_sessions)
+        self._sessions: "OrderedDict[str, RenderSession]" = OrderedDict()
+        self._stack: Optional[AsyncExitStack] = None
+        self._base_context: Optional["BrowserContext"] = None
+        self._unavailable = False
+        self._lock = asyncio.Lock()
+        self.stats = RenderSessionStats()
+
+    async def get(self, html: str) -> Optional[RenderSession]:
+        """
+        Session for an HTML version, rendering it on first request.
+
+        Returns:
+            The RenderSession, or None when no browser/render is available
+        """
+        key = content_hash(html)
+        async with self._lock:
+            session = self._sessions.get(key)
+            if session is not None:
+                self._sessions.move_to_end(key)
+                self.stats.reuses += 1
+                return session
+
+            if self._unavailable:
+                return None
+
+            try:
+                base_context = await self._get_base_context()
+                context = await self._sandbox._new_worker_context(base_context)
+            except Exception as e:
+                logger.warning(f"Render sessions unavailable: {e}")
+                self.stats.failures += 1
+                self._unavailable = True
+                return None
+
+            try:
+                session = await RenderSession.open(self._sandbox, html, context)
+            except Exception as e:
+                logger.warning(f"Render session failed: {e}")
+                self.stats.failures += 1
+                await context.close()
+                return None
+
+            self.stats.renders += 1
+            self._sessions[key] = session
+            while len(self._sessions) > self._max_sessions:
+                _, evicted = self._sessions.popitem(last=False)
+                self.stats.evictions += 1
+                await evicted.close()
+            return session
+
+    @property
+    def base_context(self) -> Optional["BrowserContext"]:
+        """Context of the browser held for the run (None until borrowed)."""
+        return self._base_context
+
+    async def _get_base_context(self) -> "BrowserContext":
+        """Borrow the run's browser (kept until close())."""
+        if self._base_context is None:
+            stack = AsyncExitStack()
+            try:
+                self._base_context = await stack.enter_async_context(
+                    self._sandbox._open_context()
+                )
+            except BaseException:
+                await stack.aclose()
+                raise
+            self._stack = stack
+        return self._base_context
+
+    async def close(self) -> None:
+        """Close every session and give the browser back."""
+        async with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+            for session in sessions:
+                await session.close()
+
+            stack, self._stack = self._stack, None
+            self._base_context = None
+            if stack is not None:
+                try:
+                    await stack.aclose()
+                except Exception as e:
+                    logger.debug(f"Releasing render session browser failed: {e}")
+
+        if self.stats.renders:
+            logger.debug(f"Render sessions: {self.stats.as_dict()}")
+
+    async def __aenter__(self) -> "RenderSessionCache":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
@@ -3,13 +3,16 @@ ResultClassifier - Classify interaction results semantically.
 
 Sprint 5: Intelligent classification of visual changes based on
 multi-scale diff analysis.
+
+Thresholds are calibrated for PIXEL-mode ratios and rescaled with
+MODE_THRESHOLD_SCALE when a DiffResult was produced in PERCEPTUAL mode.
 """
 
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from .diff_engine import DiffResult, ComparisonScale
+from .diff_engine import DiffResult, ComparisonMode, ComparisonScale, MODE_THRESHOLD_SCALE
 from .contracts import ElementInfo
 
 
@@ -41,6 +44,7 @@ class ClassificationResult:
     reasoning: str
     primary_scale: ComparisonScale
     diff_ratios: Dict[str, float]  # {tight, local, global}
+    mode: ComparisonMode = ComparisonMode.PIXEL  # Mode of the classified ratios
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize for reporting."""
@@ -50,6 +54,7 @@ class ClassificationResult:
             "reasoning": self.reasoning,
             "primary_scale": self.primary_scale.value,
             "diff_ratios": self.diff_ratios,
+            "mode": self.mode.value,
         }
 
 
@@ -101,6 +106,24 @@ class ResultClassifier:
         self.navigation_threshold = navigation_threshold
         self.navigation_ratio = navigation_ratio
 
+    def thresholds_for(self, mode: ComparisonMode) -> Dict[str, float]:
+        """
+        Ratio thresholds calibrated for a comparison mode.
+
+        Args:
+            mode: Mode that produced the ratios
+
+        Returns:
+            {responsive, weak, cascade, navigation} thresholds
+        """
+        scale = MODE_THRESHOLD_SCALE[mode]
+        return {
+            "responsive": self.responsive_threshold * scale,
+            "weak": self.weak_threshold * scale,
+            "cascade": self.cascade_threshold * scale,
+            "navigation": self.navigation_threshold * scale,
+        }
+
     def classify(
         self,
         diff_result: DiffResult,
@@ -125,22 +148,28 @@ class ResultClassifier:
             "local": local,
             "global": global_,
         }
+        mode = diff_result.mode
+        thresholds = self.thresholds_for(mode)
+        responsive_threshold = thresholds["responsive"]
+        weak_threshold = thresholds["weak"]
+        cascade_threshold = thresholds["cascade"]
 
         # 1. Check for RESPONSIVE (direct element feedback)
-        if tight >= self.responsive_threshold:
+        if tight >= responsive_threshold:
             return ClassificationResult(
                 classification=InteractionClassification.RESPONSIVE,
-                confidence=min(1.0, tight / self.responsive_threshold),
+                confidence=min(1.0, tight / responsive_threshold),
                 reasoning=(
                     f"Element showed clear visual feedback "
                     f"({tight:.1%} change in tight region)"
                 ),
                 primary_scale=ComparisonScale.TIGHT,
                 diff_ratios=diff_ratios,
+                mode=mode,
             )
 
         # 2. Check for NAVIGATION (page-wide change)
-        if global_ >= self.navigation_threshold:
+        if global_ >= thresholds["navigation"]:
             # Is it disproportionately global vs local?
             ratio = global_ / local if local > 0 else float('inf')
             if ratio > self.navigation_ratio:
@@ -153,10 +182,11 @@ class ResultClassifier:
                     ),
                     primary_scale=ComparisonScale.GLOBAL,
                     diff_ratios=diff_ratios,
+                    mode=mode,
                 )
 
         # 3. Check for CASCADE_EFFECT (change elsewhere)
-        if local >= self.cascade_threshold and tight < self.weak_threshold:
+        if local >= cascade_threshold and tight < weak_threshold:
             return ClassificationResult(
                 classification=InteractionClassification.CASCADE_EFFECT,
                 confidence=0.7,
@@ -166,9 +196,10 @@ class ResultClassifier:
                 ),
                 primary_scale=ComparisonScale.LOCAL,
                 diff_ratios=diff_ratios,
+                mode=mode,
             )
 
-        if global_ >= self.cascade_threshold and tight < self.weak_threshold:
+        if global_ >= cascade_threshold and tight < weak_threshold:
             return ClassificationResult(
                 classification=InteractionClassification.CASCADE_EFFECT,
                 confidence=0.6,
@@ -177,19 +208,21 @@ class ResultClassifier:
                 ),
                 primary_scale=ComparisonScale.GLOBAL,
                 diff_ratios=diff_ratios,
+                mode=mode,
             )
 
         # 4. Check for WEAK_FEEDBACK
-        if tight >= self.weak_threshold:
+        if tight >= weak_threshold:
             return ClassificationResult(
                 classification=InteractionClassification.WEAK_FEEDBACK,
-                confidence=tight / self.responsive_threshold,
+                confidence=tight / responsive_threshold,
                 reasoning=(
                     f"Subtle feedback detected ({tight:.1%}) but below "
-                    f"{self.responsive_threshold:.1%} threshold"
+                    f"{responsive_threshold:.1%} threshold"
                 ),
                 primary_scale=ComparisonScale.TIGHT,
                 diff_ratios=diff_ratios,
+                mode=mode,
             )
 
         # 5. NO_RESPONSE - nothing detected
@@ -202,6 +235,7 @@ class ResultClassifier:
             ),
             primary_scale=ComparisonScale.TIGHT,
             diff_ratios=diff_ratios,
+            mode=mode,
         )
 
     def is_passing(self, classification: InteractionClassification) -> bool:
@@ -228,6 +262,7 @@ class ResultClassifier:
         tight: float,
         local: float,
         global_: float,
+        mode: ComparisonMode = ComparisonMode.PIXEL,
     ) -> ClassificationResult:
         """
         Convenience method to classify from raw diff ratios.
@@ -238,6 +273,8 @@ class ResultClassifier:
             tight: Tight region diff ratio
             local: Local region diff ratio
             global_: Global diff ratio
+            mode: Comparison mode that produced the ratios (selects the
+                  calibrated thresholds)
 
         Returns:
             ClassificationResult
@@ -245,6 +282,8 @@ class ResultClassifier:
         # Create a minimal DiffResult
         from .diff_engine import RegionDiff
 
+        responsive_threshold = self.thresholds_for(mode)["responsive"]
+
         diff_result = DiffResult(
             tight=RegionDiff(
                 ComparisonScale.TIGHT, tight, int(tight * 1000), 1000
@@ -257,11 +296,12 @@ class ResultClassifier:
             ),
             element_box={"x": 0, "y": 0, "width": 100, "height": 50},
             has_significant_change=(
-                tight >= self.responsive_threshold or
-                local >= self.responsive_threshold or
-                global_ >= self.responsive_threshold
+                tight >= responsive_threshold or
+                local >= responsive_threshold or
+                global_ >= responsive_threshold
             ),
             primary_change_location=ComparisonScale.TIGHT,
+            mode=mode,
         )
 
         return self.classify(diff_result)
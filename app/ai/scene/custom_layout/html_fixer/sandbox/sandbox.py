@@ -4,6 +4,26 @@ Sandbox - Visual validation of HTML with Playwright.
 Sprint 4: Basic sandbox for HTML validation.
 Sprint 5: Integrated DiffEngine for multi-scale comparison and classification.
 
+Browsers come from the shared BrowserPool (one long-lived Chromium per
+concurrent validation, fresh BrowserContext per validation) unless
+SANDBOX_BROWSER_POOL_ENABLED is off. With parallel_pages > 1, element
+click tests fan out over isolated contexts of the same browser, each
+restored to the initial render before every test. Pages are restored by
+undoing DOM changes recorded since the render (PageSnapshot, animations
+frozen) and only re-rendered when the snapshot can't be restored exactly.
+
+Renders are hermetic: the AssetCache serves whitelisted CDN assets
+(Tailwind, fonts, icons) from disk and stubs every other external request,
+so a render is ready at the load event + READY_SCRIPT, not networkidle.
+
+Within a fix run the render can be shared: validate(html, session=...)
+tests on a RenderSession (see render_sessions()) that the classification
+pipeline may already have used, instead of rendering the HTML again.
+
+After a patch pass, validate(html, previous=..., tailwind_patches=...,
+js_patches=...) re-tests only the elements the patches can affect and
+reuses the previous ElementResults for the rest (see incremental.py).
+
 This module renders HTML in a headless browser and validates
 that interactive elements work correctly.
 
@@ -17,25 +37,45 @@ Features:
 """
 
 import asyncio
+import base64
 import logging
 import re
 import time
+import weakref
 from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, List, Optional, TYPE_CHECKING
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from app.core.config import settings
 
+from .asset_cache import AssetCache, get_asset_cache
+from .browser_pool import BrowserPool, get_browser_pool
 from .contracts import (
     ElementInfo,
     ElementResult,
     ElementStatus,
     ValidationResult,
 )
-from .diff_engine import DiffEngine
+from .page_snapshot import PageRestoreStats, PageSnapshot
+from .render_session import RenderSession, RenderSessionCache
+from .incremental import IncrementalPlan
+from .diff_engine import DiffEngine, ComparisonMode, ElementCapture, MODE_THRESHOLD_SCALE
 from .result_classifier import ResultClassifier, InteractionClassification, ClassificationResult
 from .screenshot_exporter import ScreenshotExporter
 from ..core.selector import SelectorService
 
 if TYPE_CHECKING:
     from playwright.async_api import Page, Browser, BrowserContext
+    from ..contracts.patches import TailwindPatch
+    from ..fixers.llm.contracts.js_patch import JSPatch
+
+# Deterministic "ready" signal once the load event fired: web fonts are
+# loaded and two frames have been rendered (styles injected by the Tailwind
+# CDN on load are applied and laid out)
+READY_SCRIPT = """async () => {
+    if (document.fonts) await document.fonts.ready;
+    await new Promise((resolve) => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+}"""
 
 logger = logging.getLogger("jarvis.ai.html_fixer.sandbox")
 
@@ -58,6 +98,10 @@ class Sandbox:
                 print(f"{blocked.selector} blocked by {blocked.blocking_element}")
     """
 
+    # Element test captures (see DiffEngine.compare_captures)
+    THUMBNAIL_SCALE = 0.5         # Viewport thumbnail for the global scale
+    THUMBNAIL_JPEG_QUALITY = 80   # Thumbnails are only diffed, never exported
+
     def __init__(
         self,
         viewport_width: int = 1920,
@@ -70,6 +114,12 @@ class Sandbox:
         max_workers: int = 4,
         save_screenshots: bool = False,
         screenshots_dir: Optional[str] = None,
+        browser_pool: Optional[BrowserPool] = None,
+        use_browser_pool: Optional[bool] = None,
+        parallel_pages: Optional[int] = None,
+        fast_restore: Optional[bool] = None,
+        asset_cache: Optional[AssetCache] = None,
+        use_asset_cache: Optional[bool] = None,
     ):
         """
         Initialize the sandbox.
@@ -84,11 +134,40 @@ class Sandbox:
             max_workers: Max threads for parallel comparisons (Sprint 5)
             save_screenshots: Save screenshots to disk (Sprint 5)
             screenshots_dir: Directory for screenshots (Sprint 5)
+            browser_pool: Pool to borrow browsers from (default: shared pool)
+            use_browser_pool: False launches a browser per validation
+                              (default: SANDBOX_BROWSER_POOL_ENABLED)
+            parallel_pages: Isolated contexts testing elements concurrently,
+                            1 = sequential on the render page
+                            (default: SANDBOX_PARALLEL_PAGES)
+            fast_restore: Restore pages between element tests from a DOM
+                          snapshot instead of re-rendering
+                          (default: SANDBOX_FAST_RESTORE)
+            asset_cache: Cache serving CDN assets (default: shared cache)
+            use_asset_cache: False renders on the real network with
+                             networkidle waits
+                             (default: SANDBOX_ASSET_CACHE_ENABLED)
         """
         self.viewport = {"width": viewport_width, "height": viewport_height}
         self.timeout_ms = timeout_ms
         self.stabilization_ms = stabilization_ms
         self._playwright_available: Optional[bool] = None
+        self._browser_pool = browser_pool
+        self._use_browser_pool = (
+            use_browser_pool
+            if use_browser_pool is not None
+            else settings.SANDBOX_BROWSER_POOL_ENABLED
+        )
+        self._parallel_pages = max(
+            1, parallel_pages if parallel_pages is not None else settings.SANDBOX_PARALLEL_PAGES
+        )
+        self._fast_restore = (
+            fast_restore if fast_restore is not None else settings.SANDBOX_FAST_RESTORE
+        )
+        self._snapshot = PageSnapshot()
+        if use_asset_cache is None:
+            use_asset_cache = settings.SANDBOX_ASSET_CACHE_ENABLED
+        self._asset_cache = (asset_cache or get_asset_cache()) if use_asset_cache else None
 
         # Sprint 5: DiffEngine integration
         self._use_diff_engine = use_diff_engine
@@ -96,15 +175,29 @@ class Sandbox:
         self._max_workers = max_workers
         self._save_screenshots = save_screenshots
 
-        # Initialize Sprint 5 components
-        self._diff_engine = DiffEngine() if use_diff_engine else None
+        # Initialize Sprint 5 components (the engine also serves the
+        # PERCEPTUAL comparison used when use_diff_engine is False)
+        self._diff_engine = DiffEngine()
         self._classifier = ResultClassifier() if use_diff_engine else None
         self._exporter = ScreenshotExporter(screenshots_dir) if save_screenshots else None
         self._executor = ThreadPoolExecutor(max_workers=max_workers) if parallel_comparisons else None
 
+        # CDP sessions for thumbnail captures (None once CDP proved unavailable)
+        self._cdp_sessions: Optional[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+
         # Store classifications for report generation
         self._classifications: Dict[str, "ClassificationResult"] = {}
 
+    @property
+    def comparison_mode(self) -> ComparisonMode:
+        """
+        Screenshot comparison mode used for element tests.
+
+        PIXEL: multi-scale DiffEngine.compare + ResultClassifier.
+        PERCEPTUAL: downsampled global comparison (fallback).
+        """
+        return ComparisonMode.PIXEL if self._use_diff_engine else ComparisonMode.PERCEPTUAL
+
     async def check_playwright_available(self) -> bool:
         """Check if Playwright is installed."""
         if self._playwright_available is not None:
@@ -123,7 +216,16 @@ class Sandbox:
 
         return self._playwright_available
 
-    async def validate(self, html: str, js_only: bool = False) -> ValidationResult:
+    async def validate(
+        self,
+        html: str,
+        js_only: bool = False,
+        session: Optional[RenderSession] = None,
+        previous: Optional[ValidationResult] = None,
+        tailwind_patches: Optional[List["TailwindPatch"]] = None,
+        js_patches: Optional[List["JSPatch"]] = None,
+        context: Optional["BrowserContext"] = None,
+    ) -> ValidationResult:
         """
         Validate HTML by rendering and testing interactions.
 
@@ -131,6 +233,14 @@ class Sandbox:
             html: HTML content to validate
             js_only: If True, only capture JS errors without testing interactive elements.
                      This is much faster (~5s vs ~60s) for Human Feedback Mode.
+            session: Existing render of `html` to test on (no new render)
+            previous: Validation of the HTML the patches were applied to;
+                      enables incremental mode (only affected elements re-tested)
+            tailwind_patches: Tailwind patches applied since `previous`
+            js_patches: JavaScript patches applied since `previous`
+            context: Context of a browser the caller already holds; the
+                     render opens its own context on that browser instead
+                     of borrowing one from the pool
 
         Returns:
             ValidationResult with test results for each element
@@ -139,6 +249,7 @@ class Sandbox:
         result = ValidationResult(
             viewport_width=self.viewport["width"],
             viewport_height=self.viewport["height"],
+            comparison_mode=self.comparison_mode,
         )
 
         # Check Playwright
@@ -147,47 +258,58 @@ class Sandbox:
             result.validation_time_ms = (time.time() - start_time) * 1000
             return result
 
-        try:
-            from playwright.async_api import async_playwright
-
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context(viewport=self.viewport)
-                page = await context.new_page()
-
-                # Capture JS errors
-                page.on("pageerror", lambda e: result.js_errors.append(str(e)))
-                page.on("console", lambda msg: (
-                    result.console_errors.append(msg.text)
-                    if msg.type == "error" else None
-                ))
+        plan: Optional[IncrementalPlan] = None
+        if previous is not None and not js_only:
+            try:
+                plan = IncrementalPlan.build(
+                    previous, html, tailwind_patches or [], js_patches or []
+                )
+            except Exception as e:
+                logger.warning(f"Incremental validation unavailable: {e}")
 
-                # Render HTML
-                await page.set_content(html, wait_until="networkidle")
-                await page.wait_for_load_state("domcontentloaded")
-                await page.wait_for_timeout(150)  # JS initialization buffer
+        try:
+            if session is not None:
+                async with session.use() as page:
+                    # Load-time errors and screenshot come from the session render
+                    result.js_errors.extend(session.load_js_errors)
+                    result.console_errors.extend(session.load_console_errors)
+                    result.initial_screenshot = session.initial_screenshot
+                    js_mark = len(session.js_errors)
+                    console_mark = len(session.console_errors)
+
+                    if not js_only:
+                        await self._test_interactive(
+                            session.context, page, html, result, plan
+                        )
+
+                    result.js_errors.extend(session.js_errors[js_mark:])
+                    result.console_errors.extend(session.console_errors[console_mark:])
+            else:
+                async with self._validation_context(context) as context:
+                    page = await context.new_page()
 
-                # Take initial screenshot
-                result.initial_screenshot = await page.screenshot()
+                    # Capture JS errors
+                    page.on("pageerror", lambda e: result.js_errors.append(str(e)))
+                    page.on("console", lambda msg: (
+                        result.console_errors.append(msg.text)
+                        if msg.type == "error" else None
+                    ))
 
-                # js_only mode: skip element testing (Human Feedback Mode)
-                if js_only:
-                    logger.info("JS-only mode: skipping element interaction tests")
-                    await browser.close()
-                    result.validation_time_ms = (time.time() - start_time) * 1000
-                    logger.info(f"JS-only validation completed in {result.validation_time_ms:.0f}ms")
-                    return result
+                    # Render HTML
+                    await self._render(page, html)
 
-                # Find interactive elements
-                interactive = await self._find_interactive_elements(page)
-                logger.info(f"Found {len(interactive)} interactive elements")
+                    # Take initial screenshot
+                    result.initial_screenshot = await page.screenshot()
 
-                # Test each element
-                for element in interactive:
-                    element_result = await self._test_element(page, element)
-                    result.element_results.append(element_result)
+                    if not js_only:
+                        await self._test_interactive(context, page, html, result, plan)
 
-                await browser.close()
+            # js_only mode: skip element testing (Human Feedback Mode)
+            if js_only:
+                logger.info("JS-only mode: skipping element interaction tests")
+                result.validation_time_ms = (time.time() - start_time) * 1000
+                logger.info(f"JS-only validation completed in {result.validation_time_ms:.0f}ms")
+                return result
 
         except Exception as e:
             logger.error(f"Sandbox validation failed: {e}")
@@ -197,6 +319,260 @@ class Sandbox:
         logger.info(result.describe())
         return result
 
+    async def _test_interactive(
+        self,
+        context: "BrowserContext",
+        page: "Page",
+        html: str,
+        result: ValidationResult,
+        plan: Optional[IncrementalPlan] = None,
+    ) -> None:
+        """
+        Find the interactive elements of the rendered page and click-test each.
+
+        With an incremental plan, elements it doesn't mark as affected keep
+        their previous result instead of being clicked.
+        """
+        interactive = await self._find_interactive_elements(page)
+        logger.info(f"Found {len(interactive)} interactive elements")
+
+        reused = plan.reusable(interactive) if plan is not None else {}
+        to_test = [e for e in interactive if e.selector not in reused]
+        if reused:
+            logger.info(
+                f"Incremental validation: re-testing {len(to_test)}, "
+                f"reusing {len(reused)} previous results"
+            )
+
+        # Test each element, starting each from the initial state
+        if self._parallel_pages > 1 and len(to_test) > 1:
+            await self._test_elements_parallel(context, html, to_test, result)
+        else:
+            await self._take_snapshot(page)
+            for index, element in enumerate(to_test):
+                if index:
+                    await self._restore(page, html)
+                element_result = await self._test_element(page, element)
+                result.element_results.append(element_result)
+
+        if reused:
+            # Merge back in element discovery order
+            by_selector = {r.selector: r for r in result.element_results}
+            by_selector.update(reused)
+            result.element_results = [by_selector[e.selector] for e in interactive]
+            result.reused_elements = len(reused)
+            for selector, element_result in reused.items():
+                if element_result.classification is not None:
+                    self._classifications[selector] = element_result.classification
+
+        if self._fast_restore and to_test:
+            logger.debug(f"Page restore: {self.restore_stats.as_dict()}")
+
+    def render_sessions(self, max_sessions: int = 4) -> RenderSessionCache:
+        """
+        Render session cache for one fix run (use as an async context manager).
+
+        Args:
+            max_sessions: HTML versions kept rendered at once
+        """
+        return RenderSessionCache(self, max_sessions=max_sessions)
+
+    @asynccontextmanager
+    async def _open_context(self) -> AsyncIterator["BrowserContext"]:
+        """
+        Open a fresh BrowserContext for one validation.
+
+        Borrows a long-lived browser from the pool, or launches (and closes)
+        a dedicated one when the pool is disabled.
+        """
+        if self._use_browser_pool:
+            pool = self._browser_pool or get_browser_pool()
+            async with pool.context(viewport=self.viewport) as context:
+                await self._route_assets(context)
+                yield context
+            return
+
+        from playwright.async_api import async_playwright
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                context = await browser.new_context(viewport=self.viewport)
+                await self._route_assets(context)
+                yield context
+            finally:
+                await browser.close()
+
+    @asynccontextmanager
+    async def _validation_context(
+        self, base_context: Optional["BrowserContext"] = None
+    ) -> AsyncIterator["BrowserContext"]:
+        """
+        Fresh context for one validation: on the browser of `base_context`
+        when given (nothing borrowed), else from _open_context().
+        """
+        if base_context is None:
+            async with self._open_context() as context:
+                yield context
+            return
+
+        context = await self._new_worker_context(base_context)
+        try:
+            yield context
+        finally:
+            try:
+                await context.close()
+            except Exception as e:
+                logger.debug(f"Closing validation context failed: {e}")
+
+    async def _route_assets(self, context: "BrowserContext") -> None:
+        """Serve the context's requests from the asset cache (if enabled)."""
+        if self._asset_cache is not None:
+            await self._asset_cache.install(context)
+
+    async def _render(self, page: "Page", html: str) -> None:
+        """Load the HTML and wait for it to settle (timed for restore_stats)."""
+        start = time.perf_counter()
+        if self._asset_cache is not None:
+            # Nothing goes to the network: "load" covers every subresource
+            await page.set_content(html, wait_until="load")
+            await page.evaluate(READY_SCRIPT)
+        else:
+            await page.set_content(html, wait_until="networkidle")
+            await page.wait_for_load_state("domcontentloaded")
+        await page.wait_for_timeout(150)  # JS initialization buffer
+        self._snapshot.stats.record_render((time.perf_counter() - start) * 1000)
+
+    @property
+    def restore_stats(self) -> PageRestoreStats:
+        """Snapshot restore vs re-render timings, accumulated over validations."""
+        return self._snapshot.stats
+
+    async def _take_snapshot(self, page: "Page") -> None:
+        """Snapshot the freshly rendered page for _restore (if enabled)."""
+        if self._fast_restore:
+            await self._snapshot.capture(page)
+
+    async def _restore(self, page: "Page", html: str) -> None:
+        """
+        Bring the page back to its initial render.
+
+        Undoes the DOM changes since the snapshot; re-renders (and
+        snapshots again) only if that restore isn't exact.
+        """
+        if self._fast_restore and await self._snapshot.restore(page):
+            return
+        await self._render_and_snapshot(page, html)
+
+    async def _render_and_snapshot(self, page: "Page", html: str) -> None:
+        """Full render, then snapshot it."""
+        await self._render(page, html)
+        await self._take_snapshot(page)
+
+    async def _test_elements_parallel(
+        self,
+        context: "BrowserContext",
+        html: str,
+        elements: List[ElementInfo],
+        result: ValidationResult,
+    ) -> None:
+        """
+        Test elements concurrently on isolated worker contexts.
+
+        Each worker owns one context + page and takes elements from a shared
+        queue; before every test the page is restored to the initial render
+        (see _restore), so a click never sees state left by another
+        element's click. Results and errors raised
+        during the clicks are merged in element discovery order, whatever
+        order the workers finish in.
+
+        Args:
+            context: Context of the initial render (its browser hosts the workers)
+            html: HTML content to restore before each test
+            elements: Interactive elements found on the initial render
+            result: ValidationResult to append element results and errors to
+        """
+        queue: "asyncio.Queue" = asyncio.Queue()
+        for index, element in enumerate(elements):
+            queue.put_nowait((index, element))
+
+        element_results: List[Optional[ElementResult]] = [None] * len(elements)
+        js_errors: List[List[str]] = [[] for _ in elements]
+        console_errors: List[List[str]] = [[] for _ in elements]
+
+        async def worker() -> None:
+            worker_context = await self._new_worker_context(context)
+            try:
+                page = await worker_context.new_page()
+                page_errors: List[str] = []
+                page_console: List[str] = []
+                page.on("pageerror", lambda e: page_errors.append(str(e)))
+                page.on("console", lambda msg: (
+                    page_console.append(msg.text)
+                    if msg.type == "error" else None
+                ))
+
+                rendered = False
+                while True:
+                    try:
+                        index, element = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+
+                    try:
+                        if rendered:
+                            await self._restore(page, html)
+                        else:
+                            await self._render_and_snapshot(page, html)
+                            rendered = True
+                    except Exception as e:
+                        element_results[index] = ElementResult(
+                            selector=element.selector,
+                            status=ElementStatus.ERROR,
+                            error=f"Restore failed: {e}",
+                        )
+                        continue
+
+                    # Load-time errors are already in result from the initial render
+                    page_errors.clear()
+                    page_console.clear()
+                    element_results[index] = await self._test_element(page, element)
+                    js_errors[index] = list(page_errors)
+                    console_errors[index] = list(page_console)
+            finally:
+                await worker_context.close()
+
+        workers = min(self._parallel_pages, len(elements))
+        outcomes = await asyncio.gather(
+            *(worker() for _ in range(workers)), return_exceptions=True
+        )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                logger.warning(f"Sandbox worker failed: {outcome}")
+
+        for index, element in enumerate(elements):
+            element_result = element_results[index]
+            if element_result is None:
+                element_result = ElementResult(
+                    selector=element.selector,
+                    status=ElementStatus.NOT_TESTED,
+                    error="No sandbox worker available",
+                )
+            result.element_results.append(element_result)
+
+            for error in js_errors[index]:
+                if error not in result.js_errors:
+                    result.js_errors.append(error)
+            for error in console_errors[index]:
+                if error not in result.console_errors:
+                    result.console_errors.append(error)
+
+    async def _new_worker_context(self, context: "BrowserContext") -> "BrowserContext":
+        """Open an isolated context on the same browser as `context`."""
+        worker_context = await context.browser.new_context(viewport=self.viewport)
+        await self._route_assets(worker_context)
+        return worker_context
+
     async def _find_interactive_elements(self, page: "Page") -> List[ElementInfo]:
         """
         Find all interactive elements in the page.
@@ -300,13 +676,16 @@ class Sandbox:
         """
         Test a single element by clicking it.
 
-        Captures screenshots before and after to detect visual changes.
+        Captures the element's local region and a viewport thumbnail before
+        and after the click to detect visual changes.
         Uses DiffEngine for multi-scale comparison (Sprint 5).
         Handles various error conditions like interception and timeouts.
         """
         try:
-            # Screenshot before
-            before = await page.screenshot()
+            region_box = self._capture_region(element)
+
+            # Capture before
+            before = await self._capture(page, region_box)
 
             # Try to click
             locator = page.locator(element.selector).first
@@ -315,12 +694,12 @@ class Sandbox:
             # Wait for visual changes
             await page.wait_for_timeout(self.stabilization_ms)
 
-            # Screenshot after
-            after = await page.screenshot()
+            # Capture after
+            after = await self._capture(page, region_box)
 
             # Sprint 5: Use DiffEngine if available
-            if self._use_diff_engine and self._diff_engine:
-                diff_result = self._diff_engine.compare(
+            if self._use_diff_engine:
+                diff_result = self._diff_engine.compare_captures(
                     before,
                     after,
                     element.bounding_box,
@@ -339,8 +718,8 @@ class Sandbox:
                 if self._save_screenshots and self._exporter:
                     self._exporter.export(
                         element.selector,
-                        before,
-                        after,
+                        before.region,
+                        after.region,
                         diff_result,
                     )
 
@@ -348,18 +727,22 @@ class Sandbox:
                     selector=element.selector,
                     status=status,
                     diff_ratio=diff_ratio,
-                    before_screenshot=before,
-                    after_screenshot=after,
+                    before_screenshot=before.region,
+                    after_screenshot=after.region,
                     diff_result=diff_result,
                     classification=classification,
                 )
             else:
-                # Fallback to Sprint 4 behavior
-                diff_ratio = self._compare_screenshots(before, after)
+                # Fallback: single global perceptual comparison
+                diff_ratio = self._compare_screenshots(before.thumbnail, after.thumbnail)
+                threshold = (
+                    ResultClassifier.RESPONSIVE_THRESHOLD
+                    * MODE_THRESHOLD_SCALE[ComparisonMode.PERCEPTUAL]
+                )
 
                 status = (
                     ElementStatus.RESPONSIVE
-                    if diff_ratio > 0.02
+                    if diff_ratio > threshold
                     else ElementStatus.NO_VISUAL_CHANGE
                 )
 
@@ -367,8 +750,8 @@ class Sandbox:
                     selector=element.selector,
                     status=status,
                     diff_ratio=diff_ratio,
-                    before_screenshot=before,
-                    after_screenshot=after,
+                    before_screenshot=before.region,
+                    after_screenshot=after.region,
                 )
 
         except Exception as e:
@@ -399,6 +782,75 @@ class Sandbox:
                 error=error_msg,
             )
 
+    def _capture_region(self, element: ElementInfo) -> Tuple[int, int, int, int]:
+        """
+        Viewport region captured for an element: its box + LOCAL_PADDING.
+
+        Falls back to the whole viewport when the element lies outside it.
+        """
+        viewport_size = (self.viewport["width"], self.viewport["height"])
+        box = self._diff_engine._expand_box(
+            element.bounding_box, self._diff_engine.local_padding, viewport_size
+        )
+        if box[2] <= box[0] or box[3] <= box[1]:
+            return (0, 0, viewport_size[0], viewport_size[1])
+        return box
+
+    async def _capture(
+        self, page: "Page", region_box: Tuple[int, int, int, int]
+    ) -> ElementCapture:
+        """Capture an element region (PNG) and a viewport thumbnail (JPEG)."""
+        x1, y1, x2, y2 = region_box
+        region = await page.screenshot(
+            clip={"x": x1, "y": y1, "width": x2 - x1, "height": y2 - y1}
+        )
+        thumbnail, scale = await self._capture_thumbnail(page)
+        return ElementCapture(
+            region=region,
+            region_box=region_box,
+            thumbnail=thumbnail,
+            thumbnail_scale=scale,
+        )
+
+    async def _capture_thumbnail(self, page: "Page") -> Tuple[bytes, float]:
+        """
+        Low-res JPEG of the viewport.
+
+        Chromium renders it directly at THUMBNAIL_SCALE through CDP
+        (Page.captureScreenshot clip.scale); without CDP a full-size JPEG
+        is captured instead.
+
+        Returns:
+            (JPEG bytes, thumbnail px per viewport px)
+        """
+        if self._cdp_sessions is not None:
+            try:
+                session = self._cdp_sessions.get(page)
+                if session is None:
+                    session = await page.context.new_cdp_session(page)
+                    self._cdp_sessions[page] = session
+
+                # CDP clips are in document coordinates
+                scroll_x, scroll_y = await page.evaluate("() => [window.scrollX, window.scrollY]")
+                capture = await session.send("Page.captureScreenshot", {
+                    "format": "jpeg",
+                    "quality": self.THUMBNAIL_JPEG_QUALITY,
+                    "clip": {
+                        "x": scroll_x,
+                        "y": scroll_y,
+                        "width": self.viewport["width"],
+                        "height": self.viewport["height"],
+                        "scale": self.THUMBNAIL_SCALE,
+                    },
+                })
+                return base64.b64decode(capture["data"]), self.THUMBNAIL_SCALE
+            except Exception as e:
+                logger.debug(f"CDP thumbnail unavailable ({e}), using full-size JPEG")
+                self._cdp_sessions = None
+
+        thumbnail = await page.screenshot(type="jpeg", quality=self.THUMBNAIL_JPEG_QUALITY)
+        return thumbnail, 1.0
+
     def _classification_to_status(
         self,
         classification: InteractionClassification
@@ -434,8 +886,10 @@ class Sandbox:
         """
         Compare two screenshots and return difference ratio.
 
-        Simple byte comparison for Sprint 4. Sprint 5 will add
-        proper pixel-level diff with pixelmatch.
+        Decodes both PNGs and compares them downsampled (PERCEPTUAL mode),
+        sharing DiffEngine's pixel tolerance. The ratio is the share of
+        downsampled cells that changed, so it must be judged with
+        PERCEPTUAL-calibrated thresholds (see MODE_THRESHOLD_SCALE).
 
         Args:
             before: Screenshot bytes before action
@@ -447,13 +901,9 @@ class Sandbox:
         if before == after:
             return 0.0
 
-        # Simple comparison: count different bytes
-        min_len = min(len(before), len(after))
-        diff_count = sum(1 for i in range(min_len) if before[i] != after[i])
-        diff_count += abs(len(before) - len(after))
-
-        total = max(len(before), len(after))
-        return diff_count / total if total > 0 else 0.0
+        return self._diff_engine.compare_quick(
+            before, after, mode=ComparisonMode.PERCEPTUAL
+        )
 
     def _extract_blocker(self, error_msg: str) -> Optional[str]:
         """
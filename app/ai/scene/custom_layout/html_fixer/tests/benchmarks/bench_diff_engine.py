@@ -0,0 +1,105 @@
+"""
+Benchmarks for DiffEngine pixel comparison.
+
+Compares the Pillow C-level comparison (ImageChops + ImageMath) with the
+original pure-Python per-pixel loop on full-HD screenshots.
+
+Note: Install pytest-benchmark for actual benchmarking:
+    pip install pytest-benchmark
+
+Run benchmarks with:
+    python -m pytest html_fixer/tests/benchmarks/bench_diff_engine.py --benchmark-only -v
+"""
+
+import io
+
+import pytest
+from PIL import Image
+
+from html_fixer.sandbox.diff_engine import ComparisonScale, DiffEngine
+from html_fixer.tests.test_diff_engine import legacy_region_diff
+
+# Check if pytest-benchmark is available
+try:
+    import pytest_benchmark
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+# Create a conditional benchmark decorator
+if not HAS_BENCHMARK:
+    def benchmark_mark(group):
+        return pytest.mark.skipif(
+            not HAS_BENCHMARK,
+            reason="pytest-benchmark not installed"
+        )
+else:
+    def benchmark_mark(group):
+        return pytest.mark.benchmark(group=group)
+
+
+ELEMENT_BOX = {"x": 860, "y": 500, "width": 200, "height": 80}
+
+
+@pytest.fixture
+def screenshots():
+    """Full-HD before/after screenshots with a button-sized change."""
+    before = Image.new("RGB", (1920, 1080), (245, 245, 245))
+    before.paste((59, 130, 246), (860, 500, 1060, 580))
+    after = before.copy()
+    after.paste((37, 99, 235), (860, 500, 1060, 580))
+
+    def png(img):
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    return png(before), png(after), before, after
+
+
+class TestDiffEngineBenchmarks:
+    """DiffEngine compare() and region comparison."""
+
+    @pytest.fixture
+    def engine(self):
+        return DiffEngine()
+
+    @benchmark_mark("diff_engine")
+    def test_compare_full_hd(self, benchmark, engine, screenshots):
+        """Benchmark multi-scale compare() on PNG bytes (decode included)."""
+        before, after, _, _ = screenshots
+        result = benchmark(lambda: engine.compare(before, after, ELEMENT_BOX))
+
+        assert result.has_significant_change
+
+    @benchmark_mark("diff_engine")
+    def test_global_region(self, benchmark, engine, screenshots):
+        """Benchmark the global (full page) region comparison."""
+        _, _, before, after = screenshots
+        result = benchmark(
+            lambda: engine._compare_region(before, after, None, ComparisonScale.GLOBAL, False)
+        )
+
+        assert result.diff_count == 200 * 80
+
+    @benchmark_mark("diff_engine")
+    def test_global_region_legacy(self, benchmark, screenshots):
+        """Benchmark the original per-pixel loop (reference)."""
+        _, _, before, after = screenshots
+        count, _ = benchmark.pedantic(
+            lambda: legacy_region_diff(before, after, DiffEngine.PIXEL_TOLERANCE),
+            rounds=1,
+            iterations=1,
+        )
+
+        assert count == 200 * 80
+
+    @benchmark_mark("diff_engine")
+    def test_diff_images(self, benchmark, engine, screenshots):
+        """Benchmark compare() with diff image generation."""
+        before, after, _, _ = screenshots
+        result = benchmark(
+            lambda: engine.compare(before, after, ELEMENT_BOX, generate_diff_images=True)
+        )
+
+        assert result.global_.diff_image is not None
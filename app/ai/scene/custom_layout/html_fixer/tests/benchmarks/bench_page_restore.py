@@ -0,0 +1,123 @@
+"""
+Benchmarks for restoring the page between Sandbox element tests.
+
+Compares a full re-render (set_content + networkidle + JS init buffer)
+with a PageSnapshot restore after a click that opens a modal, toggles
+classes and appends nodes. Needs a Chromium install
+(`playwright install chromium`); skipped otherwise.
+
+Note: Install pytest-benchmark for actual benchmarking:
+    pip install pytest-benchmark
+
+Run benchmarks with:
+    python -m pytest html_fixer/tests/benchmarks/bench_page_restore.py --benchmark-only -v
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from html_fixer.sandbox import PageSnapshot, Sandbox
+
+# Check if pytest-benchmark is available
+try:
+    import pytest_benchmark
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+# Create a conditional benchmark decorator
+if not HAS_BENCHMARK:
+    def benchmark_mark(group):
+        return pytest.mark.skipif(
+            not HAS_BENCHMARK,
+            reason="pytest-benchmark not installed"
+        )
+else:
+    def benchmark_mark(group):
+        return pytest.mark.benchmark(group=group)
+
+
+ROUNDS = 10
+
+PAGE = """<!DOCTYPE html>
+<html>
+<head><style>
+    .card { padding: 16px; margin: 8px; background: #eef; transition: background 0.3s; }
+    .card.active { background: #88f; }
+    .spinner { width: 20px; height: 20px; border: 3px solid #333; animation: spin 1s linear infinite; }
+    @keyframes spin { to { transform: rotate(360deg); } }
+    #modal { display: none; position: fixed; inset: 0; background: rgba(0,0,0,.5); }
+    #modal.open { display: block; }
+</style></head>
+<body>
+    <div class="spinner"></div>
+    <button id="open" onclick="openModal()">Open</button>
+    <div id="list"></div>
+    <div id="modal"><button onclick="this.parentNode.classList.remove('open')">Close</button></div>
+    <script>
+        const list = document.getElementById('list');
+        for (let i = 0; i < 200; i++) {
+            const card = document.createElement('div');
+            card.className = 'card';
+            card.textContent = 'Card ' + i;
+            list.appendChild(card);
+        }
+        function openModal() {
+            document.getElementById('modal').classList.add('open');
+            document.querySelectorAll('.card').forEach((c) => c.classList.toggle('active'));
+            list.appendChild(document.createElement('hr'));
+        }
+    </script>
+</body>
+</html>"""
+
+
+async def _measure(rounds: int) -> dict:
+    """Average ms per test start: re-render vs click + snapshot restore."""
+    from playwright.async_api import async_playwright
+
+    sandbox = Sandbox()
+    snapshot = PageSnapshot()
+
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except Exception as e:
+            pytest.skip(f"Chromium not available: {e}")
+
+        page = await browser.new_page(viewport=sandbox.viewport)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            await sandbox._render(page, PAGE)
+        render_ms = (time.perf_counter() - start) * 1000 / rounds
+
+        await snapshot.capture(page)
+        restore_ms = 0.0
+        for _ in range(rounds):
+            await page.click("#open")
+            start = time.perf_counter()
+            assert await snapshot.restore(page)
+            restore_ms += (time.perf_counter() - start) * 1000
+        restore_ms /= rounds
+
+        assert await page.evaluate("document.querySelectorAll('hr').length") == 0
+        await browser.close()
+
+    return {"render_ms": round(render_ms, 1), "restore_ms": round(restore_ms, 1)}
+
+
+class TestPageRestoreBenchmarks:
+    """Per-test page reset cost."""
+
+    @benchmark_mark("page_restore")
+    def test_restore_vs_render(self, benchmark):
+        """Benchmark snapshot restore against a full re-render."""
+        timings = benchmark.pedantic(
+            lambda: asyncio.run(_measure(ROUNDS)), rounds=1, iterations=1
+        )
+        benchmark.extra_info.update(timings)
+
+        assert timings["restore_ms"] < timings["render_ms"]
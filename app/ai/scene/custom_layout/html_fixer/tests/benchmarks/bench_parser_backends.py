@@ -0,0 +1,134 @@
+"""
+Benchmarks for the DOMParser backends.
+
+Parses and statically classifies (classify_static) every HTML file of the
+fixture corpus with each installed backend: "html.parser", "lxml",
+"html5lib". Every run uses a fresh DocumentCache so parses are measured,
+not cache hits. Conformance of the results is covered by
+tests/test_parser_backends.py.
+
+Note: Install pytest-benchmark for actual benchmarking:
+    pip install pytest-benchmark
+
+Run benchmarks with:
+    python -m pytest html_fixer/tests/benchmarks/bench_parser_backends.py --benchmark-only -v
+"""
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from html_fixer.analyzers import PARSER_BACKENDS, DOMParser, DocumentCache
+from html_fixer.validators.classification_pipeline import ErrorClassificationPipeline
+
+# Check if pytest-benchmark is available
+try:
+    import pytest_benchmark
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+# Create a conditional benchmark decorator
+if not HAS_BENCHMARK:
+    def benchmark_mark(group):
+        return pytest.mark.skipif(
+            not HAS_BENCHMARK,
+            reason="pytest-benchmark not installed"
+        )
+else:
+    def benchmark_mark(group):
+        return pytest.mark.benchmark(group=group)
+
+
+ROUNDS = 5
+
+TESTS_DIR = Path(__file__).parent.parent
+
+CORPUS = sorted(
+    list((TESTS_DIR / "fixtures").rglob("*.html"))
+    + list((TESTS_DIR / "test_htmls").rglob("*.html"))
+)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    """HTML of every fixture file."""
+    return [path.read_text(encoding="utf-8") for path in CORPUS]
+
+
+def _require(backend: str) -> None:
+    if backend != "html.parser":
+        pytest.importorskip(backend)
+
+
+def _parse_all(corpus, backend):
+    return [DOMParser(html, backend=backend) for html in corpus]
+
+
+def _classify_all(corpus, backend):
+    async def run():
+        pipeline = ErrorClassificationPipeline(documents=DocumentCache(backend=backend))
+        return [await pipeline.classify_static(html) for html in corpus]
+
+    return asyncio.run(run())
+
+
+def _measure(corpus, rounds: int) -> dict:
+    """Average ms per corpus pass (parse, parse + classify_static) per backend."""
+    timings = {}
+    for backend in PARSER_BACKENDS:
+        if backend != "html.parser":
+            try:
+                __import__(backend)
+            except ImportError:
+                continue
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            _parse_all(corpus, backend)
+        parse_ms = (time.perf_counter() - start) * 1000 / rounds
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            _classify_all(corpus, backend)
+        classify_ms = (time.perf_counter() - start) * 1000 / rounds
+
+        timings[backend] = {
+            "parse_ms": round(parse_ms, 1),
+            "classify_static_ms": round(classify_ms, 1),
+        }
+    return timings
+
+
+class TestParserBackendBenchmarks:
+    """Parse and classify_static cost per backend on the fixture corpus."""
+
+    @benchmark_mark("parser_backends")
+    @pytest.mark.parametrize("backend", PARSER_BACKENDS)
+    def test_parse(self, benchmark, corpus, backend):
+        """Benchmark parsing the corpus."""
+        _require(backend)
+        parsers = benchmark(lambda: _parse_all(corpus, backend))
+
+        assert len(parsers) == len(corpus)
+
+    @benchmark_mark("parser_backends")
+    @pytest.mark.parametrize("backend", PARSER_BACKENDS)
+    def test_classify_static(self, benchmark, corpus, backend):
+        """Benchmark parse + static classification of the corpus."""
+        _require(backend)
+        reports = benchmark(lambda: _classify_all(corpus, backend))
+
+        assert len(reports) == len(corpus)
+
+    @benchmark_mark("parser_backends")
+    def test_backend_comparison(self, benchmark, corpus):
+        """Side by side timings of every installed backend."""
+        timings = benchmark.pedantic(
+            lambda: _measure(corpus, ROUNDS), rounds=1, iterations=1
+        )
+        benchmark.extra_info.update(timings)
+
+        assert "html.parser" in timings
@@ -0,0 +1,132 @@
+"""
+Scaling benchmarks for static pointer-blockage detection.
+
+Synthetic layouts of 1k to 10k elements: sections of cards, each card a
+z-indexed stacking context with a decorative overlay (half of them
+without pointer-events-none), a badge and buttons, plus fixed navigation.
+Per-element cost of PointerBlockageDetector (ElementIndex build included)
+and of the ZIndexHierarchyBuilder conflict queries should stay flat as the
+page grows (near-linear), where pairwise checks grow with the number of
+blockers.
+
+find_conflicts returns every overlapping pair, so layouts where many
+same-z contexts overlap (e.g. hundreds of z-10 absolute badges) are
+output-bound; the cards here share z-indexes without overlapping.
+
+Note: Install pytest-benchmark for actual benchmarking:
+    pip install pytest-benchmark
+
+Run benchmarks with:
+    python -m pytest html_fixer/tests/benchmarks/bench_pointer_scaling.py --benchmark-only -v
+"""
+
+import time
+
+import pytest
+
+from html_fixer.analyzers import (
+    DOMParser,
+    InteractiveDetector,
+    PointerBlockageDetector,
+    ZIndexHierarchyBuilder,
+)
+
+# Check if pytest-benchmark is available
+try:
+    import pytest_benchmark
+    HAS_BENCHMARK = True
+except ImportError:
+    HAS_BENCHMARK = False
+
+# Create a conditional benchmark decorator
+if not HAS_BENCHMARK:
+    def benchmark_mark(group):
+        return pytest.mark.skipif(
+            not HAS_BENCHMARK,
+            reason="pytest-benchmark not installed"
+        )
+else:
+    def benchmark_mark(group):
+        return pytest.mark.benchmark(group=group)
+
+
+SIZES = (1_000, 2_000, 5_000, 10_000)
+
+# Elements per card (see _card)
+CARD_ELEMENTS = 7
+
+
+def _card(i: int) -> str:
+    overlay = "absolute inset-0 bg-black/10" + (" pointer-events-none" if i % 2 else "")
+    return (
+        f'<div class="card relative z-{10 * (i % 5)} p-4">'
+        f'<div class="{overlay}"></div>'
+        f'<span class="badge absolute top-0 right-0">{i}</span>'
+        f'<h3 class="text-lg">Card {i}</h3>'
+        f'<p><button class="buy px-4" data-id="{i}">Buy</button></p>'
+        f'<a class="more" href="#card-{i}">More</a>'
+        f'</div>'
+    )
+
+
+def synthetic_layout(elements: int) -> str:
+    """HTML page with roughly `elements` elements."""
+    cards = max(1, elements // CARD_ELEMENTS)
+    sections = []
+    for start in range(0, cards, 20):
+        body = "".join(_card(i) for i in range(start, min(start + 20, cards)))
+        sections.append(f'<section class="relative grid grid-cols-4">{body}</section>')
+    return (
+        "<!DOCTYPE html><html><body>"
+        '<nav class="fixed top-0 z-40"><button class="menu">Menu</button></nav>'
+        + "".join(sections)
+        + "</body></html>"
+    )
+
+
+def _detect(html: str) -> float:
+    """Seconds spent in blockage detection and z-index queries (parse excluded)."""
+    parser = DOMParser(html)
+    start = time.perf_counter()
+
+    interactive = InteractiveDetector().find_interactive_elements(parser)
+    PointerBlockageDetector().find_blocked_elements(parser, interactive)
+
+    builder = ZIndexHierarchyBuilder()
+    builder.build_hierarchy(parser)
+    builder.find_conflicts()
+    builder.find_interactive_below_overlay([item.element for item in interactive])
+
+    return time.perf_counter() - start
+
+
+def _per_element_us(elements: int) -> float:
+    html = synthetic_layout(elements)
+    count = len(DOMParser(html).get_all_elements())
+    return min(_detect(html) for _ in range(3)) * 1e6 / count
+
+
+class TestPointerScalingBenchmarks:
+    """Blockage detection cost as the page grows."""
+
+    @benchmark_mark("pointer_scaling")
+    @pytest.mark.parametrize("elements", SIZES)
+    def test_detection(self, benchmark, elements):
+        """Benchmark detection on a synthetic layout."""
+        html = synthetic_layout(elements)
+        seconds = benchmark(lambda: _detect(html))
+
+        assert seconds >= 0
+
+    @benchmark_mark("pointer_scaling")
+    def test_near_linear(self, benchmark):
+        """Per-element cost at 10k elements stays close to the 1k cost."""
+        timings = benchmark.pedantic(
+            lambda: {n: round(_per_element_us(n), 2) for n in (SIZES[0], SIZES[-1])},
+            rounds=1,
+            iterations=1,
+        )
+        benchmark.extra_info.update({f"us_per_element_{n}": t for n, t in timings.items()})
+
+        # Linear: ratio ~1; pairwise checks: ratio ~10
+        assert timings[SIZES[-1]] < 3 * timings[SIZES[0]]
@@ -243,3 +243,28 @@ class TestEndToEndPerformance:
         result = injector.inject(html, patch_set.patches)
         assert result.success
         assert "opacity-100" in result.html
+
+
+class TestDiffEnginePerformance:
+    """
+    Smoke test for DiffEngine pixel comparison.
+
+    Timings vs. the original per-pixel loop: bench_diff_engine.py
+    (wall-clock ratios are too noisy for the collected suite).
+    """
+
+    def test_region_comparison_matches_legacy_loop(self):
+        """C-level comparison counts the same pixels as the original loop."""
+        from PIL import Image
+        from html_fixer.sandbox.diff_engine import ComparisonScale, DiffEngine
+        from html_fixer.tests.test_diff_engine import legacy_region_diff
+
+        before = Image.new("RGB", (640, 360), (255, 255, 255))
+        after = before.copy()
+        after.paste((0, 0, 0), (100, 100, 300, 200))
+        engine = DiffEngine()
+
+        region = engine._compare_region(before, after, None, ComparisonScale.GLOBAL, True)
+        legacy_count, _ = legacy_region_diff(before, after, engine.pixel_tolerance)
+
+        assert region.diff_count == legacy_count == 200 * 100
@@ -0,0 +1,292 @@
+"""
+Tests for the sandbox AssetCache (hermetic renders).
+
+Playwright routes are replaced by fakes:
+- Whitelisted CDN assets served from the versioned on-disk cache
+- Misses fetched once and stored, or stubbed when they can't be fetched
+- Unknown external requests stubbed by resource type
+- Sandbox renders wait for load + ready signal instead of networkidle
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from html_fixer.sandbox import AssetCache, Sandbox
+from html_fixer.sandbox.asset_cache import PRELOAD_URLS, normalize_url
+from html_fixer.sandbox.sandbox import READY_SCRIPT
+
+
+# As Chromium requests it (WHATWG serialization adds the "/" path)
+TAILWIND = "https://cdn.tailwindcss.com/"
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=b"tailwind();", content_type="application/javascript"):
+        self.status = status
+        self.headers = {"content-type": content_type}
+        self._body = body
+
+    async def body(self):
+        return self._body
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type="script", method="GET", response=None):
+        self.request = FakeRequest(url, resource_type, method)
+        self.response = response
+        self.fulfilled = None
+        self.continued = False
+        self.fetches = 0
+
+    async def fulfill(self, status, headers, body):
+        self.fulfilled = {"status": status, "headers": headers, "body": body}
+
+    async def continue_(self):
+        self.continued = True
+
+    async def fetch(self, timeout=None):
+        self.fetches += 1
+        if self.response is None:
+            raise RuntimeError("net::ERR_NAME_NOT_RESOLVED")
+        return self.response
+
+
+def make_cache(tmp_path, **kwargs):
+    kwargs.setdefault("fetch_missing", True)
+    return AssetCache(cache_dir=str(tmp_path), version="test", **kwargs)
+
+
+class TestCache:
+    """Versioned on-disk storage."""
+
+    def test_put_and_get_from_disk(self, tmp_path):
+        make_cache(tmp_path).put(TAILWIND, 200, "application/javascript", b"tw")
+
+        asset = make_cache(tmp_path).get(TAILWIND)
+
+        assert asset.body == b"tw"
+        assert asset.content_type == "application/javascript"
+        assert (tmp_path / "vtest").is_dir()
+
+    def test_versions_are_separate(self, tmp_path):
+        make_cache(tmp_path).put(TAILWIND, 200, "application/javascript", b"tw")
+
+        other = AssetCache(cache_dir=str(tmp_path), version="other")
+
+        assert other.get(TAILWIND) is None
+
+    def test_whitelist(self, tmp_path):
+        cache = make_cache(tmp_path)
+
+        assert cache.is_whitelisted("https://fonts.gstatic.com/s/inter/v12/a.woff2")
+        assert not cache.is_whitelisted("https://tracker.example.com/pixel.gif")
+
+    @pytest.mark.parametrize("url, expected", [
+        ("https://cdn.tailwindcss.com", "https://cdn.tailwindcss.com/"),
+        ("HTTPS://CDN.Tailwindcss.com:443/?plugins=forms#x", "https://cdn.tailwindcss.com/?plugins=forms"),
+        ("http://example.com:8080", "http://example.com:8080/"),
+        ("data:text/css,body{}", "data:text/css,body{}"),
+    ])
+    def test_normalize_url(self, url, expected):
+        assert normalize_url(url) == expected
+
+    def test_equivalent_urls_share_an_entry(self, tmp_path):
+        make_cache(tmp_path).put("https://cdn.tailwindcss.com", 200, "application/javascript", b"tw")
+
+        assert make_cache(tmp_path).get(TAILWIND).body == b"tw"
+        assert len(list((tmp_path / "vtest").glob("*.body"))) == 1
+
+
+class TestRouting:
+    """AssetCache.handle as a Playwright route handler."""
+
+    async def test_hit_is_served_without_network(self, tmp_path):
+        cache = make_cache(tmp_path)
+        cache.put(TAILWIND, 200, "application/javascript", b"tw")
+        route = FakeRoute(TAILWIND)
+
+        await cache.handle(route)
+
+        assert route.fulfilled["body"] == b"tw"
+        assert route.fetches == 0
+        assert cache.stats.hits == 1
+
+    async def test_miss_is_fetched_once(self, tmp_path):
+        cache = make_cache(tmp_path)
+
+        first = FakeRoute(TAILWIND, response=FakeResponse())
+        await cache.handle(first)
+        second = FakeRoute(TAILWIND, response=FakeResponse())
+        await cache.handle(second)
+
+        assert first.fetches == 1 and second.fetches == 0
+        assert second.fulfilled["body"] == b"tailwind();"
+        assert cache.stats.as_dict()["fetched"] == 1
+        assert make_cache(tmp_path).get(TAILWIND) is not None
+
+    async def test_unfetchable_miss_is_stubbed(self, tmp_path):
+        cache = make_cache(tmp_path)
+        route = FakeRoute(TAILWIND)
+
+        await cache.handle(route)
+
+        assert route.fulfilled == {
+            "status": 200,
+            "headers": {"content-type": "application/javascript", "access-control-allow-origin": "*"},
+            "body": b"",
+        }
+        assert cache.stats.fetch_failures == 1
+
+    async def test_error_status_is_not_cached(self, tmp_path):
+        cache = make_cache(tmp_path)
+
+        await cache.handle(FakeRoute(TAILWIND, response=FakeResponse(status=503)))
+
+        assert cache.get(TAILWIND) is None
+
+    async def test_offline_does_not_fetch(self, tmp_path):
+        cache = make_cache(tmp_path, fetch_missing=False)
+        route = FakeRoute(TAILWIND, response=FakeResponse())
+
+        await cache.handle(route)
+
+        assert route.fetches == 0
+        assert cache.stats.stubbed == 1
+
+    @pytest.mark.parametrize("resource_type,content_type", [
+        ("stylesheet", "text/css"),
+        ("image", "image/gif"),
+        ("fetch", "application/json"),
+        ("document", "text/plain"),
+    ])
+    async def test_unknown_hosts_are_stubbed(self, tmp_path, resource_type, content_type):
+        cache = make_cache(tmp_path)
+        route = FakeRoute("https://api.example.com/data", resource_type=resource_type)
+
+        await cache.handle(route)
+
+        assert route.fetches == 0
+        assert route.fulfilled["headers"]["content-type"] == content_type
+
+    async def test_non_http_requests_continue(self, tmp_path):
+        cache = make_cache(tmp_path)
+        route = FakeRoute("data:image/png;base64,AAAA")
+
+        await cache.handle(route)
+
+        assert route.continued
+
+    async def test_install_routes_every_request(self, tmp_path):
+        cache = make_cache(tmp_path)
+        context = AsyncMock()
+
+        await cache.install(context)
+
+        context.route.assert_awaited_once_with("**/*", cache.handle)
+
+
+class TestSandboxRender:
+    """Sandbox._render with and without the asset cache."""
+
+    async def test_ready_signal_instead_of_networkidle(self, tmp_path):
+        sandbox = Sandbox(asset_cache=make_cache(tmp_path))
+        page = AsyncMock()
+
+        await sandbox._render(page, "<html></html>")
+
+        page.set_content.assert_awaited_once_with("<html></html>", wait_until="load")
+        page.evaluate.assert_awaited_once_with(READY_SCRIPT)
+
+    async def test_disabled_uses_networkidle(self):
+        sandbox = Sandbox(use_asset_cache=False)
+        page = AsyncMock()
+
+        await sandbox._render(page, "<html></html>")
+
+        page.set_content.assert_awaited_once_with("<html></html>", wait_until="networkidle")
+        page.evaluate.assert_not_awaited()
+
+
+class TestPreseed:
+    """`python -m ...asset_cache` exit status (Dockerfile build step)."""
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        from html_fixer.sandbox import asset_cache
+
+        cache = make_cache(tmp_path)
+        monkeypatch.setattr(asset_cache, "get_asset_cache", lambda: cache)
+        monkeypatch.setattr(asset_cache, "PRELOAD_URLS", (TAILWIND,))
+        return cache
+
+    def _main(self):
+        from html_fixer.sandbox.asset_cache import main
+
+        return main()
+
+    def test_stored(self, cache, monkeypatch):
+        async def preload(strict=False):
+            cache.put(TAILWIND, 200, "application/javascript", b"tailwind();")
+            return 1
+
+        monkeypatch.setattr(cache, "preload", preload)
+
+        assert self._main() == 0
+
+    def test_network_unavailable_is_tolerated(self, cache, monkeypatch):
+        import httpx
+
+        monkeypatch.setattr(cache, "preload", AsyncMock(side_effect=httpx.ConnectError("offline")))
+
+        assert self._main() == 0
+
+    def test_http_error_fails(self, cache, monkeypatch):
+        import httpx
+
+        request = httpx.Request("GET", TAILWIND)
+        error = httpx.HTTPStatusError("404", request=request, response=httpx.Response(404))
+        monkeypatch.setattr(cache, "preload", AsyncMock(side_effect=error))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            self._main()
+
+    def test_unwritten_asset_fails(self, cache, monkeypatch):
+        monkeypatch.setattr(cache, "preload", AsyncMock(return_value=1))
+
+        assert self._main() == 1
+
+
+class TestPreloadedAssets:
+    """Assets stored by preload() are served to the browser offline."""
+
+    async def test_preloaded_asset_served_offline(self, tmp_path, monkeypatch):
+        import httpx
+
+        real_client = httpx.AsyncClient
+        transport = httpx.MockTransport(lambda request: httpx.Response(
+            200, headers={"content-type": "application/javascript"}, content=b"tailwind();",
+        ))
+        monkeypatch.setattr(
+            httpx, "AsyncClient", lambda **kwargs: real_client(transport=transport, **kwargs)
+        )
+        # Written the way a person would type it; Chromium adds the "/"
+        assert await make_cache(tmp_path).preload(["https://cdn.tailwindcss.com"]) == 1
+
+        cache = make_cache(tmp_path, fetch_missing=False)
+        route = FakeRoute(TAILWIND)
+        await cache.handle(route)
+
+        assert route.fulfilled["body"] == b"tailwind();"
+        assert route.fetches == 0
+        assert cache.stats.hits == 1
+
+    def test_preload_urls_are_normalized(self):
+        assert all(normalize_url(url) == url for url in PRELOAD_URLS)
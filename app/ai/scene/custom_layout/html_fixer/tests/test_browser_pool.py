@@ -0,0 +1,271 @@
+"""
+Tests for the Sandbox BrowserPool.
+
+Playwright is replaced by in-memory fakes so the tests don't need a
+Chromium install:
+- Browser reuse and fresh context per validation
+- Bounded concurrency (pool size)
+- Recycling after max_uses
+- Crash recovery and health checks
+- Graceful shutdown
+- Sandbox.validate borrowing from the pool
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from html_fixer.sandbox import BrowserPool, Sandbox
+
+
+class FakeContext:
+    def __init__(self, browser):
+        self.browser = browser
+        self.closed = False
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append((pattern, handler))
+
+    async def new_page(self):
+        page = AsyncMock()
+        page.on = MagicMock()
+        page.screenshot.return_value = b"png"
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.fail_new_context = False
+        self.contexts = []
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        if self.fail_new_context:
+            raise RuntimeError("Target page, context or browser has been closed")
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.closed = True
+        self.connected = False
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.browsers = []
+        self.stopped = False
+        self.chromium = self
+
+    async def start(self):
+        return self
+
+    async def launch(self, **options):
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+    async def __aexit__(self, *exc):
+        self.stopped = True
+
+
+@pytest.fixture
+def playwright():
+    fake = FakePlaywright()
+    with patch("playwright.async_api.async_playwright", return_value=fake):
+        yield fake
+
+
+def make_pool(**kwargs):
+    kwargs.setdefault("size", 1)
+    kwargs.setdefault("max_uses", 100)
+    kwargs.setdefault("health_check_seconds", 0)
+    return BrowserPool(**kwargs)
+
+
+class TestReuse:
+    """Browsers stay alive across validations."""
+
+    async def test_browser_is_reused_with_fresh_contexts(self, playwright):
+        pool = make_pool()
+        contexts = []
+
+        for _ in range(3):
+            async with pool.context(viewport={"width": 800, "height": 600}) as context:
+                contexts.append(context)
+
+        assert len(playwright.browsers) == 1
+        assert len({id(c) for c in contexts}) == 3
+        assert all(c.closed for c in contexts)
+        assert pool.stats.launches == 1
+        assert pool.stats.contexts == 3
+        await pool.close()
+
+    async def test_browsers_launch_lazily(self, playwright):
+        pool = make_pool(size=3)
+
+        async with pool.context():
+            pass
+
+        assert pool.stats.launches == 1
+        await pool.close()
+
+    async def test_concurrency_is_bounded_by_size(self, playwright):
+        pool = make_pool(size=2)
+        peak = 0
+
+        async def validate():
+            nonlocal peak
+            async with pool.context():
+                peak = max(peak, pool.in_use)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(validate() for _ in range(5)))
+
+        assert peak == 2
+        assert len(playwright.browsers) == 2
+        assert pool.in_use == 0
+        await pool.close()
+
+
+class TestRecycling:
+    """max_uses and crash recovery."""
+
+    async def test_recycled_after_max_uses(self, playwright):
+        pool = make_pool(max_uses=2)
+
+        for _ in range(3):
+            async with pool.context():
+                pass
+
+        assert len(playwright.browsers) == 2
+        assert playwright.browsers[0].closed
+        assert pool.stats.recycled == 1
+        await pool.close()
+
+    async def test_disconnected_browser_is_replaced(self, playwright):
+        pool = make_pool()
+        async with pool.context():
+            pass
+        playwright.browsers[0].connected = False
+
+        async with pool.context() as context:
+            assert context.browser is playwright.browsers[1]
+
+        assert pool.stats.crashes == 1
+        await pool.close()
+
+    async def test_new_context_failure_relaunches(self, playwright):
+        pool = make_pool()
+        async with pool.context():
+            pass
+        playwright.browsers[0].fail_new_context = True
+
+        async with pool.context() as context:
+            assert context.browser is playwright.browsers[1]
+
+        assert pool.stats.crashes == 1
+        await pool.close()
+
+    async def test_error_in_validation_releases_browser(self, playwright):
+        pool = make_pool()
+
+        with pytest.raises(ValueError):
+            async with pool.context() as context:
+                raise ValueError("render failed")
+
+        assert context.closed
+        assert pool.in_use == 0
+        async with pool.context():
+            pass
+        assert pool.stats.launches == 1
+        await pool.close()
+
+    async def test_health_check_replaces_unresponsive_browser(self, playwright):
+        pool = make_pool(size=2)
+        await asyncio.gather(*(self._use(pool) for _ in range(2)))
+        playwright.browsers[0].fail_new_context = True
+
+        replaced = await pool.health_check()
+
+        assert replaced == 1
+        assert pool.stats.health_check_failures == 1
+        assert len(playwright.browsers) == 3
+        await pool.close()
+
+    @staticmethod
+    async def _use(pool):
+        async with pool.context():
+            await asyncio.sleep(0.01)
+
+
+class TestShutdown:
+    """Graceful shutdown."""
+
+    async def test_close_waits_for_in_flight_validation(self, playwright):
+        pool = make_pool()
+        entered = asyncio.Event()
+        finished = []
+
+        async def validate():
+            async with pool.context():
+                entered.set()
+                await asyncio.sleep(0.05)
+                finished.append(True)
+
+        task = asyncio.create_task(validate())
+        await entered.wait()
+        await pool.close()
+
+        assert finished == [True]
+        assert playwright.browsers[0].closed
+        assert playwright.stopped
+        await task
+
+    async def test_acquire_after_close_fails(self, playwright):
+        pool = make_pool()
+        await pool.close()
+
+        with pytest.raises(RuntimeError):
+            async with pool.context():
+                pass
+
+    async def test_close_without_start(self):
+        pool = make_pool()
+
+        await pool.close()
+
+        assert pool.closed
+
+
+class TestSandboxIntegration:
+    """Sandbox.validate borrows contexts from the pool."""
+
+    async def test_validate_uses_pool(self, playwright):
+        pool = make_pool()
+        sandbox = Sandbox(browser_pool=pool, use_diff_engine=False, parallel_comparisons=False)
+
+        first = await sandbox.validate("<html><body></body></html>", js_only=True)
+        second = await sandbox.validate("<html><body></body></html>", js_only=True)
+
+        assert first.initial_screenshot == b"png"
+        assert second.js_errors == []
+        assert pool.stats.launches == 1
+        assert pool.stats.contexts == 2
+        assert all(c.closed for c in playwright.browsers[0].contexts)
+        assert all(c.routes for c in playwright.browsers[0].contexts)
+        await pool.close()
+
+    def test_pool_can_be_disabled(self):
+        sandbox = Sandbox(use_browser_pool=False)
+
+        assert sandbox._use_browser_pool is False
@@ -5,15 +5,23 @@ Tests the multi-scale pixel comparison engine.
 """
 
 import io
+import random
+
 import pytest
 from PIL import Image
 
 from html_fixer.sandbox.diff_engine import (
     DiffEngine,
     DiffResult,
+    ElementCapture,
     RegionDiff,
+    ComparisonMode,
     ComparisonScale,
 )
+from html_fixer.sandbox.result_classifier import (
+    InteractionClassification,
+    ResultClassifier,
+)
 
 
 class TestDiffEngine:
@@ -287,3 +295,224 @@ class TestComparisonScale:
         assert ComparisonScale.TIGHT.value == "tight"
         assert ComparisonScale.LOCAL.value == "local"
         assert ComparisonScale.GLOBAL.value == "global"
+
+
+def _png(img: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    img.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestPerceptualMode:
+    """Downsampled comparison (ComparisonMode.PERCEPTUAL)."""
+
+    BOX = {"x": 860, "y": 500, "width": 200, "height": 80}
+
+    def _screenshots(self, change):
+        before = Image.new("RGB", (1920, 1080), (243, 244, 246))
+        before.paste((59, 130, 246), (860, 500, 1060, 580))
+        after = before.copy()
+        change(after)
+        return _png(before), _png(after)
+
+    def test_mode_is_recorded(self):
+        """DiffResult carries the mode that produced its ratios."""
+        engine = DiffEngine()
+        before, after = self._screenshots(lambda img: img.paste((29, 78, 216), (860, 500, 1060, 580)))
+
+        pixel = engine.compare(before, after, self.BOX)
+        perceptual = engine.compare(before, after, self.BOX, mode=ComparisonMode.PERCEPTUAL)
+
+        assert pixel.mode == ComparisonMode.PIXEL
+        assert perceptual.mode == ComparisonMode.PERCEPTUAL
+        assert perceptual.to_dict()["mode"] == "perceptual"
+
+    def test_downsampled_to_max_width(self):
+        """1920px screenshots are compared at 960px; boxes stay in screenshot coordinates."""
+        engine = DiffEngine()
+        before, after = self._screenshots(lambda img: img.paste((29, 78, 216), (860, 500, 1060, 580)))
+
+        result = engine.compare(before, after, self.BOX, mode=ComparisonMode.PERCEPTUAL)
+
+        assert result.global_.total_pixels == 960 * 540
+        assert result.global_.region_box == (0, 0, 1920, 1080)
+        assert result.tight.region_box == (840, 480, 1080, 600)
+        assert result.tight.diff_ratio == pytest.approx(
+            engine.compare(before, after, self.BOX).tight.diff_ratio, abs=0.01
+        )
+
+    def test_compare_quick_perceptual(self):
+        """compare_quick supports the perceptual mode."""
+        engine = DiffEngine()
+        before, after = self._screenshots(lambda img: img.paste((0, 0, 0), (0, 0, 960, 1080)))
+
+        assert engine.compare_quick(before, after, mode=ComparisonMode.PERCEPTUAL) == pytest.approx(0.5)
+
+    def test_thin_change_needs_calibrated_thresholds(self):
+        """
+        Recolored button text reads higher once downsampled; the
+        PERCEPTUAL thresholds keep its classification the same as PIXEL.
+        """
+        from PIL import ImageDraw, ImageFont
+
+        engine = DiffEngine()
+        classifier = ResultClassifier()
+        font = ImageFont.load_default(size=24)
+
+        def label(color):
+            img = Image.new("RGB", (1920, 1080), (243, 244, 246))
+            draw = ImageDraw.Draw(img)
+            draw.rectangle((860, 500, 1060, 580), fill=(59, 130, 246))
+            draw.text((900, 530), "Submit", fill=color, font=font)
+            return _png(img)
+
+        before, after = label((255, 255, 255)), label((250, 204, 21))
+        pixel = engine.compare(before, after, self.BOX)
+        perceptual = engine.compare(before, after, self.BOX, mode=ComparisonMode.PERCEPTUAL)
+
+        assert perceptual.tight.diff_ratio > pixel.tight.diff_ratio
+        assert (
+            classifier.classify(perceptual).classification
+            == classifier.classify(pixel).classification
+            == InteractionClassification.WEAK_FEEDBACK
+        )
+
+
+class TestCompareCaptures:
+    """Region + thumbnail captures (Sandbox element tests)."""
+
+    BOX = {"x": 860, "y": 500, "width": 200, "height": 80}
+
+    def _pages(self):
+        before = Image.new("RGB", (1920, 1080), (243, 244, 246))
+        before.paste((59, 130, 246), (860, 500, 1060, 580))
+        after = before.copy()
+        after.paste((29, 78, 216), (880, 510, 1040, 570))
+        after.paste((0, 0, 0), (1500, 100, 1600, 200))
+        return before, after
+
+    def _capture(self, engine, page, scale=1.0):
+        region_box = engine._expand_box(self.BOX, engine.local_padding, page.size)
+        thumbnail = page.resize((round(page.width * scale), round(page.height * scale)))
+        return ElementCapture(
+            region=_png(page.crop(region_box)),
+            region_box=region_box,
+            thumbnail=_png(thumbnail),
+            thumbnail_scale=scale,
+        )
+
+    def test_matches_full_screenshot_compare(self):
+        """Ratios and boxes equal those of compare() on full screenshots."""
+        engine = DiffEngine()
+        before, after = self._pages()
+
+        full = engine.compare(_png(before), _png(after), self.BOX)
+        captured = engine.compare_captures(
+            self._capture(engine, before), self._capture(engine, after), self.BOX
+        )
+
+        for scale in ("tight", "local", "global_"):
+            expected, actual = getattr(full, scale), getattr(captured, scale)
+            assert actual.diff_ratio == pytest.approx(expected.diff_ratio)
+            assert actual.region_box == expected.region_box
+        assert captured.mode == ComparisonMode.PIXEL
+
+    def test_global_from_thumbnail(self):
+        """The global scale comes from the thumbnail, boxed in viewport coordinates."""
+        engine = DiffEngine()
+        before, after = self._pages()
+
+        result = engine.compare_captures(
+            self._capture(engine, before, scale=0.5),
+            self._capture(engine, after, scale=0.5),
+            self.BOX,
+        )
+
+        assert result.global_.total_pixels == 960 * 540
+        assert result.global_.region_box == (0, 0, 1920, 1080)
+        assert result.global_.diff_ratio == pytest.approx(
+            engine.compare(_png(before), _png(after), self.BOX).global_.diff_ratio, abs=0.002
+        )
+
+    def test_diff_images(self):
+        """Diff images are generated per scale on request."""
+        engine = DiffEngine()
+        before, after = self._pages()
+
+        result = engine.compare_captures(
+            self._capture(engine, before), self._capture(engine, after), self.BOX,
+            generate_diff_images=True,
+        )
+
+        assert result.tight.diff_image is not None
+        assert result.global_.diff_image is not None
+
+
+def legacy_region_diff(img1: Image.Image, img2: Image.Image, pixel_tolerance: int):
+    """
+    Reference: the original pure-Python DiffEngine comparison loop.
+
+    Returns:
+        (diff_count, diff visualization image)
+    """
+    data1, data2 = img1.tobytes(), img2.tobytes()
+    diff_count = 0
+    output = bytearray()
+    for i in range(0, len(data1), 3):
+        p1, p2 = data1[i:i + 3], data2[i:i + 3]
+        channel_diff = sum(abs(a - b) for a, b in zip(p1, p2)) / 3
+        if channel_diff > pixel_tolerance:
+            diff_count += 1
+            output += bytes((255, 0, 0))
+        else:
+            output += bytes((p1[0] // 2, p1[1] // 2, p1[2] // 2))
+    return diff_count, Image.frombytes("RGB", img1.size, bytes(output))
+
+
+def random_image(rng: random.Random, size=(64, 48)) -> Image.Image:
+    return Image.frombytes("RGB", size, bytes(rng.randrange(256) for _ in range(size[0] * size[1] * 3)))
+
+
+class TestLegacyEquivalence:
+    """Pillow C-level comparison matches the original per-pixel loop."""
+
+    @pytest.mark.parametrize("pixel_tolerance", [0, 1, 20, 84, 85, 128, 255])
+    def test_random_images(self, pixel_tolerance):
+        """Same diff count and diff image for random noise at any tolerance."""
+        rng = random.Random(pixel_tolerance)
+        before, after = random_image(rng), random_image(rng)
+        engine = DiffEngine(pixel_tolerance=pixel_tolerance)
+
+        region = engine._compare_region(before, after, None, ComparisonScale.GLOBAL, True)
+        expected_count, expected_image = legacy_region_diff(before, after, pixel_tolerance)
+
+        assert region.diff_count == expected_count
+        assert region.total_pixels == 64 * 48
+        assert Image.open(io.BytesIO(region.diff_image)).tobytes() == expected_image.tobytes()
+
+    def test_tolerance_boundary(self):
+        """A pixel exactly at the tolerance is unchanged; one above is changed."""
+        engine = DiffEngine(pixel_tolerance=20)
+        before = Image.new("RGB", (2, 1), (100, 100, 100))
+        after = Image.new("RGB", (2, 1), (100, 100, 100))
+        after.putpixel((0, 0), (160, 100, 100))  # avg diff 20.0
+        after.putpixel((1, 0), (161, 100, 100))  # avg diff 20.33
+
+        region = engine._compare_region(before, after, None, ComparisonScale.GLOBAL, False)
+
+        assert region.diff_count == 1
+        assert legacy_region_diff(before, after, 20)[0] == 1
+
+    def test_cropped_region(self):
+        """Cropped comparisons count only pixels inside the region."""
+        rng = random.Random(7)
+        before, after = random_image(rng, (120, 90)), random_image(rng, (120, 90))
+        box = (10, 20, 70, 80)
+        engine = DiffEngine()
+
+        region = engine._compare_region(before, after, box, ComparisonScale.TIGHT, False)
+        expected_count, _ = legacy_region_diff(before.crop(box), after.crop(box), engine.pixel_tolerance)
+
+        assert region.diff_count == expected_count
+        assert region.total_pixels == 60 * 60
+        assert region.region_box == box
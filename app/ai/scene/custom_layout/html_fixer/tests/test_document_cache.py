@@ -0,0 +1,130 @@
+"""
+Tests for the shared DocumentCache.
+
+- One parse per HTML version, served to every reader
+- Clones are independent of the cached tree
+- LRU eviction
+- Mutating fixers never touch the cached tree
+"""
+
+import pytest
+
+from html_fixer.analyzers import DocumentCache
+from html_fixer.contracts.patches import PatchSet, TailwindPatch
+from html_fixer.fixers.llm import LLMFixer
+from html_fixer.fixers.llm.contracts.js_patch import JSPatch, JSPatchType
+from html_fixer.fixers.llm.js_patch_applier import JSPatchApplier
+from html_fixer.fixers.tailwind_injector import TailwindInjector
+from html_fixer.validators.js_runtime_validator import JSRuntimeValidator
+
+
+HTML = """
+<html><body>
+  <button id="save" class="px-4" onclick="save()">Save</button>
+  <script>function save() {}</script>
+</body></html>
+"""
+
+
+class TestDocumentCache:
+    """Parse sharing."""
+
+    def test_parse_once(self):
+        documents = DocumentCache(max_documents=4)
+
+        parser = documents.parser(HTML)
+
+        assert documents.parser(HTML) is parser
+        assert documents.soup(HTML) is parser.soup
+        assert HTML in documents
+        assert documents.stats.parses == 1
+        assert documents.stats.hits == 2
+
+    def test_clone_is_independent(self):
+        documents = DocumentCache(max_documents=4)
+        shared = documents.soup(HTML)
+
+        tree = documents.clone(HTML)
+        tree.select_one("#save")["class"] = ["z-50"]
+
+        assert str(documents.clone(HTML)) == str(shared)
+        assert shared.select_one("#save")["class"] == ["px-4"]
+        assert documents.stats.parses == 1
+        assert documents.stats.clones == 2
+
+    def test_lru_eviction(self):
+        documents = DocumentCache(max_documents=2)
+        first, second, third = "<p>1</p>", "<p>2</p>", "<p>3</p>"
+
+        documents.parser(first)
+        documents.parser(second)
+        documents.parser(first)          # Most recently used
+        documents.parser(third)
+
+        assert first in documents
+        assert second not in documents
+        assert len(documents) == 2
+        assert documents.stats.evictions == 1
+
+
+class TestSharedReaders:
+    """Readers and mutators of the same HTML version."""
+
+    @pytest.mark.asyncio
+    async def test_validator_reuses_parse(self):
+        documents = DocumentCache(max_documents=4)
+        parser = documents.parser(HTML)
+
+        await JSRuntimeValidator(documents=documents).validate_static_only(HTML)
+
+        assert documents.stats.parses == 1
+        assert documents.parser(HTML) is parser
+
+    def test_empty_cache_is_used(self):
+        documents = DocumentCache(max_documents=4)
+        patches = PatchSet(patches=[TailwindPatch(selector="#save", add_classes=["z-50"])])
+
+        TailwindInjector(documents=documents).inject(HTML, patches)
+
+        assert documents.stats.parses == 1
+
+    def test_llm_fixer_components_share_its_cache(self):
+        documents = DocumentCache(max_documents=4)
+        fixer = LLMFixer(provider=object(), documents=documents)
+
+        fixer._tailwind_builder._extract_element_context(HTML, "#save")
+        fixer._js_builder._extract_scripts(HTML)
+        fixer._validator.validate(TailwindPatch(selector="#save", add_classes=["z-50"]), HTML)
+
+        assert documents.stats.parses == 1
+        assert documents.stats.hits == 3
+
+    def test_injector_leaves_cache_untouched(self):
+        documents = DocumentCache(max_documents=4)
+        shared = documents.soup(HTML)
+        patches = PatchSet(patches=[TailwindPatch(selector="#save", add_classes=["z-50"])])
+
+        result = TailwindInjector(documents=documents).inject(HTML, patches)
+
+        assert result.success
+        assert "z-50" in result.html
+        assert "z-50" not in str(shared)
+        assert documents.stats.parses == 1
+
+    def test_js_applier_leaves_cache_untouched(self):
+        documents = DocumentCache(max_documents=4)
+        shared = documents.soup(HTML)
+        patches = [
+            JSPatch(patch_type=JSPatchType.MODIFY_HANDLER, selector="#save", new_handler="load()"),
+            JSPatch(
+                patch_type=JSPatchType.ADD_FUNCTION,
+                function_name="load",
+                function_code="function load() {}",
+            ),
+        ]
+
+        result = JSPatchApplier(documents=documents).apply(HTML, patches)
+
+        assert result.success
+        assert "load()" in result.html
+        assert shared.select_one("#save")["onclick"] == "save()"
@@ -0,0 +1,173 @@
+"""
+Tests for the per-document ElementIndex.
+
+- One TailwindAnalyzer pass per element, shared by every analyzer
+- Ancestry (pre-order intervals) and containing blocks
+- Detectors built on the index find the same elements and blockages
+- Blocker lookups scoped by containing block and z-index
+"""
+
+from html_fixer.analyzers import (
+    DOMParser,
+    ElementIndex,
+    InteractiveDetector,
+    PointerBlockageDetector,
+    TailwindAnalyzer,
+    ZIndexHierarchyBuilder,
+)
+
+
+HTML = """
+<html><body>
+  <div id="card" class="relative">
+    <div id="veil" class="absolute inset-0 bg-black/10"></div>
+    <p id="text"><button id="buy" class="px-4">Buy</button></p>
+  </div>
+  <div id="nav" class="pointer-events-none">
+    <a id="home" href="/">Home</a>
+  </div>
+  <div class="relative z-10"><span>A</span></div>
+  <div class="relative z-10"><span>A</span></div>
+</body></html>
+"""
+
+
+class CountingAnalyzer(TailwindAnalyzer):
+    def __init__(self):
+        self.calls = 0
+
+    def analyze_element(self, element):
+        self.calls += 1
+        return super().analyze_element(element)
+
+
+class TestElementIndex:
+    """Single-pass facts."""
+
+    def test_one_analysis_per_element(self):
+        parser = DOMParser(HTML)
+        analyzer = CountingAnalyzer()
+
+        index = ElementIndex(parser, analyzer=analyzer)
+        for element in parser.get_all_elements():
+            index.info(element)
+
+        assert analyzer.calls == len(parser.get_all_elements()) == len(index)
+
+    def test_built_once_per_parser(self):
+        parser = DOMParser(HTML)
+
+        assert parser.element_index is parser.element_index
+
+    def test_ancestry(self):
+        parser = DOMParser(HTML)
+        index = parser.element_index
+        buy = parser.get_element_by_id("buy")
+        card = parser.get_element_by_id("card")
+
+        assert index.containing_block(buy) is card
+        assert index.containing_block(card) is None
+        assert index.is_descendant_of(buy, card)
+        assert not index.is_descendant_of(card, buy)
+        assert [el.get("id") for el in index.parent_chain(buy)][:2] == ["text", "card"]
+
+    def test_intervals(self):
+        parser = DOMParser(HTML)
+        index = parser.element_index
+        card = index.get(parser.get_element_by_id("card"))
+        nav = index.get(parser.get_element_by_id("nav"))
+
+        for element in parser.get_all_elements():
+            entry = index.get(element)
+            chain = index.parent_chain(element)
+            assert card.contains(entry) == (entry is card or card.element in chain)
+            assert nav.contains(entry) == (entry is nav or nav.element in chain)
+        assert index.is_descendant_of(card.element, parser.soup)
+
+    def test_pointer_none_ancestor(self):
+        parser = DOMParser(HTML)
+        index = parser.element_index
+
+        assert index.pointer_none_ancestor(parser.get_element_by_id("home")) is (
+            parser.get_element_by_id("nav")
+        )
+        assert index.pointer_none_ancestor(parser.get_element_by_id("buy")) is None
+
+    def test_interactive(self):
+        parser = DOMParser(HTML)
+        detector = InteractiveDetector()
+
+        indexed = [entry.element for entry in parser.element_index.interactive()]
+
+        assert indexed == [el for el in parser.get_all_elements() if detector.is_interactive(el)]
+
+    def test_unindexed_tag(self):
+        parser = DOMParser(HTML)
+
+        info = parser.element_index.info(parser.soup)
+
+        assert info.all_classes == set()
+
+
+class TestIndexedDetectors:
+    """Detectors querying the index."""
+
+    def test_blockages(self):
+        parser = DOMParser(HTML)
+        interactive = InteractiveDetector().find_interactive_elements(parser)
+
+        blockages = PointerBlockageDetector().find_blocked_elements(parser, interactive)
+
+        blocked = {b.blocked_element.get("id"): b.reason.value for b in blockages}
+        assert blocked == {"buy": "overlay_blocking", "home": "parent_pointer_none"}
+
+    def test_identical_contexts_kept_apart(self):
+        parser = DOMParser(HTML)
+        builder = ZIndexHierarchyBuilder()
+
+        builder.build_hierarchy(parser)
+
+        # Two structurally equal elements are two stacking contexts
+        assert len(builder.get_elements_at_zindex(10)) == 2
+
+
+SCOPED = """
+<html><body>
+  <nav class="fixed top-0 z-40"><a id="menu" href="#">Menu</a></nav>
+  <section class="relative">
+    <div class="absolute inset-0"></div>
+    <button id="a">A</button>
+  </section>
+  <section class="relative">
+    <button id="b">B</button>
+    <div class="absolute inset-0 z-10"></div>
+    <div class="absolute inset-0 z-10"></div>
+  </section>
+  <button id="c" class="fixed bottom-0">C</button>
+</body></html>
+"""
+
+
+class TestBlockerLookups:
+    """Blockages found without pairwise checks."""
+
+    def _blockages(self, html):
+        parser = DOMParser(html)
+        interactive = InteractiveDetector().find_interactive_elements(parser)
+        blockages = PointerBlockageDetector().find_blocked_elements(parser, interactive)
+        return parser, {b.blocked_element.get("id"): b for b in blockages}
+
+    def test_overlay_scoped_to_containing_block(self):
+        parser, blockages = self._blockages(SCOPED)
+        sections = parser.get_elements_by_tag("section")
+
+        assert blockages["a"].blocking_element.parent is sections[0]
+        # Highest z-index wins, later line on ties
+        assert blockages["b"].blocking_element is sections[1].find_all("div")[1]
+
+    def test_zindex_conflict_first_in_document(self):
+        parser, blockages = self._blockages(SCOPED)
+
+        # Fixed nav (z-40) is the first higher blocker overlapping fixed #c
+        assert blockages["c"].reason.value == "zindex_conflict"
+        assert blockages["c"].blocking_element is parser.get_element_by_selector("nav")
@@ -0,0 +1,289 @@
+"""
+Tests for incremental re-validation after patches.
+
+- PatchImpactAnalyzer: targets, ancestry, stacking scope, full fallbacks
+- IncrementalPlan: which previous ElementResults are reused
+- Sandbox: only affected elements clicked, results merged in order
+- Orchestrator: patch passes validated against the previous result
+"""
+
+import pytest
+
+from html_fixer.contracts.patches import TailwindPatch
+from html_fixer.fixers.llm.contracts.js_patch import JSPatch, JSPatchType
+from html_fixer.sandbox import (
+    ElementInfo,
+    ElementResult,
+    ElementStatus,
+    IncrementalPlan,
+    PatchImpactAnalyzer,
+    Sandbox,
+    ValidationResult,
+)
+
+
+HTML = """
+<html><body>
+  <div id="toolbar">
+    <button id="save" class="px-4">Save</button>
+    <button id="load" class="px-4">Load</button>
+  </div>
+  <div id="panel" class="relative z-10">
+    <div id="veil" class="absolute inset-0"></div>
+    <button id="open" class="px-4">Open</button>
+  </div>
+  <a id="help" href="#help">Help</a>
+</body></html>
+"""
+
+
+def _result(*statuses, js_errors=None):
+    """ValidationResult with one ElementResult per (selector, status)."""
+    return ValidationResult(
+        element_results=[
+            ElementResult(selector=selector, status=status)
+            for selector, status in statuses
+        ],
+        js_errors=list(js_errors or []),
+    )
+
+
+def _elements(*selectors):
+    return [ElementInfo(selector=s, tag="button") for s in selectors]
+
+
+class TestPatchImpactAnalyzer:
+    """Dependency map of a patch set."""
+
+    def test_local_patch(self):
+        impact = PatchImpactAnalyzer().analyze(
+            HTML, [TailwindPatch(selector="#save", add_classes=["ring-2", "focus:ring-4"])]
+        )
+
+        assert not impact.full
+        assert impact.affects("#save")
+        assert impact.affects("#toolbar")          # Ancestor
+        assert not impact.affects("#load")         # Sibling, classes are local
+        assert not impact.affects("#open")
+
+    def test_stacking_patch_affects_context(self):
+        impact = PatchImpactAnalyzer().analyze(
+            HTML, [TailwindPatch(selector="#veil", add_classes=["pointer-events-none"])]
+        )
+
+        assert impact.affects("#veil")
+        assert impact.affects("#open")             # Same stacking context
+        assert not impact.affects("#save")
+
+    def test_overlay_target_affects_context(self):
+        impact = PatchImpactAnalyzer().analyze(
+            HTML, [TailwindPatch(selector="#veil", add_classes=["bg-black/50"])]
+        )
+
+        assert impact.affects("#open")
+
+    def test_unknown_selector_is_affected(self):
+        impact = PatchImpactAnalyzer().analyze(
+            HTML, [TailwindPatch(selector="#save", add_classes=["ring-2"])]
+        )
+
+        assert impact.affects("#missing")
+        assert impact.affects(None)
+
+    def test_handler_patch_is_local(self):
+        patch = JSPatch(
+            patch_type=JSPatchType.MODIFY_HANDLER,
+            selector="#load",
+            new_handler="load()",
+        )
+        impact = PatchImpactAnalyzer().analyze(HTML, js_patches=[patch])
+
+        assert not impact.full
+        assert impact.affects("#load")
+        assert not impact.affects("#save")
+
+    def test_global_js_patch_is_full(self):
+        patch = JSPatch(
+            patch_type=JSPatchType.ADD_FUNCTION,
+            function_name="load",
+            function_code="function load() {}",
+        )
+        impact = PatchImpactAnalyzer().analyze(HTML, js_patches=[patch])
+
+        assert impact.full
+        assert "global" in impact.reason
+
+    def test_unmatched_patch_is_full(self):
+        impact = PatchImpactAnalyzer().analyze(
+            HTML, [TailwindPatch(selector=".gone", add_classes=["z-50"])]
+        )
+
+        assert impact.full
+
+
+class TestIncrementalPlan:
+    """Reuse of previous element results."""
+
+    def test_reusable(self):
+        previous = _result(
+            ("#save", ElementStatus.NO_VISUAL_CHANGE),
+            ("#load", ElementStatus.RESPONSIVE),
+            ("#help", ElementStatus.TIMEOUT),
+        )
+        plan = IncrementalPlan.build(
+            previous, HTML, [TailwindPatch(selector="#save", add_classes=["ring-2"])]
+        )
+
+        reused = plan.reusable(_elements("#save", "#load", "#help", "#open"))
+
+        # Patched, flaky status and new element are re-tested
+        assert list(reused) == ["#load"]
+        assert reused["#load"] is previous.element_results[1]
+
+    def test_intercepted_by_affected_blocker(self):
+        previous = ValidationResult(element_results=[
+            ElementResult(
+                selector="#open",
+                status=ElementStatus.INTERCEPTED,
+                blocking_element="#save",
+            ),
+        ])
+        plan = IncrementalPlan.build(
+            previous, HTML, [TailwindPatch(selector="#save", add_classes=["ring-2"])]
+        )
+
+        assert plan.reusable(_elements("#open")) == {}
+
+    def test_previous_js_errors_force_full(self):
+        previous = _result(("#load", ElementStatus.RESPONSIVE), js_errors=["boom"])
+
+        assert IncrementalPlan.build(previous, HTML, []) is None
+
+
+HANDLERS = """
+<html><body>
+  <button id="toggle" onclick="togglePanel()">Menu</button>
+  <button id="direct" onclick="document.getElementById('panel').classList.toggle('hidden')">Show</button>
+  <button id="self" onclick="this.classList.toggle('ring-2')">Ring</button>
+  <button id="dynamic" onclick="show(this.dataset.target)" data-target="panel">Dyn</button>
+  <div id="panel" class="hidden"><span>Panel</span></div>
+  <button id="other">Other</button>
+  <script>
+    function togglePanel() { setPanel(); }
+    const setPanel = () => { document.querySelector('#panel').classList.toggle('hidden'); };
+    function show(id) { document.getElementById(id).hidden = false; }
+  </script>
+</body></html>
+"""
+
+
+class TestHandlerDependencies:
+    """Elements acted on by a handler are part of its dependency map."""
+
+    def _plan(self, html=HANDLERS, selector="#panel"):
+        previous = _result(*(
+            (s, ElementStatus.NO_VISUAL_CHANGE)
+            for s in ("#toggle", "#direct", "#self", "#dynamic", "#other")
+        ))
+        return IncrementalPlan.build(
+            previous, html, [TailwindPatch(selector=selector, add_classes=["bg-white"])]
+        )
+
+    def test_handler_targets_are_dependencies(self):
+        plan = self._plan()
+
+        # Through page functions (transitively) and inline lookups
+        assert plan.impact.affects("#toggle")
+        assert plan.impact.affects("#direct")
+        assert not plan.impact.affects("#self")
+
+    def test_unreadable_handler_not_reused(self):
+        plan = self._plan()
+
+        reused = plan.reusable(_elements("#toggle", "#direct", "#self", "#dynamic", "#other"))
+
+        assert list(reused) == ["#self", "#other"]
+
+    def test_script_listeners_make_no_change_opaque(self):
+        html = HANDLERS.replace(
+            "</script>", "document.getElementById('other').addEventListener('click', show);</script>"
+        )
+        plan = self._plan(html)
+
+        assert plan.reusable(_elements("#self", "#other")) == {}
+
+
+class TestSandboxIncremental:
+    """Sandbox._test_interactive with a plan."""
+
+    @pytest.mark.asyncio
+    async def test_only_affected_elements_clicked(self):
+        sandbox = Sandbox(use_asset_cache=False, parallel_pages=1, fast_restore=False)
+        interactive = _elements("#save", "#load", "#open")
+        clicked = []
+
+        async def find_interactive_elements(page):
+            return interactive
+
+        async def test_element(page, element):
+            clicked.append(element.selector)
+            return ElementResult(selector=element.selector, status=ElementStatus.RESPONSIVE)
+
+        async def restore(page, html):
+            pass
+
+        sandbox._find_interactive_elements = find_interactive_elements
+        sandbox._test_element = test_element
+        sandbox._restore = restore
+
+        previous = _result(
+            ("#save", ElementStatus.NO_VISUAL_CHANGE),
+            ("#load", ElementStatus.RESPONSIVE),
+            ("#open", ElementStatus.NO_VISUAL_CHANGE),
+        )
+        plan = IncrementalPlan.build(
+            previous, HTML, [TailwindPatch(selector="#save", add_classes=["ring-2"])]
+        )
+        result = ValidationResult()
+
+        await sandbox._test_interactive(None, object(), HTML, result, plan)
+
+        assert clicked == ["#save"]
+        assert [r.selector for r in result.element_results] == ["#save", "#load", "#open"]
+        assert result.element_results[0].status == ElementStatus.RESPONSIVE
+        assert result.element_results[2] is previous.element_results[2]
+        assert result.reused_elements == 2
+
+
+class TestOrchestratorIncremental:
+    """Validations after patches carry the previous result."""
+
+    @pytest.mark.asyncio
+    async def test_feedback_pass_is_incremental(self):
+        from html_fixer.orchestrator import Orchestrator
+        from html_fixer.validators.error_report import ErrorReportGenerator
+
+        failing = _result(("#save", ElementStatus.NO_VISUAL_CHANGE))
+        passing = _result(("#save", ElementStatus.RESPONSIVE))
+        calls = []
+
+        class FakeSandbox:
+            async def validate(self, html, **kwargs):
+                calls.append(kwargs)
+                return failing if len(calls) == 1 else passing
+
+        class Classifier:
+            async def classify(self, html, page=None):
+                return ErrorReportGenerator().generate(errors=[], html=html, total_interactive=1)
+
+            async def classify_static(self, html):
+                return ErrorReportGenerator().generate(errors=[], html=html, total_interactive=1)
+
+        orchestrator = Orchestrator(classifier=Classifier(), sandbox=FakeSandbox())
+        result = await orchestrator.fix(HTML)
+
+        assert result.success
+        assert "previous" not in calls[0]
+        assert calls[1]["previous"] is failing
+        assert calls[1]["tailwind_patches"]
+        assert calls[1]["js_patches"] == []
@@ -0,0 +1,88 @@
+"""
+Tests for the pluggable DOMParser backend.
+
+- Backend resolution and fallback when not installed
+- Lazy line map
+- Conformance: every backend finds the same interactive selectors and
+  static errors on the fixture corpus
+- Fixers keep serializing "html.parser" trees
+"""
+
+from pathlib import Path
+
+import pytest
+
+from html_fixer.analyzers import DOMParser, DocumentCache, resolve_parser_backend
+from html_fixer.analyzers import dom_parser
+from html_fixer.validators.classification_pipeline import ErrorClassificationPipeline
+
+
+TESTS_DIR = Path(__file__).parent
+CORPUS = sorted(
+    list((TESTS_DIR / "fixtures").rglob("*.html"))
+    + list((TESTS_DIR / "test_htmls").rglob("*.html"))
+)
+
+HTML = """<!DOCTYPE html>
+<html><body>
+  <div class="relative">
+    <button class="px-4" id="go" onclick="go()">Go</button>
+    <div class="absolute inset-0 z-10"></div>
+  </div>
+  <img src="a.png">
+</body></html>
+"""
+
+
+async def _classify(html, backend):
+    """(interactive selectors, (selector, error type) pairs) for a backend."""
+    pipeline = ErrorClassificationPipeline(documents=DocumentCache(backend=backend))
+    report = await pipeline.classify_static(html)
+    interactive = sorted(el.selector for el in pipeline.get_interactive_elements())
+    errors = sorted((e.selector, e.error_type.value) for e in report.errors)
+    return interactive, errors
+
+
+class TestBackendResolution:
+    """Selecting a tree builder."""
+
+    def test_default_backend(self):
+        assert DOMParser(HTML).backend == "html.parser"
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            resolve_parser_backend("regex")
+
+    def test_missing_backend_falls_back(self, monkeypatch):
+        monkeypatch.setattr(dom_parser.builder_registry, "lookup", lambda *features: None)
+
+        assert resolve_parser_backend("lxml") == "html.parser"
+
+    def test_line_map_is_lazy(self):
+        pytest.importorskip("lxml")
+        parser = DOMParser(HTML, backend="lxml")
+
+        assert parser._line_map is None
+        button = parser.get_element_by_selector("#go")
+        assert parser.get_source_line(button) == 4
+        assert parser._line_map is not None
+
+
+@pytest.mark.parametrize("backend", ["lxml", "html5lib"])
+class TestBackendConformance:
+    """Every backend classifies the corpus like html.parser."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", CORPUS, ids=lambda p: p.name)
+    async def test_same_selectors_and_errors(self, backend, path):
+        pytest.importorskip(backend)
+        html = path.read_text(encoding="utf-8")
+
+        assert await _classify(html, backend) == await _classify(html, "html.parser")
+
+    def test_clone_serializes_like_html_parser(self, backend):
+        pytest.importorskip(backend)
+        documents = DocumentCache(backend=backend)
+
+        assert documents.parser(HTML).backend == backend
+        assert str(documents.clone(HTML)) == str(DocumentCache().clone(HTML))
@@ -0,0 +1,112 @@
+"""
+Tests for the batched PatchEngine.
+
+- Mixed Tailwind and JS patches applied in order to one tree
+- Same output as the individual appliers
+- Per-patch outcomes
+- One clone per batch, one serialization per read
+- History rollback keeps the pre-batch version
+"""
+
+from html_fixer.analyzers import DocumentCache
+from html_fixer.contracts.patches import PatchSet, TailwindPatch
+from html_fixer.fixers.llm import PatchEngine
+from html_fixer.fixers.llm.contracts.js_patch import JSPatch, JSPatchType
+from html_fixer.fixers.llm.js_patch_applier import JSPatchApplier
+from html_fixer.fixers.tailwind_injector import TailwindInjector
+from html_fixer.orchestrator.contracts import FixPhase
+from html_fixer.orchestrator.history_manager import HistoryManager
+
+
+HTML = """
+<html><body>
+  <div class="card relative z-10">
+    <button id="save" class="btn px-4" onclick="save()">Save</button>
+  </div>
+  <script>function save() { document.getElementById('out').textContent = 'ok'; }</script>
+  <p id="result"></p>
+</body></html>
+"""
+
+TAILWIND = [
+    TailwindPatch(selector=".btn", add_classes=["hover:bg-blue-600", "z-50"]),
+    TailwindPatch(selector=".missing", add_classes=["z-50"]),
+]
+
+JS = [
+    JSPatch(patch_type=JSPatchType.FIX_DOM_REFERENCE, old_reference="out", new_reference="result"),
+    JSPatch(patch_type=JSPatchType.ADD_FUNCTION, function_name="load", function_code="function load() {}"),
+    JSPatch(patch_type=JSPatchType.REPLACE_FUNCTION),
+    JSPatch(patch_type=JSPatchType.MODIFY_HANDLER, selector="#save", new_handler="save(); load()"),
+]
+
+
+class TestPatchEngine:
+    """Single-tree batch application."""
+
+    def test_same_html_as_individual_appliers(self):
+        documents = DocumentCache(max_documents=4)
+        tailwind = TailwindInjector(documents=documents).inject(HTML, PatchSet(patches=TAILWIND))
+        expected = JSPatchApplier(documents=documents).apply(tailwind.html, JS).html
+
+        result = PatchEngine(documents=documents).apply(HTML, TAILWIND + JS)
+
+        assert result.success
+        assert result.html == expected
+
+    def test_per_patch_outcomes(self):
+        result = PatchEngine(documents=DocumentCache()).apply(HTML, TAILWIND + JS)
+
+        assert [o.applied for o in result.outcomes] == [True, False, True, True, False, True]
+        assert result.outcomes[0].elements == 1
+        assert result.outcomes[1].error == "No matching elements found"
+        assert result.outcomes[4].error == "No changes made"
+        assert result.tailwind_applied == TAILWIND[:1]
+        assert result.js_applied == [JS[0], JS[1], JS[3]]
+
+    def test_order_is_kept(self):
+        patches = [
+            TailwindPatch(selector=".btn", add_classes=["z-20"]),
+            TailwindPatch(selector=".btn", remove_classes=["z-20"], add_classes=["z-30"]),
+        ]
+
+        result = PatchEngine(documents=DocumentCache()).apply(HTML, patches)
+
+        assert 'class="btn px-4 z-30"' in result.html
+
+    def test_one_clone_per_batch(self):
+        documents = DocumentCache(max_documents=4)
+        engine = PatchEngine(documents=documents)
+
+        batch = engine.begin(HTML)
+        assert batch.html is HTML
+        batch.apply(TAILWIND)
+        prompt_html = batch.html
+        assert batch.html is prompt_html  # Serialization cached
+        batch.apply(JS)
+        result = batch.result()
+
+        assert documents.stats.clones == 1
+        assert documents.stats.parses == 1
+        assert "hover:bg-blue-600" in prompt_html and "load()" not in prompt_html
+        assert "load()" in result.html
+
+    def test_nothing_applied_returns_input(self):
+        documents = DocumentCache(max_documents=4)
+        shared = documents.soup(HTML)
+
+        result = PatchEngine(documents=documents).apply(HTML, [TAILWIND[1], JS[2]])
+
+        assert not result.success
+        assert result.html is HTML
+        assert str(shared) == str(documents.soup(HTML))
+
+    def test_rollback_to_pre_batch_version(self):
+        history = HistoryManager()
+        history.push(HTML, FixPhase.INITIAL)
+
+        result = PatchEngine(documents=DocumentCache()).apply(HTML, TAILWIND + JS)
+        history.push(result.html, FixPhase.LLM_FIX, patches_applied=result.applied)
+
+        assert history.latest.patches_applied == result.applied
+        assert history.rollback(steps=1).html == HTML
@@ -0,0 +1,388 @@
+"""
+Tests for RenderSession / RenderSessionCache.
+
+Playwright is replaced by in-memory fakes so the tests don't need a
+Chromium install:
+- One render per content hash, LRU eviction, cleanup
+- Page restored between borrowers
+- Sandbox.validate and JSRuntimeValidator.validate on a session
+- JS runtime checks kept off the shared page
+- Orchestrator sharing renders within a fix run
+- Fallback renders kept on the run's browser (no second pool borrow)
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from html_fixer.sandbox import RenderSessionCache, Sandbox
+from html_fixer.sandbox.render_session import content_hash
+from html_fixer.validators.js_evaluators import JSEvaluators
+from html_fixer.validators.js_runtime_validator import JSRuntimeValidator
+
+
+class FakePage:
+    def __init__(self, load_errors=()):
+        self.load_errors = list(load_errors)
+        self.handlers = {}
+        self.evaluated = []
+        self.set_content_calls = 0
+
+    def on(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def remove_listener(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def emit_error(self, message):
+        for handler in self.handlers.get("pageerror", []):
+            handler(message)
+
+    async def screenshot(self, **kwargs):
+        return b"initial"
+
+    async def set_content(self, html, **kwargs):
+        self.set_content_calls += 1
+        for message in self.load_errors:
+            self.emit_error(message)
+
+    async def evaluate(self, script, arg=None):
+        self.evaluated.append(script)
+        if script == JSEvaluators.GET_CAPTURED_ERRORS:
+            return []
+        return {}
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+        self.pages = []
+
+    async def new_page(self):
+        page = FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+
+
+def _sandbox(fail_open=False, load_errors=(), fail_render=False):
+    """Sandbox whose browser, renders and restores are fakes (counted)."""
+    sandbox = Sandbox(use_asset_cache=False)
+    sandbox.opened = 0
+    sandbox.released = 0
+    sandbox.contexts = []
+    sandbox.renders = []
+    sandbox.restores = []
+    sandbox.isolated_renders = []
+
+    @asynccontextmanager
+    async def open_context():
+        if fail_open:
+            raise RuntimeError("no browser")
+        sandbox.opened += 1
+        try:
+            yield FakeContext()
+        finally:
+            sandbox.released += 1
+
+    async def new_worker_context(context):
+        worker_context = FakeContext()
+        sandbox.contexts.append(worker_context)
+        return worker_context
+
+    async def render_and_snapshot(page, html):
+        if fail_render:
+            raise RuntimeError("render crashed")
+        sandbox.renders.append(html)
+        for message in load_errors:
+            page.emit_error(message)
+
+    async def restore(page, html):
+        sandbox.restores.append(html)
+
+    async def render(page, html):
+        sandbox.isolated_renders.append(html)
+
+    sandbox._open_context = open_context
+    sandbox._new_worker_context = new_worker_context
+    sandbox._render_and_snapshot = render_and_snapshot
+    sandbox._restore = restore
+    sandbox._render = render
+    return sandbox
+
+
+class TestRenderSessionCache:
+    """Sessions keyed by content hash for one fix run."""
+
+    @pytest.mark.asyncio
+    async def test_renders_once_per_version(self):
+        sandbox = _sandbox()
+
+        async with sandbox.render_sessions() as sessions:
+            first = await sessions.get("<p>a</p>")
+            again = await sessions.get("<p>a</p>")
+            other = await sessions.get("<p>b</p>")
+
+            assert first is again
+            assert other is not first
+            assert first.content_hash == content_hash("<p>a</p>")
+            assert first.initial_screenshot == b"initial"
+            assert sandbox.renders == ["<p>a</p>", "<p>b</p>"]
+            assert sessions.stats.as_dict() == {
+                "renders": 2, "reuses": 1, "evictions": 0, "failures": 0,
+            }
+            # One borrowed browser for the whole run
+            assert sandbox.opened == 1
+
+        assert sandbox.released == 1
+        assert all(context.closed for context in sandbox.contexts)
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_closes_context(self):
+        sandbox = _sandbox()
+        sessions = RenderSessionCache(sandbox, max_sessions=2)
+
+        await sessions.get("a")
+        await sessions.get("b")
+        await sessions.get("a")
+        await sessions.get("c")
+
+        assert len(sessions) == 2
+        assert sessions.stats.evictions == 1
+        assert [context.closed for context in sandbox.contexts] == [False, True, False]
+        await sessions.close()
+
+    @pytest.mark.asyncio
+    async def test_unavailable_browser(self):
+        sandbox = _sandbox(fail_open=True)
+        sessions = RenderSessionCache(sandbox)
+
+        assert await sessions.get("a") is None
+        assert await sessions.get("b") is None
+        assert sessions.stats.failures == 1
+        await sessions.close()
+
+    @pytest.mark.asyncio
+    async def test_page_restored_for_later_borrowers(self):
+        sandbox = _sandbox()
+        async with sandbox.render_sessions() as sessions:
+            session = await sessions.get("a")
+
+            async with session.use() as page:
+                assert page is session.page
+            assert sandbox.restores == []
+
+            async with session.use():
+                pass
+            assert sandbox.restores == ["a"]
+            assert session.uses == 2
+
+    @pytest.mark.asyncio
+    async def test_load_errors_separated(self):
+        sandbox = _sandbox(load_errors=["ReferenceError: foo is not defined"])
+        async with sandbox.render_sessions() as sessions:
+            session = await sessions.get("a")
+            session.page.emit_error("later")
+
+            assert session.load_js_errors == ["ReferenceError: foo is not defined"]
+            assert session.js_errors[-1] == "later"
+
+
+class TestSessionConsumers:
+    """Validators running on a session instead of rendering."""
+
+    @pytest.mark.asyncio
+    async def test_sandbox_validate_reuses_render(self):
+        sandbox = _sandbox(load_errors=["boom"])
+        async with sandbox.render_sessions() as sessions:
+            session = await sessions.get("<button>x</button>")
+            tested = []
+
+            async def test_interactive(context, page, html, result, plan=None):
+                assert context is session.context
+                tested.append(page)
+                session.page.emit_error("click error")
+
+            sandbox._test_interactive = test_interactive
+            result = await sandbox.validate("<button>x</button>", session=session)
+
+        assert sandbox.renders == ["<button>x</button>"]
+        assert sandbox.opened == 1
+        assert tested == [session.page]
+        assert result.initial_screenshot == b"initial"
+        assert result.js_errors == ["boom", "click error"]
+
+    @pytest.mark.asyncio
+    async def test_sandbox_validate_js_only(self):
+        sandbox = _sandbox()
+        async with sandbox.render_sessions() as sessions:
+            session = await sessions.get("a")
+
+            async def test_interactive(*args):
+                raise AssertionError("js_only must not test elements")
+
+            sandbox._test_interactive = test_interactive
+            result = await sandbox.validate("a", js_only=True, session=session)
+
+        assert result.initial_screenshot == b"initial"
+        assert result.element_results == []
+
+    @pytest.mark.asyncio
+    async def test_sandbox_validate_on_held_browser(self):
+        sandbox = _sandbox(fail_render=True)
+        async with sandbox.render_sessions() as sessions:
+            assert await sessions.get("<button>x</button>") is None
+            tested = []
+
+            async def test_interactive(context, page, html, result, plan=None):
+                tested.append(context)
+
+            sandbox._test_interactive = test_interactive
+            result = await sandbox.validate(
+                "<button>x</button>", context=sessions.base_context
+            )
+
+            # Rendered on a context of the held browser, closed afterwards
+            assert tested == [sandbox.contexts[-1]]
+            assert sandbox.contexts[-1].closed
+            assert sandbox.isolated_renders == ["<button>x</button>"]
+            assert sandbox.opened == 1
+
+        assert result.js_errors == []
+        assert sandbox.released == 1
+
+    @pytest.mark.asyncio
+    async def test_js_runtime_validator_on_session(self):
+        html = "<button onclick=\"go()\">Go</button><script>function go() {}</script>"
+        sandbox = _sandbox(load_errors=["ReferenceError: x is not defined"])
+        async with sandbox.render_sessions() as sessions:
+            session = await sessions.get(html)
+            result = await JSRuntimeValidator().validate(html, session=session)
+
+            # Checks ran on a throwaway render, closed afterwards
+            isolated_context = sandbox.contexts[-1]
+            assert isolated_context is not session.context
+            assert isolated_context.closed and not session.context.closed
+            assert sandbox.isolated_renders == [html]
+            assert JSEvaluators.CAPTURE_JS_ERRORS in isolated_context.pages[0].evaluated
+
+        assert session.page.set_content_calls == 0
+        assert session.page.evaluated == []
+        assert [e.message for e in result.console_errors] == ["ReferenceError: x is not defined"]
+        assert result.console_errors[0].error_type == "uncaught_error"
+
+    @pytest.mark.asyncio
+    async def test_sandbox_borrows_untouched_page_after_js_checks(self):
+        html = "<button onclick=\"go()\">Go</button><script>function go() {}</script>"
+        sandbox = _sandbox()
+        async with sandbox.render_sessions() as sessions:
+            session = await sessions.get(html)
+            await JSRuntimeValidator().validate(html, session=session)
+
+            async def test_interactive(context, page, html, result, plan=None):
+                assert page is session.page
+                assert page.evaluated == []
+
+            sandbox._test_interactive = test_interactive
+            await sandbox.validate(html, session=session)
+
+        # The Sandbox is the shared page's first borrower: no restore needed
+        assert sandbox.restores == []
+
+    @pytest.mark.asyncio
+    async def test_js_runtime_validator_reports_load_errors_on_page(self):
+        page = FakePage(load_errors=["ReferenceError: x is not defined"])
+
+        result = await JSRuntimeValidator().validate("<p>x</p>", page)
+
+        assert [e.message for e in result.console_errors] == ["ReferenceError: x is not defined"]
+        assert result.console_errors[0].error_type == "uncaught_error"
+        assert result.has_errors
+        assert page.handlers == {"pageerror": [], "console": []}
+
+
+class TestOrchestratorSharedRenders:
+    """One render per HTML version within a fix run."""
+
+    @pytest.mark.asyncio
+    async def test_validations_share_render(self):
+        from html_fixer.orchestrator import Orchestrator
+        from html_fixer.sandbox import ValidationResult
+
+        sandbox = _sandbox()
+        seen_sessions = []
+
+        async def validate(html, js_only=False, session=None):
+            seen_sessions.append(session)
+            return ValidationResult()
+
+        sandbox.validate = validate
+
+        class Classifier:
+            async def classify(self, html, page=None, session=None):
+                from html_fixer.validators.error_report import ErrorReportGenerator
+                assert session is not None and page is None
+                return ErrorReportGenerator().generate(errors=[], html=html, total_interactive=0)
+
+        orchestrator = Orchestrator(classifier=Classifier(), sandbox=sandbox)
+        result = await orchestrator.fix("<p>ok</p>", page=object())
+
+        assert result.success
+        assert sandbox.renders == ["<p>ok</p>"]
+        assert seen_sessions and seen_sessions[0] is not None
+        assert sandbox.released == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_render_validates_on_held_browser(self):
+        from html_fixer.orchestrator import Orchestrator
+        from html_fixer.sandbox import ValidationResult
+
+        sandbox = _sandbox(fail_render=True)
+        calls = []
+
+        async def validate(html, js_only=False, session=None, context=None):
+            calls.append((session, context))
+            return ValidationResult()
+
+        sandbox.validate = validate
+
+        class Classifier:
+            async def classify(self, html, page=None, session=None):
+                from html_fixer.validators.error_report import ErrorReportGenerator
+                return ErrorReportGenerator().generate(errors=[], html=html, total_interactive=0)
+
+        orchestrator = Orchestrator(classifier=Classifier(), sandbox=sandbox)
+        await orchestrator.fix("<p>ok</p>")
+
+        # No second browser requested while the run holds one
+        assert len(calls) == 1
+        session, context = calls[0]
+        assert session is None and context is not None
+        assert sandbox.opened == 1 and sandbox.released == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled(self):
+        from html_fixer.orchestrator import Orchestrator
+        from html_fixer.sandbox import ValidationResult
+
+        sandbox = _sandbox()
+        calls = []
+
+        async def validate(html, js_only=False, session=None):
+            calls.append(session)
+            return ValidationResult()
+
+        sandbox.validate = validate
+
+        class Classifier:
+            async def classify(self, html, page=None, session=None):
+                from html_fixer.validators.error_report import ErrorReportGenerator
+                return ErrorReportGenerator().generate(errors=[], html=html, total_interactive=0)
+
+        orchestrator = Orchestrator(classifier=Classifier(), sandbox=sandbox, share_renders=False)
+        await orchestrator.fix("<p>ok</p>")
+
+        assert calls == [None]
+        assert sandbox.opened == 0
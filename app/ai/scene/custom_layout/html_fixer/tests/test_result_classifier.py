@@ -10,7 +10,13 @@ from html_fixer.sandbox.result_classifier import (
     InteractionClassification,
     ClassificationResult,
 )
-from html_fixer.sandbox.diff_engine import DiffResult, RegionDiff, ComparisonScale
+from html_fixer.sandbox.diff_engine import (
+    DiffResult,
+    RegionDiff,
+    ComparisonMode,
+    ComparisonScale,
+    MODE_THRESHOLD_SCALE,
+)
 from html_fixer.sandbox.contracts import ElementInfo
 
 
@@ -172,6 +178,31 @@ class TestResultClassifier:
 
         assert result.classification == InteractionClassification.RESPONSIVE
 
+    def test_classify_from_ratios_perceptual_mode(self):
+        """PERCEPTUAL ratios are judged against rescaled thresholds."""
+        classifier = ResultClassifier()
+
+        pixel = classifier.classify_from_ratios(tight=0.022, local=0.0, global_=0.0)
+        perceptual = classifier.classify_from_ratios(
+            tight=0.022, local=0.0, global_=0.0, mode=ComparisonMode.PERCEPTUAL,
+        )
+
+        assert pixel.classification == InteractionClassification.RESPONSIVE
+        assert perceptual.classification == InteractionClassification.WEAK_FEEDBACK
+        assert perceptual.mode == ComparisonMode.PERCEPTUAL
+        assert perceptual.to_dict()["mode"] == "perceptual"
+
+    def test_thresholds_for_mode(self):
+        """thresholds_for scales every ratio threshold by the mode factor."""
+        classifier = ResultClassifier()
+        scale = MODE_THRESHOLD_SCALE[ComparisonMode.PERCEPTUAL]
+
+        pixel = classifier.thresholds_for(ComparisonMode.PIXEL)
+        perceptual = classifier.thresholds_for(ComparisonMode.PERCEPTUAL)
+
+        assert pixel["responsive"] == classifier.responsive_threshold
+        assert perceptual == {k: pytest.approx(v * scale) for k, v in pixel.items()}
+
     def test_diff_ratios_in_result(self):
         """Test that diff_ratios are included in result."""
         classifier = ResultClassifier()
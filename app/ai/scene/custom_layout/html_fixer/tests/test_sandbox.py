@@ -6,16 +6,28 @@ Tests the basic sandbox functionality:
 - Sandbox initialization
 - Error extraction
 - Screenshot comparison
+- Parallel element tests (isolated, restored pages; deterministic merge)
+- Element captures (local region + viewport thumbnail)
+- Page restore between element tests (snapshot, re-render fallback)
 """
 
+import asyncio
+import base64
+import io
+
 import pytest
+from PIL import Image as PILImage
+
 from html_fixer.sandbox import (
+    ComparisonMode,
     Sandbox,
     ElementInfo,
     ElementResult,
     ElementStatus,
+    PageRestoreStats,
     ValidationResult,
 )
+from html_fixer.sandbox.page_snapshot import CAPTURE_SCRIPT, RESTORE_SCRIPT
 
 
 class TestElementStatus:
@@ -202,36 +214,62 @@ class TestSandbox:
         assert sandbox.timeout_ms == 5000
         assert sandbox.stabilization_ms == 1000
 
+    @staticmethod
+    def _png(size=(400, 200), color=(255, 255, 255), box=None, box_color=(0, 0, 0)) -> bytes:
+        img = PILImage.new("RGB", size, color)
+        if box:
+            img.paste(box_color, box)
+        buffer = io.BytesIO()
+        img.save(buffer, format="PNG")
+        return buffer.getvalue()
+
     def test_compare_screenshots_identical(self):
         """Test screenshot comparison with identical images."""
         sandbox = Sandbox()
 
-        screenshot = b"identical image content here"
+        screenshot = self._png()
         diff = sandbox._compare_screenshots(screenshot, screenshot)
 
         assert diff == 0.0
 
     def test_compare_screenshots_different(self):
-        """Test screenshot comparison with different images."""
+        """Test screenshot comparison with a changed region."""
         sandbox = Sandbox()
 
-        before = b"aaaaaaaaaa"
-        after = b"aaaaaabbbb"
+        before = self._png()
+        after = self._png(box=(0, 0, 100, 200))
         diff = sandbox._compare_screenshots(before, after)
 
-        assert diff > 0.0
-        assert diff < 1.0
+        assert diff == pytest.approx(0.25)
 
     def test_compare_screenshots_completely_different(self):
         """Test screenshot comparison with completely different images."""
         sandbox = Sandbox()
 
-        before = b"aaaaaaaaaa"
-        after = b"bbbbbbbbbb"
+        before = self._png(color=(255, 255, 255))
+        after = self._png(color=(0, 0, 0))
         diff = sandbox._compare_screenshots(before, after)
 
         assert diff == 1.0
 
+    def test_compare_screenshots_ignores_encoding(self):
+        """Same pixels encoded differently compare as identical (PNG bytes differ)."""
+        sandbox = Sandbox()
+
+        img = PILImage.new("RGB", (400, 200), (255, 255, 255))
+        img.paste((0, 0, 0), (10, 10, 50, 50))
+        fast, small = io.BytesIO(), io.BytesIO()
+        img.save(fast, format="PNG", compress_level=0)
+        img.save(small, format="PNG", compress_level=9)
+
+        assert fast.getvalue() != small.getvalue()
+        assert sandbox._compare_screenshots(fast.getvalue(), small.getvalue()) == 0.0
+
+    def test_comparison_mode(self):
+        """The sandbox reports which comparison mode calibrates its ratios."""
+        assert Sandbox().comparison_mode == ComparisonMode.PIXEL
+        assert Sandbox(use_diff_engine=False).comparison_mode == ComparisonMode.PERCEPTUAL
+
     def test_extract_blocker_with_class(self):
         """Test blocker extraction from error with class."""
         sandbox = Sandbox()
@@ -303,3 +341,382 @@ class TestSandboxIntegration:
 
         assert isinstance(result, ValidationResult)
         assert result.validation_time_ms > 0
+
+
+class FakeWorkerPage:
+    """Records renders and lets tests emit page errors."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.renders = 0
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def emit_error(self, message):
+        self.handlers["pageerror"](message)
+
+
+class FakeSnapshotPage(FakeWorkerPage):
+    """Supports PageSnapshot: restore succeeds unless restore_result says why not."""
+
+    def __init__(self, restore_result=None):
+        super().__init__()
+        self.captures = 0
+        self.restores = 0
+        self.restore_result = restore_result
+
+    async def evaluate(self, script):
+        if script is CAPTURE_SCRIPT:
+            self.captures += 1
+            return True
+        if script is RESTORE_SCRIPT:
+            self.restores += 1
+            return self.restore_result if self.captures else "no snapshot"
+        raise AssertionError("unexpected script")
+
+
+class FakeWorkerContext:
+    def __init__(self, page_factory=FakeWorkerPage):
+        self.page = page_factory()
+        self.closed = False
+
+    async def new_page(self):
+        return self.page
+
+    async def close(self):
+        self.closed = True
+
+
+class TestParallelElementTests:
+    """Sandbox._test_elements_parallel with fake worker contexts."""
+
+    @staticmethod
+    def _elements(count):
+        return [ElementInfo(selector=f"#btn{i}", tag="button") for i in range(count)]
+
+    @staticmethod
+    def _sandbox(parallel_pages, fail_contexts=0, fast_restore=False, page_factory=FakeWorkerPage):
+        sandbox = Sandbox(
+            use_diff_engine=False, parallel_pages=parallel_pages, fast_restore=fast_restore
+        )
+        sandbox.contexts = []
+        failures = [fail_contexts]
+
+        async def new_worker_context(context):
+            if failures[0]:
+                failures[0] -= 1
+                raise RuntimeError("browser gone")
+            worker_context = FakeWorkerContext(page_factory)
+            sandbox.contexts.append(worker_context)
+            return worker_context
+
+        async def render(page, html):
+            page.renders += 1
+            page.emit_error("load-time error")
+
+        sandbox._new_worker_context = new_worker_context
+        sandbox._render = render
+        return sandbox
+
+    @pytest.mark.asyncio
+    async def test_results_keep_discovery_order(self):
+        """Results are merged in element order, not completion order."""
+        sandbox = self._sandbox(parallel_pages=3)
+        elements = self._elements(6)
+        active = {"now": 0, "peak": 0}
+
+        async def test_element(page, element):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            # Later elements finish first
+            await asyncio.sleep(0.001 * (10 - int(element.selector[4:])))
+            active["now"] -= 1
+            return ElementResult(element.selector, ElementStatus.RESPONSIVE)
+
+        sandbox._test_element = test_element
+        result = ValidationResult()
+
+        await sandbox._test_elements_parallel(None, "<html></html>", elements, result)
+
+        assert [r.selector for r in result.element_results] == [e.selector for e in elements]
+        assert active["peak"] == 3
+        assert len(sandbox.contexts) == 3
+        assert all(c.closed for c in sandbox.contexts)
+
+    @pytest.mark.asyncio
+    async def test_page_restored_before_each_test(self):
+        """Every element test starts from a fresh render."""
+        sandbox = self._sandbox(parallel_pages=2)
+        renders_at_test = []
+
+        async def test_element(page, element):
+            renders_at_test.append(page.renders)
+            await asyncio.sleep(0)
+            return ElementResult(element.selector, ElementStatus.RESPONSIVE)
+
+        sandbox._test_element = test_element
+
+        await sandbox._test_elements_parallel(None, "<html></html>", self._elements(5), ValidationResult())
+
+        total_renders = sum(c.page.renders for c in sandbox.contexts)
+        assert total_renders == 5
+        assert sorted(renders_at_test) == [1, 1, 2, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_snapshot_restore_between_tests(self):
+        """With fast restore each worker renders once and restores afterwards."""
+        sandbox = self._sandbox(parallel_pages=2, fast_restore=True, page_factory=FakeSnapshotPage)
+
+        async def test_element(page, element):
+            await asyncio.sleep(0)
+            return ElementResult(element.selector, ElementStatus.RESPONSIVE)
+
+        sandbox._test_element = test_element
+
+        await sandbox._test_elements_parallel(None, "<html></html>", self._elements(5), ValidationResult())
+
+        assert [c.page.renders for c in sandbox.contexts] == [1, 1]
+        assert sum(c.page.restores for c in sandbox.contexts) == 3
+        assert sandbox.restore_stats.restores == 3
+        assert sandbox.restore_stats.fallbacks == 0
+
+    @pytest.mark.asyncio
+    async def test_click_errors_merged_in_order(self):
+        """Errors raised by clicks are kept once; load-time errors are not repeated."""
+        sandbox = self._sandbox(parallel_pages=2)
+
+        async def test_element(page, element):
+            if element.selector != "#btn1":
+                await asyncio.sleep(0.01)
+            page.emit_error(f"error from {element.selector}")
+            page.emit_error("shared error")
+            return ElementResult(element.selector, ElementStatus.RESPONSIVE)
+
+        sandbox._test_element = test_element
+        result = ValidationResult(js_errors=["load-time error"])
+
+        await sandbox._test_elements_parallel(None, "<html></html>", self._elements(3), result)
+
+        assert result.js_errors == [
+            "load-time error",
+            "error from #btn0",
+            "shared error",
+            "error from #btn1",
+            "error from #btn2",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_worker_leaves_work_to_others(self):
+        """A worker that cannot open a context doesn't lose elements."""
+        sandbox = self._sandbox(parallel_pages=3, fail_contexts=2)
+
+        async def test_element(page, element):
+            return ElementResult(element.selector, ElementStatus.RESPONSIVE)
+
+        sandbox._test_element = test_element
+        result = ValidationResult()
+
+        await sandbox._test_elements_parallel(None, "<html></html>", self._elements(4), result)
+
+        assert [r.status for r in result.element_results] == [ElementStatus.RESPONSIVE] * 4
+
+    @pytest.mark.asyncio
+    async def test_no_worker_marks_not_tested(self):
+        """If no worker starts, elements are reported as not tested."""
+        sandbox = self._sandbox(parallel_pages=2, fail_contexts=2)
+        result = ValidationResult()
+
+        await sandbox._test_elements_parallel(None, "<html></html>", self._elements(2), result)
+
+        assert [r.status for r in result.element_results] == [ElementStatus.NOT_TESTED] * 2
+
+    def test_sequential_when_one_page(self):
+        """parallel_pages=1 keeps the single-page sequential mode."""
+        assert Sandbox(parallel_pages=1)._parallel_pages == 1
+        assert Sandbox(parallel_pages=0)._parallel_pages == 1
+
+
+class FakeCapturePage:
+    """Renders a button that turns dark when clicked; records screenshot calls."""
+
+    def __init__(self, cdp=True):
+        self.clicked = False
+        self.screenshots = []
+        self.cdp_calls = []
+        self.context = self
+        self.cdp = cdp
+
+    def _render(self):
+        img = PILImage.new("RGB", (1920, 1080), (255, 255, 255))
+        img.paste((0, 0, 0) if self.clicked else (59, 130, 246), (100, 100, 300, 160))
+        return img
+
+    @staticmethod
+    def _encode(img, format="PNG"):
+        buffer = io.BytesIO()
+        img.save(buffer, format=format)
+        return buffer.getvalue()
+
+    async def screenshot(self, clip=None, type="png", quality=None):
+        self.screenshots.append({"clip": clip, "type": type})
+        img = self._render()
+        if clip:
+            img = img.crop((clip["x"], clip["y"], clip["x"] + clip["width"], clip["y"] + clip["height"]))
+        return self._encode(img, "JPEG" if type == "jpeg" else "PNG")
+
+    async def new_cdp_session(self, page):
+        if not self.cdp:
+            raise RuntimeError("CDP sessions are only supported in Chromium")
+        return self
+
+    async def send(self, method, params):
+        self.cdp_calls.append((method, params))
+        clip = params["clip"]
+        img = self._render().resize(
+            (round(clip["width"] * clip["scale"]), round(clip["height"] * clip["scale"]))
+        )
+        return {"data": base64.b64encode(self._encode(img, "JPEG")).decode()}
+
+    async def evaluate(self, script):
+        return [0, 0]
+
+    def locator(self, selector):
+        return self
+
+    @property
+    def first(self):
+        return self
+
+    async def click(self, timeout=None):
+        self.clicked = True
+
+    async def wait_for_timeout(self, ms):
+        pass
+
+
+class TestElementCaptures:
+    """Sandbox._test_element captures a local region and a thumbnail."""
+
+    ELEMENT = ElementInfo(
+        selector="#submit",
+        tag="button",
+        bounding_box={"x": 100, "y": 100, "width": 200, "height": 60},
+    )
+
+    @pytest.mark.asyncio
+    async def test_region_clip_and_thumbnail(self):
+        """Only the padded element region is captured at full resolution."""
+        sandbox = Sandbox()
+        page = FakeCapturePage()
+
+        result = await sandbox._test_element(page, self.ELEMENT)
+
+        png_clips = [s["clip"] for s in page.screenshots if s["type"] == "png"]
+        assert png_clips == [{"x": 0, "y": 0, "width": 400, "height": 260}] * 2
+        assert [params["clip"]["scale"] for _, params in page.cdp_calls] == [0.5, 0.5]
+        assert PILImage.open(io.BytesIO(result.before_screenshot)).size == (400, 260)
+        assert result.diff_result.global_.region_box == (0, 0, 1920, 1080)
+        assert result.status == ElementStatus.RESPONSIVE
+
+    @pytest.mark.asyncio
+    async def test_thumbnail_without_cdp(self):
+        """Without CDP the thumbnail falls back to a full-size JPEG."""
+        sandbox = Sandbox()
+        page = FakeCapturePage(cdp=False)
+
+        result = await sandbox._test_element(page, self.ELEMENT)
+
+        assert [s["type"] for s in page.screenshots] == ["png", "jpeg", "png", "jpeg"]
+        assert result.diff_result.global_.total_pixels == 1920 * 1080
+        assert result.status == ElementStatus.RESPONSIVE
+
+    def test_offscreen_element_captures_viewport(self):
+        """Elements outside the viewport fall back to a full-viewport region."""
+        sandbox = Sandbox()
+        element = ElementInfo(
+            selector="#footer",
+            tag="button",
+            bounding_box={"x": 100, "y": 3000, "width": 200, "height": 60},
+        )
+
+        assert sandbox._capture_region(element) == (0, 0, 1920, 1080)
+
+    @pytest.mark.asyncio
+    async def test_legacy_mode_compares_thumbnails(self):
+        """Without DiffEngine the perceptual fallback diffs the thumbnails."""
+        sandbox = Sandbox(use_diff_engine=False)
+
+        result = await sandbox._test_element(FakeCapturePage(), self.ELEMENT)
+
+        assert result.diff_ratio > 0
+        assert result.diff_result is None
+
+
+class TestPageRestore:
+    """Sandbox._restore: snapshot restore with re-render fallback."""
+
+    @staticmethod
+    def _sandbox(fast_restore=True):
+        sandbox = Sandbox(fast_restore=fast_restore)
+
+        async def render(page, html):
+            page.renders += 1
+
+        sandbox._render = render
+        return sandbox
+
+    @pytest.mark.asyncio
+    async def test_restore_without_render(self):
+        """An exact snapshot restore needs no re-render."""
+        sandbox = self._sandbox()
+        page = FakeSnapshotPage()
+        await sandbox._render_and_snapshot(page, "<html></html>")
+
+        await sandbox._restore(page, "<html></html>")
+
+        assert page.renders == 1
+        assert page.restores == 1
+
+    @pytest.mark.asyncio
+    async def test_inexact_restore_falls_back_to_render(self):
+        """A DOM mismatch after the undo re-renders and snapshots again."""
+        sandbox = self._sandbox()
+        page = FakeSnapshotPage(restore_result="dom mismatch")
+        await sandbox._render_and_snapshot(page, "<html></html>")
+
+        await sandbox._restore(page, "<html></html>")
+
+        assert page.renders == 2
+        assert page.captures == 2
+        assert sandbox.restore_stats.fallbacks == 1
+
+    @pytest.mark.asyncio
+    async def test_page_without_snapshot_support(self):
+        """Pages that can't be scripted always re-render."""
+        sandbox = self._sandbox()
+        page = FakeWorkerPage()
+
+        await sandbox._restore(page, "<html></html>")
+
+        assert page.renders == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_always_renders(self):
+        """fast_restore=False re-renders before every test."""
+        sandbox = self._sandbox(fast_restore=False)
+        page = FakeSnapshotPage()
+        await sandbox._render_and_snapshot(page, "<html></html>")
+
+        await sandbox._restore(page, "<html></html>")
+
+        assert page.renders == 2
+        assert page.captures == page.restores == 0
+
+    def test_savings(self):
+        """Stats report the time saved vs re-rendering."""
+        stats = PageRestoreStats(restores=4, renders=2, restore_ms=20.0, render_ms=900.0)
+
+        assert stats.avg_render_ms == 450.0
+        assert stats.saved_ms == 4 * (450.0 - 5.0)
+        assert stats.as_dict()["saved_ms"] == 1780.0
@@ -8,11 +8,16 @@ Includes:
 - Sprint 1: Static CSS/HTML analysis
 - Sprint 2: Playwright dynamic analysis
 - Sprint 3.5: JavaScript validation
+
+The HTML is parsed once (DocumentCache) and the same tree is shared with
+the JavaScript validators. Per-element Tailwind facts come from the
+document's ElementIndex, computed once for all analyzers.
 """
 
 import time
 from typing import List, Dict, Optional
 
+from ..analyzers.document_cache import DocumentCache, get_document_cache
 from ..analyzers.dom_parser import DOMParser
 from ..analyzers.interactive_detector import InteractiveDetector, InteractiveElement
 from ..analyzers.pointer_detector import PointerBlockageDetector, BlockageInfo
@@ -44,18 +49,29 @@ class ErrorClassificationPipeline:
         # With Playwright page
         report = await pipeline.classify(html, page)
 
+        # On a shared render (RenderSession): no set_content of its own
+        report = await pipeline.classify(html, session=session)
+
         # Static-only mode (no Playwright)
         report = await pipeline.classify_static(html)
     """
 
-    def __init__(self, viewport_width: int = 1920, viewport_height: int = 1080):
+    def __init__(
+        self,
+        viewport_width: int = 1920,
+        viewport_height: int = 1080,
+        documents: Optional[DocumentCache] = None,
+    ):
         """
         Initialize the pipeline.
 
         Args:
             viewport_width: Expected viewport width
             viewport_height: Expected viewport height
+            documents: Parsed-document cache (default: shared cache)
         """
+        self._documents = documents or get_document_cache()
+
         # Sprint 1 analyzers
         self.dom_parser: Optional[DOMParser] = None
         self.interactive_detector = InteractiveDetector()
@@ -72,7 +88,7 @@ class ErrorClassificationPipeline:
         self.report_generator = ErrorReportGenerator()
 
         # Sprint 3.5: JavaScript validators
-        self.js_validator = JSRuntimeValidator()
+        self.js_validator = JSRuntimeValidator(documents=self._documents)
         self.js_classifier = JSErrorClassifier()
 
         # Config
@@ -83,13 +99,15 @@ class ErrorClassificationPipeline:
         self._last_interactive: List[InteractiveElement] = []
         self._last_static_errors: List[BlockageInfo] = []
 
-    async def classify(self, html: str, page=None) -> ErrorReport:
+    async def classify(self, html: str, page=None, session=None) -> ErrorReport:
         """
         Classify all errors in HTML.
 
         Args:
             html: HTML string to analyze
             page: Optional Playwright Page for dynamic analysis
+            session: Optional RenderSession of `html` for dynamic analysis
+                     (used instead of `page`, the HTML is not loaded again)
 
         Returns:
             ErrorReport with all classified errors
@@ -97,7 +115,7 @@ class ErrorClassificationPipeline:
         start_time = time.time()
 
         # Phase 1: Static analysis (Sprint 1)
-        self.dom_parser = DOMParser(html)
+        self.dom_parser = self._documents.parser(html)
         interactive = self.interactive_detector.find_interactive_elements(
             self.dom_parser
         )
@@ -109,32 +127,34 @@ class ErrorClassificationPipeline:
         self._last_static_errors = static_errors
 
         # Get Tailwind info for all interactive elements
+        index = self.dom_parser.element_index
         tailwind_infos: Dict[str, TailwindInfo] = {}
         for element in interactive:
-            tailwind_infos[element.selector] = self.tailwind_analyzer.analyze_element(
-                element.element
-            )
+            tailwind_infos[element.selector] = index.info(element.element)
 
         # Phase 2: Dynamic analysis (Sprint 2) - if page provided
         diagnoses: Dict[str, ElementDiagnosis] = {}
         transform_errors: List[ClassifiedError] = []
 
-        if page:
-            # Load HTML into page
-            await page.set_content(html, wait_until="networkidle")
+        dynamic = page is not None or session is not None
 
-            # Diagnose each interactive element
-            for element in interactive:
-                diagnosis = await self.playwright_diagnostic.diagnose_element(
-                    page, element.selector
-                )
-                diagnoses[element.selector] = diagnosis
-
-            # Check for transform issues
+        if dynamic:
+            # Diagnose every interactive element and check transforms in a
+            # single page.evaluate
             selectors = [e.selector for e in interactive]
-            transform_issues = await self.transform_detector.detect_transform_issues(
-                page, selectors
-            )
+            if session is not None:
+                async with session.use() as session_page:
+                    batch = await self.playwright_diagnostic.evaluate_batch(
+                        session_page, selectors, transforms=True
+                    )
+            else:
+                # Load HTML into page
+                await page.set_content(html, wait_until="networkidle")
+                batch = await self.playwright_diagnostic.evaluate_batch(
+                    page, selectors, transforms=True
+                )
+            diagnoses = self.playwright_diagnostic.diagnoses_from_batch(batch)
+            transform_issues = self.transform_detector.issues_from_batch(batch, selectors)
 
             # Convert transform issues to ClassifiedErrors
             for issue in transform_issues:
@@ -156,9 +176,9 @@ class ErrorClassificationPipeline:
 
         # Phase 2.5: JavaScript validation (Sprint 3.5)
         js_errors: List[ClassifiedError] = []
-        if page:
+        if dynamic:
             # Runtime validation with Playwright
-            js_result = await self.js_validator.validate(html, page)
+            js_result = await self.js_validator.validate(html, page, session=session)
             js_errors = self.js_classifier.classify(js_result)
         else:
             # Static-only JavaScript validation
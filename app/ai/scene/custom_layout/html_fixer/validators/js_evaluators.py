@@ -336,6 +336,38 @@ class JSEvaluators:
     # BATCH OPERATIONS
     # =========================================================================
 
+    # Runs DIAGNOSE_ELEMENT and the transform checks for many selectors in
+    # one evaluate (one CDP round trip, helpers injected once). Returns
+    # {selector: {diagnosis, backface, transform}}; checks that weren't
+    # requested are null, and a selector that throws counts as not found.
+    # Requires with_helpers() (interceptor selectors).
+    DIAGNOSE_BATCH = """
+    ({selectors, diagnose, transforms}) => {
+        const diagnoseElement = """ + DIAGNOSE_ELEMENT.strip() + """;
+        const checkBackface = """ + CHECK_BACKFACE_VISIBILITY.strip() + """;
+        const checkOffscreen = """ + CHECK_TRANSFORM_OFFSCREEN.strip() + """;
+
+        const run = (check, selector) => {
+            try {
+                return check(selector);
+            } catch (e) {
+                return { found: false, error: String(e) };
+            }
+        };
+
+        const results = {};
+        for (const selector of selectors) {
+            if (Object.prototype.hasOwnProperty.call(results, selector)) continue;
+            results[selector] = {
+                diagnosis: diagnose ? run(diagnoseElement, selector) : null,
+                backface: transforms ? run(checkBackface, selector) : null,
+                transform: transforms ? run(checkOffscreen, selector) : null
+            };
+        }
+        return results;
+    }
+    """
+
     DIAGNOSE_ALL_INTERACTIVE = """
     () => {
         // Find all potentially interactive elements
@@ -20,14 +20,22 @@ Usage:
 
         for error in result.syntax_errors:
             print(f"Syntax error: {error.message}")
+
+    # On a shared render (load-time errors from the session; the checks
+    # run on an isolated page and leave the session's page untouched)
+    result = await validator.validate(html, session=session)
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, Optional, Set, TYPE_CHECKING
 
+from ..analyzers.document_cache import DocumentCache, get_document_cache
 from .js_evaluators import JSEvaluators
 from .js_validator import JSValidator, JSValidationResult
 
+if TYPE_CHECKING:
+    from ..sandbox.render_session import RenderSession
+
 
 @dataclass
 class RuntimeError:
@@ -101,31 +109,61 @@ class JSRuntimeValidator:
     for comprehensive error detection.
     """
 
-    def __init__(self):
-        """Initialize the runtime validator."""
+    def __init__(self, documents: Optional[DocumentCache] = None):
+        """
+        Initialize the runtime validator.
+
+        Args:
+            documents: Parsed-document cache (default: shared cache)
+        """
         self._static_validator = JSValidator()
+        self._documents = documents or get_document_cache()
 
-    async def validate(self, html: str, page) -> JSRuntimeResult:
+    async def validate(
+        self, html: str, page=None, session: Optional["RenderSession"] = None
+    ) -> JSRuntimeResult:
         """
         Validate JavaScript in HTML using browser.
 
         Args:
             html: HTML string containing JavaScript
-            page: Playwright Page instance
+            page: Playwright Page instance (the HTML is loaded into it)
+            session: Existing render of `html`, used instead of `page`
 
         Returns:
             JSRuntimeResult with all errors found
         """
-        from ..analyzers.dom_parser import DOMParser
-
         # First do static analysis
-        parser = DOMParser(html)
+        parser = self._documents.parser(html)
         static_result = self._static_validator.validate(parser)
 
         # Initialize result
         result = JSRuntimeResult(static_result=static_result)
 
-        # Load HTML into page
+        if session is not None:
+            # Load-time errors come from the session render (captured from the start)
+            self._add_load_errors(
+                result, session.load_js_errors, session.load_console_errors
+            )
+            # The checks wrap console.error and run handlers by hand: JS state
+            # a snapshot restore doesn't undo, so keep them off the shared page
+            async with session.isolated() as isolated_page:
+                await self._validate_runtime(isolated_page, parser, static_result, result)
+            return result
+
+        # Load HTML into page, capturing the errors raised while it loads
+        load_js_errors: List[str] = []
+        load_console_errors: List[str] = []
+
+        def on_page_error(error) -> None:
+            load_js_errors.append(str(error))
+
+        def on_console(msg) -> None:
+            if msg.type == "error":
+                load_console_errors.append(msg.text)
+
+        page.on("pageerror", on_page_error)
+        page.on("console", on_console)
         try:
             await page.set_content(html, wait_until="networkidle", timeout=10000)
         except Exception as e:
@@ -138,7 +176,32 @@ class JSRuntimeValidator:
             )
             result.has_errors = True
             return result
+        finally:
+            page.remove_listener("pageerror", on_page_error)
+            page.remove_listener("console", on_console)
+
+        self._add_load_errors(result, load_js_errors, load_console_errors)
+        await self._validate_runtime(page, parser, static_result, result)
+        return result
 
+    @staticmethod
+    def _add_load_errors(
+        result: JSRuntimeResult, js_errors: List[str], console_errors: List[str]
+    ) -> None:
+        """Report errors raised while the page loaded."""
+        for message in js_errors:
+            result.console_errors.append(
+                RuntimeError(error_type="uncaught_error", message=message)
+            )
+        for message in console_errors:
+            result.console_errors.append(
+                RuntimeError(error_type="console_error", message=message)
+            )
+
+    async def _validate_runtime(
+        self, page, parser, static_result: JSValidationResult, result: JSRuntimeResult
+    ) -> None:
+        """Run the browser checks on a loaded page, filling `result`."""
         # Setup error capture
         await page.evaluate(JSEvaluators.CAPTURE_JS_ERRORS)
 
@@ -178,8 +241,6 @@ class JSRuntimeValidator:
             or static_result.has_errors
         )
 
-        return result
-
     async def _validate_syntax(
         self, page, static_result: JSValidationResult
     ) -> List[RuntimeError]:
@@ -306,9 +367,7 @@ class JSRuntimeValidator:
         Returns:
             JSValidationResult from static validation
         """
-        from ..analyzers.dom_parser import DOMParser
-
-        parser = DOMParser(html)
+        parser = self._documents.parser(html)
         return self._static_validator.validate(parser)
 
     def __repr__(self) -> str:
@@ -3,6 +3,9 @@ Playwright Element Diagnosis - Browser-based element analysis.
 
 Uses Playwright to get actual computed styles, bounding boxes,
 and elementFromPoint data for accurate interactivity diagnosis.
+
+Many selectors are diagnosed in a single page.evaluate (evaluate_batch),
+which can also run the TransformDetector checks in the same round trip.
 """
 
 from dataclasses import dataclass
@@ -247,24 +250,13 @@ class PlaywrightDiagnostic:
         code = JSEvaluators.with_helpers(JSEvaluators.DIAGNOSE_ELEMENT)
         result = await page.evaluate(code, selector)
 
-        if not result.get("found"):
-            return ElementDiagnosis(
-                found=False,
-                selector=selector,
-                visibility=None,
-                interceptor=None,
-                stacking=None,
-                pointer_events=None,
-                rect=None,
-            )
-
-        return self._parse_diagnosis_result(selector, result)
+        return self.parse_diagnosis(selector, result)
 
     async def diagnose_elements(
         self, page, selectors: List[str]
     ) -> Dict[str, ElementDiagnosis]:
         """
-        Diagnose multiple elements.
+        Diagnose multiple elements in one page.evaluate.
 
         Args:
             page: Playwright Page instance
@@ -273,10 +265,65 @@ class PlaywrightDiagnostic:
         Returns:
             Dictionary mapping selector to diagnosis
         """
-        results = {}
-        for selector in selectors:
-            results[selector] = await self.diagnose_element(page, selector)
-        return results
+        batch = await self.evaluate_batch(page, selectors)
+        return self.diagnoses_from_batch(batch)
+
+    async def evaluate_batch(
+        self,
+        page,
+        selectors: List[str],
+        diagnose: bool = True,
+        transforms: bool = False,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run the element diagnosis and/or transform checks for all selectors
+        in a single page.evaluate.
+
+        Args:
+            page: Playwright Page instance
+            selectors: List of CSS selectors
+            diagnose: Include the DIAGNOSE_ELEMENT result ("diagnosis")
+            transforms: Include the TransformDetector checks
+                        ("backface" and "transform")
+
+        Returns:
+            Raw results: {selector: {"diagnosis", "backface", "transform"}},
+            for diagnoses_from_batch / TransformDetector.issues_from_batch
+        """
+        from .js_evaluators import JSEvaluators
+
+        if not selectors:
+            return {}
+
+        code = JSEvaluators.with_helpers(JSEvaluators.DIAGNOSE_BATCH)
+        return await page.evaluate(
+            code,
+            {"selectors": list(selectors), "diagnose": diagnose, "transforms": transforms},
+        )
+
+    def diagnoses_from_batch(
+        self, batch: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, ElementDiagnosis]:
+        """Parse the "diagnosis" part of an evaluate_batch result."""
+        return {
+            selector: self.parse_diagnosis(selector, result.get("diagnosis") or {})
+            for selector, result in batch.items()
+        }
+
+    def parse_diagnosis(self, selector: str, result: Dict[str, Any]) -> ElementDiagnosis:
+        """Build an ElementDiagnosis from a DIAGNOSE_ELEMENT result."""
+        if not result.get("found"):
+            return ElementDiagnosis(
+                found=False,
+                selector=selector,
+                visibility=None,
+                interceptor=None,
+                stacking=None,
+                pointer_events=None,
+                rect=None,
+            )
+
+        return self._parse_diagnosis_result(selector, result)
 
     async def find_interceptor_at_point(
         self, page, x: float, y: float
@@ -5,10 +5,14 @@ Identifies elements hidden by CSS transforms including:
 - Backface-visibility with rotation > 90deg
 - Scale(0) or very small scale
 - Translate off-screen
+
+detect_transform_issues runs the checks for all selectors in one
+page.evaluate (PlaywrightDiagnostic.evaluate_batch); ErrorClassificationPipeline
+folds them into the same batch as the element diagnoses (issues_from_batch).
 """
 
 from dataclasses import dataclass, field
-from typing import Optional, List, Union
+from typing import Any, Dict, Optional, List, Union
 
 from ..contracts.errors import ErrorType
 
@@ -98,8 +102,13 @@ class TransformDetector:
         from .js_evaluators import JSEvaluators
 
         result = await page.evaluate(JSEvaluators.CHECK_BACKFACE_VISIBILITY, selector)
+        return self._backface_issue(selector, result)
 
-        if not result.get("found"):
+    def _backface_issue(
+        self, selector: str, result: Optional[Dict[str, Any]]
+    ) -> Optional[BackfaceIssue]:
+        """BackfaceIssue from a CHECK_BACKFACE_VISIBILITY result."""
+        if not result or not result.get("found"):
             return None
 
         if result.get("hiddenByBackface"):
@@ -129,8 +138,13 @@ class TransformDetector:
         from .js_evaluators import JSEvaluators
 
         result = await page.evaluate(JSEvaluators.CHECK_TRANSFORM_OFFSCREEN, selector)
+        return self._transform_issue(selector, result)
 
-        if not result.get("found"):
+    def _transform_issue(
+        self, selector: str, result: Optional[Dict[str, Any]]
+    ) -> Optional[TransformIssue]:
+        """TransformIssue from a CHECK_TRANSFORM_OFFSCREEN result."""
+        if not result or not result.get("found"):
             return None
 
         if result.get("isHiddenByTransform"):
@@ -148,26 +162,49 @@ class TransformDetector:
         self, page, selectors: List[str]
     ) -> List[Union[BackfaceIssue, TransformIssue]]:
         """
-        Check multiple elements for transform issues.
+        Check multiple elements for transform issues (one page.evaluate).
 
         Args:
             page: Playwright Page instance
             selectors: List of CSS selectors
 
+        Returns:
+            List of found issues
+        """
+        from .playwright_diagnostic import PlaywrightDiagnostic
+
+        batch = await PlaywrightDiagnostic().evaluate_batch(
+            page, selectors, diagnose=False, transforms=True
+        )
+        return self.issues_from_batch(batch, selectors)
+
+    def issues_from_batch(
+        self, batch: Dict[str, Dict[str, Any]], selectors: List[str]
+    ) -> List[Union[BackfaceIssue, TransformIssue]]:
+        """
+        Transform issues from a PlaywrightDiagnostic.evaluate_batch result
+        (run with transforms=True).
+
+        Args:
+            batch: Raw batch results by selector
+            selectors: Selectors in the order issues should be reported
+
         Returns:
             List of found issues
         """
         issues: List[Union[BackfaceIssue, TransformIssue]] = []
 
-        for selector in selectors:
+        for selector in dict.fromkeys(selectors):
+            result = batch.get(selector) or {}
+
             # Check backface first
-            backface = await self.check_backface_visibility(page, selector)
+            backface = self._backface_issue(selector, result.get("backface"))
             if backface:
                 issues.append(backface)
                 continue
 
             # Check transform offscreen
-            transform = await self.check_transform_offscreen(page, selector)
+            transform = self._transform_issue(selector, result.get("transform"))
             if transform:
                 issues.append(transform)
 
@@ -397,3 +397,87 @@ class TestInterceptorDetection:
 
         # Should find body or html element
         assert interceptor is not None
+
+
+# ============================================================================
+# BATCH DIAGNOSIS TESTS
+# ============================================================================
+
+
+class FakeEvaluatePage:
+    """Page double that records evaluate() calls and returns a canned result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def evaluate(self, code, arg=None):
+        self.calls.append((code, arg))
+        return self.result
+
+
+class TestBatchDiagnosis:
+    """Batched diagnosis parsing (no browser)."""
+
+    async def test_diagnose_elements_single_evaluate(self, diagnostic):
+        """All selectors are diagnosed in one page.evaluate."""
+        page = FakeEvaluatePage({
+            "#btn": {
+                "diagnosis": {
+                    "found": True,
+                    "rect": {"x": 0, "y": 0, "width": 80, "height": 30},
+                    "visibility": {
+                        "display": "block",
+                        "visibility": "visible",
+                        "opacity": 1,
+                        "width": 80,
+                        "height": 30,
+                        "inViewport": True,
+                    },
+                    "pointerEvents": {"value": "auto", "inherited": False, "effective": "auto"},
+                },
+                "backface": None,
+                "transform": None,
+            },
+            "#missing": {"diagnosis": {"found": False}, "backface": None, "transform": None},
+        })
+
+        diagnoses = await diagnostic.diagnose_elements(page, ["#btn", "#missing"])
+
+        assert len(page.calls) == 1
+        code, arg = page.calls[0]
+        assert "diagnoseElement" in code
+        assert arg == {"selectors": ["#btn", "#missing"], "diagnose": True, "transforms": False}
+        assert diagnoses["#btn"].found is True
+        assert diagnoses["#btn"].rect.width == 80
+        assert diagnoses["#missing"].found is False
+
+    async def test_evaluate_batch_empty(self, diagnostic):
+        """No selectors, no round trip."""
+        page = FakeEvaluatePage({})
+
+        assert await diagnostic.evaluate_batch(page, []) == {}
+        assert page.calls == []
+
+
+@pytest.mark.playwright
+class TestBatchDiagnosisBrowser:
+    """Batched diagnosis matches per-element diagnosis."""
+
+    async def test_batch_matches_single(self, page_with_html, diagnostic):
+        """diagnose_elements gives the same results as diagnose_element."""
+        html = """
+        <html><body style="position:relative">
+            <button id="btn" style="position:relative;z-index:1">Click me</button>
+            <button id="hidden" style="display:none">Hidden</button>
+            <div id="overlay" style="position:absolute;top:0;left:0;right:0;bottom:0;z-index:10"></div>
+        </body></html>
+        """
+        page = await page_with_html(html)
+        selectors = ["#btn", "#hidden", "#nonexistent"]
+
+        batch = await diagnostic.diagnose_elements(page, selectors)
+
+        for selector in selectors:
+            single = await diagnostic.diagnose_element(page, selector)
+            assert batch[selector].to_dict() == single.to_dict()
@@ -314,3 +314,56 @@ class TestBackfaceVisibility:
 
         # Should not report issue when backface is visible
         assert issue is None
+
+
+# ============================================================================
+# BATCH TESTS
+# ============================================================================
+
+
+class FakeEvaluatePage:
+    """Page double that records evaluate() calls and returns a canned result."""
+
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def evaluate(self, code, arg=None):
+        self.calls.append((code, arg))
+        return self.result
+
+
+class TestTransformBatch:
+    """Batched transform checks (no browser)."""
+
+    async def test_detect_transform_issues_single_evaluate(self, detector):
+        """All selectors are checked in one page.evaluate, backface first."""
+        page = FakeEvaluatePage({
+            "#card": {
+                "diagnosis": None,
+                "backface": {"found": True, "hiddenByBackface": True, "rotationY": 180},
+                "transform": {"found": True, "isHiddenByTransform": True},
+            },
+            "#ok": {
+                "diagnosis": None,
+                "backface": {"found": True, "hiddenByBackface": False},
+                "transform": {"found": True, "isHiddenByTransform": False},
+            },
+            "#missing": {
+                "diagnosis": None,
+                "backface": {"found": False},
+                "transform": {"found": False},
+            },
+        })
+
+        issues = await detector.detect_transform_issues(page, ["#card", "#ok", "#missing"])
+
+        assert len(page.calls) == 1
+        assert page.calls[0][1]["transforms"] is True
+        assert page.calls[0][1]["diagnose"] is False
+        assert [issue.selector for issue in issues] == ["#card"]
+        assert isinstance(issues[0], BackfaceIssue)
+
+    def test_issues_from_batch_missing_selector(self, detector):
+        """Selectors absent from the batch report no issue."""
+        assert detector.issues_from_batch({}, ["#a"]) == []
@@ -29,7 +29,7 @@ from typing import Optional, List
 from uuid import uuid4
 from datetime import datetime, timezone
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.scene.schemas import (
     SceneGraph,
@@ -511,7 +511,7 @@ async def get_default_scene(
     target_devices: List[str],
     user_id: str,
     user_request: str,
-    db: Session,
+    db: AsyncSession,
 ) -> SceneGraph:
     """
     Get a complete default scene with populated data.
@@ -22,14 +22,16 @@ Usage:
     )
 """
 
+import asyncio
 import json
 import logging
 import re
+import time
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Any, Optional, Tuple, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Awaitable
 from uuid import uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.ai.scene.schemas import (
     SceneGraph,
@@ -66,6 +68,47 @@ SIZE_KEYWORDS = {
 }
 
 
+# ---------------------------------------------------------------------------
+# SCENE DATA FETCHING
+# ---------------------------------------------------------------------------
+
+class SceneFetchContext:
+    """
+    State shared by the component fetchers of one populate_scene_data call.
+    
+    - `now`: One reference time, so widgets over "the next N days" ask for
+      exactly the same range
+    - `share()`: Identical underlying requests (e.g. calendar_widget and
+      calendar_agenda, or meeting_detail and event_countdown both asking
+      for the next event) run once and every component awaits the result
+    """
+    
+    def __init__(self):
+        self.now = datetime.now(timezone.utc)
+        self.shared_requests = 0
+        self._requests: Dict[Tuple, asyncio.Task] = {}
+    
+    async def share(self, key: Tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run `factory()` once per key; later callers await the same result."""
+        task = self._requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(factory())
+            # Retrieve the exception so a request nobody awaits anymore
+            # (its component timed out) doesn't log "never retrieved"
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._requests[key] = task
+        else:
+            self.shared_requests += 1
+        # shield: one component timing out must not cancel the request for others
+        return await asyncio.shield(task)
+    
+    def close(self) -> None:
+        """Cancel requests still running for components that timed out."""
+        for task in self._requests.values():
+            if not task.done():
+                task.cancel()
+
+
 # ---------------------------------------------------------------------------
 # SCENE SERVICE
 # ---------------------------------------------------------------------------
@@ -98,7 +141,7 @@ class SceneService:
         target_devices: List[str],
         user_id: str,
         user_request: str,
-        db: Session,
+        db: AsyncSession,
         realtime_data: Dict[str, Any] = None,
         conversation_context: Dict[str, Any] = None,
     ) -> SceneGraph:
@@ -979,7 +1022,7 @@ Fix the issue and generate a valid Scene Graph."""
         self,
         scene: SceneGraph,
         user_id: str,
-        db: Session,
+        db: AsyncSession,
     ) -> SceneGraph:
         """
         Populate data for all components in a scene.
@@ -989,6 +1032,11 @@ Fix the issue and generate a valid Scene Graph."""
         
         Sprint 4.1: Skips components that already have real-time data from Gemini.
         
+        Components are fetched concurrently (at most SCENE_FETCH_CONCURRENCY
+        at a time). Each one gets SCENE_COMPONENT_TIMEOUT_SECONDS; a slower
+        component is rendered as a placeholder instead of stalling the scene.
+        Identical requests across components are made once (SceneFetchContext).
+        
         Args:
             scene: SceneGraph with empty component data
             user_id: User ID for OAuth credentials
@@ -997,6 +1045,9 @@ Fix the issue and generate a valid Scene Graph."""
         Returns:
             SceneGraph with populated data
         """
+        from app.core.config import settings
+        
+        pending = []
         for component in scene.components:
             # Sprint 4.1: Skip if component already has real-time data from Gemini
             if component.data and not component.data.get("is_placeholder", True):
@@ -1004,15 +1055,36 @@ Fix the issue and generate a valid Scene Graph."""
                     f"Component {component.id} ({component.type}) already has real-time data, skipping fetch"
                 )
                 continue
-            
-            try:
-                data = await self._fetch_component_data(
+            pending.append(component)
+        
+        if not pending:
+            return scene
+        
+        shared = SceneFetchContext()
+        semaphore = asyncio.Semaphore(settings.SCENE_FETCH_CONCURRENCY)
+        timeout = settings.SCENE_COMPONENT_TIMEOUT_SECONDS
+        start_time = time.time()
+        
+        async def fetch(component: SceneComponent) -> None:
+            async with semaphore:
+                component.data = await self._fetch_component_data(
                     component_type=component.type,
                     props=component.props,
                     user_id=user_id,
                     db=db,
+                    shared=shared,
                 )
-                component.data = data
+        
+        async def fetch_with_fallback(component: SceneComponent) -> None:
+            try:
+                await asyncio.wait_for(fetch(component), timeout=timeout)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    f"Component {component.id} ({component.type}) timed out after {timeout}s, "
+                    "using placeholder",
+                    extra={"component_type": component.type}
+                )
+                component.data = self._timeout_placeholder(component.type, timeout)
             except Exception as e:
                 logger.warning(
                     f"Failed to fetch data for component {component.id}: {e}",
@@ -1021,19 +1093,64 @@ Fix the issue and generate a valid Scene Graph."""
                 # Set error state in data
                 component.data = {"error": str(e)}
         
+        try:
+            await asyncio.gather(*(fetch_with_fallback(c) for c in pending))
+        finally:
+            shared.close()
+        
+        logger.info(
+            f"Populated {len(pending)} components in {(time.time() - start_time) * 1000:.0f}ms "
+            f"({shared.shared_requests} shared requests)"
+        )
         return scene
     
+    def _timeout_placeholder(self, component_type: str, timeout: float) -> Dict[str, Any]:
+        """Data for a component whose fetch exceeded its time budget."""
+        data: Dict[str, Any] = {
+            "is_placeholder": True,
+            "timed_out": True,
+            "error": f"Data not available in time ({timeout:g}s)",
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if component_type.startswith("calendar"):
+            data["events"] = []
+        elif component_type in ("countdown_timer", "event_countdown"):
+            data["seconds_until"] = 0
+        return data
+    
+    async def _list_events_shared(
+        self,
+        calendar_client,
+        time_min: datetime,
+        time_max: datetime,
+        max_results: int,
+        shared: Optional[SceneFetchContext] = None,
+    ) -> List[Any]:
+        """list_upcoming_events, made once per scene for identical ranges."""
+        def request():
+            return calendar_client.list_upcoming_events(
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+            )
+        
+        if shared is None:
+            return await request()
+        return await shared.share(("events", time_min, time_max, max_results), request)
+    
     async def _fetch_component_data(
         self,
         component_type: str,
         props: Dict[str, Any],
         user_id: str,
-        db: Session,
+        db: AsyncSession,
+        shared: Optional[SceneFetchContext] = None,
     ) -> Dict[str, Any]:
         """
         Fetch actual data for a component.
         
         Routes to the appropriate data fetcher based on component type.
+        `shared` lets concurrent fetchers reuse identical requests.
         """
         # Calendar components
         if component_type.startswith("calendar"):
@@ -1042,6 +1159,7 @@ Fix the issue and generate a valid Scene Graph."""
                 props=props,
                 user_id=user_id,
                 db=db,
+                shared=shared,
             )
         
         # Meeting detail component (single event with full details)
@@ -1050,6 +1168,7 @@ Fix the issue and generate a valid Scene Graph."""
                 props=props,
                 user_id=user_id,
                 db=db,
+                shared=shared,
             )
         
         # Countdown/Timer components
@@ -1059,6 +1178,7 @@ Fix the issue and generate a valid Scene Graph."""
                 props=props,
                 user_id=user_id,
                 db=db,
+                shared=shared,
             )
         
         # Document components (Google Docs)
@@ -1103,7 +1223,8 @@ Fix the issue and generate a valid Scene Graph."""
         component_type: str,
         props: Dict[str, Any],
         user_id: str,
-        db: Session,
+        db: AsyncSession,
+        shared: Optional[SceneFetchContext] = None,
     ) -> Dict[str, Any]:
         """
         Fetch calendar events using GoogleCalendarClient.
@@ -1111,14 +1232,11 @@ Fix the issue and generate a valid Scene Graph."""
         Determines date range from component_type and props,
         fetches events, and formats for frontend.
         """
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
         
         # Get OAuth credentials
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
         
         if not credentials:
             return {
@@ -1127,10 +1245,10 @@ Fix the issue and generate a valid Scene Graph."""
             }
         
         # Create calendar client
-        calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+        calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
         
         # Determine date range based on component type
-        now = datetime.now(timezone.utc)
+        now = shared.now if shared else datetime.now(timezone.utc)
         
         if component_type == "calendar_day":
             # Single day
@@ -1178,10 +1296,12 @@ Fix the issue and generate a valid Scene Graph."""
         
         # Fetch events
         try:
-            events = await calendar_client.list_upcoming_events(
+            events = await self._list_events_shared(
+                calendar_client,
                 time_min=time_min,
                 time_max=time_max,
                 max_results=max_results,
+                shared=shared,
             )
             
             # Format events for frontend
@@ -1260,7 +1380,8 @@ Fix the issue and generate a valid Scene Graph."""
         self,
         props: Dict[str, Any],
         user_id: str,
-        db: Session,
+        db: AsyncSession,
+        shared: Optional[SceneFetchContext] = None,
     ) -> Dict[str, Any]:
         """
         Fetch details for a single meeting/event.
@@ -1268,18 +1389,15 @@ Fix the issue and generate a valid Scene Graph."""
         Can fetch by event_id, meeting_search, or get the next upcoming event.
         Sprint 4.3.2: Added meeting_search support to find events by title/keywords.
         """
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
 
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
 
         if not credentials:
             return {"error": "Google Calendar not connected"}
 
-        calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+        calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
 
         # If specific event_id provided, fetch that event
         event_id = props.get("event_id")
@@ -1318,11 +1436,13 @@ Fix the issue and generate a valid Scene Graph."""
 
         # Otherwise, get next upcoming event
         try:
-            now = datetime.now(timezone.utc)
-            events = await calendar_client.list_upcoming_events(
+            now = shared.now if shared else datetime.now(timezone.utc)
+            events = await self._list_events_shared(
+                calendar_client,
                 time_min=now,
                 time_max=now + timedelta(days=7),
                 max_results=1,
+                shared=shared,
             )
             
             if events:
@@ -1400,7 +1520,8 @@ Fix the issue and generate a valid Scene Graph."""
         component_type: str,
         props: Dict[str, Any],
         user_id: str,
-        db: Session,
+        db: AsyncSession,
+        shared: Optional[SceneFetchContext] = None,
     ) -> Dict[str, Any]:
         """
         Fetch countdown/timer data.
@@ -1408,7 +1529,7 @@ Fix the issue and generate a valid Scene Graph."""
         For event_countdown: fetches next event and calculates time until.
         For countdown_timer: can use custom target_time or next event.
         """
-        now = datetime.now(timezone.utc)
+        now = shared.now if shared else datetime.now(timezone.utc)
         
         # If custom target_time provided
         target_time_str = props.get("target_time")
@@ -1426,23 +1547,22 @@ Fix the issue and generate a valid Scene Graph."""
                 return {"error": f"Invalid target_time format: {e}"}
         
         # Auto-fetch next event for countdown
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
         
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
         
         if not credentials:
             return {"error": "Google Calendar not connected", "seconds_until": 0}
         
         try:
-            calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
-            events = await calendar_client.list_upcoming_events(
+            calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
+            events = await self._list_events_shared(
+                calendar_client,
                 time_min=now,
                 time_max=now + timedelta(days=7),  # Match meeting_detail window
                 max_results=1,
+                shared=shared,
             )
             
             if events:
@@ -1492,7 +1612,7 @@ Fix the issue and generate a valid Scene Graph."""
         meeting_search: Optional[str] = None,
         event_id: Optional[str] = None,
         user_id: Optional[str] = None,
-        db: Optional[Session] = None,
+        db: Optional[AsyncSession] = None,
     ) -> Optional[str]:
         """
         Extract a Google Doc URL from a calendar event.
@@ -1643,7 +1763,7 @@ Generate the requested content now:"""
         component_type: str,
         props: Dict[str, Any],
         user_id: str,
-        db: Session,
+        db: AsyncSession,
     ) -> Dict[str, Any]:
         """
         Fetch Google Doc data for doc_summary or doc_preview components.
@@ -1656,13 +1776,10 @@ Generate the requested content now:"""
         If content_request prop is specified, uses AI to generate custom content.
         """
         import re
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.docs.client import GoogleDocsClient
         
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
         
         if not credentials:
             return {"error": "Google Docs not connected"}
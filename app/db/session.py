@@ -1,13 +1,41 @@
 """
-Database session management - SQLAlchemy engine and session factory.
-This module provides the database connection and session dependency for FastAPI.
+Database session management - SQLAlchemy engines and session factories.
+This module provides the database connection and session dependencies for FastAPI.
+
+Two engines share the same DATABASE_URL and pool settings:
+- engine / SessionLocal / get_db: Synchronous sessions for sync (def) routes
+- async_engine / AsyncSessionLocal / get_async_db: Async sessions for
+  async (async def) routes, so queries never block the event loop
 """
 
 from sqlalchemy import create_engine  # Creates the database connection pool
+from sqlalchemy.ext.asyncio import (  # Async engine + session factory (psycopg3 async)
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker  # Factory for creating database sessions
 
 from app.core.config import settings  # App configuration with DATABASE_URL
 
+
+def _pool_kwargs() -> dict:
+    """
+    Pool sizing options from settings.
+
+    SQLite (used by tests and local experiments) doesn't use a QueuePool,
+    so sizing options are skipped for it.
+    """
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+    }
+
+
 # ---------------------------------------------------------------------------
 # DATABASE ENGINE
 # ---------------------------------------------------------------------------
@@ -19,9 +47,25 @@ from app.core.config import settings  # App configuration with DATABASE_URL
 #   simple query ("SELECT 1") to check if the connection is still alive.
 #   This prevents errors from stale connections (e.g., after DB restart).
 #   Small performance cost, but much better reliability.
+# 
+# - Pool sizing (DB_POOL_SIZE, DB_MAX_OVERFLOW, ...) comes from settings
+#   so pools can be sized per gunicorn worker.
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,
+    **_pool_kwargs(),
+)
+
+# ---------------------------------------------------------------------------
+# ASYNC DATABASE ENGINE
+# ---------------------------------------------------------------------------
+# create_async_engine: Same URL, but psycopg3 is driven in async mode.
+# Connections are only opened on first use, so importing this module
+# never touches the database.
+async_engine = create_async_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=True,
+    **_pool_kwargs(),
 )
 
 # ---------------------------------------------------------------------------
@@ -40,6 +84,16 @@ engine = create_engine(
 # SessionLocal is a class (factory), not an instance. Call SessionLocal() to get a session.
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async_sessionmaker: Async counterpart of SessionLocal
+# - expire_on_commit=False: Attributes stay loaded after commit, because
+#   lazy-loading an expired attribute would need an implicit (sync) refresh
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
 
 def get_db():
     """
@@ -77,3 +131,26 @@ def get_db():
         # Always close the session when done
         # This returns the connection to the pool
         db.close()
+
+
+async def get_async_db():
+    """
+    FastAPI dependency that provides an async database session.
+
+    Use this in async (async def) routes so queries are awaited instead of
+    blocking the event loop.
+
+    Usage in a route:
+        @app.get("/items")
+        async def get_items(db: AsyncSession = Depends(get_async_db)):
+            result = await db.execute(select(Item))
+            return result.scalars().all()
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_engines() -> None:
+    """Close all pooled connections (called on application shutdown)."""
+    await async_engine.dispose()
+    engine.dispose()
@@ -35,6 +35,7 @@ from urllib.parse import urlencode
 import httpx
 
 from app.core.config import settings
+from app.environments.http_client import shared_http_client
 from app.environments.base import (
     EnvironmentProvider,
     OAuthTokens,
@@ -94,6 +95,7 @@ class GoogleAuthClient(EnvironmentProvider):
         client_id: Optional[str] = None,
         client_secret: Optional[str] = None,
         redirect_uri: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the Google OAuth client.
@@ -102,10 +104,13 @@ class GoogleAuthClient(EnvironmentProvider):
             client_id: Google OAuth Client ID (defaults to settings)
             client_secret: Google OAuth Client Secret (defaults to settings)
             redirect_uri: OAuth callback URL (defaults to settings)
+            http_client: Optional client to use instead of the shared pool
         """
         self.client_id = client_id or settings.GOOGLE_CLIENT_ID
         self.client_secret = client_secret or settings.GOOGLE_CLIENT_SECRET
         self.redirect_uri = redirect_uri or settings.GOOGLE_REDIRECT_URI
+        # None = use the application-wide pooled client (app.environments.http_client)
+        self._http_client: Optional[httpx.AsyncClient] = http_client
         
         # Validate configuration
         if not self.client_id or not self.client_secret:
@@ -213,7 +218,7 @@ class GoogleAuthClient(EnvironmentProvider):
         
         logger.info("Exchanging authorization code for tokens")
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.post(
                     self.TOKEN_URL,
@@ -283,7 +288,7 @@ class GoogleAuthClient(EnvironmentProvider):
         
         logger.info("Refreshing access token")
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.post(
                     self.TOKEN_URL,
@@ -338,7 +343,7 @@ class GoogleAuthClient(EnvironmentProvider):
         """
         logger.info("Fetching user info from Google")
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.get(
                     self.USERINFO_URL,
@@ -395,7 +400,7 @@ class GoogleAuthClient(EnvironmentProvider):
         """
         logger.info("Revoking Google token")
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.post(
                     self.REVOKE_URL,
@@ -0,0 +1,508 @@
+"""
+Calendar Caches - Per-user event window and calendar metadata.
+
+Nearly every calendar intent re-downloaded up to a year of events from
+Google. A "what's next / show it on the TV / how many today" burst paid
+for three identical full fetches. This cache keeps one event window per
+(user, calendar) and answers range queries locally.
+
+How it works:
+=============
+1. First query for a user → full sync of a default window
+   [start of yesterday UTC, now + CALENDAR_CACHE_DAYS_AHEAD days]
+   (paginated, singleEvents=true) and the returned nextSyncToken is stored.
+2. Queries inside the window within CALENDAR_CACHE_TTL_SECONDS are served
+   from memory (no network).
+3. After the TTL (or after invalidate()), the window is refreshed with
+   Google's incremental sync (syncToken): only changed/cancelled events
+   are downloaded. A 410 Gone (token expired) falls back to a full sync.
+4. create_event / update_event / delete_event mark the window stale.
+
+Queries the window can't answer exactly (range outside the window,
+non-default ordering) return None so the client falls back to a direct
+API request.
+
+Calendar Metadata:
+==================
+Timezone (get_user_timezone) and the calendar list (list_calendars) were
+fetched before almost every date-ranged query but practically never
+change. CalendarMetadataCache keeps them per user for
+CALENDAR_METADATA_TTL_SECONDS (hours). Failed lookups are never cached.
+
+Credential version:
+===================
+Event windows and metadata entries remember the access token they were
+fetched with; a client holding another token is answered with a full
+sync / a fresh lookup. Re-consent (possibly to a different Google
+account) always yields a new token, so no worker serves one account's
+data to another, even though drop_user_calendar_cache(user_id), called
+on re-consent or disconnect, only clears the worker it runs in. Other
+workers switch once GoogleTokenManager re-reads the credential row
+(GOOGLE_TOKEN_CACHE_TTL_SECONDS). The hourly token refresh costs one full
+sync per user and worker.
+
+Writes made through another worker (invalidate() is per worker too) are
+picked up by the next incremental sync, at most CALENDAR_CACHE_TTL_SECONDS
+later.
+
+Usage:
+======
+    # Used by GoogleCalendarClient when it is built with a user_id
+    client = GoogleCalendarClient(access_token=token, user_id=user.id)
+    events = await client.list_upcoming_events(max_results=10)  # cached
+    tz = await client.get_user_timezone()                        # cached
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from app.core.config import settings
+from app.environments.base import APIError
+from app.environments.google.calendar.schemas import (
+    CalendarEvent,
+    CalendarEventsResponse,
+    CalendarInfo,
+)
+
+if TYPE_CHECKING:
+    from app.environments.google.calendar.client import GoogleCalendarClient
+
+
+logger = logging.getLogger("jarvis.environments.google.calendar.cache")
+
+# Google's maximum page size for events.list
+_PAGE_SIZE = 2500
+
+CacheKey = Tuple[str, str]  # (user_id, calendar_id)
+
+
+@dataclass
+class CalendarWindow:
+    """Cached events for one (user, calendar) over [time_min, time_max)."""
+    time_min: datetime
+    time_max: datetime
+    events: Dict[str, CalendarEvent] = field(default_factory=dict)
+    time_zone: Optional[str] = None
+    sync_token: Optional[str] = None
+    synced_at: float = 0.0
+    stale: bool = False
+    access_token: Optional[str] = field(default=None, repr=False)
+
+    def covers(self, time_min: datetime, time_max: Optional[datetime]) -> bool:
+        """Check whether a query range lies inside this window."""
+        if time_min < self.time_min:
+            return False
+        return time_max is None or time_max <= self.time_max
+
+    def is_fresh(self, ttl_seconds: float) -> bool:
+        return not self.stale and (time.monotonic() - self.synced_at) < ttl_seconds
+
+
+@dataclass
+class CalendarCacheStats:
+    """Hit/miss counters for monitoring."""
+    hits: int = 0
+    misses: int = 0
+    bypasses: int = 0
+    full_syncs: int = 0
+    incremental_syncs: int = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "full_syncs": self.full_syncs,
+            "incremental_syncs": self.incremental_syncs,
+        }
+
+
+class CalendarEventCache:
+    """
+    In-memory, per-user calendar event cache (LRU over users).
+
+    Concurrent queries for the same (user, calendar) share one sync via a
+    per-key lock, so a burst of identical requests costs one fetch.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        days_ahead: Optional[int] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.CALENDAR_CACHE_TTL_SECONDS
+        self.days_ahead = days_ahead or settings.CALENDAR_CACHE_DAYS_AHEAD
+        self.max_entries = max_entries or settings.CALENDAR_CACHE_MAX_ENTRIES
+        self._windows: "OrderedDict[CacheKey, CalendarWindow]" = OrderedDict()
+        self._locks: Dict[CacheKey, asyncio.Lock] = {}
+        self.stats = CalendarCacheStats()
+
+    # -------------------------------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------------------------------
+
+    async def list_events(
+        self,
+        client: "GoogleCalendarClient",
+        calendar_id: str,
+        time_min: datetime,
+        time_max: Optional[datetime],
+        max_results: int,
+    ) -> Optional[List[CalendarEvent]]:
+        """
+        Answer an events.list range query from the cache.
+
+        Args:
+            client: Calendar client (provides user_id and the HTTP requests)
+            calendar_id: Calendar identifier
+            time_min: Lower bound (exclusive) for event end time
+            time_max: Upper bound (exclusive) for event start time (None = open)
+            max_results: Maximum events to return
+
+        Returns:
+            Events sorted by start time, or None if the query can't be
+            answered exactly from the cache (caller should fetch directly)
+        """
+        time_min = _as_aware(time_min)
+        time_max = _as_aware(time_max) if time_max else None
+
+        default_min, default_max = self._default_window()
+        if time_min < default_min or (time_max is not None and time_max > default_max):
+            self.stats.bypasses += 1
+            return None
+
+        key = (str(client.user_id), calendar_id)
+        async with self._lock(key):
+            window = self._windows.get(key)
+
+            if (
+                window is None
+                or not window.covers(time_min, time_max)
+                # Another token: refreshed, or re-consented (maybe to
+                # another account) through any worker
+                or window.access_token != client.access_token
+            ):
+                self.stats.misses += 1
+                window = await self._full_sync(client, calendar_id, default_min, default_max)
+                self._store(key, window)
+            elif not window.is_fresh(self.ttl_seconds):
+                self.stats.misses += 1
+                window = await self._refresh(client, calendar_id, window)
+                self._store(key, window)
+            else:
+                self.stats.hits += 1
+                self._windows.move_to_end(key)
+
+        events = self._query(window, time_min, time_max)
+
+        # Open-ended query: events beyond the window could be among the
+        # first max_results only if the window has fewer than that
+        if time_max is None and len(events) < max_results:
+            self.stats.bypasses += 1
+            return None
+
+        return [event.model_copy() for event in events[:max_results]]
+
+    def invalidate(self, user_id, calendar_id: Optional[str] = None) -> None:
+        """
+        Mark a user's window(s) stale after a write.
+
+        The next read does a cheap incremental sync instead of a full fetch.
+        Only this worker's windows: others see the write when their TTL
+        runs out.
+        """
+        for (uid, cid), window in self._windows.items():
+            if uid == str(user_id) and (calendar_id is None or cid == calendar_id):
+                window.stale = True
+
+    def drop(self, user_id) -> None:
+        """Forget everything cached for a user (e.g. account re-consent)."""
+        for key in [k for k in self._windows if k[0] == str(user_id)]:
+            del self._windows[key]
+            self._locks.pop(key, None)
+
+    def clear(self) -> None:
+        self._windows.clear()
+        self._locks.clear()
+        self.stats = CalendarCacheStats()
+
+    # -------------------------------------------------------------------------
+    # SYNC
+    # -------------------------------------------------------------------------
+
+    async def _full_sync(
+        self,
+        client: "GoogleCalendarClient",
+        calendar_id: str,
+        time_min: datetime,
+        time_max: datetime,
+    ) -> CalendarWindow:
+        """Download every event in the window and keep the sync token."""
+        self.stats.full_syncs += 1
+        window = CalendarWindow(
+            time_min=time_min, time_max=time_max, access_token=client.access_token
+        )
+        params = {
+            "timeMin": time_min.isoformat(),
+            "timeMax": time_max.isoformat(),
+            "singleEvents": "true",
+            "maxResults": _PAGE_SIZE,
+        }
+        await self._fetch_pages(client, calendar_id, params, window)
+        logger.info(
+            f"Calendar cache full sync: user={client.user_id} calendar={calendar_id} "
+            f"events={len(window.events)}"
+        )
+        return window
+
+    async def _refresh(
+        self,
+        client: "GoogleCalendarClient",
+        calendar_id: str,
+        window: CalendarWindow,
+    ) -> CalendarWindow:
+        """Apply changes since the last sync; full sync if that's not possible."""
+        if not window.sync_token:
+            return await self._full_sync(client, calendar_id, window.time_min, window.time_max)
+
+        params = {
+            "syncToken": window.sync_token,
+            "singleEvents": "true",
+            "maxResults": _PAGE_SIZE,
+        }
+        try:
+            changed = await self._fetch_pages(client, calendar_id, params, window)
+        except APIError as e:
+            if e.status_code == 410:
+                logger.info("Calendar sync token expired (410) - full resync")
+                return await self._full_sync(
+                    client, calendar_id, window.time_min, window.time_max
+                )
+            raise
+
+        self.stats.incremental_syncs += 1
+        logger.info(
+            f"Calendar cache incremental sync: user={client.user_id} "
+            f"calendar={calendar_id} changed={changed}"
+        )
+        return window
+
+    async def _fetch_pages(
+        self,
+        client: "GoogleCalendarClient",
+        calendar_id: str,
+        params: dict,
+        window: CalendarWindow,
+    ) -> int:
+        """
+        Page through events.list and merge results into the window.
+
+        Returns:
+            Number of events added, updated or removed
+        """
+        changed = 0
+        page_token = None
+        while True:
+            page_params = dict(params)
+            if page_token:
+                page_params["pageToken"] = page_token
+
+            data = await client._make_request(
+                method="GET",
+                endpoint=f"/calendars/{calendar_id}/events",
+                params=page_params,
+            )
+            page = CalendarEventsResponse(**data)
+            window.time_zone = page.time_zone or window.time_zone
+
+            for event in page.items:
+                changed += 1
+                if event.status == "cancelled":
+                    window.events.pop(event.id, None)
+                else:
+                    window.events[event.id] = event
+
+            page_token = page.next_page_token
+            if not page_token:
+                window.sync_token = page.next_sync_token
+                break
+
+        window.synced_at = time.monotonic()
+        window.stale = False
+        return changed
+
+    # -------------------------------------------------------------------------
+    # QUERY HELPERS
+    # -------------------------------------------------------------------------
+
+    def _query(
+        self,
+        window: CalendarWindow,
+        time_min: datetime,
+        time_max: Optional[datetime],
+    ) -> List[CalendarEvent]:
+        """Events overlapping [time_min, time_max), sorted like orderBy=startTime."""
+        tz = _zone(window.time_zone)
+        # Incremental syncs may return events past the window; never answer
+        # beyond what a full sync of the window would have fetched
+        time_max = min(time_max, window.time_max) if time_max else window.time_max
+        matches = []
+        for event in window.events.values():
+            start = _event_bound(event.start, tz)
+            end = _event_bound(event.end, tz) or start
+            if start is None:
+                continue
+            # Google semantics: timeMin bounds end time, timeMax bounds start time
+            if end <= time_min:
+                continue
+            if start >= time_max:
+                continue
+            matches.append((start, event))
+
+        matches.sort(key=lambda item: item[0])
+        return [event for _, event in matches]
+
+    def _default_window(self) -> Tuple[datetime, datetime]:
+        """Window fetched on a miss: start of yesterday (UTC) to now + days_ahead."""
+        now = datetime.now(timezone.utc)
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+        return start, now + timedelta(days=self.days_ahead)
+
+    def _store(self, key: CacheKey, window: CalendarWindow) -> None:
+        self._windows[key] = window
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.max_entries:
+            evicted, _ = self._windows.popitem(last=False)
+            self._locks.pop(evicted, None)
+
+    def _lock(self, key: CacheKey) -> asyncio.Lock:
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        return lock
+
+
+def _as_aware(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC (matches how the client formats them)."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _zone(name: Optional[str]):
+    try:
+        return ZoneInfo(name) if name else timezone.utc
+    except Exception:
+        return timezone.utc
+
+
+def _event_bound(event_time, tz) -> Optional[datetime]:
+    """Start/end as an aware datetime; all-day dates are midnight in the calendar's zone."""
+    if event_time is None:
+        return None
+    if event_time.date_time:
+        return _as_aware(event_time.date_time)
+    if event_time.date:
+        return datetime.strptime(event_time.date, "%Y-%m-%d").replace(tzinfo=tz)
+    return None
+
+
+class CalendarMetadataCache:
+    """
+    Per-user TTL cache for calendar timezones and calendar lists.
+
+    Entries are keyed by (user_id, kind, detail) so a user's data can be
+    dropped at once on re-consent, and only served to a client holding
+    the access token they were fetched with.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else settings.CALENDAR_METADATA_TTL_SECONDS
+        self.max_entries = max_entries or settings.CALENDAR_CACHE_MAX_ENTRIES
+        # key -> (stored_at, access_token, value)
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Optional[str], Any]]" = OrderedDict()
+        self.stats = CalendarCacheStats()
+
+    def get_timezone(
+        self, user_id, calendar_id: str = "primary", access_token: Optional[str] = None
+    ) -> Optional[str]:
+        return self._get((str(user_id), "timezone", calendar_id), access_token)
+
+    def set_timezone(
+        self, user_id, calendar_id: str, time_zone: str, access_token: Optional[str] = None
+    ) -> None:
+        self._set((str(user_id), "timezone", calendar_id), time_zone, access_token)
+
+    def get_calendars(
+        self, user_id, variant: str, access_token: Optional[str] = None
+    ) -> Optional[List[CalendarInfo]]:
+        """Cached calendar list for a (max_results, show_hidden) variant."""
+        calendars = self._get((str(user_id), "calendars", variant), access_token)
+        if calendars is None:
+            return None
+        return [calendar.model_copy() for calendar in calendars]
+
+    def set_calendars(
+        self,
+        user_id,
+        variant: str,
+        calendars: List[CalendarInfo],
+        access_token: Optional[str] = None,
+    ) -> None:
+        self._set((str(user_id), "calendars", variant), list(calendars), access_token)
+
+    def drop(self, user_id) -> None:
+        """Forget everything cached for a user."""
+        for key in [k for k in self._entries if k[0] == str(user_id)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.stats = CalendarCacheStats()
+
+    def _get(self, key: Tuple[str, str, str], access_token: Optional[str]) -> Any:
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or time.monotonic() - entry[0] >= self.ttl_seconds
+            or entry[1] != access_token
+        ):
+            self._entries.pop(key, None)
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        self._entries.move_to_end(key)
+        return entry[2]
+
+    def _set(self, key: Tuple[str, str, str], value: Any, access_token: Optional[str]) -> None:
+        self._entries[key] = (time.monotonic(), access_token, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+# Singleton instances shared by all calendar clients
+calendar_event_cache = CalendarEventCache()
+calendar_metadata_cache = CalendarMetadataCache()
+
+
+def drop_user_calendar_cache(user_id) -> None:
+    """
+    Forget all cached calendar data for a user.
+
+    Called when the user re-consents or disconnects Google, since the
+    tokens may now belong to a different account. Clears this worker
+    only; other workers stop using the data once they hold the new token
+    (see "Credential version" above).
+    """
+    calendar_event_cache.drop(user_id)
+    calendar_metadata_cache.drop(user_id)
@@ -34,7 +34,13 @@ from typing import List, Optional
 
 import httpx
 
+from app.core.config import settings
 from app.environments.base import EnvironmentService, APIError
+from app.environments.google.calendar.cache import (
+    calendar_event_cache,
+    calendar_metadata_cache,
+)
+from app.environments.http_client import shared_http_client
 from app.environments.google.calendar.schemas import (
     CalendarEvent,
     CalendarInfo,
@@ -71,20 +77,39 @@ class GoogleCalendarClient(EnvironmentService):
     # Google Calendar API base URL
     BASE_URL = "https://www.googleapis.com/calendar/v3"
     
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        http_client: Optional[httpx.AsyncClient] = None,
+        user_id=None,
+    ):
         """
         Initialize the Calendar client.
         
         Args:
             access_token: Valid Google OAuth access token with calendar scope
+            http_client: Optional client to use instead of the shared pool
+            user_id: Owner of the token; enables the per-user event cache
+                     (app.environments.google.calendar.cache)
         """
         self.access_token = access_token
-        self._http_client: Optional[httpx.AsyncClient] = None
+        self.user_id = user_id
+        # None = use the application-wide pooled client (app.environments.http_client)
+        self._http_client: Optional[httpx.AsyncClient] = http_client
     
     # -------------------------------------------------------------------------
     # HTTP CLIENT MANAGEMENT
     # -------------------------------------------------------------------------
     
+    def _cache_enabled(self) -> bool:
+        """Event caching needs to know whose calendar this is."""
+        return self.user_id is not None and settings.CALENDAR_CACHE_ENABLED
+    
+    def _invalidate_cache(self, calendar_id: str) -> None:
+        """Mark cached events stale after a write."""
+        if self.user_id is not None:
+            calendar_event_cache.invalidate(self.user_id, calendar_id)
+    
     def _get_headers(self) -> dict:
         """Get authorization headers for API requests."""
         return {
@@ -114,7 +139,7 @@ class GoogleCalendarClient(EnvironmentService):
         """
         url = f"{self.BASE_URL}{endpoint}"
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.request(
                     method=method,
@@ -196,6 +221,19 @@ class GoogleCalendarClient(EnvironmentService):
         if time_min is None:
             time_min = datetime.now(timezone.utc)
         
+        # Serve from the per-user event cache when possible
+        if self._cache_enabled() and single_events and order_by == "startTime":
+            cached = await calendar_event_cache.list_events(
+                client=self,
+                calendar_id=calendar_id,
+                time_min=time_min,
+                time_max=time_max,
+                max_results=max_results,
+            )
+            if cached is not None:
+                logger.info(f"Served {len(cached)} calendar events from cache")
+                return cached
+        
         # Format times in RFC3339 format
         params = {
             "maxResults": min(max_results, 2500),
@@ -849,6 +887,14 @@ class GoogleCalendarClient(EnvironmentService):
         Returns:
             List of CalendarInfo objects
         """
+        variant = f"{max_results}:{show_hidden}"
+        if self._cache_enabled():
+            cached = calendar_metadata_cache.get_calendars(
+                self.user_id, variant, access_token=self.access_token
+            )
+            if cached is not None:
+                return cached
+        
         params = {
             "maxResults": min(max_results, 250),
             "showHidden": str(show_hidden).lower(),
@@ -867,6 +913,11 @@ class GoogleCalendarClient(EnvironmentService):
         
         logger.info(f"Found {len(calendar_list.items)} calendars")
         
+        if self._cache_enabled():
+            calendar_metadata_cache.set_calendars(
+                self.user_id, variant, calendar_list.items, access_token=self.access_token
+            )
+        
         return calendar_list.items
     
     async def get_primary_calendar(self) -> Optional[CalendarInfo]:
@@ -932,6 +983,13 @@ class GoogleCalendarClient(EnvironmentService):
             tz = await client.get_user_timezone()
             # Returns: "America/Los_Angeles"
         """
+        if self._cache_enabled():
+            cached = calendar_metadata_cache.get_timezone(
+                self.user_id, calendar_id, access_token=self.access_token
+            )
+            if cached:
+                return cached
+        
         try:
             response_data = await self._make_request(
                 method="GET",
@@ -940,6 +998,10 @@ class GoogleCalendarClient(EnvironmentService):
             
             timezone_str = response_data.get("timeZone", "UTC")
             logger.info(f"User timezone: {timezone_str}")
+            if self._cache_enabled() and response_data.get("timeZone"):
+                calendar_metadata_cache.set_timezone(
+                    self.user_id, calendar_id, timezone_str, access_token=self.access_token
+                )
             return timezone_str
             
         except APIError as e:
@@ -1037,6 +1099,7 @@ class GoogleCalendarClient(EnvironmentService):
         created_event = self._parse_create_response(response_data, request)
         
         logger.info(f"Created event: {created_event.event_id}")
+        self._invalidate_cache(calendar_id)
         
         return created_event
     
@@ -1109,7 +1172,7 @@ class GoogleCalendarClient(EnvironmentService):
         """
         url = f"{self.BASE_URL}{endpoint}"
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.post(
                     url=url,
@@ -1327,6 +1390,7 @@ class GoogleCalendarClient(EnvironmentService):
         updated_event = CalendarEvent(**response_data)
         
         logger.info(f"Updated event: {event_id}")
+        self._invalidate_cache(calendar_id)
         
         return updated_event
     
@@ -1368,6 +1432,7 @@ class GoogleCalendarClient(EnvironmentService):
         )
         
         logger.info(f"Deleted event: {event_id}")
+        self._invalidate_cache(calendar_id)
         
         return True
     
@@ -1454,7 +1519,7 @@ class GoogleCalendarClient(EnvironmentService):
         """
         url = f"{self.BASE_URL}{endpoint}"
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.patch(
                     url=url,
@@ -1517,7 +1582,7 @@ class GoogleCalendarClient(EnvironmentService):
         """
         url = f"{self.BASE_URL}{endpoint}"
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.delete(
                     url=url,
@@ -315,6 +315,8 @@ class CalendarEventsResponse(BaseModel):
     time_zone: Optional[str] = Field(None, alias="timeZone")
     items: List[CalendarEvent] = Field(default_factory=list)
     next_page_token: Optional[str] = Field(None, alias="nextPageToken")
+    # Only present on the last page; used for incremental sync (syncToken)
+    next_sync_token: Optional[str] = Field(None, alias="nextSyncToken")
     
     class Config:
         populate_by_name = True
@@ -36,6 +36,7 @@ from typing import Optional
 import httpx
 
 from app.environments.base import EnvironmentService, APIError
+from app.environments.http_client import shared_http_client
 from app.environments.google.docs.schemas import (
     GoogleDoc,
     DocContent,
@@ -89,15 +90,21 @@ class GoogleDocsClient(EnvironmentService):
         r"(?:https?://)?docs\.google\.com/open\?id=([a-zA-Z0-9_-]+)"
     )
     
-    def __init__(self, access_token: str):
+    def __init__(
+        self,
+        access_token: str,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         """
         Initialize the Docs client.
         
         Args:
             access_token: Valid Google OAuth access token with docs scope
+            http_client: Optional client to use instead of the shared pool
         """
         self.access_token = access_token
-        self._http_client: Optional[httpx.AsyncClient] = None
+        # None = use the application-wide pooled client (app.environments.http_client)
+        self._http_client: Optional[httpx.AsyncClient] = http_client
     
     # -------------------------------------------------------------------------
     # HTTP CLIENT MANAGEMENT
@@ -132,7 +139,7 @@ class GoogleDocsClient(EnvironmentService):
         """
         url = f"{self.BASE_URL}{endpoint}"
         
-        async with httpx.AsyncClient() as client:
+        async with shared_http_client(self._http_client) as client:
             try:
                 response = await client.request(
                     method=method,
@@ -338,7 +345,7 @@ class GoogleDocsClient(EnvironmentService):
             # Try to get a document with an invalid ID
             # 404 means token is valid but doc doesn't exist (expected)
             # 401/403 means token is invalid
-            async with httpx.AsyncClient() as client:
+            async with shared_http_client(self._http_client) as client:
                 response = await client.get(
                     f"{self.BASE_URL}/documents/invalid-doc-id-for-validation",
                     headers=self._get_headers(),
@@ -0,0 +1,193 @@
+"""
+Shared HTTP Client - Application-lifetime connection pool for environment APIs.
+
+Every Google API call used to open a brand-new httpx.AsyncClient, paying
+DNS + TCP + TLS for each request. This module owns ONE pooled client
+(keep-alive, HTTP/2 when available) that all environment services share.
+
+Lifecycle:
+==========
+- start_http_client(): Called on app startup (creates the pool)
+- close_http_client(): Called on app shutdown (closes pooled connections)
+- get_http_client(): Returns the pool, creating it lazily if startup
+  hasn't run (scripts, tests)
+
+Usage:
+======
+    from app.environments.http_client import shared_http_client
+
+    async with shared_http_client() as client:
+        response = await client.get(url, headers=headers)
+
+`shared_http_client()` keeps the `async with httpx.AsyncClient() as client:`
+shape of the call sites but does NOT close the pool on exit.
+
+Connection Reuse Stats:
+=======================
+Each request is traced (httpcore trace events) so we can see how many
+requests actually opened a new TCP/TLS connection:
+
+    from app.environments.http_client import http_pool_stats
+    http_pool_stats.as_dict()
+    # {"requests": 120, "tcp_connects": 3, "tls_handshakes": 3, "reuse_ratio": 0.975}
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+
+import httpx
+
+from app.core.config import settings
+
+
+logger = logging.getLogger("jarvis.environments.http")
+
+
+# ---------------------------------------------------------------------------
+# CONNECTION REUSE STATS
+# ---------------------------------------------------------------------------
+
+@dataclass
+class HTTPPoolStats:
+    """
+    Counters for connection reuse in the shared pool.
+
+    A request that reuses a pooled connection produces no connect/TLS
+    trace events, so `tls_handshakes` staying flat while `requests`
+    grows means keep-alive is working.
+    """
+    requests: int = 0
+    tcp_connects: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def reused_requests(self) -> int:
+        """Requests served on an already-open connection."""
+        return max(self.requests - self.tcp_connects, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Fraction of requests that reused a connection (0.0 - 1.0)."""
+        if self.requests == 0:
+            return 0.0
+        return self.reused_requests / self.requests
+
+    def reset(self) -> None:
+        self.requests = 0
+        self.tcp_connects = 0
+        self.tls_handshakes = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "tcp_connects": self.tcp_connects,
+            "tls_handshakes": self.tls_handshakes,
+            "reuse_ratio": round(self.reuse_ratio, 3),
+        }
+
+
+http_pool_stats = HTTPPoolStats()
+
+
+async def _trace(event_name: str, info: dict) -> None:
+    """httpcore trace callback: count new connections and TLS handshakes."""
+    if event_name == "connection.connect_tcp.complete":
+        http_pool_stats.tcp_connects += 1
+    elif event_name == "connection.start_tls.complete":
+        http_pool_stats.tls_handshakes += 1
+
+
+async def _on_request(request: httpx.Request) -> None:
+    """Request hook: count the request and attach the trace callback."""
+    http_pool_stats.requests += 1
+    request.extensions["trace"] = _trace
+
+
+# ---------------------------------------------------------------------------
+# POOL MANAGEMENT
+# ---------------------------------------------------------------------------
+
+_client: Optional[httpx.AsyncClient] = None
+
+
+def _http2_available() -> bool:
+    """HTTP/2 needs the optional `h2` package (pip install httpx[http2])."""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """
+    Build a pooled AsyncClient from settings.
+
+    Returns:
+        httpx.AsyncClient with keep-alive limits, HTTP/2 (if available)
+        and connection reuse instrumentation
+    """
+    http2 = settings.GOOGLE_HTTP2_ENABLED and _http2_available()
+    if settings.GOOGLE_HTTP2_ENABLED and not http2:
+        logger.warning("HTTP/2 requested but 'h2' is not installed - using HTTP/1.1")
+
+    logger.info(
+        f"Shared HTTP client created (http2={http2}, "
+        f"max_connections={settings.GOOGLE_HTTP_MAX_CONNECTIONS})"
+    )
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=settings.GOOGLE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GOOGLE_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=settings.GOOGLE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        timeout=settings.GOOGLE_HTTP_TIMEOUT_SECONDS,
+        event_hooks={"request": [_on_request]},
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared pooled client, creating it if needed.
+
+    Returns:
+        The application-wide httpx.AsyncClient
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+    return _client
+
+
+async def start_http_client() -> None:
+    """Create the shared pool (app startup)."""
+    get_http_client()
+
+
+async def close_http_client() -> None:
+    """Close the shared pool and its connections (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        logger.info(f"Shared HTTP client closed: {http_pool_stats.as_dict()}")
+        _client = None
+
+
+@asynccontextmanager
+async def shared_http_client(
+    client: Optional[httpx.AsyncClient] = None,
+) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Borrow a pooled client for a block of requests.
+
+    Args:
+        client: Explicit client to use instead of the shared pool
+                (e.g. an injected client in tests)
+
+    Yields:
+        An httpx.AsyncClient that is NOT closed when the block exits
+    """
+    yield client or get_http_client()
@@ -4,10 +4,22 @@ This is where the ASGI application is created and configured.
 Run with: uvicorn app.main:app --reload
 """
 
+from contextlib import asynccontextmanager  # Lifespan (startup/shutdown) hooks
+
 from fastapi import FastAPI  # The FastAPI framework
 from fastapi.middleware.cors import CORSMiddleware  # Cross-Origin Resource Sharing
 
 from app.core.config import settings  # Application settings
+from app.db.session import dispose_engines  # Connection pool cleanup
+from app.environments.http_client import (  # Shared Google API connection pool
+    start_http_client,
+    close_http_client,
+    http_pool_stats,
+)
+from app.ai.scene.custom_layout.html_fixer.sandbox.browser_pool import (  # Sandbox Chromium pool
+    close_browser_pool,
+    browser_pool_stats,
+)
 from app.routers import auth, users, devices, commands  # Route handlers (endpoints)
 from app.routers import websocket as ws_router  # WebSocket router
 from app.routers import intent  # AI Intent processing router (Sprint 3)
@@ -16,6 +28,22 @@ from app.routers import cloud  # Cloud content router (Sprint 3.5)
 from app.routers import simulator  # Display Simulator for development (Sprint 3.5)
 from app.routers import feedback  # Human Feedback for layout validation (Sprint 4)
 
+# ---------------------------------------------------------------------------
+# APPLICATION LIFESPAN
+# ---------------------------------------------------------------------------
+# startup: Open the shared HTTP pool used by all Google environment clients
+# shutdown: Close pooled HTTP + database connections (sync + async engines)
+# and the HTML sandbox's Chromium pool, so gunicorn worker restarts don't
+# leave idle connections or orphaned browser processes behind.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_http_client()
+    yield
+    await close_http_client()
+    await close_browser_pool()
+    await dispose_engines()
+
+
 # ---------------------------------------------------------------------------
 # CREATE FASTAPI APPLICATION
 # ---------------------------------------------------------------------------
@@ -30,6 +58,7 @@ app = FastAPI(
     title=settings.APP_NAME,  # "Jarvis Cloud Core"
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------------------------
@@ -106,3 +135,32 @@ def health_check():
         {"status": "ok"}
     """
     return {"status": "ok"}
+
+
+@app.get("/health/http-pool", tags=["health"])
+def http_pool_health():
+    """
+    Connection reuse stats for the shared Google API HTTP pool.
+    
+    With keep-alive working, `tls_handshakes` stays flat while `requests`
+    grows and `reuse_ratio` approaches 1.0.
+    
+    Returns:
+        {"requests": int, "tcp_connects": int, "tls_handshakes": int, "reuse_ratio": float}
+    """
+    return http_pool_stats.as_dict()
+
+
+@app.get("/health/browser-pool", tags=["health"])
+def browser_pool_health():
+    """
+    Reuse stats for the HTML sandbox's Chromium pool.
+    
+    `contexts_per_launch` well above 1 means validations are reusing
+    long-lived browsers instead of launching one each.
+    
+    Returns:
+        {"launches": int, "contexts": int, "recycled": int, "crashes": int, ...}
+        or {"started": false} if no validation has run in this worker yet
+    """
+    return browser_pool_stats() or {"started": False}
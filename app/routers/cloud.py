@@ -32,16 +32,18 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.deps import get_current_user
 from app.models.user import User
 from app.models.oauth_credential import OAuthCredential
-from app.environments.google import GoogleAuthClient, GoogleCalendarClient
+from app.environments.google import GoogleCalendarClient
 from app.environments.google.calendar import CalendarRenderer
-from app.environments.base import TokenExpiredError, APIError
+from app.environments.base import APIError
 from app.services.content_token import content_token_service
+from app.services.google_token_manager import google_token_manager
 
 
 logger = logging.getLogger("jarvis.routers.cloud")
@@ -58,56 +60,19 @@ router = APIRouter(prefix="/cloud", tags=["cloud"])
 # ---------------------------------------------------------------------------
 
 
-async def _get_valid_google_token(
-    user_id: UUID,
-    db: Session,
-) -> Optional[str]:
+async def _get_valid_google_token(user_id: UUID) -> Optional[str]:
     """
     Get a valid Google access token for a user, refreshing if needed.
     
+    Delegates to the shared token manager (cached, single-flight refresh).
+    
     Args:
         user_id: The user's ID
-        db: Database session
     
     Returns:
         Valid access token, or None if not available
     """
-    # Get stored credentials
-    cred = db.query(OAuthCredential).filter(
-        OAuthCredential.user_id == user_id,
-        OAuthCredential.provider == "google",
-    ).first()
-    
-    if not cred:
-        return None
-    
-    # Check if token needs refresh
-    if cred.is_expired():
-        if not cred.refresh_token:
-            logger.warning(f"Token expired and no refresh token for user {user_id}")
-            return None
-        
-        # Refresh the token
-        try:
-            auth_client = GoogleAuthClient()
-            new_tokens = await auth_client.refresh_access_token(cred.refresh_token)
-            
-            # Update stored credentials
-            cred.access_token = new_tokens.access_token
-            cred.expires_at = new_tokens.expires_at
-            if new_tokens.refresh_token:
-                cred.refresh_token = new_tokens.refresh_token
-            
-            db.commit()
-            
-            logger.info(f"Refreshed Google token for user {user_id}")
-            return cred.access_token
-            
-        except TokenExpiredError as e:
-            logger.error(f"Failed to refresh token for user {user_id}: {e}")
-            return None
-    
-    return cred.access_token
+    return await google_token_manager.get_access_token(user_id)
 
 
 # ---------------------------------------------------------------------------
@@ -118,7 +83,7 @@ async def _get_valid_google_token(
 @router.get("/calendar", response_class=HTMLResponse)
 async def get_calendar_html(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     theme: str = Query("dark", description="Color theme: dark or light"),
     max_events: int = Query(10, description="Maximum events to show", ge=1, le=50),
     view: str = Query("upcoming", description="View type: upcoming, today, week, date"),
@@ -141,7 +106,7 @@ async def get_calendar_html(
     
     Args:
         request: FastAPI request
-        db: Database session
+        db: Async database session
         theme: "dark" or "light" color scheme
         max_events: Maximum number of events to display
         view: "upcoming", "today", "week", or "date"
@@ -192,7 +157,7 @@ async def get_calendar_html(
         return HTMLResponse(content=html, status_code=403)
     
     # Get valid access token for this user
-    access_token = await _get_valid_google_token(user_id, db)
+    access_token = await _get_valid_google_token(user_id)
     
     if not access_token:
         # No Google account connected or token invalid
@@ -203,12 +168,12 @@ async def get_calendar_html(
         return HTMLResponse(content=html, status_code=200)
     
     # Get user for display name
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     display_name = user.display_name if user else "User"
     
     # Fetch calendar events
     try:
-        calendar_client = GoogleCalendarClient(access_token=access_token)
+        calendar_client = GoogleCalendarClient(access_token=access_token, user_id=user_id)
         
         # ---------------------------------------------------------------------------
         # SPRINT 3.9: Smart Semantic Search with LLM Matching
@@ -264,14 +229,16 @@ async def get_calendar_html(
                 search_result = await calendar_search_service.smart_search(
                     user_query=search_term,
                     user_id=user_id,
-                    db=db,
+                    db=None,
+                    access_token=access_token,
                 )
             else:
                 # Smart search across all future events
                 search_result = await calendar_search_service.smart_search(
                     user_query=search_term,
                     user_id=user_id,
-                    db=db,
+                    db=None,
+                    access_token=access_token,
                 )
             
             # Handle errors from smart search
@@ -512,7 +479,7 @@ async def get_calendar_preview(
 @router.get("/calendar/status")
 async def get_calendar_status(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Check calendar integration status.
@@ -522,16 +489,19 @@ async def get_calendar_status(
     
     Args:
         current_user: Authenticated user
-        db: Database session
+        db: Async database session
     
     Returns:
         Status information including connection state and event count
     """
     # Check for Google credentials
-    cred = db.query(OAuthCredential).filter(
-        OAuthCredential.user_id == current_user.id,
-        OAuthCredential.provider == "google",
-    ).first()
+    result = await db.execute(
+        select(OAuthCredential).where(
+            OAuthCredential.user_id == current_user.id,
+            OAuthCredential.provider == "google",
+        )
+    )
+    cred = result.scalars().first()
     
     if not cred:
         return {
@@ -542,7 +512,7 @@ async def get_calendar_status(
         }
     
     # Check if token is valid
-    access_token = await _get_valid_google_token(current_user.id, db)
+    access_token = await _get_valid_google_token(current_user.id)
     
     if not access_token:
         return {
@@ -554,7 +524,7 @@ async def get_calendar_status(
     
     # Try to fetch calendar info
     try:
-        calendar_client = GoogleCalendarClient(access_token=access_token)
+        calendar_client = GoogleCalendarClient(access_token=access_token, user_id=current_user.id)
         calendars = await calendar_client.list_calendars(max_results=5)
         events = await calendar_client.list_upcoming_events(max_results=5)
         
@@ -34,14 +34,17 @@ from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request
 from fastapi.responses import RedirectResponse
 from jose import JWTError, jwt
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.deps import get_current_user
 from app.models.user import User
 from app.models.oauth_credential import OAuthCredential
 from app.environments.google import GoogleAuthClient, CALENDAR_SCOPES, DOCS_SCOPES
+from app.environments.google.calendar.cache import drop_user_calendar_cache
+from app.services.google_token_manager import google_token_manager
 
 
 logger = logging.getLogger("jarvis.routers.google_auth")
@@ -80,7 +83,7 @@ def _get_and_remove_state(state: str) -> Optional[dict]:
 async def google_login(
     token: str = Query(..., description="JWT token (required for browser redirects)"),
     redirect_after: Optional[str] = Query(None, description="URL to redirect after auth"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Initiate Google OAuth login flow.
@@ -117,7 +120,8 @@ async def google_login(
     except ValueError:
         raise credentials_exception
 
-    current_user = db.query(User).filter(User.id == uid).first()
+    result = await db.execute(select(User).where(User.id == uid))
+    current_user = result.scalars().first()
     if not current_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -169,7 +173,7 @@ async def google_callback(
     state: Optional[str] = Query(None, description="CSRF state token"),
     error: Optional[str] = Query(None, description="Error from Google"),
     error_description: Optional[str] = Query(None, description="Error details"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Handle Google OAuth callback.
@@ -225,7 +229,8 @@ async def google_callback(
     redirect_after = state_data.get("redirect_after", "/")
     
     # Get the user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    result = await db.execute(select(User).where(User.id == uuid.UUID(user_id)))
+    user = result.scalars().first()
     if not user:
         logger.error(f"User not found for OAuth callback: {user_id}")
         raise HTTPException(
@@ -253,10 +258,11 @@ async def google_callback(
         google_user = None
     
     # Check if user already has Google credentials
-    existing_cred = db.query(OAuthCredential).filter(
+    result = await db.execute(select(OAuthCredential).where(
         OAuthCredential.user_id == user.id,
         OAuthCredential.provider == "google",
-    ).first()
+    ))
+    existing_cred = result.scalars().first()
     
     if existing_cred:
         # Update existing credentials
@@ -285,7 +291,11 @@ async def google_callback(
         logger.info(f"Created Google credentials for user {user.id}")
     
     # Commit to database
-    db.commit()
+    await db.commit()
+    
+    # Re-consent may switch Google accounts: forget cached tokens and calendar data
+    google_token_manager.invalidate(user.id)
+    drop_user_calendar_cache(user.id)
     
     # Redirect to success page or specified URL
     # In production, this would redirect to your frontend
@@ -303,7 +313,7 @@ async def google_callback(
 @router.delete("")
 async def disconnect_google(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Disconnect Google account from Jarvis.
@@ -318,10 +328,11 @@ async def disconnect_google(
         Success message
     """
     # Find existing credentials
-    cred = db.query(OAuthCredential).filter(
+    result = await db.execute(select(OAuthCredential).where(
         OAuthCredential.user_id == current_user.id,
         OAuthCredential.provider == "google",
-    ).first()
+    ))
+    cred = result.scalars().first()
     
     if not cred:
         raise HTTPException(
@@ -339,8 +350,10 @@ async def disconnect_google(
         # Continue anyway - we'll remove our stored credentials
     
     # Delete credentials from database
-    db.delete(cred)
-    db.commit()
+    await db.delete(cred)
+    await db.commit()
+    google_token_manager.invalidate(current_user.id)
+    drop_user_calendar_cache(current_user.id)
     
     logger.info(f"Disconnected Google account for user {current_user.id}")
     
@@ -350,7 +363,7 @@ async def disconnect_google(
 @router.get("/status")
 async def google_connection_status(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Check if user has connected their Google account.
@@ -364,10 +377,11 @@ async def google_connection_status(
     Returns:
         Connection status and granted scopes
     """
-    cred = db.query(OAuthCredential).filter(
+    result = await db.execute(select(OAuthCredential).where(
         OAuthCredential.user_id == current_user.id,
         OAuthCredential.provider == "google",
-    ).first()
+    ))
+    cred = result.scalars().first()
     
     if not cred:
         return {
@@ -40,13 +40,15 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.deps import get_current_user, get_user_from_agent
 from app.models.user import User
 from app.services.intent_service import intent_service, IntentResult
 from app.ai.monitoring import ai_monitor
+from app.ai.intent.fast_path import fast_path_classifier
+from app.ai.response_cache import response_cache_stats
 
 
 # ---------------------------------------------------------------------------
@@ -148,6 +150,9 @@ class AIStatsResponse(BaseModel):
     avg_latency_ms: float
     estimated_total_cost: str
     requests_by_provider: Dict[str, int]
+    speculation: Optional[Dict[str, Any]] = None  # Speculative parse p50/p95 (see ai_monitor)
+    fast_path: Optional[Dict[str, Any]] = None  # Local device-command matches (LLM skipped)
+    response_cache: Optional[Dict[str, Any]] = None  # Routing/intent cache hits (see app/ai/response_cache.py)
 
 
 # ---------------------------------------------------------------------------
@@ -167,7 +172,7 @@ def _result_to_response(result: IntentResult) -> IntentResponse:
 @router.post("", response_model=IntentResponse)
 async def process_intent(
     request: IntentRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -220,7 +225,7 @@ async def process_intent(
 @router.post("/agent", response_model=IntentResponse)
 async def process_intent_agent(
     request: IntentRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: User = Depends(get_user_from_agent),
 ):
     """
@@ -301,4 +306,7 @@ async def get_ai_stats(
         avg_latency_ms=round(stats.avg_latency_ms, 2),
         estimated_total_cost=f"${stats.estimated_total_cost:.4f}",
         requests_by_provider=stats.requests_by_provider,
+        speculation=ai_monitor.get_speculation_stats(),
+        fast_path=fast_path_classifier.stats.as_dict(),
+        response_cache=response_cache_stats(),
     )
@@ -16,9 +16,10 @@ import logging
 from uuid import UUID
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import SessionLocal
+from app.db.session import AsyncSessionLocal
 from app.models.device import Device
 from app.services.websocket_manager import connection_manager
 
@@ -35,21 +36,12 @@ router = APIRouter(prefix="/ws", tags=["websocket"])
 # HELPER FUNCTIONS
 # ---------------------------------------------------------------------------
 
-def get_db():
-    """Create a database session for WebSocket handlers."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-def validate_agent(db: Session, agent_id: str) -> Device:
+async def validate_agent(db: AsyncSession, agent_id: str) -> Device:
     """
     Validate that an agent_id is paired with a device.
     
     Args:
-        db: Database session
+        db: Async database session
         agent_id: The agent identifier from the connection request
     
     Returns:
@@ -58,7 +50,8 @@ def validate_agent(db: Session, agent_id: str) -> Device:
     Raises:
         HTTPException: If agent is not paired with any device
     """
-    device = db.query(Device).filter(Device.agent_id == agent_id).first()
+    result = await db.execute(select(Device).where(Device.agent_id == agent_id))
+    device = result.scalars().first()
     
     if not device:
         raise HTTPException(
@@ -116,12 +109,13 @@ async def websocket_endpoint(
         "timestamp": "ISO-8601"
     }
     """
-    # Create database session
-    db = SessionLocal()
+    # Create async database session (the connection is only checked out
+    # while a transaction is open, not for the lifetime of the socket)
+    db = AsyncSessionLocal()
     
     try:
         # Validate the agent is paired
-        device = validate_agent(db, agent_id)
+        device = await validate_agent(db, agent_id)
         device_id = device.id
         
         logger.info(f"Agent {agent_id} attempting to connect for device {device_id}")
@@ -131,7 +125,7 @@ async def websocket_endpoint(
         
         # Update device status in database
         device.is_online = True
-        db.commit()
+        await db.commit()
         
         # Send welcome message
         await websocket.send_json({
@@ -171,7 +165,7 @@ async def websocket_endpoint(
                     # Status update from agent (capabilities, etc.)
                     if "capabilities" in data:
                         device.capabilities = data["capabilities"]
-                        db.commit()
+                        await db.commit()
                         logger.info(f"Device {device_id}: Updated capabilities")
                 
                 else:
@@ -203,13 +197,13 @@ async def websocket_endpoint(
             
             # Update device status in database
             try:
-                device = db.query(Device).filter(Device.id == device_id).first()
+                device = await db.get(Device, device_id)
                 if device:
                     device.is_online = False
                     from datetime import datetime, timezone
                     device.last_seen = datetime.now(timezone.utc)
-                    db.commit()
+                    await db.commit()
             except Exception:
                 pass  # Best effort
         
-        db.close()
+        await db.close()
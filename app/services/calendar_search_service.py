@@ -38,9 +38,9 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from dataclasses import dataclass
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.oauth_credential import OAuthCredential
+from app.services.google_token_manager import google_token_manager
 from app.environments.google.calendar.client import GoogleCalendarClient
 from app.environments.google.calendar.schemas import CalendarEvent
 from app.environments.base import APIError
@@ -76,10 +76,11 @@ class CalendarSearchService:
         self,
         user_query: str,
         user_id: UUID,
-        db: Session,
+        db: Optional[AsyncSession],
         date_range: Optional[str] = None,
         max_events: int = 100,
         days_ahead: int = 365,
+        access_token: Optional[str] = None,
     ) -> SmartSearchResult:
         """
         Perform semantic search on calendar events using LLM matching.
@@ -89,10 +90,11 @@ class CalendarSearchService:
         Args:
             user_query: The user's search query (may contain typos, translations)
             user_id: The user's UUID
-            db: Database session
+            db: Database session (unused when access_token is given)
             date_range: Optional date filter ("today", "tomorrow", "this_week", None=all)
             max_events: Maximum events to fetch from calendar
             days_ahead: How many days ahead to search (only used if date_range=None)
+            access_token: Already-resolved Google token; skips the credential lookup
         
         Returns:
             SmartSearchResult with matched events
@@ -113,22 +115,21 @@ class CalendarSearchService:
         
         logger.info(f"Smart search for query: '{query}' for user {user_id}, date_range={date_range}")
         
-        # Step 1: Get user's OAuth credentials
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
-        
-        if not credentials or not credentials.access_token:
-            logger.warning(f"No Google credentials for user {user_id}")
-            return SmartSearchResult(
-                events=[],
-                error="Google Calendar not connected. Please connect your Google account.",
-            )
+        # Step 1: Get user's OAuth credentials (unless the caller already has a token)
+        if not access_token:
+            credentials = await google_token_manager.get_token(user_id)
+            
+            if not credentials or not credentials.access_token:
+                logger.warning(f"No Google credentials for user {user_id}")
+                return SmartSearchResult(
+                    events=[],
+                    error="Google Calendar not connected. Please connect your Google account.",
+                )
+            access_token = credentials.access_token
         
         # Step 2: Create calendar client and fetch events
         try:
-            calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+            calendar_client = GoogleCalendarClient(access_token=access_token, user_id=user_id)
             
             # Determine time range based on date_range parameter
             if date_range:
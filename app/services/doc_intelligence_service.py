@@ -33,9 +33,9 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.oauth_credential import OAuthCredential
+from app.services.google_token_manager import google_token_manager
 from app.environments.google.docs import GoogleDocsClient, DocContent
 from app.environments.base import APIError
 from app.ai.providers import gemini_provider
@@ -394,7 +394,7 @@ class DocIntelligenceService:
         self,
         doc_id: str,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
     ) -> Optional[DocContent]:
         """
         Fetch a document for a user using their OAuth credentials.
@@ -411,10 +411,7 @@ class DocIntelligenceService:
             APIError: With user-friendly error message
         """
         # Get user's Google credentials
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
         
         if not credentials or not credentials.access_token:
             logger.warning(f"No Google credentials for user {user_id}")
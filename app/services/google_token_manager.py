@@ -0,0 +1,360 @@
+"""
+Google Token Manager - One place to get a valid Google access token.
+
+Token handling used to be duplicated: the cloud router refreshed expired
+tokens, while the intent handlers, scene service and doc services read
+`credentials.access_token` straight from the DB (one OAuthCredential query
+per handler, no expiry check). Concurrent requests from one user could
+each call GoogleAuthClient.refresh_access_token.
+
+This manager:
+- Keeps each user's token in memory (no DB query on the hot path)
+    * for at most GOOGLE_TOKEN_CACHE_TTL_SECONDS, then the OAuthCredential
+      row is read again: a token refreshed, re-consented or disconnected
+      through another worker is seen within that delay (invalidate()
+      only reaches the worker it runs in)
+    * for at most GOOGLE_TOKEN_CACHE_MAX_USERS users (least recently used
+      ones are dropped)
+- Refreshes before `expires_at`:
+    * inside GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS → callers wait for a refresh
+    * inside twice that margin → the current token is returned and a
+      background refresh is started
+- Coalesces concurrent loads/refreshes for one user into a single
+  in-flight call (single-flight)
+- Persists refreshed tokens back to the OAuthCredential row
+
+Usage:
+======
+    from app.services.google_token_manager import google_token_manager
+
+    token = await google_token_manager.get_token(user_id)
+    if not token:
+        # Google not connected (or refresh token revoked)
+        ...
+    client = GoogleCalendarClient(access_token=token.access_token, user_id=user_id)
+
+    # After OAuth re-consent / disconnect
+    google_token_manager.invalidate(user_id)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.environments.base import TokenExpiredError
+from app.environments.google.auth import GoogleAuthClient
+from app.models.oauth_credential import OAuthCredential
+
+
+logger = logging.getLogger("jarvis.services.google_token_manager")
+
+
+# ---------------------------------------------------------------------------
+# DATA STRUCTURES
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class GoogleToken:
+    """A user's Google credentials as seen by API callers."""
+    access_token: str
+    expires_at: Optional[datetime] = None
+    scopes: List[str] = field(default_factory=list)
+    refresh_token: Optional[str] = field(default=None, repr=False)
+
+    def expires_within(self, seconds: float) -> bool:
+        """True if the token expires in less than `seconds` (or expiry is unknown)."""
+        if self.expires_at is None:
+            return True
+        expires_at = self.expires_at
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) >= expires_at - timedelta(seconds=seconds)
+
+    def has_scope(self, fragment: str) -> bool:
+        """Check whether any granted scope contains `fragment` (e.g. "documents")."""
+        return any(fragment in scope.lower() for scope in self.scopes)
+
+
+@dataclass
+class TokenManagerStats:
+    """Counters for monitoring."""
+    hits: int = 0
+    loads: int = 0
+    refreshes: int = 0
+    coalesced: int = 0
+    failures: int = 0
+    expired: int = 0     # Cached tokens dropped after the TTL (re-read from the DB)
+    evictions: int = 0   # Cached tokens dropped to stay within max_users
+
+    def as_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "loads": self.loads,
+            "refreshes": self.refreshes,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "expired": self.expired,
+            "evictions": self.evictions,
+        }
+
+
+# ---------------------------------------------------------------------------
+# TOKEN MANAGER
+# ---------------------------------------------------------------------------
+
+class GoogleTokenManager:
+    """
+    In-memory, single-flight Google token cache.
+
+    Loading from the DB and refreshing with Google both go through
+    `_single_flight`, so N concurrent callers for one user share one
+    DB query and at most one refresh_access_token call.
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable] = None,
+        auth_client_factory: Callable[[], GoogleAuthClient] = GoogleAuthClient,
+        refresh_margin_seconds: Optional[float] = None,
+        cache_ttl_seconds: Optional[float] = None,
+        max_users: Optional[int] = None,
+    ):
+        self._session_factory = session_factory or AsyncSessionLocal
+        self._auth_client_factory = auth_client_factory
+        self.refresh_margin_seconds = (
+            refresh_margin_seconds
+            if refresh_margin_seconds is not None
+            else settings.GOOGLE_TOKEN_REFRESH_MARGIN_SECONDS
+        )
+        self.cache_ttl_seconds = (
+            cache_ttl_seconds
+            if cache_ttl_seconds is not None
+            else settings.GOOGLE_TOKEN_CACHE_TTL_SECONDS
+        )
+        self.max_users = max(
+            1, max_users if max_users is not None else settings.GOOGLE_TOKEN_CACHE_MAX_USERS
+        )
+        # user key -> (token, monotonic time it was read / refreshed)
+        self._tokens: "OrderedDict[str, Tuple[GoogleToken, float]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.stats = TokenManagerStats()
+
+    # -------------------------------------------------------------------------
+    # PUBLIC API
+    # -------------------------------------------------------------------------
+
+    async def get_token(self, user_id) -> Optional[GoogleToken]:
+        """
+        Get valid Google credentials for a user.
+
+        Args:
+            user_id: The user's ID (UUID or str)
+
+        Returns:
+            GoogleToken with a non-expired access token, or None if the user
+            has no Google connection or the refresh token was rejected
+        """
+        key = str(user_id)
+        token = self._cached(key)
+
+        if token is not None and not token.expires_within(self.refresh_margin_seconds):
+            self.stats.hits += 1
+            if token.expires_within(self.refresh_margin_seconds * 2):
+                # Refresh early in the background; this caller doesn't wait
+                self._start(key, lambda: self._refresh(user_id, token))
+            return token
+
+        return await self._single_flight(key, lambda: self._resolve(user_id))
+
+    async def get_access_token(self, user_id) -> Optional[str]:
+        """Shortcut for callers that only need the bearer token."""
+        token = await self.get_token(user_id)
+        return token.access_token if token else None
+
+    def invalidate(self, user_id) -> None:
+        """
+        Forget a user's cached token (re-consent, disconnect, 401 from Google).
+
+        Only this worker's cache: other workers re-read the row once their
+        copy is older than cache_ttl_seconds.
+        """
+        self._tokens.pop(str(user_id), None)
+
+    def clear(self) -> None:
+        self._tokens.clear()
+        self._inflight.clear()
+        self.stats = TokenManagerStats()
+
+    # -------------------------------------------------------------------------
+    # CACHE
+    # -------------------------------------------------------------------------
+
+    def _cached(self, key: str) -> Optional[GoogleToken]:
+        """Cached token of a user, None if missing or older than the TTL."""
+        entry = self._tokens.get(key)
+        if entry is None:
+            return None
+        token, stored_at = entry
+        if time.monotonic() - stored_at >= self.cache_ttl_seconds:
+            # Another worker may have refreshed or revoked it: re-read the row
+            del self._tokens[key]
+            self.stats.expired += 1
+            return None
+        self._tokens.move_to_end(key)
+        return token
+
+    def _store(self, key: str, token: GoogleToken) -> None:
+        """Cache a token read from the DB or refreshed by this worker."""
+        self._tokens[key] = (token, time.monotonic())
+        self._tokens.move_to_end(key)
+        while len(self._tokens) > self.max_users:
+            self._tokens.popitem(last=False)
+            self.stats.evictions += 1
+
+    # -------------------------------------------------------------------------
+    # SINGLE-FLIGHT
+    # -------------------------------------------------------------------------
+
+    def _start(
+        self,
+        key: str,
+        work: Callable[[], Awaitable[Optional[GoogleToken]]],
+    ) -> asyncio.Task:
+        """Start `work` for a user unless a call is already in flight."""
+        task = self._inflight.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            return task
+
+        task = asyncio.get_running_loop().create_task(work())
+        self._inflight[key] = task
+
+        def _done(finished: asyncio.Task) -> None:
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.error(f"Token task failed for user {key}: {finished.exception()}")
+
+        task.add_done_callback(_done)
+        return task
+
+    async def _single_flight(
+        self,
+        key: str,
+        work: Callable[[], Awaitable[Optional[GoogleToken]]],
+    ) -> Optional[GoogleToken]:
+        # shield: a cancelled caller must not cancel the call others wait on
+        return await asyncio.shield(self._start(key, work))
+
+    # -------------------------------------------------------------------------
+    # LOAD / REFRESH
+    # -------------------------------------------------------------------------
+
+    async def _resolve(self, user_id) -> Optional[GoogleToken]:
+        """Load from the DB if needed, then refresh if the token is (nearly) expired."""
+        key = str(user_id)
+        token = self._cached(key)
+        if token is None:
+            token = await self._load(user_id)
+            if token is None:
+                return None
+
+        if token.expires_within(self.refresh_margin_seconds):
+            return await self._refresh(user_id, token)
+
+        self._store(key, token)
+        return token
+
+    async def _load(self, user_id) -> Optional[GoogleToken]:
+        """Read the user's OAuthCredential row."""
+        self.stats.loads += 1
+        async with self._session_factory() as db:
+            result = await db.execute(
+                select(OAuthCredential).where(
+                    OAuthCredential.user_id == user_id,
+                    OAuthCredential.provider == "google",
+                )
+            )
+            cred = result.scalars().first()
+
+        if not cred or not cred.access_token:
+            return None
+
+        return GoogleToken(
+            access_token=cred.access_token,
+            expires_at=cred.expires_at,
+            scopes=list(cred.scopes or []),
+            refresh_token=cred.refresh_token,
+        )
+
+    async def _refresh(self, user_id, token: GoogleToken) -> Optional[GoogleToken]:
+        """Refresh with Google, persist, and cache the new token."""
+        key = str(user_id)
+        still_valid = not token.expires_within(0)
+
+        if not token.refresh_token:
+            logger.warning(f"Token expiring and no refresh token for user {user_id}")
+            if still_valid:
+                self._store(key, token)
+                return token
+            self._tokens.pop(key, None)
+            return None
+
+        try:
+            new_tokens = await self._auth_client_factory().refresh_access_token(
+                token.refresh_token
+            )
+        except TokenExpiredError as e:
+            self.stats.failures += 1
+            logger.error(f"Failed to refresh token for user {user_id}: {e}")
+            if still_valid:
+                return token
+            self._tokens.pop(key, None)
+            return None
+
+        self.stats.refreshes += 1
+        refreshed = GoogleToken(
+            access_token=new_tokens.access_token,
+            expires_at=new_tokens.expires_at,
+            scopes=list(new_tokens.scopes or token.scopes),
+            refresh_token=new_tokens.refresh_token or token.refresh_token,
+        )
+        self._store(key, refreshed)
+        await self._persist(user_id, refreshed)
+
+        logger.info(f"Refreshed Google token for user {user_id}")
+        return refreshed
+
+    async def _persist(self, user_id, token: GoogleToken) -> None:
+        """Write a refreshed token back to OAuthCredential (best effort)."""
+        try:
+            async with self._session_factory() as db:
+                result = await db.execute(
+                    select(OAuthCredential).where(
+                        OAuthCredential.user_id == user_id,
+                        OAuthCredential.provider == "google",
+                    )
+                )
+                cred = result.scalars().first()
+                if cred is None:
+                    return
+                cred.access_token = token.access_token
+                cred.expires_at = token.expires_at
+                if token.refresh_token:
+                    cred.refresh_token = token.refresh_token
+                await db.commit()
+        except Exception as e:
+            # The in-memory token is still valid; the next refresh retries
+            logger.error(f"Failed to persist refreshed token for user {user_id}: {e}")
+
+
+# Singleton instance for use across the application
+google_token_manager = GoogleTokenManager()
@@ -41,7 +41,7 @@ class HandlerContext:
         user_id: The ID of the user making the request
         request_id: Unique identifier for this request (for logging/tracing)
         devices: List of user's devices (pre-loaded)
-        db: Database session for queries
+        db: Async database session for queries
         start_time: Request start time for latency tracking
         require_feedback: If True, return HTML for human validation
         resolved_references: Anaphoric references resolved from context
@@ -64,7 +64,7 @@ class HandlerContext:
     user_id: UUID
     request_id: str
     devices: List[Any]  # List[Device] - using Any to avoid circular import
-    db: Any  # Session - using Any to avoid circular import
+    db: Any  # AsyncSession - using Any to avoid circular import
     start_time: float
 
     # Behavioral flags
@@ -25,7 +25,7 @@ from app.ai.intent.schemas import (
 )
 
 if TYPE_CHECKING:
-    from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import AsyncSession
     from app.services.pending_event_service import PendingEvent
     from app.environments.google.calendar.schemas import EventCreateResponse
 
@@ -141,8 +141,8 @@ class CalendarHandler(IntentHandler):
         Sprint 4.1: Returns context-aware, multilingual responses.
         Sprint 5.1.4: Supports anaphoric event references ("that meeting", "esa reunion").
         """
-        from app.models.oauth_credential import OAuthCredential
-        from app.db.session import SessionLocal
+        from app.services.google_token_manager import google_token_manager
+        from app.db.session import AsyncSessionLocal
 
         action = self._get_action_value(intent.action) or "count_events"
         date_range = intent.date_range
@@ -161,14 +161,11 @@ class CalendarHandler(IntentHandler):
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Check for credentials first
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == context.user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(context.user_id)
 
             if not credentials or not credentials.access_token:
                 processing_time = (time.time() - context.start_time) * 1000
@@ -262,7 +259,7 @@ class CalendarHandler(IntentHandler):
             )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     # -----------------------------------------------------------------------
     # SMART CALENDAR QUERY HELPERS (Sprint 3.9 + Sprint 4.1 Multilingual)
@@ -273,7 +270,7 @@ class CalendarHandler(IntentHandler):
         template_type: str,
         user_request: str,
         context: HandlerContext,
-        db: "Session",
+        db: "AsyncSession",
         **kwargs
     ) -> str:
         """
@@ -481,7 +478,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         self,
         search_term: Optional[str],
         context: HandlerContext,
-        db: "Session",
+        db: "AsyncSession",
     ) -> str:
         """
         Find a specific event using smart semantic search.
@@ -586,7 +583,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         self,
         search_term: Optional[str],
         context: HandlerContext,
-        db: "Session",
+        db: "AsyncSession",
     ) -> str:
         """
         Find the next event matching a term using smart search.
@@ -671,7 +668,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         date_range: Optional[str],
         search_term: Optional[str],
         context: HandlerContext,
-        db: "Session",
+        db: "AsyncSession",
     ) -> str:
         """
         Count events using smart search for semantic matching.
@@ -680,7 +677,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.calendar_search_service import calendar_search_service
         from app.environments.google.calendar.client import GoogleCalendarClient
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
 
         original_text = context.original_text
 
@@ -724,10 +721,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
 
         # No search term - fetch events and use multilingual generator
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == context.user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(context.user_id)
 
         if not credentials:
             return await self._generate_calendar_response(
@@ -739,7 +733,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             )
 
         # Fetch events using the calendar client with proper date filtering
-        calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+        calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=context.user_id)
         user_timezone = await calendar_client.get_user_timezone("primary")
         time_min, time_max = calendar_client._parse_date_range(date_range, user_timezone)
 
@@ -781,7 +775,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         date_range: Optional[str],
         search_term: Optional[str],
         context: HandlerContext,
-        db: "Session",
+        db: "AsyncSession",
     ) -> str:
         """
         List events using smart search for semantic matching.
@@ -790,7 +784,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.calendar_search_service import calendar_search_service
         from app.environments.google.calendar.client import GoogleCalendarClient
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
 
         original_text = context.original_text
 
@@ -830,10 +824,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             )
 
         # No search term - fetch events and use multilingual generator
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == context.user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(context.user_id)
 
         if not credentials:
             return await self._generate_calendar_response(
@@ -845,7 +836,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             )
 
         # Fetch events using the calendar client with proper date filtering
-        calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+        calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=context.user_id)
         user_timezone = await calendar_client.get_user_timezone("primary")
         time_min, time_max = calendar_client._parse_date_range(date_range, user_timezone)
 
@@ -928,22 +919,19 @@ Ask them politely what event they want to find. Respond in their language.'''
         Returns confirmation prompt for user.
         """
         from app.services.pending_event_service import pending_event_service
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         # Get or create DB session
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Check for Google OAuth credentials
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == context.user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(context.user_id)
 
             if not credentials or not credentials.access_token:
                 processing_time = (time.time() - context.start_time) * 1000
@@ -958,7 +946,7 @@ Ask them politely what event they want to find. Respond in their language.'''
 
             # Get user's timezone from calendar
             try:
-                calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+                calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=context.user_id)
                 user_timezone = await calendar_client.get_user_timezone()
             except Exception as e:
                 logger.warning(f"Could not get user timezone: {e}")
@@ -1022,7 +1010,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     async def _handle_confirm_create(
         self,
@@ -1041,17 +1029,17 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.pending_event_service import pending_event_service
         from app.services.pending_edit_service import pending_edit_service
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
         from app.environments.google.calendar.schemas import EventCreateRequest
         from app.ai.context import _build_pending_state
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         # Get or create DB session
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Get pending state to determine priority (Sprint 3.9.1)
@@ -1173,10 +1161,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
 
             # Get credentials
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == context.user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(context.user_id)
 
             if not credentials or not credentials.access_token:
                 processing_time = (time.time() - context.start_time) * 1000
@@ -1190,7 +1175,7 @@ Ask them politely what event they want to find. Respond in their language.'''
 
             # Build event request
             try:
-                calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+                calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=context.user_id)
 
                 # Build description - include doc link if from doc source (Sprint 3.9)
                 description = None
@@ -1281,7 +1266,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     async def _handle_cancel_create(
         self,
@@ -1470,7 +1455,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.pending_edit_service import pending_edit_service
         from app.services.calendar_search_service import calendar_search_service
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         search_term = intent.search_term
         date_filter = intent.date_filter
@@ -1498,7 +1483,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Use smart semantic search (handles typos, translations, synonyms)
@@ -1582,7 +1567,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     async def _handle_delete_existing_event(
         self,
@@ -1599,7 +1584,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.pending_edit_service import pending_edit_service
         from app.services.calendar_search_service import calendar_search_service
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         search_term = intent.search_term
         date_filter = intent.date_filter
@@ -1627,7 +1612,7 @@ Ask them politely what event they want to find. Respond in their language.'''
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Use smart semantic search (handles typos, translations, synonyms)
@@ -1701,7 +1686,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     async def _handle_select_event(
         self,
@@ -1782,17 +1767,17 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.pending_edit_service import pending_edit_service, PendingOperationType
         from app.services.pending_event_service import pending_event_service
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
         from app.environments.google.calendar.schemas import EventUpdateRequest
         from app.ai.context import _build_pending_state
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         # Get or create DB session
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Get pending state to determine priority (Sprint 3.9.1)
@@ -1844,10 +1829,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
 
             # Get credentials
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == context.user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(context.user_id)
 
             if not credentials or not credentials.access_token:
                 processing_time = (time.time() - context.start_time) * 1000
@@ -1863,6 +1845,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             try:
                 client = GoogleCalendarClient(
                     access_token=credentials.access_token,
+                    user_id=context.user_id,
                 )
 
                 # Get user's timezone to preserve local time intent (Bug Fix: Sprint 3.9.1)
@@ -1940,7 +1923,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     async def _handle_confirm_delete(
         self,
@@ -1955,16 +1938,16 @@ Ask them politely what event they want to find. Respond in their language.'''
         """
         from app.services.pending_edit_service import pending_edit_service, PendingOperationType
         from app.services.pending_event_service import pending_event_service
-        from app.models.oauth_credential import OAuthCredential
+        from app.services.google_token_manager import google_token_manager
         from app.environments.google.calendar.client import GoogleCalendarClient
         from app.ai.context import _build_pending_state
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         # Get or create DB session
         db = context.db
         owns_db = db is None
         if owns_db:
-            db = SessionLocal()
+            db = AsyncSessionLocal()
 
         try:
             # Get pending state to determine priority (Sprint 3.9.1)
@@ -2023,10 +2006,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
 
             # Get credentials
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == context.user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(context.user_id)
 
             if not credentials or not credentials.access_token:
                 processing_time = (time.time() - context.start_time) * 1000
@@ -2042,6 +2022,7 @@ Ask them politely what event they want to find. Respond in their language.'''
             try:
                 client = GoogleCalendarClient(
                     access_token=credentials.access_token,
+                    user_id=context.user_id,
                 )
 
                 event_id = pending.selected_event.event_id
@@ -2081,7 +2062,7 @@ Ask them politely what event they want to find. Respond in their language.'''
                 )
         finally:
             if owns_db:
-                db.close()
+                await db.close()
 
     async def _handle_cancel_edit(
         self,
@@ -128,7 +128,7 @@ class ConversationHandler(IntentHandler):
             build_assistant_prompt,
         )
         from app.ai.context import build_unified_context
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
         from app.services.conversation_context_service import conversation_context_service
 
         request_id = context.request_id
@@ -137,11 +137,8 @@ class ConversationHandler(IntentHandler):
         start_time = context.start_time
 
         # Build context
-        db = SessionLocal()
-        try:
+        async with AsyncSessionLocal() as db:
             unified_context = await build_unified_context(user_id=user_id, db=db)
-        finally:
-            db.close()
 
         # Sprint 4.1: Get conversation history for context
         conversation_history = conversation_context_service.get_conversation_summary(str(user_id))
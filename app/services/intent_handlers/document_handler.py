@@ -21,13 +21,14 @@ from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 from zoneinfo import ZoneInfo
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.intent_handlers.base import IntentHandler, HandlerContext
 from app.services.intent_result import IntentResult, IntentResultType
 from app.ai.intent.schemas import DocQueryIntent, ActionType
 from app.ai.intent.device_mapper import device_mapper
-from app.models.oauth_credential import OAuthCredential
+from app.services.google_token_manager import google_token_manager
 from app.models.device import Device
 from app.environments.google.docs import GoogleDocsClient
 from app.environments.google.calendar.client import GoogleCalendarClient
@@ -391,9 +392,10 @@ class DocumentHandler(IntentHandler):
             return event.get("title"), event.get("id"), event.get("date")
         return None, None, None
 
-    def _get_user_devices(self, db: Session, user_id: UUID) -> List[Device]:
+    async def _get_user_devices(self, db: AsyncSession, user_id: UUID) -> List[Device]:
         """Get all devices for a user."""
-        return db.query(Device).filter(Device.user_id == user_id).all()
+        result = await db.execute(select(Device).where(Device.user_id == user_id))
+        return list(result.scalars().all())
 
     def _store_doc_context(
         self,
@@ -454,7 +456,7 @@ class DocumentHandler(IntentHandler):
         intent: DocQueryIntent,
         user_id: UUID,
         start_time: float,
-        db: Session,
+        db: AsyncSession,
         context: Optional[Dict[str, Any]] = None,
     ) -> IntentResult:
         """
@@ -535,10 +537,7 @@ class DocumentHandler(IntentHandler):
                 )
 
             # Get OAuth credentials (following _handle_confirm_edit pattern)
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(user_id)
 
             if not credentials or not credentials.access_token:
                 processing_time = (time.time() - start_time) * 1000
@@ -551,7 +550,7 @@ class DocumentHandler(IntentHandler):
                 )
 
             # Create calendar client
-            client = GoogleCalendarClient(access_token=credentials.access_token)
+            client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
 
             # Build new description - append doc URL to existing description
             doc_id = meeting_link_service.extract_doc_id_from_url(doc_url)
@@ -613,7 +612,7 @@ class DocumentHandler(IntentHandler):
         intent: DocQueryIntent,
         user_id: UUID,
         start_time: float,
-        db: Session,
+        db: AsyncSession,
         context: Optional[Dict[str, Any]] = None,
     ) -> IntentResult:
         """
@@ -692,7 +691,7 @@ class DocumentHandler(IntentHandler):
             # Sprint 3.9: If device specified, display doc on device
             if device_name:
                 # Get user's devices
-                devices = self._get_user_devices(db, user_id)
+                devices = await self._get_user_devices(db, user_id)
 
                 if devices:
                     # Find the device
@@ -774,7 +773,7 @@ class DocumentHandler(IntentHandler):
 
             if has_display_intent:
                 # User wants to SEE it - try to auto-assign device
-                devices = self._get_user_devices(db, user_id)
+                devices = await self._get_user_devices(db, user_id)
                 display_devices = [d for d in devices if d.is_online]
 
                 if len(display_devices) == 1:
@@ -894,7 +893,7 @@ class DocumentHandler(IntentHandler):
         intent: DocQueryIntent,
         user_id: UUID,
         start_time: float,
-        db: Session,
+        db: AsyncSession,
         context: Optional[Dict[str, Any]] = None,
     ) -> IntentResult:
         """
@@ -941,10 +940,7 @@ class DocumentHandler(IntentHandler):
 
         try:
             # Get OAuth credentials from database
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(user_id)
 
             if not credentials or not credentials.access_token:
                 return IntentResult(
@@ -1042,7 +1038,7 @@ class DocumentHandler(IntentHandler):
         intent: DocQueryIntent,
         user_id: UUID,
         start_time: float,
-        db: Session,
+        db: AsyncSession,
     ) -> IntentResult:
         """
         Summarize a document linked to a meeting.
@@ -1118,10 +1114,7 @@ class DocumentHandler(IntentHandler):
 
         try:
             # Get OAuth credentials from database
-            credentials = db.query(OAuthCredential).filter(
-                OAuthCredential.user_id == user_id,
-                OAuthCredential.provider == "google",
-            ).first()
+            credentials = await google_token_manager.get_token(user_id)
 
             if not credentials or not credentials.access_token:
                 return IntentResult(
@@ -1202,7 +1195,7 @@ class DocumentHandler(IntentHandler):
         intent: DocQueryIntent,
         user_id: UUID,
         start_time: float,
-        db: Session,
+        db: AsyncSession,
     ) -> IntentResult:
         """
         Create a calendar event from document content.
@@ -1245,10 +1238,7 @@ class DocumentHandler(IntentHandler):
         doc_id = GoogleDocsClient.extract_doc_id(doc_url)
 
         # Get credentials
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
 
         if not credentials or not credentials.access_token:
             return IntentResult(
@@ -1298,7 +1288,7 @@ class DocumentHandler(IntentHandler):
         if details.needs_clarification:
             # Get user timezone for pending event
             try:
-                calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+                calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
                 user_tz = await calendar_client.get_user_timezone()
             except Exception:
                 user_tz = "UTC"
@@ -1340,7 +1330,7 @@ class DocumentHandler(IntentHandler):
 
         # Create the calendar event
         try:
-            calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+            calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
 
             # Get user timezone
             user_tz = await calendar_client.get_user_timezone()
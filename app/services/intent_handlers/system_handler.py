@@ -118,16 +118,13 @@ class SystemHandler(IntentHandler):
         """
         from app.ai.providers.gemini import gemini_provider
         from app.ai.context import build_unified_context
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
 
         action = self._get_action_value(intent.action) or "help"
 
         # Build context
-        db = SessionLocal()
-        try:
+        async with AsyncSessionLocal() as db:
             unified_context = await build_unified_context(user_id=context.user_id, db=db)
-        finally:
-            db.close()
 
         # System prompt with multilingual rule
         system_prompt = f"""You are Jarvis, a helpful assistant.
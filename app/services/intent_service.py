@@ -46,21 +46,23 @@ from app.services.intent_service import intent_service
 result = await intent_service.process(
     text="Show calendar on living room TV",
     user_id=user.id,
-    db=db_session,
+    db=db_session,  # AsyncSession
 )
 ```
 """
 
+import asyncio
 import logging
 import time
 import uuid as uuid_module
-from typing import Optional, Dict, Any, List, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     pass
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.device import Device
 from app.services.commands import command_service
@@ -72,6 +74,7 @@ from app.services.intent_result import IntentResult, IntentResultType
 # AI imports
 from app.ai.intent.parser import intent_parser
 from app.ai.intent.device_mapper import device_mapper
+from app.ai.intent.fast_path import fast_path_classifier
 from app.ai.intent.schemas import (
     DeviceCommand,
     DeviceQuery,
@@ -83,6 +86,7 @@ from app.ai.intent.schemas import (
     DisplayContentIntent,
     ConversationIntent,
     SequentialAction,  # Sprint 4.0.3: Multi-action support
+    ParsedCommand,
 )
 from app.ai.router.orchestrator import ai_router, TaskComplexity
 from app.ai.monitoring import ai_monitor
@@ -143,7 +147,7 @@ class IntentService:
         self,
         text: str,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
         device_id: Optional[UUID] = None,
         require_feedback: bool = False,
     ) -> IntentResult:
@@ -154,11 +158,17 @@ class IntentService:
         1. Analyzes complexity with AI Router
         2. Routes to appropriate handler
         3. Returns structured result
+        
+        With INTENT_SPECULATIVE_PARSE_ENABLED the simple-path intent parse
+        runs in parallel with step 1 (see _route_with_speculative_parse).
+        
+        With INTENT_FAST_PATH_ENABLED plain device commands ("turn off the
+        living room TV") are recognized locally and skip both LLM calls.
 
         Args:
             text: Natural language command
             user_id: User's ID
-            db: Database session
+            db: Async database session
             device_id: Optional specific device to target
             require_feedback: If True, return HTML for human validation instead of sending to device
 
@@ -181,12 +191,12 @@ class IntentService:
         
         try:
             # Get user's devices for context
-            devices = self._get_user_devices(db, user_id)
+            devices = await self._get_user_devices(db, user_id)
             device_context = device_mapper.to_device_context(devices)
 
             # Close DB connection BEFORE long AI operations
             # The session won't be used anymore - handlers will open their own session if needed
-            db.close()
+            await db.close()
             
             # Sprint 5.1.4: Unified context building with anaphoric resolution
             # Replaces 30+ lines of manual context assembly with single call
@@ -218,8 +228,38 @@ class IntentService:
                     f"resolved={list(request_context.resolved_references.keys())}"
                 )
             
+            # Plain device commands: no routing or parsing LLM calls needed
+            fast_parse = self._try_fast_path(
+                request_id=request_id,
+                text=text,
+                devices=devices,
+                device_id=device_id,
+                user_id=user_id,
+                has_pending=request_context.has_pending(),
+            )
+            if fast_parse is not None:
+                return await self._handle_simple_task(
+                    request_id=request_id,
+                    text=text,
+                    context=context,
+                    devices=devices,
+                    device_id=device_id,
+                    start_time=start_time,
+                    user_id=user_id,
+                    parsed=fast_parse,
+                )
+            
             # Analyze complexity and get routing decision
-            routing_decision = await ai_router.analyze_request(text, context)
+            speculative_parse = None
+            if settings.INTENT_SPECULATIVE_PARSE_ENABLED:
+                routing_decision, speculative_parse = await self._route_with_speculative_parse(
+                    request_id=request_id,
+                    text=text,
+                    context=context,
+                    user_id=user_id,
+                )
+            else:
+                routing_decision = await ai_router.analyze_request(text, context)
             
             ai_monitor.track_routing(
                 request_id=request_id,
@@ -265,6 +305,7 @@ class IntentService:
                 device_id=device_id,
                 start_time=start_time,
                 user_id=user_id,
+                parsed=speculative_parse,
             )
         
         except Exception as e:
@@ -284,6 +325,108 @@ class IntentService:
                 request_id=request_id,
             )
     
+    def _try_fast_path(
+        self,
+        request_id: str,
+        text: str,
+        devices: List[Device],
+        device_id: Optional[UUID],
+        user_id: UUID,
+        has_pending: bool,
+    ) -> Optional[ParsedCommand]:
+        """
+        Recognize a plain device command without the LLM.
+        
+        Skipped while a calendar operation is pending, since the reply may
+        belong to that conversation.
+        
+        Returns:
+            ParsedCommand to hand to the simple path, or None to route as usual
+        """
+        if not settings.INTENT_FAST_PATH_ENABLED or has_pending:
+            return None
+        
+        if device_id:
+            devices = [d for d in devices if d.id == device_id] or devices
+        
+        parsed = fast_path_classifier.parse(text, devices, user_id=user_id)
+        if parsed is None:
+            return None
+        
+        ai_monitor.track_routing(
+            request_id=request_id,
+            complexity=TaskComplexity.SIMPLE.value,
+            target_provider="fast_path",
+            confidence=parsed.intent.confidence,
+            reasoning=parsed.intent.reasoning or "fast_path",
+            is_device_command=True,
+        )
+        return parsed
+    
+    async def _route_with_speculative_parse(
+        self,
+        request_id: str,
+        text: str,
+        context: Dict[str, Any],
+        user_id: UUID,
+    ) -> Tuple[Any, Optional[ParsedCommand]]:
+        """
+        Run routing and the simple-path intent parse concurrently.
+        
+        Most requests are simple, so the parse the simple path would make
+        after routing is started right away. If routing says COMPLEX the
+        parse is cancelled and discarded.
+        
+        Returns:
+            (routing_decision, parsed) - parsed is None when routing chose a
+            complex path or the speculative parse failed (the simple path
+            then parses again as usual)
+        """
+        started = time.time()
+        parse_task = asyncio.create_task(
+            intent_parser.create_parsed_command(
+                text=text,
+                user_id=user_id,
+                context=context,
+            )
+        )
+        
+        try:
+            routing_decision = await ai_router.analyze_request(text, context)
+        except BaseException:
+            parse_task.cancel()
+            raise
+        routing_ms = (time.time() - started) * 1000
+        
+        if routing_decision.complexity in (
+            TaskComplexity.COMPLEX_EXECUTION,
+            TaskComplexity.COMPLEX_REASONING,
+        ):
+            parse_task.cancel()
+            ai_monitor.track_speculation(
+                request_id=request_id,
+                used=False,
+                routing_ms=routing_ms,
+                parse_ms=None,
+                elapsed_ms=routing_ms,
+            )
+            return routing_decision, None
+        
+        try:
+            parsed = await parse_task
+        except Exception as e:
+            logger.warning(f"Speculative intent parse failed, parsing again: {e}")
+            return routing_decision, None
+        
+        ai_monitor.track_speculation(
+            request_id=request_id,
+            used=True,
+            routing_ms=routing_ms,
+            parse_ms=parsed.processing_time_ms,
+            elapsed_ms=(time.time() - started) * 1000,
+        )
+        return routing_decision, parsed
+    
     # -----------------------------------------------------------------------
     # SIMPLE TASK HANDLER
     # -----------------------------------------------------------------------
@@ -297,14 +440,14 @@ class IntentService:
         device_id: Optional[UUID],
         start_time: float,
         user_id: UUID,
+        parsed: Optional[ParsedCommand] = None,
     ) -> IntentResult:
         """Handle simple tasks using Gemini Intent Parser."""
         # Open a fresh DB session for handlers that need it
         # This is closed at the end of the method
-        from app.db.session import SessionLocal
-        db = SessionLocal()
+        from app.db.session import AsyncSessionLocal
 
-        try:
+        async with AsyncSessionLocal() as db:
             return await self._handle_simple_task_internal(
                 request_id=request_id,
                 text=text,
@@ -314,9 +457,8 @@ class IntentService:
                 start_time=start_time,
                 user_id=user_id,
                 db=db,
+                parsed=parsed,
             )
-        finally:
-            db.close()
 
     async def _handle_simple_task_internal(
         self,
@@ -327,15 +469,17 @@ class IntentService:
         device_id: Optional[UUID],
         start_time: float,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
+        parsed: Optional[ParsedCommand] = None,
     ) -> IntentResult:
         """Internal handler with DB session."""
-        # Parse the intent
-        parsed = await intent_parser.create_parsed_command(
-            text=text,
-            user_id=user_id,
-            context=context,
-        )
+        # Parse the intent (unless a speculative parse already did)
+        if parsed is None:
+            parsed = await intent_parser.create_parsed_command(
+                text=text,
+                user_id=user_id,
+                context=context,
+            )
         
         # Log the parsed intent
         ai_monitor.track_intent(
@@ -501,18 +645,16 @@ class IntentService:
         )
         
         # Build unified context - open a fresh DB session for this operation
-        from app.db.session import SessionLocal
+        from app.db.session import AsyncSessionLocal
         unified_context = None
         try:
-            db = SessionLocal()
-            try:
+            # Closed immediately after context building
+            async with AsyncSessionLocal() as db:
                 unified_context = await build_unified_context(
                     user_id=user_id,
                     db=db,
                     request_id=request_id,
                 )
-            finally:
-                db.close()  # Close immediately after context building
         except Exception as e:
             logger.error(f"Failed to build unified context: {e}")
             processing_time = (time.time() - start_time) * 1000
@@ -1313,9 +1455,10 @@ ALWAYS return valid JSON. For visual/interactive requests, use show_content with
     # HELPERS
     # -----------------------------------------------------------------------
     
-    def _get_user_devices(self, db: Session, user_id: UUID) -> List[Device]:
+    async def _get_user_devices(self, db: AsyncSession, user_id: UUID) -> List[Device]:
         """Get all devices for a user."""
-        return db.query(Device).filter(Device.user_id == user_id).all()
+        result = await db.execute(select(Device).where(Device.user_id == user_id))
+        return list(result.scalars().all())
     
     @staticmethod
     def _get_action_value(action) -> Optional[str]:
@@ -33,9 +33,9 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, List, Dict, Any
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.oauth_credential import OAuthCredential
+from app.services.google_token_manager import google_token_manager
 from app.environments.google.calendar import GoogleCalendarClient, CalendarEvent
 from app.environments.google.docs import GoogleDocsClient
 from app.environments.base import APIError
@@ -104,7 +104,7 @@ class MeetingLinkService:
         self,
         query: str,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
         date_filter: Optional[str] = None,
     ) -> MeetingDocResult:
         """
@@ -180,7 +180,7 @@ class MeetingLinkService:
         self,
         time_reference: str,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
     ) -> MeetingDocResult:
         """
         Find a meeting by time reference.
@@ -209,7 +209,7 @@ class MeetingLinkService:
         self,
         event_id: str,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
     ) -> Optional[str]:
         """
         Get the linked document ID for a specific event.
@@ -223,10 +223,7 @@ class MeetingLinkService:
             Document ID if linked, None otherwise
         """
         # Get user's Google credentials
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
         
         if not credentials or not credentials.access_token:
             logger.warning(f"No Google credentials for user {user_id}")
@@ -234,7 +231,7 @@ class MeetingLinkService:
         
         # Fetch the specific event
         try:
-            calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+            calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
             # Note: This would need a get_event() method on the calendar client
             # For now, we rely on the events from search
             return None
@@ -263,7 +260,7 @@ class MeetingLinkService:
     async def find_events_with_docs(
         self,
         user_id: UUID,
-        db: Session,
+        db: AsyncSession,
         days_ahead: int = 7,
     ) -> List[MeetingDocResult]:
         """
@@ -278,17 +275,14 @@ class MeetingLinkService:
             List of MeetingDocResult for events with docs
         """
         # Get user's Google credentials
-        credentials = db.query(OAuthCredential).filter(
-            OAuthCredential.user_id == user_id,
-            OAuthCredential.provider == "google",
-        ).first()
+        credentials = await google_token_manager.get_token(user_id)
         
         if not credentials or not credentials.access_token:
             logger.warning(f"No Google credentials for user {user_id}")
             return []
         
         try:
-            calendar_client = GoogleCalendarClient(access_token=credentials.access_token)
+            calendar_client = GoogleCalendarClient(access_token=credentials.access_token, user_id=user_id)
             
             time_min = datetime.now(timezone.utc)
             time_max = time_min + timedelta(days=days_ahead)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the local fast-path intent classifier on an utterance corpus.
+
+Reports how many requests skip the LLM (hit rate), whether the skipped
+ones were classified correctly, and the classifier's latency. With --llm
+the same utterances are also sent through the AI router + intent parser
+(needs GEMINI_API_KEY) so the latency can be compared with the path the
+fast path replaces.
+
+Usage:
+    python scripts/bench_fast_path.py
+    python scripts/bench_fast_path.py --threshold 0.8 --repeat 500 --verbose
+    python scripts/bench_fast_path.py --llm
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+# Adjust path so imports resolve when running from project root
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from app.ai.intent.fast_path import FastPathClassifier
+
+CORPUS = ROOT / "tests" / "fixtures" / "fast_path_utterances.json"
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def load_corpus(path):
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    devices = [
+        SimpleNamespace(id=uuid.uuid4(), name=name, is_online=True, capabilities={})
+        for name in data["devices"]
+    ]
+    return devices, data["utterances"]
+
+
+def run_fast_path(classifier, devices, utterances, repeat, verbose):
+    hits = correct = false_positives = 0
+    expected_commands = sum(1 for u in utterances if u["expected"])
+    latencies_ms = []
+
+    for utterance in utterances:
+        text, expected = utterance["text"], utterance["expected"]
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            intent = classifier.classify(text, devices)
+        latencies_ms.append((time.perf_counter() - started) * 1000 / repeat)
+
+        got = None
+        if intent is not None:
+            hits += 1
+            got = {
+                "action": intent.action.value,
+                "device": intent.device_name,
+                "parameters": intent.parameters,
+            }
+            if got == expected:
+                correct += 1
+            elif expected is None:
+                false_positives += 1
+
+        if verbose or (got is not None and got != expected):
+            marker = "ok " if got == expected else ("LLM" if got is None else "BAD")
+            print(f"  [{marker}] {text!r} -> {got}")
+
+    total = len(utterances)
+    print(f"\nCorpus: {total} utterances ({expected_commands} plain device commands)")
+    print(f"Threshold: {classifier.min_confidence}")
+    print(f"Hit rate (LLM skipped):      {hits}/{total} = {hits / total:.1%}")
+    print(f"Device-command coverage:     {correct}/{expected_commands} = {correct / expected_commands:.1%}")
+    print(f"Precision on hits:           {correct}/{hits} = {correct / hits if hits else 0:.1%}")
+    print(f"False positives:             {false_positives}")
+    print(
+        f"Fast-path latency (ms/utterance): p50={percentile(latencies_ms, 50):.3f} "
+        f"p95={percentile(latencies_ms, 95):.3f} max={max(latencies_ms):.3f}"
+    )
+
+
+async def run_llm(devices, utterances):
+    """Time the path the fast path replaces: routing + intent parsing."""
+    from app.ai.intent.device_mapper import device_mapper
+    from app.ai.intent.parser import intent_parser
+    from app.ai.router.orchestrator import ai_router
+
+    context = {"devices": device_mapper.to_device_context(devices)}
+    latencies_ms = []
+    for utterance in utterances:
+        if not utterance["expected"]:
+            continue
+        started = time.perf_counter()
+        await ai_router.analyze_request(utterance["text"], context)
+        await intent_parser.parse(utterance["text"], context)
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    print(
+        f"LLM route+parse latency (ms/utterance): p50={percentile(latencies_ms, 50):.0f} "
+        f"p95={percentile(latencies_ms, 95):.0f} max={max(latencies_ms):.0f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", default=str(CORPUS))
+    parser.add_argument("--threshold", type=float, default=None,
+                        help="Minimum confidence (default: INTENT_FAST_PATH_MIN_CONFIDENCE)")
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="Classifications per utterance for latency timing")
+    parser.add_argument("--llm", action="store_true",
+                        help="Also time routing + parsing with the configured LLM")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    devices, utterances = load_corpus(args.corpus)
+    classifier = FastPathClassifier(min_confidence=args.threshold)
+    run_fast_path(classifier, devices, utterances, args.repeat, args.verbose)
+
+    if args.llm:
+        asyncio.run(run_llm(devices, utterances))
+
+
+if __name__ == "__main__":
+    main()
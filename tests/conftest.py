@@ -8,31 +8,42 @@ This module provides shared fixtures used across all tests:
 - Sample data factories
 """
 
+import os
+import tempfile
+
 import pytest
 from datetime import datetime, timezone
-from typing import Generator
+from typing import AsyncGenerator, Generator
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.main import app
 from app.db.base import Base
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 from app.models.device import Device
 from app.core.security import hash_password, create_access_token
+from app.ai.response_cache import intent_cache, routing_cache
 
 
 # ---------------------------------------------------------------------------
 # TEST DATABASE SETUP
 # ---------------------------------------------------------------------------
-# Use SQLite in-memory for fast tests (no PostgreSQL dependency)
-# StaticPool keeps the same connection across all operations
+# Use SQLite for fast tests (no PostgreSQL dependency)
+# A temporary file rather than :memory:, so the async engine (aiosqlite,
+# used by async routes) sees the same tables and rows as the sync one
+# StaticPool keeps the same sync connection across all operations
+
+_db_fd, _db_path = tempfile.mkstemp(prefix="test-", suffix=".db")
+os.close(_db_fd)
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{_db_path}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{_db_path}"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
@@ -40,7 +51,39 @@ engine = create_engine(
     poolclass=StaticPool,  # Keep connection alive across operations
 )
 
+# NullPool: no aiosqlite connection (or its worker thread) outlives the
+# request that opened it
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    class_=AsyncSession,
+)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Remove the temporary test database file."""
+    engine.dispose()
+    if os.path.exists(_db_path):
+        os.remove(_db_path)
+
+
+# ---------------------------------------------------------------------------
+# AI RESPONSE CACHES
+# ---------------------------------------------------------------------------
+# Routing/intent results are cached in module-level singletons; clear them
+# so one test's mocked LLM response never answers another test's request
+
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    routing_cache.clear()
+    intent_cache.clear()
+    yield
+    routing_cache.clear()
+    intent_cache.clear()
 
 
 # ---------------------------------------------------------------------------
@@ -75,15 +118,21 @@ def client(db: Session) -> Generator[TestClient, None, None]:
     """
     Create a test client with the test database.
     
-    Overrides the get_db dependency to use our test database.
+    Overrides the get_db and get_async_db dependencies to use our test
+    database (async routes get an aiosqlite session on the same file).
     """
     def override_get_db():
         try:
             yield db
         finally:
             pass
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with TestingAsyncSessionLocal() as async_db:
+            yield async_db
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     
     with TestClient(app) as test_client:
         yield test_client
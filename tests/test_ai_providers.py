@@ -13,7 +13,10 @@ We mock LLM calls to ensure tests are:
 - Free (no token costs)
 """
 
+import asyncio
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 import json
@@ -379,3 +382,174 @@ class TestResponseComparison:
         responses = [gemini_response, openai_response, anthropic_response]
         fastest = min(responses, key=lambda r: r.latency_ms)
         assert fastest.provider == ProviderType.GEMINI
+
+
+# ---------------------------------------------------------------------------
+# GEMINI NON-BLOCKING TESTS
+# ---------------------------------------------------------------------------
+
+def _fake_gemini_response(text: str = "ok"):
+    """Minimal stand-in for a google.genai GenerateContentResponse."""
+    response = MagicMock()
+    response.text = text
+    response.candidates = []
+    response.usage_metadata = None
+    return response
+
+
+def _slow_aio_client(delay: float):
+    """Gemini client whose async generate_content sleeps for `delay` seconds."""
+    async def generate_content(**kwargs):
+        await asyncio.sleep(delay)
+        return _fake_gemini_response()
+
+    client = MagicMock()
+    client.aio.models.generate_content = AsyncMock(side_effect=generate_content)
+    return client
+
+
+class TestGeminiProviderAsync:
+    """GeminiProvider must never block the event loop."""
+
+    def _provider(self, client, timeout: float = 5):
+        from app.ai.providers.gemini import GeminiProvider
+
+        provider = GeminiProvider(api_key="test-key", timeout=timeout)
+        provider._client = client
+        return provider
+
+    @pytest.mark.asyncio
+    async def test_generate_uses_async_client(self):
+        """generate() awaits client.aio instead of the sync client."""
+        client = _slow_aio_client(0)
+        provider = self._provider(client)
+
+        response = await provider.generate("hello")
+
+        assert response.success is True
+        assert response.content == "ok"
+        client.aio.models.generate_content.assert_awaited_once()
+        client.models.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_with_grounding_uses_async_client(self):
+        """generate_with_grounding() awaits client.aio as well."""
+        client = _slow_aio_client(0)
+        client.aio.models.generate_content.side_effect = None
+        response_mock = _fake_gemini_response("sunny")
+        response_mock.candidates = [MagicMock(grounding_metadata=None)]
+        client.aio.models.generate_content.return_value = response_mock
+        provider = self._provider(client)
+
+        response = await provider.generate_with_grounding("weather?")
+
+        assert response.success is True
+        assert response.content == "sunny"
+        client.models.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_timeout_returns_error_response(self):
+        """A call slower than the timeout fails fast with an error response."""
+        provider = self._provider(_slow_aio_client(1.0), timeout=0.05)
+
+        start = time.perf_counter()
+        response = await provider.generate("hello")
+        elapsed = time.perf_counter() - start
+
+        assert response.success is False
+        assert "timed out" in response.error
+        assert elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_per_call_timeout_overrides_default(self):
+        """timeout= on the call takes precedence over AI_REQUEST_TIMEOUT."""
+        provider = self._provider(_slow_aio_client(1.0), timeout=30)
+
+        response = await provider.generate("hello", timeout=0.05)
+
+        assert response.success is False
+        assert "0.05s" in response.error
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self):
+        """Cancelling the caller cancels the in-flight Gemini call."""
+        provider = self._provider(_slow_aio_client(1.0))
+
+        task = asyncio.create_task(provider.generate("hello"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_executor_fallback_without_aio(self):
+        """Clients without client.aio run the sync call off the event loop."""
+        client = MagicMock(spec=["models"])
+        client.models.generate_content = MagicMock(
+            side_effect=lambda **kwargs: (time.sleep(0.2), _fake_gemini_response())[1]
+        )
+        provider = self._provider(client)
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(provider.generate("hi") for _ in range(4)))
+        elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in responses)
+        assert elapsed < 0.6  # ~max latency, not 4 x 0.2s
+
+    @pytest.mark.asyncio
+    async def test_parallel_calls_overlap(self):
+        """N concurrent calls take ~max latency rather than ~sum latency."""
+        provider = self._provider(_slow_aio_client(0.2))
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(provider.generate("hi") for _ in range(5)))
+        elapsed = time.perf_counter() - start
+
+        assert all(r.success for r in responses)
+        assert elapsed < 0.5  # sum would be 1.0s
+
+
+class TestIntentEndpointConcurrency:
+    """Parallel /intent requests must not serialise behind Gemini calls."""
+
+    def test_parallel_intent_requests_complete_in_max_latency(
+        self,
+        client,
+        test_user,
+    ):
+        from app.ai.providers.gemini import GeminiProvider
+        from app.deps import get_current_user
+        from app.main import app
+        from app.services.intent_service import IntentResult, IntentResultType
+
+        delay, n_requests = 0.3, 5
+        provider = GeminiProvider(api_key="test-key")
+        provider._client = _slow_aio_client(delay)
+
+        async def process(*args, **kwargs):
+            response = await provider.generate(kwargs["text"])
+            return IntentResult(
+                success=response.success,
+                intent_type=IntentResultType.CONVERSATION,
+                message=response.content,
+            )
+
+        app.dependency_overrides[get_current_user] = lambda: test_user
+
+        with patch(
+            "app.routers.intent.intent_service.process",
+            new_callable=AsyncMock,
+            side_effect=process,
+        ):
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=n_requests) as pool:
+                responses = list(pool.map(
+                    lambda i: client.post("/intent", json={"text": f"hello {i}"}),
+                    range(n_requests),
+                ))
+            elapsed = time.perf_counter() - start
+
+        assert all(r.status_code == 200 for r in responses)
+        assert elapsed < delay * n_requests / 2  # sum would be 1.5s
@@ -0,0 +1,320 @@
+"""
+Tests for the per-user Google Calendar caches.
+
+This module tests:
+- A burst of queries for one user costs a single full sync
+- TTL expiry / invalidate() refresh with the sync token (incremental)
+- Cancelled events are removed, 410 Gone falls back to a full sync
+- Queries the cache can't answer exactly fall back to the API
+- GoogleCalendarClient uses the cache only when built with a user_id
+- Timezone / calendar list metadata is cached and dropped per user
+- Cached data is only served to clients holding the same access token
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.environments.base import APIError
+from app.environments.google.calendar.cache import (
+    CalendarEventCache,
+    CalendarMetadataCache,
+    drop_user_calendar_cache,
+)
+from app.environments.google.calendar.client import GoogleCalendarClient
+
+
+NOW = datetime.now(timezone.utc)
+
+
+def _event(event_id, hours_from_now, status="confirmed", summary=None):
+    start = NOW + timedelta(hours=hours_from_now)
+    return {
+        "id": event_id,
+        "status": status,
+        "summary": summary or event_id,
+        "start": {"dateTime": start.isoformat()},
+        "end": {"dateTime": (start + timedelta(hours=1)).isoformat()},
+    }
+
+
+def _page(items, sync_token="sync-1", page_token=None):
+    page = {"items": items, "timeZone": "UTC"}
+    if page_token:
+        page["nextPageToken"] = page_token
+    else:
+        page["nextSyncToken"] = sync_token
+    return page
+
+
+class FakeClient:
+    """Stands in for GoogleCalendarClient: only user_id, access_token and _make_request are used."""
+
+    def __init__(self, *pages, user_id="user-1", access_token="token-1"):
+        self.user_id = user_id
+        self.access_token = access_token
+        self._make_request = AsyncMock(side_effect=list(pages))
+
+    def params(self, call_index):
+        return self._make_request.call_args_list[call_index].kwargs["params"]
+
+
+@pytest.fixture
+def cache():
+    return CalendarEventCache(ttl_seconds=60, days_ahead=30, max_entries=10)
+
+
+class TestCalendarEventCache:
+    """Sync behaviour of CalendarEventCache."""
+
+    @pytest.mark.asyncio
+    async def test_burst_of_queries_costs_one_full_sync(self, cache):
+        client = FakeClient(_page([_event("a", 1), _event("b", 3), _event("c", 30)]))
+
+        results = await asyncio.gather(
+            cache.list_events(client, "primary", NOW, NOW + timedelta(hours=5), 10),
+            cache.list_events(client, "primary", NOW, NOW + timedelta(days=2), 10),
+            cache.list_events(client, "primary", NOW, NOW + timedelta(hours=2), 10),
+        )
+
+        assert client._make_request.await_count == 1
+        assert [e.id for e in results[0]] == ["a", "b"]
+        assert [e.id for e in results[1]] == ["a", "b", "c"]
+        assert [e.id for e in results[2]] == ["a"]
+        assert cache.stats.full_syncs == 1
+        assert cache.stats.hits == 2
+
+    @pytest.mark.asyncio
+    async def test_full_sync_follows_pages(self, cache):
+        client = FakeClient(
+            _page([_event("a", 1)], page_token="p2"),
+            _page([_event("b", 2)]),
+        )
+
+        events = await cache.list_events(client, "primary", NOW, NOW + timedelta(days=1), 10)
+
+        assert [e.id for e in events] == ["a", "b"]
+        assert client.params(1)["pageToken"] == "p2"
+
+    @pytest.mark.asyncio
+    async def test_expired_ttl_uses_sync_token(self, cache):
+        client = FakeClient(
+            _page([_event("a", 1), _event("b", 2)], sync_token="sync-1"),
+            _page([_event("a", 1, status="cancelled"), _event("d", 4)], sync_token="sync-2"),
+        )
+        time_max = NOW + timedelta(days=1)
+        await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        cache.ttl_seconds = 0
+        events = await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        incremental = client.params(1)
+        assert incremental["syncToken"] == "sync-1"
+        assert "timeMin" not in incremental and "timeMax" not in incremental
+        assert [e.id for e in events] == ["b", "d"]
+        assert cache.stats.incremental_syncs == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidate_triggers_incremental_sync(self, cache):
+        client = FakeClient(
+            _page([_event("a", 1)]),
+            _page([_event("a", 1, summary="renamed")], sync_token="sync-2"),
+        )
+        time_max = NOW + timedelta(days=1)
+        await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        cache.invalidate("user-1", "primary")
+        events = await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        assert client.params(1)["syncToken"] == "sync-1"
+        assert events[0].summary == "renamed"
+
+    @pytest.mark.asyncio
+    async def test_new_access_token_forces_full_sync(self, cache):
+        client = FakeClient(
+            _page([_event("a", 1)]),
+            _page([_event("other-account", 2)], sync_token="sync-9"),
+        )
+        time_max = NOW + timedelta(days=1)
+        await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        # Re-consent (maybe to another account) seen by this worker's token manager
+        client.access_token = "token-2"
+        events = await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        assert "syncToken" not in client.params(1)
+        assert [e.id for e in events] == ["other-account"]
+        assert cache.stats.full_syncs == 2
+
+    @pytest.mark.asyncio
+    async def test_gone_sync_token_falls_back_to_full_sync(self, cache):
+        client = FakeClient(
+            _page([_event("a", 1)]),
+            APIError("Sync token is no longer valid", status_code=410),
+            _page([_event("b", 2)], sync_token="sync-3"),
+        )
+        time_max = NOW + timedelta(days=1)
+        await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        cache.invalidate("user-1")
+        events = await cache.list_events(client, "primary", NOW, time_max, 10)
+
+        assert "timeMin" in client.params(2)
+        assert [e.id for e in events] == ["b"]
+        assert cache.stats.full_syncs == 2
+
+    @pytest.mark.asyncio
+    async def test_query_outside_window_bypasses_cache(self, cache):
+        client = FakeClient()
+
+        events = await cache.list_events(
+            client, "primary", NOW - timedelta(days=10), NOW, 10
+        )
+
+        assert events is None
+        client._make_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_open_ended_query_with_too_few_events_bypasses(self, cache):
+        client = FakeClient(_page([_event("a", 1)]))
+
+        assert await cache.list_events(client, "primary", NOW, None, 10) is None
+        assert [e.id for e in await cache.list_events(client, "primary", NOW, None, 1)] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_users_are_isolated(self, cache):
+        alice = FakeClient(_page([_event("a", 1)]), user_id="alice")
+        bob = FakeClient(_page([_event("b", 1)]), user_id="bob")
+        time_max = NOW + timedelta(days=1)
+
+        assert [e.id for e in await cache.list_events(alice, "primary", NOW, time_max, 10)] == ["a"]
+        assert [e.id for e in await cache.list_events(bob, "primary", NOW, time_max, 10)] == ["b"]
+
+        cache.drop("alice")
+        assert ("alice", "primary") not in cache._windows
+        assert ("bob", "primary") in cache._windows
+
+
+class TestCalendarClientCaching:
+    """GoogleCalendarClient integration with the event cache."""
+
+    @pytest.mark.asyncio
+    async def test_client_without_user_id_skips_cache(self):
+        client = GoogleCalendarClient(access_token="token")
+        client._make_request = AsyncMock(return_value=_page([_event("a", 1)]))
+
+        with patch(
+            "app.environments.google.calendar.client.calendar_event_cache"
+        ) as mock_cache:
+            events = await client.list_upcoming_events(max_results=5)
+
+        mock_cache.list_events.assert_not_called()
+        assert [e.id for e in events] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_client_with_user_id_serves_repeat_queries_from_cache(self):
+        test_cache = CalendarEventCache(ttl_seconds=60, days_ahead=30, max_entries=10)
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_request = AsyncMock(return_value=_page([_event("a", 1)]))
+        time_max = NOW + timedelta(days=1)
+
+        with patch(
+            "app.environments.google.calendar.client.calendar_event_cache", test_cache
+        ):
+            first = await client.list_upcoming_events(time_max=time_max)
+            second = await client.list_upcoming_events(time_max=time_max)
+
+        assert [e.id for e in first] == [e.id for e in second] == ["a"]
+        assert client._make_request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cache(self):
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_delete_request = AsyncMock(return_value=None)
+
+        with patch(
+            "app.environments.google.calendar.client.calendar_event_cache"
+        ) as mock_cache:
+            await client.delete_event("event-1")
+
+        mock_cache.invalidate.assert_called_once_with("user-1", "primary")
+
+
+class TestCalendarMetadataCache:
+    """Timezone and calendar list caching."""
+
+    @pytest.fixture
+    def metadata_cache(self):
+        test_cache = CalendarMetadataCache(ttl_seconds=3600, max_entries=10)
+        with patch(
+            "app.environments.google.calendar.client.calendar_metadata_cache", test_cache
+        ), patch(
+            "app.environments.google.calendar.cache.calendar_metadata_cache", test_cache
+        ):
+            yield test_cache
+
+    @pytest.mark.asyncio
+    async def test_timezone_fetched_once_per_user(self, metadata_cache):
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_request = AsyncMock(return_value={"timeZone": "America/New_York"})
+
+        assert await client.get_user_timezone() == "America/New_York"
+        assert await client.get_user_timezone() == "America/New_York"
+
+        assert client._make_request.await_count == 1
+        assert metadata_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_timezone_lookup_is_not_cached(self, metadata_cache):
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_request = AsyncMock(
+            side_effect=[APIError("boom", status_code=500), {"timeZone": "Europe/Madrid"}]
+        )
+
+        assert await client.get_user_timezone() == "UTC"
+        assert await client.get_user_timezone() == "Europe/Madrid"
+
+    @pytest.mark.asyncio
+    async def test_calendar_list_cached_per_variant(self, metadata_cache):
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_request = AsyncMock(
+            return_value={"items": [{"id": "primary-id", "summary": "Me", "primary": True}]}
+        )
+
+        primary = await client.get_primary_calendar()
+        await client.list_calendars()
+        await client.list_calendars(max_results=5)
+
+        assert primary.id == "primary-id"
+        assert client._make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_drop_user_forgets_metadata(self, metadata_cache):
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_request = AsyncMock(return_value={"timeZone": "UTC"})
+        await client.get_user_timezone()
+
+        drop_user_calendar_cache("user-1")
+        await client.get_user_timezone()
+
+        assert client._make_request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_other_access_token_is_a_miss(self, metadata_cache):
+        client = GoogleCalendarClient(access_token="token", user_id="user-1")
+        client._make_request = AsyncMock(return_value={"timeZone": "UTC"})
+        await client.get_user_timezone()
+
+        # Re-consented through another worker: this one now gets a new token
+        client.access_token = "token-2"
+        await client.get_user_timezone()
+
+        assert client._make_request.await_count == 2
+
+    def test_entries_expire_after_ttl(self):
+        metadata_cache = CalendarMetadataCache(ttl_seconds=0, max_entries=10)
+        metadata_cache.set_timezone("user-1", "primary", "UTC")
+
+        assert metadata_cache.get_timezone("user-1") is None
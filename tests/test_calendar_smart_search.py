@@ -64,6 +64,16 @@ def mock_db():
     return MagicMock()
 
 
+@pytest.fixture
+def mock_token_manager():
+    """Patch the Google token manager used for credential lookups."""
+    with patch(
+        "app.services.calendar_search_service.google_token_manager"
+    ) as manager:
+        manager.get_token = AsyncMock(return_value=None)
+        yield manager
+
+
 @pytest.fixture
 def mock_credentials():
     """Create mock OAuth credentials."""
@@ -177,9 +187,9 @@ class TestSmartSearchNoCredentials:
     """Test smart search when user has no credentials."""
     
     @pytest.mark.asyncio
-    async def test_returns_error_when_no_credentials(self, mock_db):
+    async def test_returns_error_when_no_credentials(self, mock_db, mock_token_manager):
         """Test that search returns error when no OAuth credentials."""
-        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_token_manager.get_token.return_value = None
         
         service = CalendarSearchService()
         result = await service.smart_search(
@@ -228,9 +238,9 @@ class TestSmartSearchWithMockedLLM:
     """Test smart search with mocked LLM responses."""
     
     @pytest.mark.asyncio
-    async def test_typo_matching_birday(self, mock_db, mock_credentials, mock_events):
+    async def test_typo_matching_birday(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test that 'birday' matches 'Cumpleaños de Victor'."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         # Mock LLM response for typo correction
         llm_response = MagicMock()
@@ -271,9 +281,9 @@ class TestSmartSearchWithMockedLLM:
             assert result.events[0].get_display_title() == "Cumpleaños de Victor"
     
     @pytest.mark.asyncio
-    async def test_translation_matching_anniversary(self, mock_db, mock_credentials, mock_events):
+    async def test_translation_matching_anniversary(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test that 'anniversary' matches 'Aniversario de boda'."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -313,9 +323,9 @@ class TestSmartSearchWithMockedLLM:
             assert "Aniversario" in result.events[0].get_display_title()
     
     @pytest.mark.asyncio
-    async def test_multiple_matches_birthday(self, mock_db, mock_credentials, mock_events):
+    async def test_multiple_matches_birthday(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test that 'birthday' matches both Spanish and English events."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -362,9 +372,9 @@ class TestSmartSearchWithMockedLLM:
             assert "Birthday party" in titles
     
     @pytest.mark.asyncio
-    async def test_no_match_returns_empty(self, mock_db, mock_credentials, mock_events):
+    async def test_no_match_returns_empty(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test that unrelated query returns no matches."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -396,9 +406,9 @@ class TestSmartSearchWithMockedLLM:
             assert len(result.events) == 0
     
     @pytest.mark.asyncio
-    async def test_synonym_matching_bday(self, mock_db, mock_credentials, mock_events):
+    async def test_synonym_matching_bday(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test that 'bday' matches birthday events."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -447,9 +457,9 @@ class TestSmartSearchWithDateRange:
     """Test smart search with date_range parameter (Sprint 4.1 consolidated API)."""
     
     @pytest.mark.asyncio
-    async def test_search_with_date_range(self, mock_db, mock_credentials, mock_events):
+    async def test_search_with_date_range(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test search scoped to a date range (Sprint 4.1 consolidated API)."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -494,9 +504,9 @@ class TestSmartSearchWithDateRange:
             assert "Meeting" in result.events[0].get_display_title()
     
     @pytest.mark.asyncio
-    async def test_search_with_this_week_range(self, mock_db, mock_credentials, mock_events):
+    async def test_search_with_this_week_range(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test search scoped to this_week date range."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -542,9 +552,9 @@ class TestLLMErrorHandling:
     """Test error handling for LLM failures."""
     
     @pytest.mark.asyncio
-    async def test_handles_llm_failure(self, mock_db, mock_credentials, mock_events):
+    async def test_handles_llm_failure(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test graceful handling of LLM failures."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = False
@@ -572,9 +582,9 @@ class TestLLMErrorHandling:
             assert len(result.events) == 0
     
     @pytest.mark.asyncio
-    async def test_handles_invalid_json_response(self, mock_db, mock_credentials, mock_events):
+    async def test_handles_invalid_json_response(self, mock_db, mock_token_manager, mock_credentials, mock_events):
         """Test handling of invalid JSON from LLM."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         llm_response = MagicMock()
         llm_response.success = True
@@ -606,9 +616,9 @@ class TestCalendarAPIErrorHandling:
     """Test error handling for Calendar API failures."""
     
     @pytest.mark.asyncio
-    async def test_handles_calendar_api_error(self, mock_db, mock_credentials):
+    async def test_handles_calendar_api_error(self, mock_db, mock_token_manager, mock_credentials):
         """Test handling of Calendar API errors."""
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_credentials
+        mock_token_manager.get_token.return_value = mock_credentials
         
         from app.environments.base import APIError
         
@@ -0,0 +1,65 @@
+"""
+Tests for database session management.
+
+This module tests:
+- Pool sizing settings are applied to the engines
+- The async session dependency yields an AsyncSession
+
+No database connection is needed: engines connect lazily.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.core.config import settings
+from app.db import session as db_session
+
+
+class TestPoolSettings:
+    """Pool sizing comes from Settings so it can be tuned per worker."""
+
+    def test_pool_kwargs_from_settings(self):
+        """Postgres URLs get the configured pool sizing."""
+        with patch.object(settings, "DATABASE_URL", "postgresql+psycopg://u:p@h/db"):
+            kwargs = db_session._pool_kwargs()
+
+        assert kwargs == {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+            "pool_timeout": settings.DB_POOL_TIMEOUT_SECONDS,
+        }
+
+    def test_pool_kwargs_skipped_for_sqlite(self):
+        """SQLite doesn't use a QueuePool, so no sizing options."""
+        with patch.object(settings, "DATABASE_URL", "sqlite:///:memory:"):
+            assert db_session._pool_kwargs() == {}
+
+    def test_engines_use_configured_pool_size(self):
+        """Both engines are built with the same pool size."""
+        if settings.DATABASE_URL.startswith("sqlite"):
+            pytest.skip("SQLite engines don't use pool sizing")
+
+        assert db_session.engine.pool.size() == settings.DB_POOL_SIZE
+        assert db_session.async_engine.pool.size() == settings.DB_POOL_SIZE
+
+
+class TestAsyncSession:
+    """Async session dependency for async routes."""
+
+    def test_async_engine_type(self):
+        assert isinstance(db_session.async_engine, AsyncEngine)
+
+    @pytest.mark.asyncio
+    async def test_get_async_db_yields_async_session(self):
+        """get_async_db yields an AsyncSession and closes it afterwards."""
+        gen = db_session.get_async_db()
+        db = await gen.__anext__()
+
+        assert isinstance(db, AsyncSession)
+        assert db.bind is db_session.async_engine
+
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
@@ -328,6 +328,41 @@ class TestNormalization:
         normalized = mapper._normalize("LIVING ROOM TV")
         
         assert normalized == normalized.lower()
+    
+    def test_normalize_is_word_order_independent(self, mapper):
+        """Test that Spanish word order matches the English device name."""
+        assert mapper._normalize("tele de la sala") == mapper._normalize("Living Room TV")
+
+
+# ===========================================================================
+# CONTAINMENT MATCH TESTS
+# ===========================================================================
+
+class TestMatchContained:
+    """Tests for match_contained() - partial names."""
+    
+    def test_unique_partial_name(self, mapper, sample_devices):
+        """Test that a word only one device has picks that device."""
+        device = mapper.match_contained("kitchen", sample_devices)
+        
+        assert device is not None
+        assert device.name == "Kitchen Display"
+    
+    def test_spanish_partial_name(self, mapper, sample_devices):
+        """Test that Spanish room names are translated first."""
+        device = mapper.match_contained("cocina", sample_devices)
+        
+        assert device.name == "Kitchen Display"
+    
+    def test_shared_word_is_ambiguous(self, mapper):
+        """Test that a word in several device names matches nothing."""
+        devices = [MockDevice("Office TV"), MockDevice("Office Display")]
+        
+        assert mapper.match_contained("office", devices) is None
+    
+    def test_generic_words_match_nothing(self, mapper, sample_devices):
+        """Test that 'tv' or 'room' alone never pick a device."""
+        assert mapper.match_contained("the room tv", sample_devices) is None
 
 
 # ===========================================================================
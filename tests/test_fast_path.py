@@ -0,0 +1,245 @@
+"""
+Tests for the local fast-path intent classifier.
+
+This module tests:
+- English and Spanish power/volume/input/clear commands
+- Phrases derived from ActionRegistry aliases
+- Requests that must still go to the LLM (compound, scheduled, ambiguous)
+- Confidence threshold and stats
+- The utterance corpus used by scripts/bench_fast_path.py (no false positives)
+- IntentService skipping routing + parsing on a fast-path hit
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.ai.actions.registry import ActionCategory, ActionDefinition, ActionRegistry
+from app.ai.intent.fast_path import FastPathClassifier
+from app.ai.intent.schemas import ActionType, DeviceCommand
+from app.services.intent_result import IntentResult, IntentResultType
+from app.services.intent_service import IntentService
+
+
+CORPUS = Path(__file__).parent / "fixtures" / "fast_path_utterances.json"
+
+
+class MockDevice:
+    """Mock Device object for testing without database."""
+
+    def __init__(self, name: str):
+        self.id = uuid4()
+        self.name = name
+        self.is_online = True
+        self.capabilities = {}
+
+
+@pytest.fixture
+def devices():
+    return [
+        MockDevice("Living Room TV"),
+        MockDevice("Bedroom TV"),
+        MockDevice("Kitchen Display"),
+    ]
+
+
+@pytest.fixture
+def classifier():
+    return FastPathClassifier(min_confidence=0.85)
+
+
+def _command(intent):
+    return intent.action.value, intent.device_name, intent.parameters
+
+
+class TestEnglishCommands:
+    """Plain English device commands."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("turn on the living room tv", ("power_on", "Living Room TV", None)),
+        ("turn the kitchen display off", ("power_off", "Kitchen Display", None)),
+        ("mute the bedroom tv", ("mute", "Bedroom TV", None)),
+        ("turn up the volume on the kitchen display", ("volume_up", "Kitchen Display", None)),
+        ("set the volume to 30 on the bedroom tv", ("volume_set", "Bedroom TV", {"level": 30})),
+        ("switch the living room tv to hdmi 2", ("set_input", "Living Room TV", {"input": "hdmi2"})),
+        ("clear the kitchen display", ("clear_content", "Kitchen Display", None)),
+    ])
+    def test_command(self, classifier, devices, text, expected):
+        intent = classifier.classify(text, devices)
+
+        assert isinstance(intent, DeviceCommand)
+        assert _command(intent) == expected
+        assert intent.confidence >= classifier.min_confidence
+
+
+class TestSpanishCommands:
+    """Plain Spanish device commands."""
+
+    @pytest.mark.parametrize("text, expected", [
+        ("enciende la tele de la sala", ("power_on", "Living Room TV", None)),
+        ("apaga el televisor del dormitorio", ("power_off", "Bedroom TV", None)),
+        ("sube el volumen de la tele de la sala", ("volume_up", "Living Room TV", None)),
+        ("pon el volumen en 20 en la cocina", ("volume_set", "Kitchen Display", {"level": 20})),
+        ("silencia la pantalla de la cocina", ("mute", "Kitchen Display", None)),
+        ("cambia la tele de la sala a HDMI 1", ("set_input", "Living Room TV", {"input": "hdmi1"})),
+    ])
+    def test_command(self, classifier, devices, text, expected):
+        intent = classifier.classify(text, devices)
+
+        assert intent is not None
+        assert _command(intent) == expected
+
+
+class TestGoesToLLM:
+    """Requests the fast path must leave alone."""
+
+    @pytest.mark.parametrize("text", [
+        "turn off the tv and show the calendar",
+        "apaga la tele y muestra mi calendario",
+        "turn off the bedroom tv in 10 minutes",
+        "what's on the living room tv?",
+        "turn it off",
+        "show my calendar on the living room tv",
+        "set the volume to 150 on the bedroom tv",
+        "turn on the garage lights",
+    ])
+    def test_not_matched(self, classifier, devices, text):
+        assert classifier.match(text, devices) is None
+
+    def test_generic_name_with_several_devices(self, classifier, devices):
+        assert classifier.match("turn on the tv", devices) is None
+
+    def test_generic_name_with_single_device(self, classifier):
+        device = MockDevice("Living Room TV")
+
+        intent = classifier.classify("mute the tv", [device])
+
+        assert intent.device_name == "Living Room TV"
+        assert intent.confidence == FastPathClassifier.IMPLICIT_DEVICE_CONFIDENCE
+
+    def test_no_devices(self, classifier):
+        assert classifier.match("turn on the living room tv", []) is None
+
+
+class TestRegistryPhrases:
+    """Action phrases come from ActionRegistry names and aliases."""
+
+    def test_new_alias_is_recognized(self, devices):
+        registry = ActionRegistry()
+        registry.register(ActionDefinition(
+            name="power_off",
+            category=ActionCategory.POWER,
+            description="Turn off a device",
+            aliases={"good_night"},
+        ))
+        classifier = FastPathClassifier(registry=registry, min_confidence=0.85)
+
+        intent = classifier.classify("good night bedroom tv", devices)
+
+        assert intent.action == ActionType.POWER_OFF
+
+
+class TestThreshold:
+    """Confidence threshold and stats."""
+
+    def test_below_threshold_is_not_returned(self, devices):
+        classifier = FastPathClassifier(min_confidence=0.85)
+
+        # "tv room" scores low against "Living Room TV"
+        assert classifier.match("mute the tv room", devices).confidence < 0.85
+        assert classifier.classify("mute the tv room", devices) is None
+        assert classifier.stats.below_threshold == 1
+
+    def test_stats(self, classifier, devices):
+        classifier.classify("mute the bedroom tv", devices)
+        classifier.classify("what's my next meeting", devices)
+
+        assert classifier.stats.as_dict() == {
+            "hits": 1, "below_threshold": 0, "misses": 1, "hit_rate": 0.5,
+        }
+
+    def test_parse_builds_parsed_command(self, classifier, devices):
+        user_id = uuid4()
+
+        parsed = classifier.parse("volume 25 on the living room tv", devices, user_id=user_id)
+
+        assert parsed.user_id == user_id
+        assert parsed.ai_provider == "fast_path"
+        assert parsed.action == "volume_set"
+        assert parsed.device_name == "Living Room TV"
+        assert parsed.parameters == {"level": 25}
+
+
+class TestCorpus:
+    """The benchmark corpus (scripts/bench_fast_path.py)."""
+
+    def test_no_false_positives(self, classifier):
+        data = json.loads(CORPUS.read_text(encoding="utf-8"))
+        devices = [MockDevice(name) for name in data["devices"]]
+
+        for utterance in data["utterances"]:
+            intent = classifier.classify(utterance["text"], devices)
+            if intent is None:
+                continue
+            assert {
+                "action": intent.action.value,
+                "device": intent.device_name,
+                "parameters": intent.parameters,
+            } == utterance["expected"], utterance["text"]
+
+        assert classifier.stats.hit_rate > 0.5
+
+
+class TestIntentServiceFastPath:
+    """IntentService.process() with the fast path."""
+
+    @pytest.fixture
+    def service(self):
+        return IntentService()
+
+    @staticmethod
+    def _context(build_context, has_pending=False):
+        build_context.return_value.has_pending.return_value = has_pending
+        build_context.return_value.resolved_references = {}
+        build_context.return_value.to_dict.return_value = {}
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_routing(self, service, devices):
+        handled = IntentResult(success=True, intent_type=IntentResultType.DEVICE_COMMAND, message="ok")
+
+        with patch.object(service, "_get_user_devices", return_value=devices), \
+             patch("app.services.intent_service.settings.INTENT_FAST_PATH_ENABLED", True), \
+             patch("app.ai.context.build_request_context") as build_context, \
+             patch("app.services.intent_service.ai_router.analyze_request", AsyncMock()) as route, \
+             patch.object(service, "_handle_simple_task", AsyncMock(return_value=handled)) as simple:
+            self._context(build_context)
+            result = await service.process(
+                text="apaga la tele de la sala", user_id=uuid4(), db=AsyncMock(),
+            )
+
+        assert result is handled
+        route.assert_not_awaited()
+        parsed = simple.await_args.kwargs["parsed"]
+        assert parsed.ai_provider == "fast_path"
+        assert parsed.action == "power_off"
+
+    @pytest.mark.asyncio
+    async def test_pending_operation_disables_fast_path(self, service, devices):
+        with patch.object(service, "_get_user_devices", return_value=devices), \
+             patch("app.services.intent_service.settings.INTENT_FAST_PATH_ENABLED", True), \
+             patch("app.services.intent_service.settings.INTENT_SPECULATIVE_PARSE_ENABLED", False), \
+             patch("app.ai.context.build_request_context") as build_context, \
+             patch(
+                 "app.services.intent_service.ai_router.analyze_request",
+                 AsyncMock(side_effect=RuntimeError("routed")),
+             ) as route:
+            self._context(build_context, has_pending=True)
+            result = await service.process(
+                text="turn off the bedroom tv", user_id=uuid4(), db=AsyncMock(),
+            )
+
+        route.assert_awaited_once()
+        assert result.success is False
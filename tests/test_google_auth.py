@@ -0,0 +1,133 @@
+"""
+Tests for the Google OAuth endpoints.
+
+These tests verify (on the async session, get_async_db):
+- Connection status
+- OAuth callback storing and updating credentials
+- Disconnect removing credentials
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.oauth_credential import OAuthCredential
+from app.models.user import User
+from app.routers import google_auth
+
+
+@pytest.fixture
+def google_credential(db: Session, test_user: User) -> OAuthCredential:
+    """Stored Google credentials for the test user."""
+    credential = OAuthCredential(
+        user_id=test_user.id,
+        provider="google",
+        access_token="old-token",
+        refresh_token="refresh-token",
+        token_type="Bearer",
+        expires_at=None,  # SQLite drops the timezone; not needed here
+        scopes=["calendar"],
+    )
+    db.add(credential)
+    db.commit()
+    return credential
+
+
+def _stored_credentials(db: Session, user: User) -> list:
+    db.expire_all()
+    return db.query(OAuthCredential).filter(OAuthCredential.user_id == user.id).all()
+
+
+class TestGoogleStatus:
+    """Tests for GET /auth/google/status."""
+
+    def test_not_connected(self, client: TestClient, auth_headers: dict):
+        response = client.get("/auth/google/status", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json() == {"connected": False, "scopes": []}
+
+    def test_connected(
+        self, client: TestClient, auth_headers: dict, google_credential: OAuthCredential
+    ):
+        response = client.get("/auth/google/status", headers=auth_headers)
+
+        assert response.status_code == 200
+        assert response.json()["connected"] is True
+        assert response.json()["scopes"] == ["calendar"]
+
+
+class TestGoogleCallback:
+    """Tests for GET /auth/google/callback."""
+
+    def _callback(self, client: TestClient, user: User):
+        tokens = SimpleNamespace(
+            access_token="new-token",
+            refresh_token=None,
+            token_type="Bearer",
+            expires_at=None,
+            scopes=["calendar", "docs"],
+            extra_data=None,
+        )
+        google_auth._store_state("state-123", {"user_id": str(user.id), "redirect_after": None})
+        with patch.object(
+            google_auth.GoogleAuthClient, "exchange_code_for_tokens",
+            new_callable=AsyncMock, return_value=tokens,
+        ), patch.object(
+            google_auth.GoogleAuthClient, "get_user_info",
+            new_callable=AsyncMock, return_value=SimpleNamespace(email="test@gmail.com"),
+        ):
+            return client.get("/auth/google/callback", params={"code": "abc", "state": "state-123"})
+
+    def test_stores_credentials(self, client: TestClient, db: Session, test_user: User):
+        response = self._callback(client, test_user)
+
+        assert response.status_code == 200
+        assert response.json()["google_email"] == "test@gmail.com"
+        [credential] = _stored_credentials(db, test_user)
+        assert credential.access_token == "new-token"
+
+    def test_updates_existing_credentials(
+        self, client: TestClient, db: Session, test_user: User, google_credential: OAuthCredential
+    ):
+        response = self._callback(client, test_user)
+
+        assert response.status_code == 200
+        [credential] = _stored_credentials(db, test_user)
+        assert credential.access_token == "new-token"
+        assert credential.refresh_token == "refresh-token"  # Kept when Google omits it
+        assert credential.scopes == ["calendar", "docs"]
+
+    def test_invalid_state(self, client: TestClient):
+        response = client.get("/auth/google/callback", params={"code": "abc", "state": "unknown"})
+
+        assert response.status_code == 400
+
+
+class TestGoogleDisconnect:
+    """Tests for DELETE /auth/google."""
+
+    def test_disconnect(
+        self,
+        client: TestClient,
+        db: Session,
+        test_user: User,
+        auth_headers: dict,
+        google_credential: OAuthCredential,
+    ):
+        with patch.object(
+            google_auth.GoogleAuthClient, "revoke_token", new_callable=AsyncMock
+        ) as revoke:
+            response = client.delete("/auth/google", headers=auth_headers)
+
+        assert response.status_code == 200
+        revoke.assert_awaited_once_with("old-token")
+        assert _stored_credentials(db, test_user) == []
+
+    def test_not_connected(self, client: TestClient, auth_headers: dict):
+        response = client.delete("/auth/google", headers=auth_headers)
+
+        assert response.status_code == 404
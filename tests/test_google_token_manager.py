@@ -0,0 +1,212 @@
+"""
+Tests for the Google token manager.
+
+This module tests:
+- Tokens are cached in memory (one DB load per user)
+- Concurrent callers share a single refresh (single-flight)
+- Proactive refresh before expires_at (blocking and background)
+- Refresh failures, missing credentials and invalidation
+- Cached tokens re-read from the DB after the TTL, bounded cache size
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.environments.base import TokenExpiredError
+from app.services.google_token_manager import GoogleToken, GoogleTokenManager
+
+
+def _credential(expires_in_seconds=3600, refresh_token="refresh-1"):
+    return SimpleNamespace(
+        access_token="access-1",
+        refresh_token=refresh_token,
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in_seconds),
+        scopes=["https://www.googleapis.com/auth/calendar"],
+    )
+
+
+class FakeSession:
+    """Async session stand-in: every select returns the same credential row."""
+
+    def __init__(self, store):
+        self._store = store
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement):
+        self._store["queries"] += 1
+        result = MagicMock()
+        result.scalars.return_value.first.return_value = self._store["credential"]
+        return result
+
+    async def commit(self):
+        self._store["commits"] += 1
+
+
+def _manager(credential, refresh_result=None, refresh_error=None, delay=0.0, **options):
+    store = {"credential": credential, "queries": 0, "commits": 0}
+
+    async def refresh(refresh_token):
+        await asyncio.sleep(delay)
+        if refresh_error:
+            raise refresh_error
+        return refresh_result
+
+    auth_client = MagicMock()
+    auth_client.refresh_access_token = AsyncMock(side_effect=refresh)
+
+    manager = GoogleTokenManager(
+        session_factory=lambda: FakeSession(store),
+        auth_client_factory=lambda: auth_client,
+        refresh_margin_seconds=300,
+        **options,
+    )
+    return manager, store, auth_client
+
+
+def _new_tokens(expires_in_seconds=3600):
+    return SimpleNamespace(
+        access_token="access-2",
+        refresh_token=None,
+        expires_at=datetime.now(timezone.utc) + timedelta(seconds=expires_in_seconds),
+        scopes=[],
+    )
+
+
+class TestGoogleTokenManager:
+    """Caching and refresh behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_valid_token_is_loaded_once(self):
+        manager, store, auth_client = _manager(_credential())
+        user_id = uuid4()
+
+        first = await manager.get_token(user_id)
+        second = await manager.get_token(str(user_id))
+
+        assert first.access_token == second.access_token == "access-1"
+        assert store["queries"] == 1
+        auth_client.refresh_access_token.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_refresh(self):
+        manager, store, auth_client = _manager(
+            _credential(expires_in_seconds=-60), refresh_result=_new_tokens(), delay=0.05
+        )
+        user_id = uuid4()
+
+        tokens = await asyncio.gather(*(manager.get_access_token(user_id) for _ in range(10)))
+
+        assert tokens == ["access-2"] * 10
+        assert auth_client.refresh_access_token.await_count == 1
+        assert store["queries"] == 2  # one load + one persist
+        assert store["commits"] == 1
+        assert store["credential"].access_token == "access-2"
+        assert store["credential"].refresh_token == "refresh-1"
+
+    @pytest.mark.asyncio
+    async def test_token_inside_margin_is_refreshed_before_use(self):
+        manager, _, auth_client = _manager(
+            _credential(expires_in_seconds=120), refresh_result=_new_tokens()
+        )
+
+        assert await manager.get_access_token(uuid4()) == "access-2"
+        auth_client.refresh_access_token.assert_awaited_once_with("refresh-1")
+
+    @pytest.mark.asyncio
+    async def test_token_near_margin_refreshes_in_background(self):
+        manager, _, auth_client = _manager(
+            _credential(expires_in_seconds=450), refresh_result=_new_tokens()
+        )
+        user_id = uuid4()
+
+        assert await manager.get_access_token(user_id) == "access-1"
+        assert await manager.get_access_token(user_id) == "access-1"
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert await manager.get_access_token(user_id) == "access-2"
+        assert auth_client.refresh_access_token.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rejected_refresh_of_expired_token_returns_none(self):
+        manager, _, _ = _manager(
+            _credential(expires_in_seconds=-60),
+            refresh_error=TokenExpiredError("Token refresh failed: invalid_grant"),
+        )
+        user_id = uuid4()
+
+        assert await manager.get_token(user_id) is None
+        assert str(user_id) not in manager._tokens
+        assert manager.stats.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_missing_credentials_returns_none(self):
+        manager, _, _ = _manager(None)
+
+        assert await manager.get_token(uuid4()) is None
+
+    @pytest.mark.asyncio
+    async def test_invalidate_forces_reload(self):
+        manager, store, _ = _manager(_credential())
+        user_id = uuid4()
+
+        await manager.get_token(user_id)
+        manager.invalidate(user_id)
+        await manager.get_token(user_id)
+
+        assert store["queries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_change_from_another_worker_seen_after_ttl(self):
+        manager, store, _ = _manager(_credential(), cache_ttl_seconds=60)
+        user_id = uuid4()
+
+        await manager.get_token(user_id)
+        store["credential"] = None  # Disconnected through another worker
+        assert (await manager.get_token(user_id)).access_token == "access-1"
+
+        manager.cache_ttl_seconds = 0
+        assert await manager.get_token(user_id) is None
+        assert store["queries"] == 2
+        assert manager.stats.expired == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_size_is_bounded(self):
+        manager, store, _ = _manager(_credential(), max_users=2)
+        first, second, third = uuid4(), uuid4(), uuid4()
+
+        await manager.get_token(first)
+        await manager.get_token(second)
+        await manager.get_token(first)   # Most recently used
+        await manager.get_token(third)
+
+        assert len(manager._tokens) == 2
+        assert str(second) not in manager._tokens
+        assert manager.stats.evictions == 1
+        await manager.get_token(first)
+        assert store["queries"] == 3
+
+
+class TestGoogleToken:
+    """GoogleToken helpers."""
+
+    def test_unknown_expiry_counts_as_expiring(self):
+        assert GoogleToken(access_token="t").expires_within(0)
+
+    def test_has_scope(self):
+        token = GoogleToken(
+            access_token="t",
+            scopes=["https://www.googleapis.com/auth/documents.readonly"],
+        )
+        assert token.has_scope("documents")
+        assert not token.has_scope("calendar")
@@ -0,0 +1,145 @@
+"""
+Tests for the shared Google API HTTP pool.
+
+This module tests:
+- The pooled client is shared and survives `async with` blocks
+- Connection reuse instrumentation (new connections vs reused)
+- Google environment clients use the pool (or an injected client)
+"""
+
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from app.environments import http_client as pool
+from app.environments.google import GoogleCalendarClient, GoogleAuthClient
+
+
+@pytest_asyncio.fixture
+async def fresh_pool():
+    """Start each test with a new pool and zeroed stats."""
+    await pool.close_http_client()
+    pool.http_pool_stats.reset()
+    yield pool
+    await pool.close_http_client()
+    pool.http_pool_stats.reset()
+
+
+@pytest_asyncio.fixture
+async def keepalive_server():
+    """Minimal HTTP/1.1 keep-alive server on localhost; yields its base URL."""
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                if not head:
+                    break
+                body = b'{"items": []}'
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}"
+    server.close()
+    await server.wait_closed()
+
+
+class TestSharedPool:
+    """The pool is created once and shared by all callers."""
+
+    @pytest.mark.asyncio
+    async def test_get_http_client_is_singleton(self, fresh_pool):
+        assert pool.get_http_client() is pool.get_http_client()
+
+    @pytest.mark.asyncio
+    async def test_shared_block_does_not_close_pool(self, fresh_pool):
+        async with pool.shared_http_client() as client:
+            pass
+
+        assert not client.is_closed
+        assert pool.get_http_client() is client
+
+    @pytest.mark.asyncio
+    async def test_close_then_recreate(self, fresh_pool):
+        first = pool.get_http_client()
+        await pool.close_http_client()
+
+        assert first.is_closed
+        assert pool.get_http_client() is not first
+
+    @pytest.mark.asyncio
+    async def test_injected_client_takes_precedence(self, fresh_pool):
+        injected = httpx.AsyncClient()
+        async with pool.shared_http_client(injected) as client:
+            assert client is injected
+        await injected.aclose()
+
+
+class TestConnectionReuse:
+    """Keep-alive means one TCP connect for many requests."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_connection(
+        self, fresh_pool, keepalive_server
+    ):
+        for _ in range(5):
+            async with pool.shared_http_client() as client:
+                response = await client.get(f"{keepalive_server}/events")
+                assert response.status_code == 200
+
+        stats = pool.http_pool_stats
+        assert stats.requests == 5
+        assert stats.tcp_connects == 1
+        assert stats.reused_requests == 4
+        assert stats.as_dict()["reuse_ratio"] == 0.8
+
+    @pytest.mark.asyncio
+    async def test_calendar_client_uses_pool(self, fresh_pool, keepalive_server):
+        calendar = GoogleCalendarClient(access_token="token")
+        calendar.BASE_URL = keepalive_server
+
+        await calendar._make_request("GET", "/calendars/primary/events")
+        await calendar._make_request("GET", "/calendars/primary/events")
+
+        assert pool.http_pool_stats.requests == 2
+        assert pool.http_pool_stats.tcp_connects == 1
+
+
+class TestInjectedClients:
+    """Environment clients accept an explicit client (tests, custom transports)."""
+
+    @pytest.mark.asyncio
+    async def test_calendar_client_with_injected_transport(self):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers["Authorization"])
+            return httpx.Response(200, json={"items": []})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            calendar = GoogleCalendarClient(access_token="abc", http_client=http)
+            data = await calendar._make_request("GET", "/calendars/primary/events")
+
+        assert data == {"items": []}
+        assert seen == ["Bearer abc"]
+
+    @pytest.mark.asyncio
+    async def test_auth_client_with_injected_transport(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200)
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            auth = GoogleAuthClient(
+                client_id="id", client_secret="secret", http_client=http
+            )
+            assert await auth.revoke_token("token") is True
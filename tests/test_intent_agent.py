@@ -382,6 +382,52 @@ class TestAgentVsJwtParity:
             assert jwt_data["message"] == agent_data["message"]
 
 
+class TestIntentAsyncSession:
+    """/intent runs on an AsyncSession (get_async_db) backed by the test DB."""
+
+    def test_intent_queries_test_db_without_postgres(
+        self,
+        client: TestClient,
+        pi_alexa_device: Device,
+        test_user: User,
+        auth_headers: dict
+    ):
+        """Test that the async session sees rows written by the sync fixtures."""
+        from sqlalchemy.ext.asyncio import AsyncSession
+        from app.services.intent_service import (
+            IntentResult,
+            IntentResultType,
+            intent_service,
+        )
+
+        seen = {}
+
+        async def process(text, user_id, db, **kwargs):
+            seen["db"] = db
+            devices = await intent_service._get_user_devices(db, user_id)
+            return IntentResult(
+                success=True,
+                intent_type=IntentResultType.DEVICE_QUERY,
+                confidence=0.9,
+                message=", ".join(device.name for device in devices),
+            )
+
+        with patch(
+            "app.routers.intent.intent_service.process",
+            new_callable=AsyncMock,
+            side_effect=process
+        ):
+            response = client.post(
+                "/intent",
+                headers=auth_headers,
+                json={"text": "what devices do I have?"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["message"] == "Pi Alexa"
+        assert isinstance(seen["db"], AsyncSession)
+
+
 # ---------------------------------------------------------------------------
 # ERROR HANDLING TESTS
 # ---------------------------------------------------------------------------
@@ -11,6 +11,9 @@ Note: These tests use mocks for AI providers and database
 to test the service logic in isolation.
 """
 
+import asyncio
+import time
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from uuid import uuid4
@@ -22,6 +25,8 @@ from app.services.intent_service import (
     IntentResultType,
     intent_service,
 )
+from app.ai.monitoring import ai_monitor
+from app.ai.router.orchestrator import RoutingDecision, TaskComplexity
 
 
 # ===========================================================================
@@ -331,8 +336,8 @@ class TestProcessWithMocks:
     @pytest.mark.asyncio
     async def test_process_handles_exception(self, service):
         """Test that process handles exceptions gracefully."""
-        mock_db = MagicMock()
-        mock_db.query.side_effect = Exception("Database error")
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = Exception("Database error")
         
         with patch.object(service, '_get_user_devices', side_effect=Exception("DB error")):
             # Should not raise, should return error result
@@ -345,6 +350,123 @@ class TestProcessWithMocks:
         assert result.success is False
         assert result.intent_type == IntentResultType.ERROR
         assert "error" in result.message.lower() or "failed" in result.message.lower()
+    
+    @pytest.mark.asyncio
+    async def test_get_user_devices_awaits_async_session(self, service):
+        """Devices are loaded with an awaited query on the AsyncSession."""
+        devices = [MagicMock()]
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = MagicMock(
+            **{"scalars.return_value.all.return_value": devices}
+        )
+        
+        result = await service._get_user_devices(mock_db, uuid4())
+        
+        assert result == devices
+        mock_db.execute.assert_awaited_once()
+
+
+
+class TestSpeculativeParse:
+    """Tests for speculative routing + intent parsing."""
+    
+    @staticmethod
+    def _routing(complexity):
+        return RoutingDecision(
+            complexity=complexity,
+            target_provider="gemini",
+            reasoning="test",
+            confidence=0.9,
+            is_device_command=complexity == TaskComplexity.SIMPLE,
+        )
+    
+    @staticmethod
+    def _slow(result, delay=0.1):
+        async def call(*args, **kwargs):
+            await asyncio.sleep(delay)
+            return result
+        return call
+    
+    @pytest.mark.asyncio
+    async def test_simple_request_overlaps_routing_and_parse(self, service):
+        """Test that a simple request pays max(routing, parse), not the sum."""
+        parsed = MagicMock(processing_time_ms=100.0)
+        ai_monitor.reset()
+        
+        with patch(
+            "app.services.intent_service.ai_router.analyze_request",
+            side_effect=self._slow(self._routing(TaskComplexity.SIMPLE)),
+        ), patch(
+            "app.services.intent_service.intent_parser.create_parsed_command",
+            side_effect=self._slow(parsed),
+        ):
+            started = time.perf_counter()
+            routing, speculative = await service._route_with_speculative_parse(
+                request_id="req-1", text="turn on the tv", context={}, user_id=uuid4(),
+            )
+            elapsed = time.perf_counter() - started
+        
+        assert routing.complexity == TaskComplexity.SIMPLE
+        assert speculative is parsed
+        assert elapsed < 0.18
+        stats = ai_monitor.get_speculation_stats()
+        assert stats["used"] == 1
+        assert stats["savings_p50_ms"] > 0
+    
+    @pytest.mark.asyncio
+    async def test_complex_request_discards_parse(self, service):
+        """Test that routing to a complex path cancels the speculative parse."""
+        parse_started = asyncio.Event()
+        parse_cancelled = asyncio.Event()
+        
+        async def parse(*args, **kwargs):
+            parse_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                parse_cancelled.set()
+                raise
+        
+        ai_monitor.reset()
+        with patch(
+            "app.services.intent_service.ai_router.analyze_request",
+            side_effect=self._slow(self._routing(TaskComplexity.COMPLEX_REASONING), 0.01),
+        ), patch(
+            "app.services.intent_service.intent_parser.create_parsed_command",
+            side_effect=parse,
+        ):
+            routing, speculative = await service._route_with_speculative_parse(
+                request_id="req-2", text="plan my week", context={}, user_id=uuid4(),
+            )
+            await asyncio.sleep(0)
+        
+        assert routing.complexity == TaskComplexity.COMPLEX_REASONING
+        assert speculative is None
+        assert parse_started.is_set() and parse_cancelled.is_set()
+        assert ai_monitor.get_speculation_stats()["discarded"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_process_reuses_speculative_parse(self, service):
+        """Test that process() hands the speculative parse to the simple path."""
+        parsed = MagicMock(processing_time_ms=5.0)
+        handled = IntentResult(success=True, intent_type=IntentResultType.DEVICE_COMMAND, message="ok")
+        
+        with patch.object(service, "_get_user_devices", return_value=[]), \
+             patch("app.services.intent_service.settings.INTENT_SPECULATIVE_PARSE_ENABLED", True), \
+             patch("app.ai.context.build_request_context") as build_context, \
+             patch.object(
+                 service,
+                 "_route_with_speculative_parse",
+                 AsyncMock(return_value=(self._routing(TaskComplexity.SIMPLE), parsed)),
+             ), \
+             patch.object(service, "_handle_simple_task", AsyncMock(return_value=handled)) as simple:
+            build_context.return_value.has_pending.return_value = False
+            build_context.return_value.resolved_references = {}
+            build_context.return_value.to_dict.return_value = {}
+            result = await service.process(text="turn on the tv", user_id=uuid4(), db=AsyncMock())
+        
+        assert result is handled
+        assert simple.await_args.kwargs["parsed"] is parsed
 
 
 # ===========================================================================
@@ -0,0 +1,245 @@
+"""
+Tests for the routing / intent-parsing response cache.
+
+This module tests:
+- Normalization and context fingerprint (device names / online state)
+- Bypass for pending operations, conversation references, time-relative
+  requests and URLs
+- TTL expiry, LRU eviction and hit/miss stats
+- AIRouter.analyze_request and IntentParser.parse reuse cached results
+"""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.ai.intent.parser import IntentParser
+from app.ai.intent.schemas import CalendarCreateIntent, DeviceCommand
+from app.ai.prompts.base_prompt import get_context_hash
+from app.ai.providers.base import AIResponse, ProviderType
+from app.ai.response_cache import (
+    LLMResponseCache,
+    bypass_reason,
+    intent_cache,
+    normalize_request,
+    routing_cache,
+)
+from app.ai.router.orchestrator import AIRouter, TaskComplexity
+
+
+def _context(online=True, name="Living Room TV", **extra):
+    context = {
+        "user_id": "user-1",
+        "devices": [{"id": "d1", "name": name, "is_online": online}],
+    }
+    context.update(extra)
+    return context
+
+
+def _response(content: dict) -> AIResponse:
+    return AIResponse(
+        content=json.dumps(content),
+        provider=ProviderType.GEMINI,
+        model="gemini-flash",
+        success=True,
+    )
+
+
+class TestCacheKey:
+    """Normalization and context fingerprint."""
+
+    def test_near_identical_text_shares_key(self):
+        cache = LLMResponseCache("test", ttl_seconds=60, max_entries=10)
+
+        assert cache.key_for("¿Show  my Calendar?", _context()) == cache.key_for(
+            "show my calendar", _context()
+        )
+
+    def test_normalize_request(self):
+        assert normalize_request("  Muestra MI calendario!! ") == "muestra mi calendario"
+
+    def test_fingerprint_includes_device_state(self):
+        assert get_context_hash(_context()) != get_context_hash(_context(online=False))
+        assert get_context_hash(_context()) != get_context_hash(_context(name="Bedroom TV"))
+        assert get_context_hash(_context()) == get_context_hash(_context())
+
+    def test_fingerprint_is_per_user(self):
+        other = _context()
+        other["user_id"] = "user-2"
+
+        assert get_context_hash(_context()) != get_context_hash(other)
+
+
+class TestBypass:
+    """Requests that must never be served from the cache."""
+
+    def test_pending_operation(self):
+        context = _context(pending_operation={"has_pending_create": True})
+
+        assert bypass_reason("yes", context) == "pending_operation"
+
+    def test_pending_content_follow_up(self):
+        context = _context(conversation_context={"conversation": {"pending_content": "a poem"}})
+
+        assert bypass_reason("show my calendar", context) == "pending_operation"
+
+    def test_resolved_references(self):
+        context = _context(resolved_references={"event": {"id": "e1"}})
+
+        assert bypass_reason("show the calendar", context) == "reference"
+
+    @pytest.mark.parametrize("text", ["show it on the tv", "muéstralo en la tele", "sí"])
+    def test_conversation_references(self, text):
+        assert bypass_reason(text, _context()) == "reference"
+
+    @pytest.mark.parametrize("text", [
+        "what's on my calendar tomorrow",
+        "qué tengo hoy",
+        "remind me at 3pm",
+        "reunión el lunes",
+    ])
+    def test_time_relative(self, text):
+        assert bypass_reason(text, _context()) == "time_relative"
+
+    def test_url(self):
+        assert bypass_reason("summarize https://docs.google.com/document/d/AbC", _context()) == "url"
+
+    @pytest.mark.parametrize("text", ["show my calendar", "muestra mi calendario", "hello"])
+    def test_plain_requests_are_cacheable(self, text):
+        assert bypass_reason(text, _context()) is None
+
+    def test_bypass_is_counted(self):
+        cache = LLMResponseCache("test", ttl_seconds=60, max_entries=10)
+
+        assert cache.key_for("what's next tomorrow", _context()) is None
+        assert cache.stats.bypasses == {"time_relative": 1}
+
+
+class TestExpiryAndEviction:
+    """TTL, LRU and stats."""
+
+    def test_entries_expire(self):
+        cache = LLMResponseCache("test", ttl_seconds=0, max_entries=10)
+        key = cache.key_for("show my calendar", _context())
+        cache.set(key, "value")
+
+        assert cache.get(key) is None
+        assert cache.stats.expirations == 1
+
+    def test_least_recently_used_is_evicted(self):
+        cache = LLMResponseCache("test", ttl_seconds=60, max_entries=2)
+        keys = [cache.key_for(text, _context()) for text in ("hello", "help", "list devices")]
+        cache.set(keys[0], 0)
+        cache.set(keys[1], 1)
+        cache.get(keys[0])
+        cache.set(keys[2], 2)
+
+        assert cache.get(keys[0]) == 0
+        assert cache.get(keys[1]) is None
+        assert cache.stats.evictions == 1
+
+    def test_disabled_by_setting(self):
+        cache = LLMResponseCache("test", ttl_seconds=60, max_entries=10)
+
+        with patch("app.ai.response_cache.settings.AI_RESPONSE_CACHE_ENABLED", False):
+            assert cache.key_for("show my calendar", _context()) is None
+
+
+class TestRouterCaching:
+    """AIRouter.analyze_request with the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_llm(self):
+        router = AIRouter()
+        response = _response({
+            "complexity": "simple",
+            "is_device_command": True,
+            "confidence": 0.9,
+            "reasoning": "display calendar",
+        })
+
+        with patch.object(router.orchestrator, "generate_json", new_callable=AsyncMock) as mock_gen:
+            mock_gen.return_value = response
+            first = await router.analyze_request("Show my calendar", _context())
+            second = await router.analyze_request("show my calendar!", _context())
+
+        assert mock_gen.await_count == 1
+        assert first.complexity == second.complexity == TaskComplexity.SIMPLE
+        assert first is not second
+        assert routing_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_analysis_is_not_cached(self):
+        router = AIRouter()
+        failed = AIResponse(
+            content="", provider=ProviderType.GEMINI, model="gemini-flash",
+            success=False, error="timeout",
+        )
+
+        with patch.object(router.orchestrator, "generate_json", new_callable=AsyncMock) as mock_gen:
+            mock_gen.return_value = failed
+            await router.analyze_request("show my calendar", _context())
+            await router.analyze_request("show my calendar", _context())
+
+        assert mock_gen.await_count == 2
+
+
+class TestParserCaching:
+    """IntentParser.parse with the cache."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_llm(self):
+        parser = IntentParser()
+        response = _response({
+            "intent_type": "device_command",
+            "device_name": "Living Room TV",
+            "action": "show_calendar",
+            "confidence": 0.95,
+        })
+
+        with patch.object(parser.provider, "generate_json", new_callable=AsyncMock) as mock_gen:
+            mock_gen.return_value = response
+            first = await parser.parse("Show my calendar on the living room TV", _context())
+            second = await parser.parse("show my calendar on the living room tv", _context())
+
+        assert mock_gen.await_count == 1
+        assert isinstance(second, DeviceCommand)
+        assert second.action == first.action
+        assert second.original_text == "show my calendar on the living room tv"
+        assert intent_cache.stats.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_device_going_offline_changes_key(self):
+        parser = IntentParser()
+        response = _response({
+            "intent_type": "device_command",
+            "device_name": "Living Room TV",
+            "action": "show_calendar",
+            "confidence": 0.95,
+        })
+
+        with patch.object(parser.provider, "generate_json", new_callable=AsyncMock) as mock_gen:
+            mock_gen.return_value = response
+            await parser.parse("show my calendar", _context())
+            await parser.parse("show my calendar", _context(online=False))
+
+        assert mock_gen.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_calendar_create_is_never_cached(self):
+        parser = IntentParser()
+        response = _response({
+            "intent_type": "calendar_create",
+            "action": "create_event",
+            "event_title": "Dentist",
+            "confidence": 0.9,
+        })
+
+        with patch.object(parser.provider, "generate_json", new_callable=AsyncMock) as mock_gen:
+            mock_gen.return_value = response
+            first = await parser.parse("add dentist appointment", _context())
+            await parser.parse("add dentist appointment", _context())
+
+        assert isinstance(first, CalendarCreateIntent)
+        assert mock_gen.await_count == 2
@@ -12,6 +12,9 @@ This module tests:
 All LLM calls are mocked for fast, reliable tests.
 """
 
+import asyncio
+import time
+
 import pytest
 import json
 from unittest.mock import AsyncMock, patch, MagicMock
@@ -373,6 +376,72 @@ class TestSceneService:
         assert isinstance(hints, list)
         # At least some hints extracted
         assert len(hints) >= 1
+    
+    @staticmethod
+    def _scene(*components):
+        return SceneGraph(
+            layout=LayoutSpec(intent=LayoutIntent.DASHBOARD, engine=LayoutEngine.GRID),
+            components=[
+                SceneComponent(id=f"{ctype}_{i}", type=ctype, position=ComponentPosition())
+                for i, ctype in enumerate(components)
+            ],
+        )
+    
+    @pytest.mark.asyncio
+    async def test_populate_scene_data_fetches_components_concurrently(self, service, mock_db):
+        """Test that component fetches overlap instead of running back to back."""
+        async def slow_fetch(component_type, **kwargs):
+            await asyncio.sleep(0.1)
+            return {"type": component_type}
+        
+        scene = self._scene("calendar_week", "meeting_detail", "event_countdown", "doc_summary")
+        with patch.object(service, "_fetch_component_data", side_effect=slow_fetch):
+            started = time.perf_counter()
+            await service.populate_scene_data(scene, user_id=str(uuid4()), db=mock_db)
+            elapsed = time.perf_counter() - started
+        
+        assert elapsed < 0.3
+        assert [c.data["type"] for c in scene.components] == [
+            "calendar_week", "meeting_detail", "event_countdown", "doc_summary",
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_populate_scene_data_slow_component_becomes_placeholder(self, service, mock_db):
+        """Test that a component over its time budget doesn't stall the scene."""
+        async def fetch(component_type, **kwargs):
+            if component_type == "doc_summary":
+                await asyncio.sleep(5)
+            return {"ok": True}
+        
+        scene = self._scene("clock_digital", "doc_summary")
+        with patch.object(service, "_fetch_component_data", side_effect=fetch), \
+             patch("app.core.config.settings.SCENE_COMPONENT_TIMEOUT_SECONDS", 0.05):
+            await service.populate_scene_data(scene, user_id=str(uuid4()), db=mock_db)
+        
+        assert scene.components[0].data == {"ok": True}
+        assert scene.components[1].data["is_placeholder"] is True
+        assert scene.components[1].data["timed_out"] is True
+    
+    @pytest.mark.asyncio
+    async def test_populate_scene_data_shares_identical_calendar_requests(self, service, mock_db):
+        """Test that widgets over the same range make one calendar request."""
+        calendar_client = MagicMock()
+        calendar_client.list_upcoming_events = AsyncMock(return_value=[])
+        token = MagicMock(access_token="token")
+        
+        scene = self._scene("calendar_widget", "calendar_agenda", "meeting_detail", "event_countdown")
+        with patch(
+            "app.services.google_token_manager.google_token_manager.get_token",
+            AsyncMock(return_value=token),
+        ), patch(
+            "app.environments.google.calendar.client.GoogleCalendarClient",
+            return_value=calendar_client,
+        ):
+            await service.populate_scene_data(scene, user_id=str(uuid4()), db=mock_db)
+        
+        # widget + agenda share (now, +14d, 10); meeting + countdown share (now, +7d, 1)
+        assert calendar_client.list_upcoming_events.await_count == 2
+        assert all("error" not in c.data for c in scene.components)
 
 
 # ---------------------------------------------------------------------------